@@ -0,0 +1,11 @@
+"""
+🔧 CODEMODS - Moteur unifié de corrections pour les repositories TypeORM
+
+Remplace les scripts fix_*_repo.py : une seule passe découvre tous les
+fichiers de src/infrastructure/database/sql/postgresql/repositories/*.ts
+et leur applique le registre de règles (voir codemods.rules) en parallèle.
+
+Usage :
+    python3 -m codemods                # tous les repositories
+    python3 -m codemods path/to/x.ts   # fichiers ciblés
+"""
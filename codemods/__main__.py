@@ -0,0 +1,99 @@
+"""
+🚀 CLI - python3 -m codemods [fichiers...]
+
+    --check   calcule les corrections en mémoire, n'écrit rien,
+              code de sortie 1 s'il reste des violations (CI)
+    --diff    idem, et écrit les diffs unifiés sur stdout
+    --staged  vérifie le contenu indexé (git) : avec --check ou --diff
+              uniquement, les corrections s'appliquent aux copies de
+              travail (--changed)
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from collections import Counter
+from fnmatch import fnmatch
+from pathlib import Path
+
+from codemods.cache import DEFAULT_CACHE_PATH, ContentCache, ruleset_version
+from codemods.changes import select
+from codemods.engine import REPOSITORIES_GLOB, discover, iter_run
+from codemods.rules import RULES
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='codemods',
+        description='Corrige les repositories TypeORM (InfrastructureException, imports, codes)',
+    )
+    parser.add_argument('paths', nargs='*', type=Path, help='fichiers à traiter (défaut : tous les repositories)')
+    parser.add_argument('--root', type=Path, default=Path('.'), help='racine du projet')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='nombre de processus')
+    parser.add_argument('--cache', type=Path, default=None, help=f'fichier de cache (défaut : <root>/{DEFAULT_CACHE_PATH})')
+    parser.add_argument('--no-cache', action='store_true', help='ignore le cache incrémental')
+    parser.add_argument('--check', action='store_true', help="n'écrit rien, échoue s'il reste des violations")
+    parser.add_argument('--diff', action='store_true', help="n'écrit rien, affiche les diffs unifiés")
+    parser.add_argument('--staged', action='store_true',
+                        help='contenu indexé des fichiers indexés (git), avec --check ou --diff')
+    parser.add_argument('--changed', nargs='?', const='HEAD', default=None, metavar='REF',
+                        help='uniquement les fichiers modifiés depuis REF (défaut HEAD)')
+    args = parser.parse_args(argv)
+
+    dry_run = args.check or args.diff
+    if args.staged and not dry_run:
+        # Réécrire la copie de travail ne corrigerait pas le contenu indexé
+        parser.error('--staged vérifie le contenu indexé : utiliser --check ou --diff (ou --changed pour corriger)')
+    # En mode --diff, stdout est réservé au patch
+    log = sys.stderr if args.diff else sys.stdout
+
+    cache = None
+    if not args.no_cache and not args.staged:
+        cache = ContentCache(args.cache or args.root / DEFAULT_CACHE_PATH, ruleset_version(RULES))
+
+    if args.staged or args.changed:
+        # Règles locales au fichier : les importeurs n'ont pas à être retraités
+        selected = select(args.root, staged=args.staged, ref=args.changed or 'HEAD', importers=False)
+        paths = [args.root / p for p in selected if fnmatch(p, REPOSITORIES_GLOB)]
+    else:
+        paths = args.paths or discover(args.root)
+    totals: Counter[str] = Counter()
+    files = changed = cached = 0
+    for result in iter_run(paths, jobs=args.jobs, cache=cache, write=not dry_run, diff=args.diff,
+                           staged=args.staged):
+        files += 1
+        cached += result.cached
+        if not result.changed:
+            continue
+        changed += 1
+        totals.update(result.counts)
+        if args.diff:
+            sys.stdout.write(result.diff)
+            sys.stdout.flush()
+        details = ', '.join(f'{name}={count}' for name, count in sorted(result.counts.items()))
+        verb = 'à corriger' if dry_run else 'corrigé'
+        print(f'✏️  {result.path} {verb} : {details}', file=log)
+
+    for name, count in sorted(totals.items()):
+        print(f'   {name}: {count}', file=log)
+
+    if dry_run:
+        status = '❌' if changed else '✅'
+        print(
+            f'{status} {files} fichiers ({cached} en cache), '
+            f'{changed} à corriger, {sum(totals.values())} violations',
+            file=log,
+        )
+        return 1 if changed else 0
+
+    print(
+        f'✅ {files} fichiers ({cached} en cache), '
+        f'{changed} modifiés, {sum(totals.values())} corrections',
+        file=log,
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,330 @@
+"""
+🏛️ ARCHITECTURE - Vérification Clean Architecture en une seule passe
+
+Remplace les pipelines grep des scripts check-clean-architecture*.sh :
+l'arbre src/ est parcouru une fois, chaque fichier est lu une seule fois
+(mmap) par un pool de processus, et TOUTES les règles sont évaluées sur
+cette lecture partagée (texte + imports extraits une fois).
+
+Usage :
+    python3 -m codemods.architecture                 # résumé lisible
+    python3 -m codemods.architecture --format json   # rapport machine
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import mmap
+import os
+import posixpath
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Iterator
+
+from codemods.changes import staged_content
+from codemods.engine import REPOSITORIES_GLOB
+from codemods.importgraph import parse_imports
+from codemods.tokenizer import find_throw_calls
+
+LAYERS = ('domain', 'application', 'infrastructure', 'presentation', 'shared')
+_TEST_FILE = re.compile(r'\.(?:spec|test)(?:\.[\w-]+)?\.ts$')
+
+
+@dataclass(frozen=True)
+class Violation:
+    rule: str
+    severity: str
+    path: str
+    line: int
+    message: str
+
+
+@dataclass
+class SourceFile:
+    """Lecture partagée d'un fichier : texte et imports extraits une fois"""
+
+    path: str
+    text: str
+    imports: list[tuple[str, int]] = field(default_factory=list)
+
+    def line_of(self, offset: int) -> int:
+        return self.text.count('\n', 0, offset) + 1
+
+    @property
+    def layer(self) -> str | None:
+        parts = self.path.split('/')
+        return parts[1] if len(parts) > 2 and parts[0] == 'src' else None
+
+
+def resolve_layer(importer: str, specifier: str) -> str | None:
+    """Couche visée par un import (alias @layer/ ou chemin relatif)"""
+    if specifier.startswith('@'):
+        alias = specifier[1:].split('/', 1)[0]
+        return alias if alias in LAYERS else None
+    if specifier.startswith('.'):
+        target = posixpath.normpath(posixpath.join(posixpath.dirname(importer), specifier))
+        parts = target.split('/')
+        if len(parts) > 1 and parts[0] == 'src' and parts[1] in LAYERS:
+            return parts[1]
+    return None
+
+
+class ArchitectureRule:
+    """Règle de base : couches concernées, sévérité et vérification pure"""
+
+    name = 'rule'
+    severity = 'error'
+    layers: tuple[str, ...] = ()
+
+    def applies_to(self, source: SourceFile) -> bool:
+        return source.layer in self.layers
+
+    def check(self, source: SourceFile) -> Iterator[Violation]:
+        raise NotImplementedError
+
+    def violation(self, source: SourceFile, line: int, message: str) -> Violation:
+        return Violation(self.name, self.severity, source.path, line, message)
+
+
+class ForbiddenLayerImportRule(ArchitectureRule):
+    """Une couche ne doit pas dépendre des couches listées, sauf exceptions
+    explicites (fichier, import) justifiées à la déclaration de la règle"""
+
+    def __init__(
+        self,
+        name: str,
+        layer: str,
+        forbidden: tuple[str, ...],
+        severity: str = 'error',
+        allowed: tuple[tuple[str, str], ...] = (),
+    ) -> None:
+        self.name = name
+        self.layers = (layer,)
+        self.forbidden = forbidden
+        self.severity = severity
+        self.allowed = frozenset(allowed)
+
+    def check(self, source: SourceFile) -> Iterator[Violation]:
+        for specifier, offset in source.imports:
+            target = resolve_layer(source.path, specifier)
+            if target in self.forbidden and (source.path, specifier) not in self.allowed:
+                yield self.violation(
+                    source,
+                    source.line_of(offset),
+                    f'{self.layers[0]} importe {target} : {specifier}',
+                )
+
+
+class ForbiddenImportPrefixRule(ArchitectureRule):
+    """Domain/Application ne dépendent jamais de NestJS"""
+
+    name = 'core-without-nestjs-imports'
+    layers = ('domain', 'application')
+    prefix = '@nestjs/'
+
+    def check(self, source: SourceFile) -> Iterator[Violation]:
+        for specifier, offset in source.imports:
+            if specifier.startswith(self.prefix):
+                yield self.violation(source, source.line_of(offset), f'import NestJS : {specifier}')
+
+
+class ForbiddenDecoratorRule(ArchitectureRule):
+    """Pas de décorateurs d'injection NestJS dans le cœur métier"""
+
+    name = 'core-without-nestjs-decorators'
+    layers = ('domain', 'application')
+    pattern = re.compile(r'^[ \t]*@(Injectable|Inject|Module)\(', re.M)
+
+    def check(self, source: SourceFile) -> Iterator[Violation]:
+        if '@' not in source.text:
+            return
+        for match in self.pattern.finditer(source.text):
+            yield self.violation(source, source.line_of(match.start()), f'décorateur @{match.group(1)}')
+
+
+class RawErrorInRepositoryRule(ArchitectureRule):
+    """Les repositories lèvent des InfrastructureException, jamais des Error"""
+
+    name = 'repository-raw-error'
+    layers = ('infrastructure',)
+
+    def applies_to(self, source: SourceFile) -> bool:
+        return fnmatch(source.path, REPOSITORIES_GLOB)
+
+    def check(self, source: SourceFile) -> Iterator[Violation]:
+        for call in find_throw_calls(source.text):
+            if call.callee == 'Error':
+                yield self.violation(
+                    source,
+                    source.line_of(call.callee_start),
+                    'throw new Error(...) : utiliser InfrastructureException',
+                )
+
+
+RULES: list[ArchitectureRule] = [
+    ForbiddenLayerImportRule(
+        'domain-purity', 'domain', ('application', 'infrastructure', 'presentation'),
+    ),
+    ForbiddenLayerImportRule(
+        'application-dependencies', 'application', ('infrastructure', 'presentation'),
+    ),
+    ForbiddenLayerImportRule(
+        'infrastructure-dependencies', 'infrastructure', ('presentation',),
+        allowed=(
+            # Contrôleur HTTP de @nestjs/terminus : route publique déclarée
+            # avec le décorateur de sécurité de la présentation
+            (
+                'src/infrastructure/health/health.controller.ts',
+                '../../presentation/security/decorators/public.decorator',
+            ),
+        ),
+    ),
+    ForbiddenImportPrefixRule(),
+    ForbiddenDecoratorRule(),
+    RawErrorInRepositoryRule(),
+]
+
+
+def is_checked(path: str) -> bool:
+    """Fichier TypeScript de production sous src/ (hors tests)"""
+    name = posixpath.basename(path)
+    return (
+        path.startswith('src/')
+        and '/__tests__/' not in path
+        and name.endswith('.ts')
+        and not name.endswith('.d.ts')
+        and not _TEST_FILE.search(name)
+    )
+
+
+def walk(root: Path) -> list[str]:
+    """Fichiers TypeScript de production sous src/ (chemins relatifs à root)"""
+    found: list[str] = []
+    stack = [root / 'src']
+    while stack:
+        try:
+            entries = list(os.scandir(stack.pop()))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in ('__tests__', 'node_modules'):
+                    stack.append(Path(entry.path))
+            else:
+                path = Path(entry.path).relative_to(root).as_posix()
+                if is_checked(path):
+                    found.append(path)
+    return sorted(found)
+
+
+def read_source(root: Path, path: str) -> SourceFile:
+    with open(root / path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            text = ''
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                text = mapped[:].decode('utf-8')
+    return parse_source(path, text)
+
+
+def parse_source(path: str, text: str) -> SourceFile:
+    imports = [(record.specifier, record.start) for record in parse_imports(text)]
+    return SourceFile(path=path, text=text, imports=imports)
+
+
+def check_files(root: Path, paths: list[str], staged: bool = False) -> list[Violation]:
+    """Évalue toutes les règles sur chaque fichier (exécuté dans un worker).
+    Avec `staged`, le contenu vérifié est celui de l'index ; les fichiers
+    absents de l'index (importeurs non suivis) ne partent pas dans le commit."""
+    violations: list[Violation] = []
+    for path in paths:
+        if staged:
+            raw = staged_content(root, path)
+            if raw is None:
+                continue
+            source = parse_source(path, raw.decode('utf-8'))
+        else:
+            source = read_source(root, path)
+        for rule in RULES:
+            if rule.applies_to(source):
+                violations.extend(rule.check(source))
+    return violations
+
+
+def scan(
+    root: Path, paths: list[str] | None = None, jobs: int | None = None, staged: bool = False,
+) -> list[Violation]:
+    targets = walk(root) if paths is None else paths
+    workers = min(jobs or os.cpu_count() or 1, max(1, len(targets) // 64))
+    if workers <= 1:
+        return check_files(root, targets, staged)
+
+    chunks = [targets[i::workers] for i in range(workers)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(check_files, [root] * workers, chunks, [staged] * workers)
+        violations = [v for chunk in results for v in chunk]
+    return sorted(violations, key=lambda v: (v.path, v.line, v.rule))
+
+
+def build_report(files: int, violations: list[Violation], elapsed: float) -> dict:
+    counts = {rule.name: 0 for rule in RULES}
+    for violation in violations:
+        counts[violation.rule] += 1
+    return {
+        'files': files,
+        'durationMs': round(elapsed * 1000, 1),
+        'errors': sum(1 for v in violations if v.severity == 'error'),
+        'warnings': sum(1 for v in violations if v.severity == 'warning'),
+        'counts': counts,
+        'violations': [asdict(v) for v in violations],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='codemods.architecture', description='Vérification Clean Architecture')
+    parser.add_argument('--root', type=Path, default=Path('.'), help='racine du projet')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='nombre de processus')
+    parser.add_argument('--format', choices=('text', 'json'), default='text')
+    parser.add_argument('--report', type=Path, default=None, help='écrit aussi le rapport JSON dans ce fichier')
+    parser.add_argument('--staged', action='store_true', help='fichiers indexés + importeurs directs uniquement')
+    parser.add_argument('--changed', nargs='?', const='HEAD', default=None, metavar='REF',
+                        help='fichiers modifiés depuis REF (défaut HEAD) + importeurs directs')
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    if args.staged or args.changed:
+        from codemods.changes import select
+
+        files = [f for f in select(args.root, staged=args.staged, ref=args.changed or 'HEAD') if is_checked(f)]
+    else:
+        files = walk(args.root)
+    violations = scan(args.root, files, jobs=args.jobs, staged=args.staged)
+    report = build_report(len(files), violations, time.perf_counter() - started)
+
+    if args.report:
+        args.report.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding='utf-8')
+
+    if args.format == 'json':
+        json.dump(report, sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write('\n')
+    else:
+        for v in violations:
+            icon = '❌' if v.severity == 'error' else '⚠️ '
+            print(f'{icon} {v.path}:{v.line} [{v.rule}] {v.message}')
+        print(
+            f"🏛️  {report['files']} fichiers, {report['errors']} erreurs, "
+            f"{report['warnings']} avertissements ({report['durationMs']} ms)"
+        )
+
+    return 1 if report['errors'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
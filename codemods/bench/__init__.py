@@ -0,0 +1,3 @@
+"""
+⏱️ BENCH - Mesures de performance de la chaîne de codemods
+"""
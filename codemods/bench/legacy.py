@@ -0,0 +1,63 @@
+"""
+🦕 LEGACY - Reproduction fidèle des anciens scripts fix_*_repo.py
+
+Sert uniquement de référence pour les benchmarks : passes re.sub DOTALL
+successives (fix_calendar/notification/role_assignment_repo.py) et six
+str.replace séquentiels (fix_rbac_context_repo.py).
+"""
+
+from __future__ import annotations
+
+import re
+
+from codemods.rules import TRANSLATE_KEY_CODES
+
+REGEX_PASSES = [
+    (r"throw new Error\('([^']+)'\);", r'throw new InfrastructureException("\1", "INFRASTRUCTURE_ERROR");'),
+    (r'throw new Error\("([^"]+)"\);', r'throw new InfrastructureException("\1", "INFRASTRUCTURE_ERROR");'),
+    (r"throw new Error\(`([^`]+)`\);", r'throw new InfrastructureException(`\1`, "INFRASTRUCTURE_ERROR");'),
+    (r'throw new Error\(\s*`([^`]+)`\s*\);', r'throw new InfrastructureException(`\1`, "INFRASTRUCTURE_ERROR");'),
+]
+
+
+def legacy_regex_passes(content: str) -> str:
+    """fix_calendar_repo.py : 4 passes re.sub sur le fichier complet"""
+    for pattern, replacement in REGEX_PASSES:
+        content = re.sub(pattern, replacement, content, flags=re.MULTILINE | re.DOTALL)
+    return content
+
+
+def legacy_translate_replaces(content: str) -> str:
+    """fix_rbac_context_repo.py : renommage puis un str.replace par clé"""
+    content = content.replace('throw new Error(', 'throw new InfrastructureException(')
+    for key, code in TRANSLATE_KEY_CODES.items():
+        content = content.replace(
+            f"throw new InfrastructureException(this.i18n.translate('{key}'));",
+            f"throw new InfrastructureException(this.i18n.translate('{key}'), '{code}');",
+        )
+    return content
+
+
+def legacy_import(content: str) -> str:
+    """fix_notification_repo.py : import inséré après une ligne d'ancrage"""
+    if 'InfrastructureException' in content:
+        return content
+    return re.sub(
+        r"import { Repository } from 'typeorm';",
+        "import { Repository } from 'typeorm';\n"
+        "import { InfrastructureException } from '@shared/exceptions/shared.exceptions';",
+        content,
+    )
+
+
+def legacy_fix(content: str) -> str:
+    """Enchaînement équivalent à l'exécution des anciens scripts"""
+    return legacy_translate_replaces(legacy_regex_passes(legacy_import(content)))
+
+
+def legacy_fix_file(path: str) -> None:
+    """Un script = lecture complète, passes, réécriture inconditionnelle"""
+    with open(path, 'r') as f:
+        content = f.read()
+    with open(path, 'w') as f:
+        f.write(legacy_fix(content))
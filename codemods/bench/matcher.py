@@ -0,0 +1,59 @@
+"""
+⏱️ MICROBENCHMARK - Moteur unifié vs passes séquentielles
+
+    python3 -m codemods.bench.matcher [fichier.ts] [-n RÉPÉTITIONS]
+
+Par défaut sur typeorm-role-assignment.repository.ts (plus gros repository).
+Deux entrées : le fichier tel quel (déjà conforme) et une variante "sale"
+où chaque InfrastructureException redevient un Error à un argument.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import timeit
+from pathlib import Path
+
+from codemods.bench.legacy import legacy_fix
+from codemods.rules import ThrowRewriteRule
+
+DEFAULT_TARGET = Path(
+    'src/infrastructure/database/sql/postgresql/repositories/typeorm-role-assignment.repository.ts'
+)
+
+
+def make_dirty(content: str) -> str:
+    """Réintroduit les violations : throw new Error(<message>) sans code"""
+    content = re.sub(r",\s*'[A-Z_]+',?(\s*)\)", r'\1)', content)
+    return content.replace('new InfrastructureException(', 'new Error(')
+
+
+def bench(content: str, number: int) -> tuple[float, float]:
+    rule = ThrowRewriteRule()
+    legacy = min(timeit.repeat(lambda: legacy_fix(content), number=number, repeat=5))
+    unified = min(timeit.repeat(lambda: rule.apply(content), number=number, repeat=5))
+    return legacy / number, unified / number
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='codemods.bench.matcher')
+    parser.add_argument('target', nargs='?', type=Path, default=DEFAULT_TARGET)
+    parser.add_argument('-n', '--number', type=int, default=200)
+    args = parser.parse_args(argv)
+
+    clean = args.target.read_text(encoding='utf-8')
+    lines = clean.count('\n') + 1
+    print(f'📄 {args.target} ({lines} lignes, {len(clean)} octets)')
+
+    for label, content in (('conforme', clean), ('violations', make_dirty(clean))):
+        legacy, unified = bench(content, args.number)
+        print(
+            f'  {label:<10} legacy={legacy * 1e6:8.1f} µs  '
+            f'unifié={unified * 1e6:8.1f} µs  x{legacy / unified:.2f}'
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,168 @@
+"""
+📈 SUITE - Benchmark de la chaîne de codemods sur des arbres synthétiques
+
+    python3 -m codemods.bench.suite                  # tous les scénarios
+    python3 -m codemods.bench.suite -s small -s wide # scénarios choisis
+    python3 -m codemods.bench.suite --quick          # tailles réduites (/10)
+    python3 -m codemods.bench.suite --baseline .codemods/bench/<ancien>.json
+
+Compare la logique des anciens fix_*_repo.py (série, un fichier à la fois)
+au moteur unifié (pool de processus), à froid et avec cache chaud. Chaque
+mesure tourne dans un sous-processus neuf pour isoler le pic de RSS
+(processus + workers). Les résultats sont écrits en JSON horodaté.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from codemods.bench.synthetic import generate_tree
+
+RESULTS_DIR = Path('.codemods/bench')
+MODES = ('legacy', 'unified', 'unified-cached')
+REGRESSION_THRESHOLD = 1.10
+SIZE_KEYS = ('files', 'lines_per_file', 'throws_per_file', 'imports_per_file')
+
+# nom : (fichiers, lignes par fichier, throws par fichier, imports par fichier)
+SCENARIOS = {
+    'small': (10, 1_000, 10, 12),
+    'medium': (200, 10_000, 60, 25),
+    'wide': (2_000, 1_000, 10, 12),
+    'deep': (10, 100_000, 400, 40),
+}
+
+
+def measure(mode: str, root: Path, jobs: int | None) -> dict:
+    """Exécuté dans le sous-processus : une seule mesure, puis rusage"""
+    from codemods.bench.legacy import legacy_fix_file
+    from codemods.cache import ContentCache, ruleset_version
+    from codemods.engine import discover, run
+    from codemods.rules import RULES
+
+    paths = discover(root)
+    cache = None
+    if mode == 'unified-cached':
+        cache = ContentCache(root / '.codemods/cache.json', ruleset_version(RULES))
+        run(paths, jobs=jobs, cache=cache)
+
+    started = time.perf_counter()
+    if mode == 'legacy':
+        for path in paths:
+            legacy_fix_file(str(path))
+    else:
+        run(paths, jobs=jobs, cache=cache)
+    elapsed = time.perf_counter() - started
+
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    workers = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return {'seconds': elapsed, 'peak_rss_kb': max(own, workers)}
+
+
+def run_scenario(name: str, scale: int, jobs: int | None) -> dict:
+    files, lines, throws, imports = SCENARIOS[name]
+    files, lines, throws = max(1, files // scale), max(100, lines // scale), max(1, throws // scale)
+    result: dict = {
+        'files': files, 'lines_per_file': lines, 'throws_per_file': throws, 'imports_per_file': imports,
+    }
+
+    for mode in MODES:
+        with tempfile.TemporaryDirectory(prefix='codemods-bench-') as tmp:
+            root = Path(tmp)
+            paths = generate_tree(root, files, throws, imports, lines)
+            size = sum(p.stat().st_size for p in paths)
+            command = [sys.executable, '-m', 'codemods.bench.suite', '--measure', mode, str(root)]
+            if jobs:
+                command += ['--jobs', str(jobs)]
+            output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+            measured = json.loads(output)
+
+        seconds = measured['seconds']
+        result['bytes'] = size
+        result[mode] = {
+            'seconds': round(seconds, 4),
+            'files_per_s': round(files / seconds, 1) if seconds else None,
+            'mb_per_s': round(size / 1e6 / seconds, 2) if seconds else None,
+            'peak_rss_kb': measured['peak_rss_kb'],
+        }
+    return result
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], check=True, capture_output=True, text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current: dict, baseline: dict) -> list[str]:
+    """Scénarios/modes plus lents que la référence au-delà du seuil"""
+    regressions = []
+    for name, scenario in current['scenarios'].items():
+        previous = baseline.get('scenarios', {}).get(name)
+        if not previous or any(previous.get(k) != scenario[k] for k in SIZE_KEYS):
+            continue
+        for mode in MODES:
+            before, after = previous.get(mode, {}).get('seconds'), scenario[mode]['seconds']
+            if before and after > before * REGRESSION_THRESHOLD:
+                regressions.append(f'{name}/{mode} : {before:.3f}s -> {after:.3f}s')
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='codemods.bench.suite')
+    parser.add_argument('-s', '--scenario', action='append', choices=sorted(SCENARIOS))
+    parser.add_argument('--quick', action='store_true', help='divise fichiers et lignes par 10')
+    parser.add_argument('-j', '--jobs', type=int, default=None)
+    parser.add_argument('--output', type=Path, default=None, help=f'fichier JSON (défaut : {RESULTS_DIR}/<date>.json)')
+    parser.add_argument('--baseline', type=Path, default=None, help='résultats précédents à comparer')
+    parser.add_argument('--measure', nargs=2, metavar=('MODE', 'ROOT'), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.measure:
+        mode, root = args.measure
+        json.dump(measure(mode, Path(root), args.jobs), sys.stdout)
+        return 0
+
+    scale = 10 if args.quick else 1
+    report = {
+        'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'revision': _git_revision(),
+        'scale': scale,
+        'scenarios': {},
+    }
+    for name in args.scenario or list(SCENARIOS):
+        scenario = run_scenario(name, scale, args.jobs)
+        report['scenarios'][name] = scenario
+        print(f"📦 {name}: {scenario['files']} fichiers x {scenario['lines_per_file']} lignes")
+        for mode in MODES:
+            m = scenario[mode]
+            print(
+                f"   {mode:<15} {m['seconds']:8.3f}s  {m['files_per_s']:>9} fichiers/s  "
+                f"{m['mb_per_s']:>7} Mo/s  RSS max {m['peak_rss_kb'] // 1024} Mo"
+            )
+
+    output = args.output or RESULTS_DIR / f"{report['date'].replace(':', '-')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding='utf-8')
+    print(f'💾 {output}')
+
+    if args.baseline:
+        regressions = compare(report, json.loads(args.baseline.read_text(encoding='utf-8')))
+        for line in regressions:
+            print(f'❌ régression {line}')
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+🏭 SYNTHETIC - Génération de repositories TypeORM synthétiques
+
+Chaque fichier contient M imports et N sites `throw new Error(...)` dans
+les formes rencontrées dans le vrai code (littéral, template multi-lignes,
+message traduit), complétés par du code de requête jusqu'à la taille voulue.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from codemods.engine import REPOSITORIES_GLOB
+from codemods.rules import TRANSLATE_KEY_CODES
+
+_TRANSLATE_KEYS = list(TRANSLATE_KEY_CODES)
+
+_THROW_FORMS = (
+    "      throw new Error('Failed to {verb} entity {i}');\n",
+    '      throw new Error(\n'
+    "        `Failed to {verb} entity {i}: ${{error instanceof Error ? error.message : 'Unknown error'}}`,\n"
+    '      );\n',
+    "      throw new Error(this.i18n.translate('{key}'));\n",
+    '      throw new Error(`Failed to {verb} ${{id}} ({i})`);\n',
+)
+
+_FILLER = (
+    "      const qb{i} = this.repository.createQueryBuilder('e{i}');\n"
+    "      qb{i}.where('e{i}.id = :id', {{ id }}).andWhere('e{i}.deleted_at IS NULL');\n"
+    "      // Tri stable (created_at puis id) pour la pagination\n"
+    "      qb{i}.orderBy('e{i}.created_at', 'DESC').addOrderBy('e{i}.id', 'ASC');\n"
+)
+
+
+def generate_repository(name: str, throws: int, imports: int, lines: int) -> str:
+    """Source d'un repository synthétique d'environ `lines` lignes"""
+    parts = [f"import {{ Injectable }} from '@nestjs/common';\n", "import { Repository } from 'typeorm';\n"]
+    for i in range(max(0, imports - 2)):
+        parts.append(f"import {{ Entity{i} }} from '../entities/entity-{i}.orm-entity';\n")
+    parts.append(f'\n@Injectable()\nexport class {name} {{\n')
+    parts.append('  constructor(private readonly repository: Repository<unknown>) {}\n\n')
+
+    body_lines = max(lines - len(parts) - 2, throws * 8)
+    per_method = max(8, body_lines // max(1, throws))
+    for i in range(throws):
+        form = _THROW_FORMS[i % len(_THROW_FORMS)]
+        method = [f'  async method{i}(id: string): Promise<void> {{\n', '    try {\n']
+        filler_lines = max(0, per_method - 8)
+        for j in range(filler_lines // 4):
+            method.append(_FILLER.format(i=f'{i}_{j}'))
+        method += [
+            '    } catch (error) {\n',
+            form.format(verb='load', i=i, key=_TRANSLATE_KEYS[i % len(_TRANSLATE_KEYS)]),
+            '    }\n',
+            '  }\n\n',
+        ]
+        parts.extend(method)
+    parts.append('}\n')
+    return ''.join(parts)
+
+
+def generate_tree(root: Path, files: int, throws: int, imports: int, lines: int) -> list[Path]:
+    """Écrit `files` repositories sous root/<REPOSITORIES_GLOB> et les retourne"""
+    directory = root / Path(REPOSITORIES_GLOB).parent
+    directory.mkdir(parents=True, exist_ok=True)
+    content = generate_repository('SyntheticRepository', throws, imports, lines)
+    paths = []
+    for i in range(files):
+        path = directory / f'typeorm-synthetic-{i:04d}.repository.ts'
+        path.write_text(content.replace('SyntheticRepository', f'Synthetic{i}Repository'), encoding='utf-8')
+        paths.append(path)
+    return paths
@@ -0,0 +1,106 @@
+"""
+💾 CACHE - Cache incrémental persistant (hash du contenu, version des règles)
+
+Un fichier dont le hash SHA-256 est connu comme "propre" pour la version
+courante du registre de règles est ignoré sans être analysé. Le couple
+(mtime_ns, taille) sert de raccourci pour éviter même la lecture du fichier.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Iterable
+
+from codemods.rules import Rule
+
+DEFAULT_CACHE_PATH = Path('.codemods/cache.json')
+
+
+def digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def ruleset_version(rules: Iterable[Rule]) -> str:
+    """Version du registre : change dès qu'une règle ou le code du paquet
+    change (tokenizer, matcher, graphe d'imports... pas seulement rules.py)"""
+    h = hashlib.sha256()
+    for rule in rules:
+        h.update(f'{rule.name}@{rule.version};'.encode())
+    package = Path(__file__).parent
+    for source in sorted(package.rglob('*.py')):
+        h.update(source.relative_to(package).as_posix().encode() + b'\0')
+        h.update(source.read_bytes())
+    return h.hexdigest()[:16]
+
+
+class ContentCache:
+    """Hashes des contenus déjà conformes + empreinte stat par chemin"""
+
+    def __init__(self, path: Path, version: str) -> None:
+        self.path = path
+        self.version = version
+        self.clean: set[str] = set()
+        self.stats: dict[str, tuple[int, int, str]] = {}
+        self.dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        if data.get('version') != self.version:
+            return
+        self.clean = set(data.get('clean', []))
+        self.stats = {p: tuple(s) for p, s in data.get('files', {}).items()}
+
+    def is_clean(self, path: str) -> bool:
+        """True si le fichier est déjà conforme (aucune règle à appliquer)"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+
+        known = self.stats.get(path)
+        if known and known[0] == st.st_mtime_ns and known[1] == st.st_size:
+            return known[2] in self.clean
+
+        with open(path, 'rb') as f:
+            content_digest = digest(f.read())
+        if content_digest not in self.clean:
+            return False
+        self._remember(path, st, content_digest)
+        return True
+
+    def mark_clean(self, path: str, content_digest: str) -> None:
+        """Enregistre le contenu final (conforme) d'un fichier traité"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return
+        self.clean.add(content_digest)
+        self._remember(path, st, content_digest)
+
+    def _remember(self, path: str, st: os.stat_result, content_digest: str) -> None:
+        entry = (st.st_mtime_ns, st.st_size, content_digest)
+        if self.stats.get(path) != entry:
+            self.stats[path] = entry
+            self.dirty = True
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        live = {s[2] for s in self.stats.values()}
+        data = {
+            'version': self.version,
+            'clean': sorted(self.clean & live),
+            'files': {p: list(s) for p, s in sorted(self.stats.items())},
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(data, indent=2), encoding='utf-8')
+        os.replace(tmp, self.path)
+        self.dirty = False
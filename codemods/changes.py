@@ -0,0 +1,62 @@
+"""
+🌿 CHANGES - Restriction aux fichiers modifiés (git) et à leurs importeurs directs
+
+Le hook de pre-commit n'a pas à retraiter tout src/ quand deux fichiers sont
+indexés : on part de `git diff --name-only` et on ajoute les fichiers qui
+importent directement un fichier modifié (via le graphe d'imports persistant).
+
+Avec --staged, c'est le contenu indexé qui est vérifié (staged_content), pas
+la copie de travail : c'est lui qui part dans le commit.
+"""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+from codemods.importgraph import ImportGraph
+
+SOURCE_EXTENSIONS = ('.ts',)
+
+
+def _git(root: Path, *args: str) -> list[str]:
+    output = subprocess.run(
+        ['git', *args], cwd=root, check=True, capture_output=True, text=True,
+    ).stdout
+    return [line for line in output.splitlines() if line]
+
+
+def changed_files(root: Path, staged: bool = False, ref: str = 'HEAD') -> list[str]:
+    """Fichiers TS ajoutés/modifiés/renommés (chemins relatifs à root)"""
+    if staged:
+        names = _git(root, 'diff', '--cached', '--name-only', '--diff-filter=ACMR')
+    else:
+        names = _git(root, 'diff', '--name-only', '--diff-filter=ACMR', ref)
+        names += _git(root, 'ls-files', '--others', '--exclude-standard')
+    return sorted({n for n in names if n.endswith(SOURCE_EXTENSIONS)})
+
+
+def staged_content(root: Path, path: str) -> bytes | None:
+    """Contenu indexé de `path` (relatif à root), None s'il n'est pas dans l'index"""
+    result = subprocess.run(
+        ['git', 'show', f':./{path}'], cwd=root, capture_output=True,
+    )
+    return result.stdout if result.returncode == 0 else None
+
+
+def direct_importers(root: Path, files: list[str]) -> list[str]:
+    """Fichiers de src/ qui importent directement l'un des `files`"""
+    graph = ImportGraph(root).refresh()
+    graph.save()
+    importers: set[str] = set()
+    for path in files:
+        importers |= graph.importers_of(path)
+    return sorted(importers)
+
+
+def select(root: Path, staged: bool = False, ref: str = 'HEAD', importers: bool = True) -> list[str]:
+    """Fichiers modifiés + (optionnellement) leurs importeurs directs"""
+    files = changed_files(root, staged=staged, ref=ref)
+    if importers and files:
+        files = sorted(set(files) | set(direct_importers(root, files)))
+    return files
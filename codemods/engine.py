@@ -0,0 +1,150 @@
+"""
+⚙️ ENGINE - Découverte des fichiers et exécution parallèle des règles
+"""
+
+from __future__ import annotations
+
+import difflib
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from codemods.cache import ContentCache, digest
+from codemods.changes import staged_content
+from codemods.rules import RULES, Rule
+
+REPOSITORIES_GLOB = 'src/infrastructure/database/sql/postgresql/repositories/*.ts'
+
+
+@dataclass
+class FileResult:
+    """Résultat de l'application des règles sur un fichier"""
+
+    path: str
+    changed: bool = False
+    written: bool = False
+    cached: bool = False
+    digest: str = ''
+    diff: str = ''
+    counts: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+
+def discover(root: Path) -> list[Path]:
+    """Liste triée des repositories TypeORM à traiter"""
+    return sorted(root.glob(REPOSITORIES_GLOB))
+
+
+def apply_rules(content: str, rules: Iterable[Rule] = RULES) -> tuple[str, dict[str, int]]:
+    """Applique chaque règle dans l'ordre du registre, sans I/O"""
+    counts: Counter[str] = Counter()
+    for rule in rules:
+        content, rule_counts = rule.apply(content)
+        counts.update(rule_counts)
+    return content, dict(counts)
+
+
+def process_file(path: str, write: bool = True, diff: bool = False, staged: bool = False) -> FileResult:
+    """Lit et corrige un fichier ; ne l'écrit que si `write` et s'il a changé.
+    Avec `staged`, le contenu vérifié est celui de l'index (jamais écrit)."""
+    if staged:
+        target = Path(path)
+        raw = staged_content(target.parent, target.name)
+        if raw is None:
+            return FileResult(path=path)
+        write = False
+    else:
+        with open(path, 'rb') as f:
+            raw = f.read()
+    original = raw.decode('utf-8')
+
+    content, counts = apply_rules(original)
+    if content == original:
+        # Jamais de réécriture à l'identique : le mtime ne bouge pas
+        return FileResult(path=path, digest=digest(raw), counts=counts)
+
+    result = FileResult(path=path, changed=True, counts=counts)
+    if diff:
+        result.diff = ''.join(
+            difflib.unified_diff(
+                original.splitlines(keepends=True),
+                content.splitlines(keepends=True),
+                fromfile=f'a/{path}',
+                tofile=f'b/{path}',
+            )
+        )
+    if write:
+        encoded = content.encode('utf-8')
+        with open(path, 'wb') as f:
+            f.write(encoded)
+        result.written = True
+        result.digest = digest(encoded)
+    return result
+
+
+def run(
+    paths: Iterable[Path],
+    jobs: int | None = None,
+    cache: ContentCache | None = None,
+    write: bool = True,
+    diff: bool = False,
+    staged: bool = False,
+) -> list[FileResult]:
+    """Traite tous les fichiers en une passe sur un pool de processus"""
+    return sorted(iter_run(paths, jobs, cache, write, diff, staged), key=lambda r: r.path)
+
+
+def iter_run(
+    paths: Iterable[Path],
+    jobs: int | None = None,
+    cache: ContentCache | None = None,
+    write: bool = True,
+    diff: bool = False,
+    staged: bool = False,
+) -> Iterator[FileResult]:
+    """Comme run(), mais produit les résultats au fil de l'eau (diffs en flux).
+    Le cache décrit les copies de travail : il est ignoré avec `staged`."""
+    if staged:
+        cache = None
+    targets = [str(p) for p in paths]
+    skipped = {p for p in targets if cache and cache.is_clean(p)}
+    pending = [p for p in targets if p not in skipped]
+
+    results: list[FileResult] = []
+    for path in sorted(skipped):
+        results.append(FileResult(path=path, cached=True))
+        yield results[-1]
+    for result in _run_pending(pending, jobs, write, diff, staged):
+        results.append(result)
+        yield result
+
+    if cache is not None:
+        # Seul un contenu sur disque conforme est mémorisé comme propre
+        for result in results:
+            if result.digest:
+                cache.mark_clean(result.path, result.digest)
+        cache.save()
+
+
+def _run_pending(
+    targets: list[str], jobs: int | None, write: bool, diff: bool, staged: bool,
+) -> Iterator[FileResult]:
+    if not targets:
+        return
+
+    worker = partial(process_file, write=write, diff=diff, staged=staged)
+    workers = min(jobs or os.cpu_count() or 1, len(targets))
+    if workers <= 1:
+        yield from map(worker, targets)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunksize = max(1, len(targets) // (workers * 4))
+        yield from pool.map(worker, targets, chunksize=chunksize)
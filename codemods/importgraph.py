@@ -0,0 +1,240 @@
+"""
+🕸️ IMPORT GRAPH - Index persistant et incrémental des imports de src/
+
+Pour chaque fichier : imports (spécifieur, cible résolue, noms importés,
+positions de l'instruction) et bornes du bloc d'imports de tête. Les alias
+tsconfig (@domain, @application, @infrastructure, @presentation, @shared)
+sont lus depuis tsconfig.json.
+
+Seuls les fichiers dont (mtime_ns, taille) a changé sont re-parsés ; l'index
+inverse ("qui importe X") est reconstruit en mémoire au chargement.
+
+    python3 -m codemods.importgraph importers src/shared/exceptions/shared.exceptions.ts
+    python3 -m codemods.importgraph imports src/app.module.ts
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import posixpath
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+DEFAULT_GRAPH_PATH = Path('.codemods/imports.json')
+GRAPH_VERSION = 1
+
+# Instruction complète : import/export ... from '...'; (positions conservées)
+_IMPORT_STATEMENT = re.compile(
+    r'''^[ \t]*(?:import|export)\b(?P<clause>[^;'"]*?\bfrom\b)?\s*(?P<quote>['"])(?P<specifier>[^'"\n]+)(?P=quote)[ \t]*;?''',
+    re.M,
+)
+_CLAUSE_NAMES = re.compile(r'[A-Za-z_$][\w$]*')
+_CLAUSE_KEYWORDS = {'import', 'export', 'type', 'from', 'as'}
+_JSON_COMMENT = re.compile(r'//[^\n]*|/\*.*?\*/', re.S)
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    specifier: str
+    start: int
+    end: int
+    names: tuple[str, ...]
+    # Chemin visé sans extension (src/... ) ou None pour un paquet npm
+    target: str | None = None
+
+
+def parse_imports(text: str) -> list[ImportRecord]:
+    """Instructions import/export ... from de `text`, dans l'ordre"""
+    if 'import' not in text and 'export' not in text:
+        return []
+    records = []
+    for match in _IMPORT_STATEMENT.finditer(text):
+        clause = match.group('clause') or ''
+        # "B as C" : seul l'alias local C est lié dans le fichier
+        clause = re.sub(r'[\w$]+\s+as\s+', '', clause)
+        names = tuple(n for n in _CLAUSE_NAMES.findall(clause) if n not in _CLAUSE_KEYWORDS)
+        records.append(ImportRecord(match.group('specifier'), match.start(), match.end(), names))
+    return records
+
+
+def import_block(text: str, records: list[ImportRecord] | None = None) -> tuple[int, int] | None:
+    """Bornes du bloc d'imports de tête (du premier au dernier import)"""
+    imports = [r for r in (parse_imports(text) if records is None else records) if text.startswith('import', r.start)]
+    if not imports:
+        return None
+    return imports[0].start, imports[-1].end
+
+
+def load_aliases(root: Path) -> dict[str, str]:
+    """compilerOptions.paths de tsconfig.json : {'@shared/': 'src/shared/'}"""
+    try:
+        raw = (root / 'tsconfig.json').read_text(encoding='utf-8')
+    except OSError:
+        return {}
+    try:
+        config = json.loads(raw)
+    except ValueError:
+        config = json.loads(_JSON_COMMENT.sub('', raw))
+    options = config.get('compilerOptions', {})
+    base = options.get('baseUrl', '.')
+    aliases = {}
+    for pattern, targets in options.get('paths', {}).items():
+        if pattern.endswith('/*') and targets and targets[0].endswith('/*'):
+            target = posixpath.normpath(posixpath.join(base, targets[0][:-2]))
+            aliases[pattern[:-1]] = f'{target}/'
+    return aliases
+
+
+def module_keys(path: str) -> tuple[str, ...]:
+    """Formes sous lesquelles un fichier peut être importé (sans extension)"""
+    stem = path[: -len('.ts')] if path.endswith('.ts') else path
+    if stem.endswith('/index'):
+        return stem, stem[: -len('/index')]
+    return (stem,)
+
+
+class ImportGraph:
+    """Graphe des imports de src/ avec requêtes directes et inverses"""
+
+    def __init__(self, root: Path, path: Path | None = None) -> None:
+        self.root = root
+        self.path = path or root / DEFAULT_GRAPH_PATH
+        self.aliases = load_aliases(root)
+        self.files: dict[str, dict] = {}
+        self.dirty = False
+        self._importers: dict[str, set[str]] | None = None
+        self._load()
+
+    # ---- persistance -------------------------------------------------
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        if data.get('version') == GRAPH_VERSION and data.get('aliases') == self.aliases:
+            self.files = data.get('files', {})
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix('.tmp')
+        data = {'version': GRAPH_VERSION, 'aliases': self.aliases, 'files': self.files}
+        tmp.write_text(json.dumps(data, separators=(',', ':')), encoding='utf-8')
+        os.replace(tmp, self.path)
+        self.dirty = False
+
+    # ---- mise à jour incrémentale --------------------------------------
+
+    def refresh(self) -> 'ImportGraph':
+        """Re-parse uniquement les fichiers ajoutés ou modifiés"""
+        seen = set()
+        for dirpath, dirnames, filenames in os.walk(self.root / 'src'):
+            dirnames[:] = [d for d in dirnames if d != 'node_modules']
+            for filename in filenames:
+                if not filename.endswith('.ts') or filename.endswith('.d.ts'):
+                    continue
+                full = os.path.join(dirpath, filename)
+                path = Path(full).relative_to(self.root).as_posix()
+                seen.add(path)
+                st = os.stat(full)
+                entry = self.files.get(path)
+                if entry and entry['mtime_ns'] == st.st_mtime_ns and entry['size'] == st.st_size:
+                    continue
+                self._index(path, full, st)
+
+        for path in set(self.files) - seen:
+            del self.files[path]
+            self.dirty = True
+        self._importers = None
+        return self
+
+    def _index(self, path: str, full: str, st: os.stat_result) -> None:
+        with open(full, 'r', encoding='utf-8') as f:
+            text = f.read()
+        records = parse_imports(text)
+        self.files[path] = {
+            'mtime_ns': st.st_mtime_ns,
+            'size': st.st_size,
+            'block': import_block(text, records),
+            'imports': [
+                [r.specifier, r.start, r.end, list(r.names), self.resolve(path, r.specifier)]
+                for r in records
+            ],
+        }
+        self.dirty = True
+
+    # ---- résolution ----------------------------------------------------
+
+    def resolve(self, importer: str, specifier: str) -> str | None:
+        """Chemin visé sans extension, pour un import relatif ou aliasé"""
+        for alias, target in self.aliases.items():
+            if specifier.startswith(alias):
+                return target + specifier[len(alias):]
+        if specifier.startswith('.'):
+            return posixpath.normpath(posixpath.join(posixpath.dirname(importer), specifier))
+        return None
+
+    # ---- requêtes --------------------------------------------------------
+
+    def imports_of(self, path: str) -> list[ImportRecord]:
+        entry = self.files.get(path)
+        if entry is None:
+            return []
+        return [
+            ImportRecord(spec, start, end, tuple(names), target)
+            for spec, start, end, names, target in entry['imports']
+        ]
+
+    def import_block_of(self, path: str) -> tuple[int, int] | None:
+        entry = self.files.get(path)
+        return tuple(entry['block']) if entry and entry['block'] else None
+
+    def importers_of(self, path: str) -> set[str]:
+        """Fichiers qui importent directement `path`"""
+        if self._importers is None:
+            self._importers = {}
+            for importer, entry in self.files.items():
+                for *_, target in entry['imports']:
+                    if target:
+                        self._importers.setdefault(target, set()).add(importer)
+        found: set[str] = set()
+        for key in module_keys(path):
+            found |= self._importers.get(key, set())
+        return found
+
+    def is_imported(self, path: str, name: str, module: str | None = None) -> bool:
+        """`name` est-il importé dans `path` (optionnellement depuis `module`) ?"""
+        for record in self.imports_of(path):
+            if name in record.names and (module is None or module in (record.specifier, record.target)):
+                return True
+        return False
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='codemods.importgraph', description="Index des imports de src/")
+    parser.add_argument('query', choices=('importers', 'imports', 'refresh'))
+    parser.add_argument('path', nargs='?')
+    parser.add_argument('--root', type=Path, default=Path('.'))
+    args = parser.parse_args(argv)
+
+    graph = ImportGraph(args.root).refresh()
+    graph.save()
+    if args.query == 'importers' and args.path:
+        for importer in sorted(graph.importers_of(args.path)):
+            print(importer)
+    elif args.query == 'imports' and args.path:
+        for record in graph.imports_of(args.path):
+            print(f'{record.specifier} -> {record.target or "(paquet)"} [{", ".join(record.names)}]')
+    else:
+        print(f'🕸️  {len(graph.files)} fichiers indexés')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
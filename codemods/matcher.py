@@ -0,0 +1,108 @@
+"""
+🎯 MATCHER - Réécriture des `throw new X(...)` à partir des spans du tokenizer
+
+Le tokenizer trouve chaque site en un seul balayage linéaire ; les
+variantes d'argument (message traduit, ...) sont compilées en UNE
+alternance et `match.lastgroup` donne le code d'erreur à injecter.
+Tout autre argument unique reçoit le code par défaut ; un appel sans
+argument reçoit le message et le code par défaut (le constructeur
+d'InfrastructureException exige les deux).
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, Sequence
+
+from codemods.tokenizer import CallSpan, find_throw_calls
+
+RENAMED_EXCEPTION = 'InfrastructureException'
+REWRITTEN_CALLEES = ('Error', RENAMED_EXCEPTION)
+
+
+@dataclass(frozen=True)
+class ThrowVariant:
+    """Forme d'argument reconnue et code d'erreur à injecter"""
+
+    name: str
+    argument: str
+    code: str | Callable[[re.Match[str], str], str]
+
+    def pattern(self, group: str) -> str:
+        """Motif de l'argument, avec ses sous-groupes préfixés par `group`"""
+        return self.argument.replace('{group}', group)
+
+
+class ThrowMatcher:
+    """Compile les variantes en un automate unique et réécrit les spans"""
+
+    rename_rule = 'error-to-infrastructure-exception'
+    inject_rule = 'error-code-injection'
+
+    def __init__(
+        self,
+        variants: Sequence[ThrowVariant],
+        default_code: str,
+        default_message: str,
+    ) -> None:
+        self.default_code = default_code
+        self.default_message = default_message
+        self.variants = {f'v{i}': v for i, v in enumerate(variants)}
+        alternatives = [
+            rf'(?P<{group}>{variant.pattern(group)})'
+            for group, variant in self.variants.items()
+        ]
+        self.pattern = re.compile('|'.join(alternatives) or r'(?!)')
+
+    def code_for(self, argument: str) -> str:
+        match = self.pattern.fullmatch(argument)
+        if match is None:
+            return self.default_code
+        group = match.lastgroup
+        code = self.variants[group].code
+        return code(match, group) if callable(code) else code
+
+    def rewrite(self, content: str) -> tuple[str, Counter[str]]:
+        counts: Counter[str] = Counter()
+        if 'throw' not in content:
+            return content, counts
+
+        edits: list[tuple[int, int, str]] = []
+        for call in find_throw_calls(content):
+            if call.callee not in REWRITTEN_CALLEES:
+                continue
+            if call.callee == 'Error':
+                edits.append((call.callee_start, call.callee_end, RENAMED_EXCEPTION))
+                counts[self.rename_rule] += 1
+            if len(call.args) == 1:
+                edits.append(self._inject(content, call))
+                counts[self.inject_rule] += 1
+            elif not call.args:
+                edits.append((
+                    call.open_paren + 1,
+                    call.close_paren,
+                    f"'{self.default_message}', '{self.default_code}'",
+                ))
+                counts[self.inject_rule] += 1
+
+        # Assemblage en une seule passe (pas de recopie du fichier par édition)
+        pieces, cursor = [], 0
+        for start, end, replacement in sorted(edits):
+            pieces += (content[cursor:start], replacement)
+            cursor = end
+        pieces.append(content[cursor:])
+        return ''.join(pieces), counts
+
+    def _inject(self, content: str, call: CallSpan) -> tuple[int, int, str]:
+        """Insertion du code juste après l'argument unique"""
+        arg_start, arg_end = call.args[0]
+        code = self.code_for(content[arg_start:arg_end])
+        leading = content[call.open_paren + 1:arg_start]
+        if '\n' not in leading:
+            return arg_end, arg_end, f", '{code}'"
+        # Forme multi-lignes (prettier) : un argument par ligne, virgule finale
+        indent = leading[leading.rfind('\n') + 1:]
+        suffix = '' if call.trailing_comma else ','
+        return arg_end, arg_end, f",\n{indent}'{code}'{suffix}"
@@ -0,0 +1,101 @@
+"""
+📋 RULES - Registre des règles de correction des repositories
+
+Chaque règle est une transformation pure (contenu -> contenu, nombre de
+corrections) : le moteur se charge des I/O et de la parallélisation.
+L'ordre du registre est l'ordre d'application.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+
+from codemods.importgraph import import_block, parse_imports
+from codemods.matcher import ThrowMatcher, ThrowVariant
+
+INFRASTRUCTURE_EXCEPTION_IMPORT = (
+    "import { InfrastructureException } from '@shared/exceptions/shared.exceptions';"
+)
+DEFAULT_ERROR_CODE = 'INFRASTRUCTURE_ERROR'
+DEFAULT_ERROR_MESSAGE = 'Infrastructure error'
+
+# Codes spécifiques pour les messages traduits (ex-fix_rbac_context_repo.py)
+TRANSLATE_KEY_CODES = {
+    'rbac.businessContext.saveError': 'RBAC_SAVE_ERROR',
+    'rbac.businessContext.findError': 'RBAC_FIND_ERROR',
+    'rbac.businessContext.findAllError': 'RBAC_FIND_ALL_ERROR',
+    'rbac.businessContext.existsError': 'RBAC_EXISTS_ERROR',
+    'rbac.businessContext.deleteError': 'RBAC_DELETE_ERROR',
+    'rbac.businessContext.statsError': 'RBAC_STATS_ERROR',
+}
+
+class Rule:
+    """Règle de base : un nom stable et une transformation pure"""
+
+    name = 'rule'
+    version = 1
+
+    def apply(self, content: str) -> tuple[str, Counter[str]]:
+        """Retourne le contenu réécrit et le nombre de corrections par règle"""
+        raise NotImplementedError
+
+
+def _translate_code(match: re.Match[str], group: str) -> str:
+    return TRANSLATE_KEY_CODES.get(match.group(f'{group}_key'), DEFAULT_ERROR_CODE)
+
+
+THROW_VARIANTS = [
+    ThrowVariant(
+        name='translated-message',
+        argument=r"this\.i18n\.translate\('(?P<{group}_key>[\w.]+)'\)",
+        code=_translate_code,
+    ),
+]
+
+
+class ThrowRewriteRule(Rule):
+    """Error -> InfrastructureException et injection des codes, en une passe"""
+
+    name = 'throw-rewrite'
+    version = 4
+
+    def __init__(self) -> None:
+        self.matcher = ThrowMatcher(
+            THROW_VARIANTS, DEFAULT_ERROR_CODE, DEFAULT_ERROR_MESSAGE,
+        )
+
+    def apply(self, content: str) -> tuple[str, Counter[str]]:
+        return self.matcher.rewrite(content)
+
+
+class InfrastructureImportRule(Rule):
+    """Insère l'import d'InfrastructureException à la fin du bloc d'imports"""
+
+    name = 'infrastructure-exception-import'
+    version = 2
+    usage = re.compile(r'\bnew\s+InfrastructureException\(')
+
+    def apply(self, content: str) -> tuple[str, Counter[str]]:
+        if not self.usage.search(content):
+            return content, Counter()
+
+        records = parse_imports(content)
+        if any('InfrastructureException' in record.names for record in records):
+            return content, Counter()
+
+        block = import_block(content, records)
+        if block is None:
+            return f'{INFRASTRUCTURE_EXCEPTION_IMPORT}\n{content}', Counter({self.name: 1})
+
+        offset = block[1]
+        return (
+            f'{content[:offset]}\n{INFRASTRUCTURE_EXCEPTION_IMPORT}{content[offset:]}',
+            Counter({self.name: 1}),
+        )
+
+
+RULES: list[Rule] = [
+    ThrowRewriteRule(),
+    InfrastructureImportRule(),
+]
@@ -0,0 +1,109 @@
+"""
+🧪 CACHE - Cache incrémental par hash de contenu et version des règles
+
+    python3 -m unittest discover -s codemods/tests -t .
+"""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from codemods import cache as cache_module
+from codemods.cache import ContentCache, digest, ruleset_version
+from codemods.rules import RULES
+
+
+class RulesetVersionTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.package = Path(tmp.name) / 'codemods'
+        self.package.mkdir()
+        for name in ('cache.py', 'rules.py', 'tokenizer.py'):
+            (self.package / name).write_text(f'# {name}\n', encoding='utf-8')
+
+    def version(self) -> str:
+        fake_file = str(self.package / 'cache.py')
+        with mock.patch.object(cache_module, '__file__', fake_file):
+            return ruleset_version(RULES)
+
+    def test_version_is_stable_for_unchanged_sources(self) -> None:
+        self.assertEqual(self.version(), self.version())
+
+    def test_version_changes_when_any_package_module_changes(self) -> None:
+        # Régression : seule une modification de rules.py changeait la version
+        before = self.version()
+        (self.package / 'tokenizer.py').write_text('# v2\n', encoding='utf-8')
+
+        self.assertNotEqual(self.version(), before)
+
+    def test_version_changes_when_a_module_is_added(self) -> None:
+        before = self.version()
+        (self.package / 'matcher.py').write_text('', encoding='utf-8')
+
+        self.assertNotEqual(self.version(), before)
+
+
+class ContentCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        self.cache_path = self.root / '.codemods' / 'cache.json'
+        self.source = self.root / 'repo.ts'
+        self.source.write_bytes(b'export class Repo {}\n')
+
+    def mark(self, cache: ContentCache) -> None:
+        cache.mark_clean(str(self.source), digest(self.source.read_bytes()))
+
+    def test_unknown_file_is_not_clean(self) -> None:
+        cache = ContentCache(self.cache_path, 'v1')
+
+        self.assertFalse(cache.is_clean(str(self.source)))
+        self.assertFalse(cache.is_clean(str(self.root / 'missing.ts')))
+
+    def test_marked_file_is_clean_across_saves(self) -> None:
+        cache = ContentCache(self.cache_path, 'v1')
+        self.mark(cache)
+        cache.save()
+
+        self.assertTrue(ContentCache(self.cache_path, 'v1').is_clean(str(self.source)))
+
+    def test_modified_content_is_not_clean(self) -> None:
+        cache = ContentCache(self.cache_path, 'v1')
+        self.mark(cache)
+
+        self.source.write_bytes(b'export class Repo { x = 1; }\n')
+
+        self.assertFalse(cache.is_clean(str(self.source)))
+
+    def test_identical_content_is_clean_without_stat_match(self) -> None:
+        cache = ContentCache(self.cache_path, 'v1')
+        self.mark(cache)
+        cache.save()
+
+        # Même contenu réécrit (mtime différent) : retrouvé par son hash
+        other = self.root / 'copy.ts'
+        other.write_bytes(self.source.read_bytes())
+
+        self.assertTrue(ContentCache(self.cache_path, 'v1').is_clean(str(other)))
+
+    def test_other_ruleset_version_discards_the_cache(self) -> None:
+        cache = ContentCache(self.cache_path, 'v1')
+        self.mark(cache)
+        cache.save()
+
+        self.assertFalse(ContentCache(self.cache_path, 'v2').is_clean(str(self.source)))
+
+    def test_corrupt_cache_file_is_ignored(self) -> None:
+        self.cache_path.parent.mkdir(parents=True)
+        self.cache_path.write_text('{not json', encoding='utf-8')
+
+        self.assertFalse(ContentCache(self.cache_path, 'v1').is_clean(str(self.source)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+🧪 CHANGES - Sélection des fichiers modifiés (git) et de leurs importeurs
+
+    python3 -m unittest discover -s codemods/tests -t .
+"""
+
+from __future__ import annotations
+
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+
+from codemods.changes import changed_files, select, staged_content
+
+
+def git(root: Path, *args: str) -> None:
+    subprocess.run(['git', *args], cwd=root, check=True, capture_output=True)
+
+
+class ChangesTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        git(self.root, 'init', '-q')
+        git(self.root, 'config', 'user.email', 'tests@example.com')
+        git(self.root, 'config', 'user.name', 'tests')
+
+        self.write('src/shared/a.ts', 'export const a = 1;\n')
+        self.write('src/domain/b.ts', "import { a } from '../shared/a';\n")
+        self.write('src/domain/c.ts', 'export const c = 3;\n')
+        self.write('README.md', '# fixture\n')
+        git(self.root, 'add', '-A')
+        git(self.root, 'commit', '-q', '-m', 'fixture')
+
+    def write(self, path: str, text: str) -> None:
+        target = self.root / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(text, encoding='utf-8')
+
+    def test_nothing_changed(self) -> None:
+        self.assertEqual(changed_files(self.root), [])
+        self.assertEqual(select(self.root), [])
+
+    def test_modified_and_untracked_typescript_files_only(self) -> None:
+        self.write('src/domain/c.ts', 'export const c = 4;\n')
+        self.write('src/domain/new.ts', 'export {};\n')
+        self.write('README.md', '# changed\n')
+
+        self.assertEqual(
+            changed_files(self.root),
+            ['src/domain/c.ts', 'src/domain/new.ts'],
+        )
+
+    def test_deleted_files_are_not_selected(self) -> None:
+        (self.root / 'src/domain/c.ts').unlink()
+
+        self.assertEqual(changed_files(self.root), [])
+
+    def test_staged_selection_ignores_unstaged_changes(self) -> None:
+        self.write('src/domain/c.ts', 'export const c = 4;\n')
+        git(self.root, 'add', 'src/domain/c.ts')
+        self.write('src/shared/a.ts', 'export const a = 2;\n')
+
+        self.assertEqual(changed_files(self.root, staged=True), ['src/domain/c.ts'])
+
+    def test_changes_since_a_reference(self) -> None:
+        self.write('src/domain/c.ts', 'export const c = 4;\n')
+        git(self.root, 'commit', '-q', '-am', 'change c')
+
+        self.assertEqual(changed_files(self.root), [])
+        self.assertEqual(changed_files(self.root, ref='HEAD~1'), ['src/domain/c.ts'])
+
+    def test_direct_importers_are_added(self) -> None:
+        self.write('src/shared/a.ts', 'export const a = 2;\n')
+
+        self.assertEqual(
+            select(self.root),
+            ['src/domain/b.ts', 'src/shared/a.ts'],
+        )
+        self.assertEqual(select(self.root, importers=False), ['src/shared/a.ts'])
+
+    def test_staged_content_is_the_index_version(self) -> None:
+        self.write('src/domain/c.ts', 'export const c = 4;\n')
+        git(self.root, 'add', 'src/domain/c.ts')
+        self.write('src/domain/c.ts', 'export const c = 5;\n')
+
+        self.assertEqual(
+            staged_content(self.root, 'src/domain/c.ts'),
+            b'export const c = 4;\n',
+        )
+        self.assertIsNone(staged_content(self.root, 'src/domain/untracked.ts'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+"""
+🧪 IMPORT GRAPH - Index persistant et incrémental des imports de src/
+
+    python3 -m unittest discover -s codemods/tests -t .
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from codemods import importgraph
+from codemods.importgraph import ImportGraph, import_block, parse_imports
+
+TSCONFIG = """{
+  // commentaires autorisés par tsc
+  "compilerOptions": {
+    "baseUrl": ".",
+    "paths": { "@shared/*": ["src/shared/*"], "@domain/*": ["src/domain/*"] }
+  }
+}
+"""
+
+
+class ParseImportsTest(unittest.TestCase):
+    def test_names_specifiers_and_aliases(self) -> None:
+        text = (
+            "import { A, B as C } from './a';\n"
+            "import type { D } from \"@shared/d\";\n"
+            "import * as E from 'pkg';\n"
+            "export { F } from './f';\n"
+            "import './side-effect';\n"
+        )
+        records = parse_imports(text)
+
+        self.assertEqual(
+            [(r.specifier, r.names) for r in records],
+            [
+                ('./a', ('A', 'C')),
+                ('@shared/d', ('D',)),
+                ('pkg', ('E',)),
+                ('./f', ('F',)),
+                ('./side-effect', ()),
+            ],
+        )
+        self.assertEqual(text[records[0].start:records[0].end], "import { A, B as C } from './a';")
+
+    def test_multiline_import(self) -> None:
+        text = "import {\n  A,\n  B,\n} from './a';\nconst x = 1;\n"
+        [record] = parse_imports(text)
+
+        self.assertEqual(record.names, ('A', 'B'))
+        self.assertEqual(text[record.end - 1], ';')
+
+    def test_import_block_spans_leading_imports_only(self) -> None:
+        text = "import { A } from './a';\nimport { B } from './b';\n\nexport { C } from './c';\n"
+
+        self.assertEqual(import_block(text), (0, text.index('\n\n')))
+        self.assertIsNone(import_block('const x = 1;\n'))
+
+
+class ImportGraphTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        (self.root / 'tsconfig.json').write_text(TSCONFIG, encoding='utf-8')
+
+        self.write('src/shared/errors.ts', 'export class E {}\n')
+        self.write('src/shared/index.ts', "export { E } from './errors';\n")
+        self.write('src/domain/user.ts', "import { E } from '@shared/errors';\n")
+        self.write('src/domain/order.ts', "import { E } from '../shared';\nimport { X } from 'pkg';\n")
+        self.write('src/domain/user.d.ts', "import { E } from '@shared/errors';\n")
+
+    def write(self, path: str, text: str) -> None:
+        target = self.root / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(text, encoding='utf-8')
+
+    def graph(self) -> ImportGraph:
+        return ImportGraph(self.root).refresh()
+
+    def test_aliases_are_read_from_tsconfig(self) -> None:
+        self.assertEqual(
+            ImportGraph(self.root).aliases,
+            {'@shared/': 'src/shared/', '@domain/': 'src/domain/'},
+        )
+
+    def test_resolution_of_relative_aliased_and_package_imports(self) -> None:
+        graph = self.graph()
+
+        self.assertEqual(
+            [r.target for r in graph.imports_of('src/domain/order.ts')],
+            ['src/shared', None],
+        )
+        self.assertEqual(
+            [r.target for r in graph.imports_of('src/domain/user.ts')],
+            ['src/shared/errors'],
+        )
+
+    def test_importers_include_index_imports(self) -> None:
+        graph = self.graph()
+
+        self.assertEqual(
+            graph.importers_of('src/shared/errors.ts'),
+            {'src/domain/user.ts', 'src/shared/index.ts'},
+        )
+        self.assertEqual(graph.importers_of('src/shared/index.ts'), {'src/domain/order.ts'})
+        self.assertNotIn('src/domain/user.d.ts', graph.files)
+
+    def test_is_imported(self) -> None:
+        graph = self.graph()
+
+        self.assertTrue(graph.is_imported('src/domain/user.ts', 'E'))
+        self.assertTrue(graph.is_imported('src/domain/user.ts', 'E', '@shared/errors'))
+        self.assertTrue(graph.is_imported('src/domain/user.ts', 'E', 'src/shared/errors'))
+        self.assertFalse(graph.is_imported('src/domain/user.ts', 'E', './other'))
+        self.assertFalse(graph.is_imported('src/domain/user.ts', 'X'))
+
+    def test_persisted_graph_is_reused(self) -> None:
+        self.graph().save()
+
+        with mock.patch.object(importgraph, 'parse_imports', wraps=parse_imports) as parse:
+            graph = self.graph()
+
+        parse.assert_not_called()
+        self.assertFalse(graph.dirty)
+        self.assertEqual(graph.importers_of('src/shared/index.ts'), {'src/domain/order.ts'})
+
+    def test_only_changed_files_are_reparsed(self) -> None:
+        self.graph().save()
+        self.write('src/domain/user.ts', "import { E } from '../shared';\n")
+        path = self.root / 'src/domain/user.ts'
+        # mtime explicite : la réécriture peut tomber dans la même tranche de temps
+        os.utime(path, ns=(1, 1))
+
+        with mock.patch.object(importgraph, 'parse_imports', wraps=parse_imports) as parse:
+            graph = self.graph()
+
+        self.assertEqual(parse.call_count, 1)
+        self.assertEqual(
+            graph.importers_of('src/shared/index.ts'),
+            {'src/domain/order.ts', 'src/domain/user.ts'},
+        )
+
+    def test_deleted_files_leave_the_graph(self) -> None:
+        self.graph().save()
+        (self.root / 'src/domain/user.ts').unlink()
+
+        graph = self.graph()
+
+        self.assertNotIn('src/domain/user.ts', graph.files)
+        self.assertEqual(graph.importers_of('src/shared/errors.ts'), {'src/shared/index.ts'})
+
+    def test_alias_change_discards_the_persisted_graph(self) -> None:
+        self.graph().save()
+        data = json.loads((self.root / importgraph.DEFAULT_GRAPH_PATH).read_text(encoding='utf-8'))
+        self.assertIn('src/domain/user.ts', data['files'])
+
+        (self.root / 'tsconfig.json').write_text('{"compilerOptions": {}}', encoding='utf-8')
+
+        self.assertEqual(ImportGraph(self.root).files, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+🧪 RULES - Réécriture des `throw` et import d'InfrastructureException
+
+    python3 -m unittest discover -s codemods/tests -t .
+"""
+
+from __future__ import annotations
+
+import unittest
+
+from codemods.rules import (
+    DEFAULT_ERROR_CODE,
+    DEFAULT_ERROR_MESSAGE,
+    INFRASTRUCTURE_EXCEPTION_IMPORT,
+    RULES,
+    ThrowRewriteRule,
+)
+
+
+def apply_all(content: str) -> str:
+    for rule in RULES:
+        content, _ = rule.apply(content)
+    return content
+
+
+class ThrowRewriteRuleTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.rule = ThrowRewriteRule()
+
+    def test_single_argument_gets_default_code(self) -> None:
+        content, counts = self.rule.apply("throw new Error('boom');")
+
+        self.assertEqual(
+            content,
+            f"throw new InfrastructureException('boom', '{DEFAULT_ERROR_CODE}');",
+        )
+        self.assertEqual(counts['error-to-infrastructure-exception'], 1)
+        self.assertEqual(counts['error-code-injection'], 1)
+
+    def test_translated_message_gets_its_code(self) -> None:
+        content, _ = self.rule.apply(
+            "throw new Error(this.i18n.translate('rbac.businessContext.saveError'));"
+        )
+
+        self.assertIn("'RBAC_SAVE_ERROR')", content)
+
+    def test_zero_argument_error_gets_default_message_and_code(self) -> None:
+        content, counts = self.rule.apply('throw new Error();')
+
+        self.assertEqual(
+            content,
+            'throw new InfrastructureException('
+            f"'{DEFAULT_ERROR_MESSAGE}', '{DEFAULT_ERROR_CODE}');",
+        )
+        self.assertEqual(counts['error-code-injection'], 1)
+
+    def test_zero_argument_exception_is_completed(self) -> None:
+        content, counts = self.rule.apply('throw new InfrastructureException( );')
+
+        self.assertEqual(
+            content,
+            'throw new InfrastructureException('
+            f"'{DEFAULT_ERROR_MESSAGE}', '{DEFAULT_ERROR_CODE}');",
+        )
+        self.assertNotIn('error-to-infrastructure-exception', counts)
+
+    def test_complete_calls_are_left_untouched(self) -> None:
+        source = "throw new InfrastructureException('boom', 'SAVE_ERROR');"
+
+        content, counts = self.rule.apply(source)
+
+        self.assertEqual(content, source)
+        self.assertEqual(sum(counts.values()), 0)
+
+    def test_multiline_argument_keeps_prettier_layout(self) -> None:
+        content, _ = self.rule.apply(
+            'throw new Error(\n'
+            "  'a message long enough to wrap',\n"
+            ');'
+        )
+
+        self.assertEqual(
+            content,
+            'throw new InfrastructureException(\n'
+            "  'a message long enough to wrap',\n"
+            f"  '{DEFAULT_ERROR_CODE}',\n"
+            ');',
+        )
+
+
+class RegistryTest(unittest.TestCase):
+    def test_rewritten_file_imports_the_exception_once(self) -> None:
+        content = apply_all(
+            "import { Injectable } from '@nestjs/common';\n"
+            '\n'
+            'export class Repo {\n'
+            '  a() { throw new Error(); }\n'
+            "  b() { throw new Error('boom'); }\n"
+            '}\n'
+        )
+
+        self.assertEqual(content.count(INFRASTRUCTURE_EXCEPTION_IMPORT), 1)
+        self.assertNotIn('new Error(', content)
+        self.assertEqual(apply_all(content), content)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+"""
+🧪 TOKENIZER - Extraction des appels `throw new X(...)`
+
+    python3 -m unittest discover -s codemods/tests -t .
+"""
+
+from __future__ import annotations
+
+import unittest
+
+from codemods.tokenizer import CallSpan, Scanner, find_throw_calls
+
+
+def calls(source: str) -> list[CallSpan]:
+    return list(find_throw_calls(source))
+
+
+def args_of(source: str, call: CallSpan) -> list[str]:
+    return [source[start:end] for start, end in call.args]
+
+
+class FindThrowCallsTest(unittest.TestCase):
+    def test_spans_of_a_simple_call(self) -> None:
+        source = "if (!x) throw new Error('boom', code);"
+        [call] = calls(source)
+
+        self.assertEqual(call.callee, 'Error')
+        self.assertEqual(source[call.callee_start:call.callee_end], 'Error')
+        self.assertEqual(source[call.open_paren], '(')
+        self.assertEqual(source[call.close_paren], ')')
+        self.assertEqual(args_of(source, call), ["'boom'", 'code'])
+        self.assertFalse(call.trailing_comma)
+
+    def test_zero_argument_call(self) -> None:
+        source = 'throw new Error( );'
+        [call] = calls(source)
+
+        self.assertEqual(call.args, ())
+
+    def test_parentheses_and_commas_inside_strings(self) -> None:
+        source = """throw new Error("a, (b", 'c)', "d\\"),");"""
+        [call] = calls(source)
+
+        self.assertEqual(args_of(source, call), ['"a, (b"', "'c)'", '"d\\"),"'])
+        self.assertEqual(call.close_paren, len(source) - 2)
+
+    def test_template_literal_with_nested_expressions(self) -> None:
+        source = 'throw new Error(`id ${fn(a, `x${b})`)} ) , done`, code);'
+        [call] = calls(source)
+
+        self.assertEqual(
+            args_of(source, call),
+            ['`id ${fn(a, `x${b})`)} ) , done`', 'code'],
+        )
+
+    def test_nested_parentheses_and_brackets(self) -> None:
+        source = 'throw new Error(format(a, [b, c], { d: (e, f) }), code,);'
+        [call] = calls(source)
+
+        self.assertEqual(
+            args_of(source, call),
+            ['format(a, [b, c], { d: (e, f) })', 'code'],
+        )
+        self.assertTrue(call.trailing_comma)
+
+    def test_comments_are_ignored(self) -> None:
+        source = (
+            '// throw new Error(commented)\n'
+            '/* throw new Error(block) */\n'
+            'throw new Error(/* ) , */ msg // )\n'
+            ');'
+        )
+        [call] = calls(source)
+
+        self.assertEqual(args_of(source, call), ['msg'])
+
+    def test_throw_inside_string_or_template_is_not_a_call(self) -> None:
+        source = (
+            "const a = 'throw new Error(x)';\n"
+            'const b = `throw new Error(${y})`;\n'
+        )
+
+        self.assertEqual(calls(source), [])
+
+    def test_regex_literal_with_parenthesis(self) -> None:
+        source = 'const re = /\\(/; throw new Error(re.source);'
+        [call] = calls(source)
+
+        self.assertEqual(args_of(source, call), ['re.source'])
+
+    def test_nested_throw_calls_are_both_reported(self) -> None:
+        source = 'throw new Error(wrap(() => { throw new TypeError(a); }));'
+        found = calls(source)
+
+        self.assertEqual([call.callee for call in found], ['TypeError', 'Error'])
+        inner, outer = found
+        self.assertEqual(args_of(source, inner), ['a'])
+        self.assertLess(outer.open_paren, inner.open_paren)
+        self.assertGreater(outer.close_paren, inner.close_paren)
+
+    def test_identifier_ending_in_throw_is_not_a_call(self) -> None:
+        self.assertEqual(calls('rethrow new Error(x);'), [])
+
+
+class ScannerTest(unittest.TestCase):
+    def test_token_kinds(self) -> None:
+        source = "a('x', `y`) // z"
+        kinds = [token.kind for token in Scanner(source).tokens()]
+
+        self.assertEqual(
+            kinds,
+            ['code', 'open', 'string', 'comma', 'code', 'template', 'close', 'code', 'comment'],
+        )
+
+    def test_advance_reports_string_context(self) -> None:
+        source = "x = 'throw new Error(a)'; throw new Error(b);"
+        scanner = Scanner(source)
+
+        in_code, _ = scanner.advance(0, source.index('throw'))
+        self.assertFalse(in_code)
+        in_code, _ = scanner.advance(0, source.rindex('throw'))
+        self.assertTrue(in_code)
+
+
+if __name__ == '__main__':
+    unittest.main()
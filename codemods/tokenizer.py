@@ -0,0 +1,261 @@
+"""
+🔤 TOKENIZER - Scanner TypeScript minimal pour les codemods
+
+Comprend juste assez de TypeScript pour ne jamais se tromper de parenthèse :
+chaînes '...' / "...", template literals (avec ${...} imbriqués),
+commentaires, littéraux regex et profondeur des crochets ( [ {.
+
+Le reste du code est regroupé en tokens "code" aussi longs que possible.
+Pour trouver les throws, les candidats `throw new X(` sont cherchés par
+regex puis validés en avançant jusqu'à eux avec un motif "code ou chaîne
+ou commentaire" exécuté en C (un appel `match` couvre des centaines de
+tokens) ; seuls les templates, les "/" et les arguments des throws sont
+scannés token par token en Python.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Generator, Iterator
+
+# Un seul motif maître : la première alternative qui correspond gagne
+_FINE = re.compile(
+    r"""
+    (?P<code>[^'"`/(){}\[\],]+)
+  | (?P<comment>//[^\n]*|/\*.*?(?:\*/|\Z))
+  | (?P<string>'(?:[^'\\\n]|\\.)*'?|"(?:[^"\\\n]|\\.)*"?)
+  | (?P<template>`)
+  | (?P<open>[(\[{])
+  | (?P<close>[)\]}])
+  | (?P<comma>,)
+  | (?P<slash>/)
+    """,
+    re.S | re.X,
+)
+# Code, chaînes et commentaires enchaînés : s'arrête sur ` et / (ambigus)
+_SKIPPABLE = re.compile(
+    r"""
+    (?:
+        [^'"`/]+
+      | '(?:[^'\\\n]|\\.)*'
+      | "(?:[^"\\\n]|\\.)*"
+      | //[^\n]*(?=\n)
+      | /\*.*?\*/
+    )*
+    """,
+    re.S | re.X,
+)
+_REGEX_BODY = re.compile(r'/(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[a-z]*')
+_TEMPLATE_CHUNK = re.compile(r'(?:[^`\\$]|\\.|\$(?!\{))*')
+_KEYWORDS_BEFORE_EXPRESSION = re.compile(
+    r'(?<![\w$])(?:return|typeof|instanceof|in|of|new|delete|void|throw|case|do|else|yield|await)\s*$'
+)
+# Pas de lookbehind en tête : il désactiverait la recherche rapide du
+# préfixe littéral "throw" ; la frontière de mot est vérifiée à la main
+_THROW_NEW = re.compile(r'throw\s+new\s+([A-Za-z_$][\w$]*)\s*\(')
+_THROW_NEW_TAIL = re.compile(r'(?<![\w$.])throw\s+new\s+([A-Za-z_$][\w$]*)\s*\($')
+
+
+@dataclass(frozen=True)
+class Token:
+    kind: str
+    start: int
+    end: int
+
+
+@dataclass(frozen=True)
+class CallSpan:
+    """`throw new X(...)` : positions du callee, des parenthèses et des arguments"""
+
+    callee: str
+    callee_start: int
+    callee_end: int
+    open_paren: int
+    close_paren: int
+    args: tuple[tuple[int, int], ...]
+    trailing_comma: bool
+
+
+def _drain(generator: Generator[Token, None, int]) -> int:
+    try:
+        while True:
+            next(generator)
+    except StopIteration as stop:
+        return stop.value
+
+
+class Scanner:
+    """Découpe une source TypeScript en tokens, en flux"""
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+
+    def tokens(self, pos: int = 0) -> Iterator[Token]:
+        yield from self._scan(pos, nested=False)
+
+    def advance(self, pos: int, target: int) -> tuple[bool, int]:
+        """Avance de `pos` vers `target` ; (True, target) si `target` est en
+        contexte code, sinon (False, fin du token chaîne/commentaire/... qui le contient)"""
+        source = self.source
+        while True:
+            pos = _SKIPPABLE.match(source, pos, target).end()
+            if pos == target:
+                return True, pos
+            token = next(self._scan(pos, nested=False))
+            pos = token.end
+            if pos > target:
+                return False, pos
+
+    def _scan(self, pos: int, nested: bool) -> Generator[Token, None, int]:
+        """Tokens à partir de `pos` ; en mode imbriqué (${...}), s'arrête
+        sur l'accolade fermante de profondeur 0 et retourne sa position"""
+        source = self.source
+        length = len(source)
+        depth = 0
+        previous = ''
+
+        while pos < length:
+            match = _FINE.match(source, pos)
+            kind = match.lastgroup
+            end = match.end()
+
+            if kind == 'template':
+                end = self._template_end(end)
+            elif kind == 'slash':
+                # Premier token d'un scan repris en cours de route : on regarde la source
+                before = previous or source[max(0, pos - 32):pos]
+                regex = _REGEX_BODY.match(source, pos) if self._regex_allowed(before) else None
+                kind, end = ('regex', regex.end()) if regex else ('code', end)
+            elif kind == 'open' and source[pos] == '{':
+                depth += 1
+            elif kind == 'close' and source[pos] == '}':
+                if nested and depth == 0:
+                    return pos
+                depth -= 1
+
+            if kind != 'comment':
+                previous = source[pos:end]
+            yield Token(kind, pos, end)
+            pos = end
+
+        return length
+
+    def _template_end(self, pos: int) -> int:
+        """Position juste après le backtick fermant (pos suit l'ouvrant)"""
+        source = self.source
+        length = len(source)
+        while pos < length:
+            pos = _TEMPLATE_CHUNK.match(source, pos).end()
+            if pos >= length:
+                break
+            if source[pos] == '`':
+                return pos + 1
+            # ${ expression } : on scanne l'expression jusqu'à son "}"
+            pos = _drain(self._scan(pos + 2, nested=True)) + 1
+        return length
+
+    @staticmethod
+    def _regex_allowed(previous: str) -> bool:
+        """Un "/" ouvre une regex s'il ne peut pas être une division"""
+        text = previous.rstrip()
+        if not text:
+            return True
+        if text[-1] in ')]}' or text[-1].isalnum() or text[-1] in '_$\'"`':
+            return bool(_KEYWORDS_BEFORE_EXPRESSION.search(text))
+        return True
+
+
+def find_throw_calls(source: str) -> Iterator[CallSpan]:
+    """Toutes les expressions `throw new X(...)`, y compris imbriquées"""
+    if 'throw' not in source:
+        return
+
+    scanner = Scanner(source)
+    pos = 0
+    for candidate in _THROW_NEW.finditer(source):
+        start = candidate.start()
+        if start < pos or (start and (source[start - 1].isalnum() or source[start - 1] in '_$.')):
+            continue
+        in_code, pos = scanner.advance(pos, candidate.start())
+        if in_code:
+            close = yield from _parse_call(scanner, candidate)
+            pos = close + 1
+
+
+def _parse_call(scanner: Scanner, throw: re.Match[str]) -> Generator[CallSpan, None, int]:
+    """Scan fin depuis la parenthèse ouvrante ; retourne la position de la fermante"""
+    source = scanner.source
+    # Pile de cadres : None pour un crochet quelconque, dict pour un throw
+    stack: list[dict | None] = []
+
+    def open_frame(callee: re.Match[str], paren: int) -> dict:
+        return {
+            'callee': callee.group(1),
+            'callee_start': callee.start(1),
+            'callee_end': callee.end(1),
+            'open': paren,
+            'args': [],
+            'arg_start': None,
+            'arg_end': None,
+            'comma': False,
+        }
+
+    def touch(start: int, end: int) -> None:
+        """Étend l'argument courant du throw au sommet de la pile"""
+        frame = stack[-1] if stack else None
+        if frame is None:
+            return
+        if frame['arg_start'] is None:
+            frame['arg_start'] = start
+        frame['arg_end'] = end
+        frame['comma'] = False
+
+    stack.append(open_frame(throw, throw.end() - 1))
+    for token in scanner.tokens(throw.end()):
+        kind = token.kind
+        if kind == 'comment':
+            continue
+
+        if kind == 'code':
+            text = source[token.start:token.end]
+            stripped = text.strip()
+            if stripped:
+                offset = token.start + len(text) - len(text.lstrip())
+                touch(offset, offset + len(stripped))
+        elif kind == 'open':
+            touch(token.start, token.end)
+            frame = None
+            if source[token.start] == '(':
+                nested = _THROW_NEW_TAIL.search(source, max(0, token.start - 200), token.end)
+                if nested:
+                    frame = open_frame(nested, token.start)
+            stack.append(frame)
+        elif kind == 'close':
+            frame = stack.pop() if stack else None
+            if frame is not None:
+                if frame['arg_start'] is not None:
+                    frame['args'].append((frame['arg_start'], frame['arg_end']))
+                yield CallSpan(
+                    callee=frame['callee'],
+                    callee_start=frame['callee_start'],
+                    callee_end=frame['callee_end'],
+                    open_paren=frame['open'],
+                    close_paren=token.start,
+                    args=tuple(frame['args']),
+                    trailing_comma=frame['comma'],
+                )
+            if not stack:
+                return token.start
+            touch(token.start, token.end)
+        elif kind == 'comma':
+            frame = stack[-1] if stack else None
+            if frame is not None:
+                if frame['arg_start'] is not None:
+                    frame['args'].append((frame['arg_start'], frame['arg_end']))
+                frame['arg_start'] = frame['arg_end'] = None
+                frame['comma'] = True
+        else:
+            touch(token.start, token.end)
+
+    return len(source)
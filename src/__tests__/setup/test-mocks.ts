@@ -124,6 +124,8 @@ export const createMockAppointmentRepository = () => ({
   findByStatus: jest.fn(),
   search: jest.fn(),
   save: jest.fn(),
+  create: jest.fn(),
+  createMany: jest.fn(),
   delete: jest.fn(),
   findConflictingAppointments: jest.fn(),
   findAvailableSlots: jest.fn(),
@@ -0,0 +1,215 @@
+/**
+ * 🧪 Tests unitaires pour AvailableSlotsCache
+ *
+ * - Lecture / écriture par (calendrier, service, praticien, jour, durée)
+ * - Expiration (TTL) et éviction LRU bornée en octets
+ * - Invalidation exacte des jours touchés sur un calendrier
+ * - Statistiques de taux de succès
+ * - Diffusion des invalidations entre instances
+ */
+
+import type {
+  ISlotsCacheInvalidationBus,
+  SlotsCacheInvalidation,
+} from "@application/ports/slots-cache-invalidation.port";
+import {
+  AvailableSlotsCache,
+  SlotGrid,
+} from "@application/services/available-slots-cache.service";
+
+const grid = (slotCount = 16): SlotGrid => ({
+  slotDurationMs: 30 * 60000,
+  starts: new Float64Array(slotCount),
+  occupied: new Uint8Array(slotCount),
+  price: 50,
+});
+
+const key = (calendarId: string, day: number, serviceId = "service-1") => ({
+  calendarId,
+  serviceId,
+  day: new Date(2030, 0, day, 10),
+});
+
+describe("AvailableSlotsCache", () => {
+  let now: number;
+  let cache: AvailableSlotsCache;
+
+  beforeEach(() => {
+    now = 0;
+    cache = new AvailableSlotsCache(64 * 1024, 60000, () => now);
+  });
+
+  it("should return a stored grid for the same day regardless of the hour", () => {
+    const stored = grid();
+    cache.set(key("calendar-1", 7), stored);
+
+    expect(
+      cache.get({ ...key("calendar-1", 7), day: new Date(2030, 0, 7, 23) }),
+    ).toBe(stored);
+    expect(cache.get(key("calendar-1", 8))).toBeUndefined();
+    expect(
+      cache.get({ ...key("calendar-1", 7), staffId: "staff-1" }),
+    ).toBeUndefined();
+    expect(
+      cache.get({ ...key("calendar-1", 7), duration: 60 }),
+    ).toBeUndefined();
+  });
+
+  it("should expire entries after the TTL", () => {
+    cache.set(key("calendar-1", 7), grid());
+
+    now = 59999;
+    expect(cache.get(key("calendar-1", 7))).toBeDefined();
+
+    now = 60000;
+    expect(cache.get(key("calendar-1", 7))).toBeUndefined();
+    expect(cache.stats().entries).toBe(0);
+  });
+
+  it("should evict least recently used entries beyond the byte budget", () => {
+    const small = new AvailableSlotsCache(2500, 60000, () => now);
+    small.set(key("calendar-1", 1), grid(64));
+    small.set(key("calendar-1", 2), grid(64));
+    small.get(key("calendar-1", 1));
+    small.set(key("calendar-1", 3), grid(64));
+
+    expect(small.get(key("calendar-1", 1))).toBeDefined();
+    expect(small.get(key("calendar-1", 2))).toBeUndefined();
+    expect(small.get(key("calendar-1", 3))).toBeDefined();
+    expect(small.stats().evictions).toBe(1);
+    expect(small.stats().bytes).toBeLessThanOrEqual(2500);
+  });
+
+  it("should invalidate only the touched days of the calendar", () => {
+    cache.set(key("calendar-1", 7), grid());
+    cache.set(key("calendar-1", 7, "service-2"), grid());
+    cache.set(key("calendar-1", 8), grid());
+    cache.set(key("calendar-1", 9), grid());
+    cache.set(key("calendar-2", 7), grid());
+
+    cache.invalidate(
+      "calendar-1",
+      new Date(2030, 0, 7, 23, 30),
+      new Date(2030, 0, 8, 0, 30),
+    );
+
+    expect(cache.get(key("calendar-1", 7))).toBeUndefined();
+    expect(cache.get(key("calendar-1", 7, "service-2"))).toBeUndefined();
+    expect(cache.get(key("calendar-1", 8))).toBeUndefined();
+    expect(cache.get(key("calendar-1", 9))).toBeDefined();
+    expect(cache.get(key("calendar-2", 7))).toBeDefined();
+    expect(cache.stats().invalidations).toBe(3);
+  });
+
+  it("should not touch the next day when an appointment ends at midnight", () => {
+    cache.set(key("calendar-1", 7), grid());
+    cache.set(key("calendar-1", 8), grid());
+
+    cache.invalidate(
+      "calendar-1",
+      new Date(2030, 0, 7, 23),
+      new Date(2030, 0, 8),
+    );
+
+    expect(cache.get(key("calendar-1", 7))).toBeUndefined();
+    expect(cache.get(key("calendar-1", 8))).toBeDefined();
+  });
+
+  it("should invalidate every cached day of a calendar", () => {
+    cache.set(key("calendar-1", 7), grid());
+    cache.set({ ...key("calendar-1", 7), day: new Date(2035, 5, 1) }, grid());
+    cache.set(key("calendar-2", 7), grid());
+
+    cache.invalidateCalendar("calendar-1");
+
+    expect(cache.get(key("calendar-1", 7))).toBeUndefined();
+    expect(
+      cache.get({ ...key("calendar-1", 7), day: new Date(2035, 5, 1) }),
+    ).toBeUndefined();
+    expect(cache.get(key("calendar-2", 7))).toBeDefined();
+    expect(cache.stats().invalidations).toBe(2);
+  });
+
+  it("should report the hit rate", () => {
+    cache.set(key("calendar-1", 7), grid());
+
+    cache.get(key("calendar-1", 7));
+    cache.get(key("calendar-1", 7));
+    cache.get(key("calendar-1", 7));
+    cache.get(key("calendar-1", 8));
+
+    expect(cache.stats()).toMatchObject({
+      hits: 3,
+      misses: 1,
+      hitRate: 0.75,
+      entries: 1,
+    });
+  });
+
+  describe("invalidation bus", () => {
+    let published: SlotsCacheInvalidation[];
+    let deliver: (invalidation: SlotsCacheInvalidation) => void;
+    let bus: ISlotsCacheInvalidationBus;
+
+    beforeEach(async () => {
+      published = [];
+      bus = {
+        publish: jest.fn(async (invalidation) => {
+          published.push(invalidation);
+        }),
+        subscribe: jest.fn(async (handler) => {
+          deliver = handler;
+        }),
+      };
+      await cache.connect(bus);
+    });
+
+    it("should broadcast local invalidations", () => {
+      cache.set(key("calendar-1", 7), grid());
+
+      cache.invalidate(
+        "calendar-1",
+        new Date(2030, 0, 7, 9),
+        new Date(2030, 0, 7, 10),
+      );
+
+      expect(cache.get(key("calendar-1", 7))).toBeUndefined();
+      expect(published).toEqual([
+        {
+          calendarId: "calendar-1",
+          startTime: new Date(2030, 0, 7, 9),
+          endTime: new Date(2030, 0, 7, 10),
+        },
+      ]);
+    });
+
+    it("should apply remote invalidations without broadcasting them", () => {
+      cache.set(key("calendar-1", 7), grid());
+
+      deliver({
+        calendarId: "calendar-1",
+        startTime: new Date(2030, 0, 7, 9),
+        endTime: new Date(2030, 0, 7, 10),
+      });
+
+      expect(cache.get(key("calendar-1", 7))).toBeUndefined();
+      expect(bus.publish).not.toHaveBeenCalled();
+      expect(cache.stats().remoteInvalidations).toBe(1);
+    });
+
+    it("should count failed broadcasts without throwing", async () => {
+      (bus.publish as jest.Mock).mockRejectedValueOnce(new Error("down"));
+
+      expect(() =>
+        cache.invalidate(
+          "calendar-1",
+          new Date(2030, 0, 7, 9),
+          new Date(2030, 0, 7, 10),
+        ),
+      ).not.toThrow();
+      await new Promise((resolve) => setImmediate(resolve));
+
+      expect(cache.stats().broadcastFailures).toBe(1);
+    });
+  });
+});
@@ -0,0 +1,180 @@
+/**
+ * 🧪 FREE/BUSY SERVICE - UNIT TESTS
+ * ✅ Créneaux servis depuis les bitmaps partagés
+ * ✅ Invalidation par génération
+ */
+
+import type { IFreeBusyStore } from "@application/ports/free-busy-store.port";
+import { FreeBusyService } from "@application/services/free-busy.service";
+import type {
+  CalendarFreeBusy,
+  CalendarRepository,
+} from "@domain/repositories/calendar.repository.interface";
+import { CalendarId } from "@domain/value-objects/calendar-id.value-object";
+import { createMockLogger } from "../../mocks";
+
+const CALENDAR_A = "660e8400-e29b-41d4-a716-446655440001";
+const UNKNOWN_CALENDAR = "660e8400-e29b-41d4-a716-446655440009";
+
+class InMemoryFreeBusyStore implements IFreeBusyStore {
+  readonly generations = new Map<string, number>();
+  readonly days = new Map<string, string>();
+
+  async getGenerations(calendarIds: readonly string[]): Promise<number[]> {
+    return calendarIds.map((id) => this.generations.get(id) ?? 0);
+  }
+
+  async bumpGeneration(calendarId: string): Promise<void> {
+    this.generations.set(
+      calendarId,
+      (this.generations.get(calendarId) ?? 0) + 1,
+    );
+  }
+
+  async getDays(keys: readonly string[]): Promise<(string | null)[]> {
+    return keys.map((key) => this.days.get(key) ?? null);
+  }
+
+  async setDays(entries: ReadonlyMap<string, string>): Promise<void> {
+    entries.forEach((value, key) => this.days.set(key, value));
+  }
+}
+
+describe("FreeBusyService", () => {
+  let service: FreeBusyService;
+  let store: InMemoryFreeBusyStore;
+  let calendarRepository: jest.Mocked<
+    Pick<CalendarRepository, "findFreeBusy">
+  >;
+
+  const at = (hour: number, minute = 0) =>
+    new Date(2099, 0, 14, hour, minute).getTime();
+  const periodStart = new Date(2099, 0, 14);
+  const periodEnd = new Date(2099, 0, 15);
+
+  const freeBusy = (
+    overrides: Partial<CalendarFreeBusy> = {},
+  ): CalendarFreeBusy => ({
+    calendarId: CalendarId.create(CALENDAR_A),
+    slotStepMinutes: null,
+    openRanges: [{ startMs: at(9), endMs: at(12) }],
+    busyRanges: [{ startMs: at(10), endMs: at(10, 30) }],
+    ...overrides,
+  });
+
+  const starts = (result: Awaited<ReturnType<typeof findSlots>>) =>
+    result[0].slots.map((slot) => {
+      const time = slot.getStartTime();
+      return `${time.getHours()}:${String(time.getMinutes()).padStart(2, "0")}`;
+    });
+
+  const findSlots = (from = periodStart) =>
+    service.findAvailableSlots(
+      [CalendarId.create(CALENDAR_A)],
+      from,
+      periodEnd,
+      30,
+    );
+
+  beforeEach(() => {
+    store = new InMemoryFreeBusyStore();
+    calendarRepository = {
+      findFreeBusy: jest.fn().mockResolvedValue([freeBusy()]),
+    };
+
+    service = new FreeBusyService(
+      calendarRepository as unknown as CalendarRepository,
+      store,
+      createMockLogger(),
+    );
+  });
+
+  it("should return free slots within opening hours", async () => {
+    const result = await findSlots();
+
+    expect(starts(result)).toEqual(["9:00", "9:30", "10:30", "11:00", "11:30"]);
+    expect(calendarRepository.findFreeBusy).toHaveBeenCalledWith(
+      [CalendarId.create(CALENDAR_A)],
+      periodStart,
+      periodEnd,
+    );
+  });
+
+  it("should align slots on the calendar step", async () => {
+    calendarRepository.findFreeBusy.mockResolvedValue([
+      freeBusy({ slotStepMinutes: 15 }),
+    ]);
+
+    const result = await findSlots();
+
+    expect(starts(result)).toEqual([
+      "9:00",
+      "9:15",
+      "9:30",
+      "10:30",
+      "10:45",
+      "11:00",
+      "11:15",
+      "11:30",
+    ]);
+  });
+
+  it("should resume a started opening range at the next step", async () => {
+    const result = await findSlots(new Date(at(10, 40)));
+
+    expect(starts(result)).toEqual(["11:00", "11:30"]);
+  });
+
+  it("should serve cached days without querying the repository", async () => {
+    await findSlots();
+    calendarRepository.findFreeBusy.mockClear();
+
+    const result = await findSlots();
+
+    expect(calendarRepository.findFreeBusy).not.toHaveBeenCalled();
+    expect(starts(result)).toHaveLength(5);
+  });
+
+  it("should reload a calendar once it is invalidated", async () => {
+    await findSlots();
+    calendarRepository.findFreeBusy.mockResolvedValue([
+      freeBusy({
+        busyRanges: [
+          { startMs: at(10), endMs: at(10, 30) },
+          { startMs: at(11), endMs: at(11, 30) },
+        ],
+      }),
+    ]);
+
+    await service.invalidate(CalendarId.create(CALENDAR_A));
+    const result = await findSlots();
+
+    expect(calendarRepository.findFreeBusy).toHaveBeenCalledTimes(2);
+    expect(starts(result)).toEqual(["9:00", "9:30", "10:30", "11:30"]);
+  });
+
+  it("should skip unknown calendars", async () => {
+    const result = await service.findAvailableSlots(
+      [CalendarId.create(UNKNOWN_CALENDAR), CalendarId.create(CALENDAR_A)],
+      periodStart,
+      periodEnd,
+      30,
+    );
+
+    expect(result.map((entry) => entry.calendarId.getValue())).toEqual([
+      CALENDAR_A,
+    ]);
+  });
+
+  it("should fall back to the repository when the store is down", async () => {
+    jest
+      .spyOn(store, "getGenerations")
+      .mockRejectedValue(new Error("redis down"));
+    const setDays = jest.spyOn(store, "setDays");
+
+    const result = await findSlots();
+
+    expect(starts(result)).toHaveLength(5);
+    expect(setDays).not.toHaveBeenCalled();
+  });
+});
@@ -0,0 +1,215 @@
+/**
+ * 🧪 NEXT AVAILABLE SLOT INDEX SERVICE - UNIT TESTS
+ * ✅ Recalcul, invalidation et lecture de l'index des prochains créneaux
+ */
+
+import { NextAvailableSlotIndexService } from "@application/services/next-available-slot-index.service";
+import type { CalendarRepository } from "@domain/repositories/calendar.repository.interface";
+import type { NextAvailableSlotRepository } from "@domain/repositories/next-available-slot.repository.interface";
+import type { ServiceRepository } from "@domain/repositories/service.repository.interface";
+import { BusinessId } from "@domain/value-objects/business-id.value-object";
+import { CalendarId } from "@domain/value-objects/calendar-id.value-object";
+import { ServiceId } from "@domain/value-objects/service-id.value-object";
+import { TimeSlot } from "@domain/value-objects/time-slot.value-object";
+import { createMockLogger } from "../../mocks";
+
+const BUSINESS_ID = "550e8400-e29b-41d4-a716-446655440000";
+const SERVICE_ID = "770e8400-e29b-41d4-a716-446655440002";
+const CALENDAR_A = "660e8400-e29b-41d4-a716-446655440001";
+const CALENDAR_B = "660e8400-e29b-41d4-a716-446655440005";
+
+describe("NextAvailableSlotIndexService", () => {
+  let service: NextAvailableSlotIndexService;
+  let nextSlotRepository: jest.Mocked<NextAvailableSlotRepository>;
+  let calendarRepository: jest.Mocked<
+    Pick<CalendarRepository, "findIdsByBusinessId" | "findAvailableSlots">
+  >;
+  let serviceRepository: jest.Mocked<
+    Pick<ServiceRepository, "findById" | "findActiveByBusinessId">
+  >;
+
+  const key = {
+    businessId: BusinessId.create(BUSINESS_ID),
+    serviceId: ServiceId.create(SERVICE_ID),
+  };
+
+  beforeEach(() => {
+    nextSlotRepository = {
+      findEarliestByBusinessIds: jest.fn(),
+      findEarliest: jest.fn(),
+      replace: jest.fn(),
+      enqueue: jest.fn(),
+      markStale: jest.fn(),
+      findRefreshKeys: jest.fn(),
+      findUnindexedKeys: jest.fn().mockResolvedValue([]),
+    };
+    calendarRepository = {
+      findIdsByBusinessId: jest
+        .fn()
+        .mockResolvedValue([
+          CalendarId.create(CALENDAR_A),
+          CalendarId.create(CALENDAR_B),
+        ]),
+      findAvailableSlots: jest.fn(),
+    };
+    serviceRepository = {
+      findById: jest.fn().mockResolvedValue({
+        isActive: () => true,
+        getDefaultDuration: () => 30,
+      }),
+      findActiveByBusinessId: jest
+        .fn()
+        .mockResolvedValue([{ id: ServiceId.create(SERVICE_ID) }]),
+    };
+
+    service = new NextAvailableSlotIndexService(
+      nextSlotRepository,
+      calendarRepository as unknown as CalendarRepository,
+      serviceRepository as unknown as ServiceRepository,
+      createMockLogger(),
+    );
+  });
+
+  describe("refresh", () => {
+    it("should store the first free slot of each calendar", async () => {
+      const first = TimeSlot.create(
+        new Date(2099, 0, 14, 9, 0),
+        new Date(2099, 0, 14, 9, 30),
+      );
+      calendarRepository.findAvailableSlots.mockResolvedValue([
+        {
+          calendarId: CalendarId.create(CALENDAR_A),
+          slots: [
+            first,
+            TimeSlot.create(
+              new Date(2099, 0, 14, 10, 0),
+              new Date(2099, 0, 14, 10, 30),
+            ),
+          ],
+        },
+        { calendarId: CalendarId.create(CALENDAR_B), slots: [] },
+      ]);
+
+      await service.refresh(key);
+
+      expect(calendarRepository.findAvailableSlots).toHaveBeenCalledTimes(1);
+      expect(calendarRepository.findAvailableSlots.mock.calls[0][3]).toBe(30);
+
+      const [replacedKey, entries, startedAt] =
+        nextSlotRepository.replace.mock.calls[0];
+      expect(replacedKey).toBe(key);
+      expect(entries).toHaveLength(2);
+      expect(entries[0].calendarId.getValue()).toBe(CALENDAR_A);
+      expect(entries[0].startTime).toEqual(first.getStartTime());
+      expect(entries[0].endTime).toEqual(first.getEndTime());
+      expect(entries[1].startTime).toBeNull();
+      expect(entries[1].computedAt).toBe(startedAt);
+    });
+
+    it("should clear the entries of a deleted service", async () => {
+      serviceRepository.findById.mockResolvedValue(null);
+
+      await service.refresh(key);
+
+      expect(calendarRepository.findAvailableSlots).not.toHaveBeenCalled();
+      expect(nextSlotRepository.replace).toHaveBeenCalledWith(
+        key,
+        [],
+        expect.any(Date),
+      );
+    });
+
+    it("should clear the entries of a deactivated service", async () => {
+      serviceRepository.findById.mockResolvedValue({
+        isActive: () => false,
+        getDefaultDuration: () => 30,
+      } as any);
+
+      await service.refresh(key);
+
+      expect(calendarRepository.findAvailableSlots).not.toHaveBeenCalled();
+      expect(nextSlotRepository.replace).toHaveBeenCalledWith(
+        key,
+        [],
+        expect.any(Date),
+      );
+    });
+  });
+
+  describe("refreshPending", () => {
+    it("should index active services missing from the index", async () => {
+      nextSlotRepository.findRefreshKeys.mockResolvedValue([]);
+      nextSlotRepository.findUnindexedKeys.mockResolvedValue([key]);
+      calendarRepository.findAvailableSlots.mockResolvedValue([]);
+
+      const processed = await service.refreshPending(10);
+
+      expect(processed).toBe(1);
+      expect(nextSlotRepository.findUnindexedKeys).toHaveBeenCalledWith(10);
+      expect(nextSlotRepository.replace.mock.calls[0][0]).toBe(key);
+    });
+
+    it("should not look for unindexed services on a full batch", async () => {
+      nextSlotRepository.findRefreshKeys.mockResolvedValue([key]);
+      calendarRepository.findAvailableSlots.mockResolvedValue([]);
+
+      await service.refreshPending(1);
+
+      expect(nextSlotRepository.findUnindexedKeys).not.toHaveBeenCalled();
+    });
+
+    it("should keep going when one key fails", async () => {
+      const otherKey = {
+        businessId: BusinessId.create(BUSINESS_ID),
+        serviceId: ServiceId.create("770e8400-e29b-41d4-a716-446655440009"),
+      };
+      nextSlotRepository.findRefreshKeys.mockResolvedValue([key, otherKey]);
+      calendarRepository.findAvailableSlots
+        .mockRejectedValueOnce(new Error("db down"))
+        .mockResolvedValueOnce([]);
+
+      const processed = await service.refreshPending(10);
+
+      expect(processed).toBe(2);
+      expect(nextSlotRepository.replace).toHaveBeenCalledTimes(1);
+      expect(nextSlotRepository.replace.mock.calls[0][0]).toBe(otherKey);
+    });
+  });
+
+  describe("invalidate", () => {
+    it("should only flag existing entries", async () => {
+      nextSlotRepository.markStale.mockResolvedValue(3);
+
+      await service.invalidate(
+        BusinessId.create(BUSINESS_ID),
+        CalendarId.create(CALENDAR_A),
+      );
+
+      expect(nextSlotRepository.markStale).toHaveBeenCalledTimes(1);
+      expect(nextSlotRepository.enqueue).not.toHaveBeenCalled();
+    });
+
+    it("should enqueue a business absent from the index", async () => {
+      nextSlotRepository.markStale.mockResolvedValue(0);
+
+      await service.invalidate(BusinessId.create(BUSINESS_ID));
+
+      const [businessId, serviceIds, calendarIds] =
+        nextSlotRepository.enqueue.mock.calls[0];
+      expect(businessId.getValue()).toBe(BUSINESS_ID);
+      expect(serviceIds.map((id) => id.getValue())).toEqual([SERVICE_ID]);
+      expect(calendarIds.map((id) => id.getValue())).toEqual([
+        CALENDAR_A,
+        CALENDAR_B,
+      ]);
+    });
+
+    it("should not propagate index failures", async () => {
+      nextSlotRepository.markStale.mockRejectedValue(new Error("db down"));
+
+      await expect(
+        service.invalidate(BusinessId.create(BUSINESS_ID)),
+      ).resolves.toBeUndefined();
+    });
+  });
+});
@@ -0,0 +1,179 @@
+/**
+ * 🧪 OUTBOX DISPATCHER SERVICE - UNIT TESTS
+ * ✅ Distribution, acquittement et reprise des messages de l'outbox
+ */
+
+import type { IAuditService } from "@application/ports/audit.port";
+import {
+  INotificationService,
+  NotificationChannel,
+  NotificationType,
+} from "@application/ports/notification.port";
+import {
+  OutboxDispatcherService,
+  OutboxMessageType,
+} from "@application/services/outbox-dispatcher.service";
+import type {
+  OutboxRepository,
+  PendingOutboxMessage,
+} from "@domain/repositories/outbox.repository.interface";
+import { createMockLogger } from "../../mocks";
+
+const APPOINTMENT_ID = "880e8400-e29b-41d4-a716-446655440003";
+
+describe("OutboxDispatcherService", () => {
+  let service: OutboxDispatcherService;
+  let outboxRepository: jest.Mocked<OutboxRepository>;
+  let notificationService: jest.Mocked<
+    Pick<INotificationService, "sendNotification">
+  >;
+  let auditService: jest.Mocked<Pick<IAuditService, "logOperation">>;
+
+  const message = (
+    id: string,
+    type: string,
+    payload: Record<string, unknown>,
+    attempts = 1,
+  ): PendingOutboxMessage => ({
+    id,
+    type,
+    aggregateId: APPOINTMENT_ID,
+    payload,
+    attempts,
+    createdAt: new Date("2099-01-10T08:00:00.000Z"),
+  });
+
+  const confirmation = (id: string, attempts = 1) =>
+    message(
+      id,
+      OutboxMessageType.APPOINTMENT_CONFIRMATION,
+      {
+        channel: NotificationChannel.EMAIL,
+        recipientId: "jane@example.com",
+        recipientEmail: "jane@example.com",
+        clientName: "Jane Doe",
+        businessName: "Salon",
+        serviceName: "Coupe",
+        startTime: "2099-01-14T09:00:00.000Z",
+        endTime: "2099-01-14T09:30:00.000Z",
+      },
+      attempts,
+    );
+
+  beforeEach(() => {
+    outboxRepository = {
+      claimBatch: jest.fn(),
+      complete: jest.fn(),
+      fail: jest.fn(),
+    };
+    notificationService = {
+      sendNotification: jest.fn().mockResolvedValue({ success: true }),
+    };
+    auditService = { logOperation: jest.fn() };
+
+    service = new OutboxDispatcherService(
+      outboxRepository,
+      notificationService as unknown as INotificationService,
+      auditService as unknown as IAuditService,
+      createMockLogger(),
+    );
+  });
+
+  it("should dispatch a claimed batch and complete it", async () => {
+    outboxRepository.claimBatch.mockResolvedValue([
+      confirmation("m1"),
+      message("m2", OutboxMessageType.APPOINTMENT_AUDIT, {
+        operation: "BOOK_APPOINTMENT",
+        userId: "jane@example.com",
+        created: { source: "ONLINE" },
+      }),
+    ]);
+
+    await expect(service.dispatchPending(10)).resolves.toBe(2);
+
+    expect(outboxRepository.claimBatch).toHaveBeenCalledWith(
+      10,
+      OutboxDispatcherService.LEASE_MS,
+    );
+    expect(notificationService.sendNotification).toHaveBeenCalledWith(
+      expect.objectContaining({
+        type: NotificationType.APPOINTMENT_CONFIRMATION,
+        channel: NotificationChannel.EMAIL,
+        recipientEmail: "jane@example.com",
+      }),
+    );
+    expect(auditService.logOperation).toHaveBeenCalledWith(
+      expect.objectContaining({
+        operation: "BOOK_APPOINTMENT",
+        entityId: APPOINTMENT_ID,
+        correlationId: "m2",
+      }),
+    );
+    expect(outboxRepository.complete).toHaveBeenCalledWith(["m1", "m2"]);
+    expect(outboxRepository.fail).not.toHaveBeenCalled();
+  });
+
+  it("should schedule a retry for a failed message only", async () => {
+    outboxRepository.claimBatch.mockResolvedValue([
+      confirmation("m1", 3),
+      confirmation("m2"),
+    ]);
+    notificationService.sendNotification
+      .mockResolvedValueOnce({
+        success: false,
+        error: "SMTP unavailable",
+      } as any)
+      .mockResolvedValueOnce({ success: true } as any);
+
+    const before = Date.now();
+    await expect(service.dispatchPending(10)).resolves.toBe(1);
+
+    expect(outboxRepository.complete).toHaveBeenCalledWith(["m2"]);
+    const [id, error, retryAt] = outboxRepository.fail.mock.calls[0];
+    expect(id).toBe("m1");
+    expect(error).toBe("SMTP unavailable");
+    // 3e tentative : délai de base × 4
+    expect(retryAt!.getTime()).toBeGreaterThanOrEqual(
+      before + OutboxDispatcherService.RETRY_BASE_MS * 4,
+    );
+  });
+
+  it("should park a message once attempts are exhausted", async () => {
+    outboxRepository.claimBatch.mockResolvedValue([
+      confirmation("m1", OutboxDispatcherService.MAX_ATTEMPTS),
+    ]);
+    notificationService.sendNotification.mockRejectedValue(
+      new Error("provider down"),
+    );
+
+    await expect(service.dispatchPending(10)).resolves.toBe(0);
+
+    expect(outboxRepository.fail).toHaveBeenCalledWith(
+      "m1",
+      "provider down",
+      null,
+    );
+  });
+
+  it("should fail unknown message types", async () => {
+    outboxRepository.claimBatch.mockResolvedValue([
+      message("m1", "UNKNOWN", {}),
+    ]);
+
+    await service.dispatchPending(10);
+
+    expect(outboxRepository.fail).toHaveBeenCalledWith(
+      "m1",
+      "Unknown outbox message type: UNKNOWN",
+      expect.any(Date),
+    );
+  });
+
+  it("should not touch the outbox when nothing is due", async () => {
+    outboxRepository.claimBatch.mockResolvedValue([]);
+
+    await expect(service.dispatchPending(10)).resolves.toBe(0);
+
+    expect(outboxRepository.complete).not.toHaveBeenCalled();
+  });
+});
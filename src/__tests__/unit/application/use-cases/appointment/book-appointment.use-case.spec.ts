@@ -1,5 +1,6 @@
 import type { I18nService } from "@application/ports/i18n.port";
 import type { Logger } from "@application/ports/logger.port";
+import type { ISlotHoldStore } from "@application/ports/slot-hold.port";
 import {
   BookAppointmentRequest,
   BookAppointmentUseCase,
@@ -12,10 +13,7 @@ import type { StaffRepository } from "@domain/repositories/staff.repository.inte
 
 // Test mocks créés inline pour éviter les problèmes de compatibilité d'interface
 
-import {
-  Appointment,
-  AppointmentStatus,
-} from "@domain/entities/appointment.entity";
+import { AppointmentSlotTakenError } from "@domain/exceptions/appointment.exceptions";
 import { Business } from "@domain/entities/business.entity";
 import { Calendar } from "@domain/entities/calendar.entity";
 import { Service } from "@domain/entities/service.entity";
@@ -28,9 +26,11 @@ import { UserId } from "@domain/value-objects/user-id.value-object";
 
 import {
   AppointmentConflictError,
+  AppointmentValidationError,
   BusinessNotFoundError,
   CalendarNotFoundError,
   ServiceNotFoundError,
+  SlotHoldExpiredError,
 } from "@application/exceptions/appointment.exceptions";
 
 describe("BookAppointmentUseCase", () => {
@@ -100,6 +100,8 @@ describe("BookAppointmentUseCase", () => {
       findById: jest.fn(),
       findConflictingAppointments: jest.fn(),
       save: jest.fn(),
+      create: jest.fn(),
+      createMany: jest.fn(),
       update: jest.fn(),
       delete: jest.fn(),
       findByBusinessId: jest.fn(),
@@ -202,8 +204,7 @@ describe("BookAppointmentUseCase", () => {
     mockBusinessRepo.findById.mockResolvedValue(mockBusiness);
     mockServiceRepo.findById.mockResolvedValue(mockService);
     mockCalendarRepo.findById.mockResolvedValue(mockCalendar);
-    mockAppointmentRepo.findConflictingAppointments.mockResolvedValue([]);
-    mockAppointmentRepo.save.mockResolvedValue(undefined);
+    mockAppointmentRepo.create.mockResolvedValue(undefined);
     mockI18n.t.mockReturnValue("Appointment booked successfully");
     mockI18n.translate.mockReturnValue("Test translated message");
   });
@@ -251,10 +252,20 @@ describe("BookAppointmentUseCase", () => {
           value: completeRequest.calendarId,
         }),
       );
+      // Un seul INSERT : le conflit est arbitré par la base, pas relu avant
       expect(
         mockAppointmentRepo.findConflictingAppointments,
-      ).toHaveBeenCalled();
-      expect(mockAppointmentRepo.save).toHaveBeenCalled();
+      ).not.toHaveBeenCalled();
+      expect(mockAppointmentRepo.create).toHaveBeenCalledTimes(1);
+      expect(mockAppointmentRepo.save).not.toHaveBeenCalled();
+      // Effets de bord écrits dans la même transaction que le rendez-vous
+      const [, outbox] = mockAppointmentRepo.create.mock.calls[0];
+      expect(outbox).toEqual(
+        expect.arrayContaining([
+          expect.objectContaining({ type: "APPOINTMENT_CONFIRMATION" }),
+          expect.objectContaining({ type: "APPOINTMENT_AUDIT" }),
+        ]),
+      );
     });
 
     it("should handle new client correctly", async () => {
@@ -319,7 +330,6 @@ describe("BookAppointmentUseCase", () => {
       mockBusinessRepo.findById.mockResolvedValue(inactiveBusiness);
       mockServiceRepo.findById.mockResolvedValue(mockService);
       mockCalendarRepo.findById.mockResolvedValue(mockCalendar);
-      mockAppointmentRepo.findConflictingAppointments.mockResolvedValue([]);
 
       // WHEN & THEN
       await expect(useCase.execute(validRequest)).rejects.toThrow();
@@ -358,14 +368,14 @@ describe("BookAppointmentUseCase", () => {
       mockServiceRepo.findById.mockResolvedValue(mockService);
       mockCalendarRepo.findById.mockResolvedValue(mockCalendar);
 
-      const conflictingAppointment = {
-        id: { getValue: () => "conflict-id" },
-        getStatus: () => AppointmentStatus.CONFIRMED,
-      } as unknown as Appointment;
-
-      mockAppointmentRepo.findConflictingAppointments.mockResolvedValue([
-        conflictingAppointment,
-      ]);
+      // Créneau pris entre-temps : la contrainte d'exclusion rejette l'INSERT
+      mockAppointmentRepo.create.mockRejectedValue(
+        new AppointmentSlotTakenError(
+          validRequest.calendarId,
+          validRequest.startTime,
+          validRequest.endTime,
+        ),
+      );
 
       // WHEN & THEN
       await expect(useCase.execute(validRequest)).rejects.toThrow(
@@ -398,6 +408,104 @@ describe("BookAppointmentUseCase", () => {
     });
   });
 
+  describe("Slot Holds", () => {
+    const holdToken = "3f2b8c1e-6a4d-4f7e-9b1a-2c5d8e7f9a0b";
+    let slotHolds: jest.Mocked<ISlotHoldStore>;
+    let heldUseCase: BookAppointmentUseCase;
+
+    beforeEach(() => {
+      slotHolds = {
+        acquire: jest.fn(),
+        find: jest.fn().mockResolvedValue({
+          token: holdToken,
+          businessId: validRequest.businessId,
+          serviceId: validRequest.serviceId,
+          calendarId: validRequest.calendarId,
+          startTime: validRequest.startTime,
+          endTime: validRequest.endTime,
+          expiresAt: new Date(Date.now() + 60_000),
+        }),
+        isHeld: jest.fn().mockResolvedValue(false),
+        release: jest.fn().mockResolvedValue(undefined),
+        countAttempt: jest.fn(),
+      };
+      heldUseCase = new BookAppointmentUseCase(
+        mockAppointmentRepo,
+        mockServiceRepo,
+        mockCalendarRepo,
+        mockStaffRepo,
+        mockBusinessRepo,
+        mockLogger,
+        mockI18n,
+        undefined,
+        undefined,
+        undefined,
+        slotHolds,
+      );
+    });
+
+    it("should skip revalidation and release a valid hold", async () => {
+      const result = await heldUseCase.execute({ ...validRequest, holdToken });
+
+      expect(result.success).toBe(true);
+      expect(mockCalendarRepo.findById).not.toHaveBeenCalled();
+      expect(mockAppointmentRepo.create).toHaveBeenCalledTimes(1);
+      expect(slotHolds.release).toHaveBeenCalledWith(
+        validRequest.calendarId,
+        holdToken,
+      );
+    });
+
+    it("should reject an expired or mismatching hold", async () => {
+      slotHolds.find.mockResolvedValue(null);
+
+      await expect(
+        heldUseCase.execute({ ...validRequest, holdToken }),
+      ).rejects.toThrow(SlotHoldExpiredError);
+      expect(mockAppointmentRepo.create).not.toHaveBeenCalled();
+    });
+
+    it("should reject a hold taken for another staff member", async () => {
+      await expect(
+        heldUseCase.execute({
+          ...validRequest,
+          holdToken,
+          staffId: "a1b2c3d4-e5f6-4a7b-8c9d-0e1f2a3b4c5d",
+        }),
+      ).rejects.toThrow(SlotHoldExpiredError);
+      expect(mockAppointmentRepo.create).not.toHaveBeenCalled();
+    });
+
+    it("should reject a held booking for an unknown staff member", async () => {
+      const staffId = "a1b2c3d4-e5f6-4a7b-8c9d-0e1f2a3b4c5d";
+      slotHolds.find.mockResolvedValue({
+        token: holdToken,
+        businessId: validRequest.businessId,
+        serviceId: validRequest.serviceId,
+        calendarId: validRequest.calendarId,
+        staffId,
+        startTime: validRequest.startTime,
+        endTime: validRequest.endTime,
+        expiresAt: new Date(Date.now() + 60_000),
+      });
+
+      await expect(
+        heldUseCase.execute({ ...validRequest, holdToken, staffId }),
+      ).rejects.toThrow(AppointmentValidationError);
+      expect(mockAppointmentRepo.create).not.toHaveBeenCalled();
+    });
+
+    it("should fail fast on a slot held by someone else", async () => {
+      slotHolds.isHeld.mockResolvedValue(true);
+
+      await expect(heldUseCase.execute(validRequest)).rejects.toThrow(
+        AppointmentConflictError,
+      );
+      expect(mockBusinessRepo.findById).not.toHaveBeenCalled();
+      expect(mockAppointmentRepo.create).not.toHaveBeenCalled();
+    });
+  });
+
   describe("Error Handling", () => {
     it("should handle repository errors gracefully", async () => {
       // GIVEN
@@ -0,0 +1,225 @@
+/**
+ * 🧪 BOOK APPOINTMENT SERIES USE CASE - UNIT TESTS
+ * ✅ Une lecture des conflits et un INSERT pour toute la série
+ * ✅ Clean Architecture - Application Layer Testing
+ */
+
+import {
+  AppointmentConflictError,
+  AppointmentValidationError,
+} from "@application/exceptions/appointment.exceptions";
+import { OutboxMessageType } from "@application/services/outbox-dispatcher.service";
+import { BookAppointmentSeriesUseCase } from "@application/use-cases/appointments/book-appointment-series.use-case";
+import { AppointmentStatus } from "@domain/entities/appointment.entity";
+import { AppointmentSlotTakenError } from "@domain/exceptions/appointment.exceptions";
+import type { AppointmentRepository } from "@domain/repositories/appointment.repository.interface";
+import type { BusinessRepository } from "@domain/repositories/business.repository.interface";
+import type { CalendarRepository } from "@domain/repositories/calendar.repository.interface";
+import type { StaffRepository } from "@domain/repositories/staff.repository.interface";
+import { BusinessId } from "@domain/value-objects/business-id.value-object";
+import { Money } from "@domain/value-objects/money.value-object";
+import { ServiceId } from "@domain/value-objects/service-id.value-object";
+import { RecurrenceType } from "@domain/value-objects/time-slot.value-object";
+import {
+  createMockI18nService,
+  createMockLogger,
+  createMockServiceRepository,
+} from "../../../mocks";
+
+const BUSINESS_ID = "550e8400-e29b-41d4-a716-446655440000";
+const SERVICE_ID = "770e8400-e29b-41d4-a716-446655440002";
+const CALENDAR_ID = "660e8400-e29b-41d4-a716-446655440001";
+
+describe("BookAppointmentSeriesUseCase", () => {
+  let useCase: BookAppointmentSeriesUseCase;
+  let appointmentRepository: jest.Mocked<
+    Pick<AppointmentRepository, "findByCalendarId" | "createMany">
+  >;
+  let businessRepository: jest.Mocked<Pick<BusinessRepository, "findById">>;
+  let calendarRepository: jest.Mocked<Pick<CalendarRepository, "findById">>;
+  let serviceRepository: ReturnType<typeof createMockServiceRepository>;
+
+  const startTime = new Date(Date.now() + 24 * 3_600_000);
+  const endTime = new Date(startTime.getTime() + 30 * 60_000);
+  const request = {
+    businessId: BUSINESS_ID,
+    serviceId: SERVICE_ID,
+    calendarId: CALENDAR_ID,
+    startTime,
+    endTime,
+    recurrence: {
+      type: RecurrenceType.DAILY,
+      interval: 7,
+      occurrences: 4,
+    },
+    clientInfo: {
+      firstName: "Jean",
+      lastName: "Dupont",
+      email: "jean.dupont@example.com",
+      isNewClient: false,
+    },
+    source: "ONLINE" as const,
+    requestingUserId: "ec94a1d8-a954-4cfb-b2e6-cbfb5099e4f0",
+  };
+
+  // Heure locale conservée d'une semaine à l'autre, comme RecurrencePattern
+  const occurrenceStart = (index: number) => {
+    const date = new Date(startTime);
+    date.setDate(date.getDate() + 7 * index);
+    return date;
+  };
+
+  const existing = (index: number, status = AppointmentStatus.CONFIRMED) => ({
+    id: {} as any,
+    status,
+    timeSlot: {
+      getStartTime: () => occurrenceStart(index),
+      getEndTime: () => new Date(occurrenceStart(index).getTime() + 60_000),
+    } as any,
+  });
+
+  beforeEach(() => {
+    appointmentRepository = {
+      findByCalendarId: jest.fn().mockResolvedValue([]),
+      createMany: jest.fn().mockResolvedValue(undefined),
+    };
+    businessRepository = {
+      findById: jest.fn().mockResolvedValue({
+        getId: () => BusinessId.create(BUSINESS_ID),
+        name: { getValue: () => "Cabinet Dupont" },
+        isActive: () => true,
+      }),
+    };
+    calendarRepository = {
+      findById: jest.fn().mockResolvedValue({}),
+    };
+    serviceRepository = createMockServiceRepository();
+    serviceRepository.findById.mockResolvedValue({
+      getId: () => ServiceId.create(SERVICE_ID),
+      name: "Consultation",
+      getBasePrice: () => Money.create(5000, "EUR"),
+      isActive: () => true,
+      isBookable: () => true,
+    } as any);
+
+    useCase = new BookAppointmentSeriesUseCase(
+      appointmentRepository as unknown as AppointmentRepository,
+      serviceRepository,
+      calendarRepository as unknown as CalendarRepository,
+      { findById: jest.fn() } as unknown as StaffRepository,
+      businessRepository as unknown as BusinessRepository,
+      createMockLogger(),
+      createMockI18nService(),
+    );
+  });
+
+  it("should read conflicts once and insert the series together", async () => {
+    const response = await useCase.execute(request);
+
+    expect(response.bookedCount).toBe(4);
+    expect(response.conflictCount).toBe(0);
+    expect(appointmentRepository.findByCalendarId).toHaveBeenCalledTimes(1);
+    expect(appointmentRepository.findByCalendarId).toHaveBeenCalledWith(
+      expect.anything(),
+      occurrenceStart(0),
+      new Date(occurrenceStart(3).getTime() + 30 * 60_000),
+    );
+    expect(appointmentRepository.createMany).toHaveBeenCalledTimes(1);
+    expect(appointmentRepository.createMany.mock.calls[0][0]).toHaveLength(4);
+    expect(businessRepository.findById).toHaveBeenCalledTimes(1);
+  });
+
+  it("should write the outbox messages in the series insert", async () => {
+    await useCase.execute(request);
+
+    const [appointments, outbox = []] =
+      appointmentRepository.createMany.mock.calls[0];
+    const typesOf = (index: number) =>
+      outbox
+        .filter(
+          (message) =>
+            message.aggregateId === appointments[index].getId().getValue(),
+        )
+        .map((message) => message.type);
+
+    // Première occurrence dans moins de 24 h : pas de rappel
+    expect(typesOf(0)).toEqual([
+      OutboxMessageType.APPOINTMENT_CONFIRMATION,
+      OutboxMessageType.APPOINTMENT_AUDIT,
+    ]);
+    expect(typesOf(3)).toEqual([
+      OutboxMessageType.APPOINTMENT_CONFIRMATION,
+      OutboxMessageType.APPOINTMENT_REMINDER,
+      OutboxMessageType.APPOINTMENT_AUDIT,
+    ]);
+  });
+
+  it("should report conflicting occurrences and book the others", async () => {
+    appointmentRepository.findByCalendarId.mockResolvedValue([
+      existing(1),
+      existing(2, AppointmentStatus.CANCELLED),
+    ]);
+
+    const response = await useCase.execute(request);
+
+    expect(response.occurrences.map((o) => o.status)).toEqual([
+      "BOOKED",
+      "CONFLICT",
+      "BOOKED",
+      "BOOKED",
+    ]);
+    expect(response.occurrences[1].appointmentId).toBeUndefined();
+    expect(response.conflictCount).toBe(1);
+    expect(appointmentRepository.createMany.mock.calls[0][0]).toHaveLength(3);
+  });
+
+  it("should book nothing on conflict when allOrNothing is set", async () => {
+    appointmentRepository.findByCalendarId.mockResolvedValue([existing(3)]);
+
+    await expect(
+      useCase.execute({ ...request, allOrNothing: true }),
+    ).rejects.toThrow(AppointmentConflictError);
+    expect(appointmentRepository.createMany).not.toHaveBeenCalled();
+  });
+
+  it("should reread conflicts once after a concurrent booking", async () => {
+    appointmentRepository.findByCalendarId
+      .mockResolvedValueOnce([])
+      .mockResolvedValueOnce([existing(0)]);
+    appointmentRepository.createMany
+      .mockRejectedValueOnce(
+        new AppointmentSlotTakenError(CALENDAR_ID, startTime, endTime),
+      )
+      .mockResolvedValueOnce(undefined);
+
+    const response = await useCase.execute(request);
+
+    expect(appointmentRepository.findByCalendarId).toHaveBeenCalledTimes(2);
+    expect(response.occurrences[0].status).toBe("CONFLICT");
+    expect(response.bookedCount).toBe(3);
+  });
+
+  it("should reject an invalid recurrence rule", async () => {
+    await expect(
+      useCase.execute({
+        ...request,
+        recurrence: { ...request.recurrence, interval: 0 },
+      }),
+    ).rejects.toThrow(AppointmentValidationError);
+    expect(appointmentRepository.createMany).not.toHaveBeenCalled();
+  });
+
+  it("should reject a recurrence without any occurrence", async () => {
+    await expect(
+      useCase.execute({
+        ...request,
+        recurrence: {
+          type: RecurrenceType.DAILY,
+          interval: 7,
+          endDate: new Date(startTime.getTime() - 60_000),
+        },
+      }),
+    ).rejects.toThrow(AppointmentValidationError);
+    expect(appointmentRepository.findByCalendarId).not.toHaveBeenCalled();
+  });
+});
@@ -0,0 +1,139 @@
+/**
+ * 🧪 EXPORT AVAILABILITY USE CASE - UNIT TESTS
+ * ✅ Export jour par jour des disponibilités d'une entreprise
+ * ✅ Clean Architecture - Application Layer Testing
+ */
+
+import { ExportAvailabilityUseCase } from "@application/use-cases/appointments/export-availability.use-case";
+import {
+  ApplicationValidationError,
+  ResourceNotFoundError,
+} from "@application/exceptions/application.exceptions";
+import type { CalendarRepository } from "@domain/repositories/calendar.repository.interface";
+import { BusinessId } from "@domain/value-objects/business-id.value-object";
+import { CalendarId } from "@domain/value-objects/calendar-id.value-object";
+import { TimeSlot } from "@domain/value-objects/time-slot.value-object";
+import {
+  createMockI18nService,
+  createMockLogger,
+  createMockServiceRepository,
+} from "../../../mocks";
+
+const BUSINESS_ID = "550e8400-e29b-41d4-a716-446655440000";
+const SERVICE_ID = "770e8400-e29b-41d4-a716-446655440002";
+const CALENDAR_A = "660e8400-e29b-41d4-a716-446655440001";
+
+describe("ExportAvailabilityUseCase", () => {
+  let useCase: ExportAvailabilityUseCase;
+  let calendarRepository: jest.Mocked<
+    Pick<CalendarRepository, "findIdsByBusinessId" | "findAvailableSlots">
+  >;
+  let serviceRepository: ReturnType<typeof createMockServiceRepository>;
+
+  beforeEach(() => {
+    calendarRepository = {
+      findIdsByBusinessId: jest
+        .fn()
+        .mockResolvedValue([CalendarId.create(CALENDAR_A)]),
+      findAvailableSlots: jest
+        .fn()
+        .mockImplementation(async (calendarIds, start: Date) => [
+          {
+            calendarId: calendarIds[0],
+            slots: [
+              TimeSlot.create(
+                new Date(start.getTime() + 9 * 3_600_000),
+                new Date(start.getTime() + 9.5 * 3_600_000),
+              ),
+            ],
+          },
+        ]),
+    };
+    serviceRepository = createMockServiceRepository();
+    serviceRepository.findById.mockResolvedValue({
+      businessId: BusinessId.create(BUSINESS_ID),
+      getDefaultDuration: () => 30,
+    } as any);
+
+    useCase = new ExportAvailabilityUseCase(
+      calendarRepository as unknown as CalendarRepository,
+      serviceRepository,
+      createMockLogger(),
+      createMockI18nService(),
+    );
+  });
+
+  const request = {
+    businessId: BUSINESS_ID,
+    serviceId: SERVICE_ID,
+    startDate: new Date(2099, 0, 1),
+    endDate: new Date(2099, 0, 3),
+    requestingUserId: "ec94a1d8-a954-4cfb-b2e6-cbfb5099e4f0",
+  };
+
+  it("should compute each day only when it is consumed", async () => {
+    const response = await useCase.execute(request);
+
+    expect(response.calendarIds).toEqual([CALENDAR_A]);
+    expect(calendarRepository.findAvailableSlots).not.toHaveBeenCalled();
+
+    const first = await response.days.next();
+    expect(first.value?.date).toBe("2099-01-01");
+    expect(calendarRepository.findAvailableSlots).toHaveBeenCalledTimes(1);
+
+    const [, start, end, duration] =
+      calendarRepository.findAvailableSlots.mock.calls[0];
+    expect(start).toEqual(new Date(2099, 0, 1));
+    expect(end).toEqual(new Date(2099, 0, 2));
+    expect(duration).toBe(30);
+  });
+
+  it("should yield one entry per day, end date included", async () => {
+    const response = await useCase.execute(request);
+
+    const dates: string[] = [];
+    for await (const day of response.days) {
+      dates.push(day.date);
+      expect(day.calendars[0].slots).toHaveLength(1);
+    }
+
+    expect(dates).toEqual(["2099-01-01", "2099-01-02", "2099-01-03"]);
+  });
+
+  it("should stop computing when the consumer stops", async () => {
+    const response = await useCase.execute(request);
+
+    for await (const day of response.days) {
+      if (day.date === "2099-01-01") break;
+    }
+
+    expect(calendarRepository.findAvailableSlots).toHaveBeenCalledTimes(1);
+  });
+
+  it("should reject an explicit calendar of another business", async () => {
+    await expect(
+      useCase.execute({
+        ...request,
+        calendarIds: [CALENDAR_A, "660e8400-e29b-41d4-a716-446655440009"],
+      }),
+    ).rejects.toThrow(ResourceNotFoundError);
+  });
+
+  it("should reject a service of another business", async () => {
+    serviceRepository.findById.mockResolvedValue({
+      businessId: BusinessId.create("550e8400-e29b-41d4-a716-446655440009"),
+      getDefaultDuration: () => 30,
+    } as any);
+
+    await expect(useCase.execute(request)).rejects.toThrow(
+      ResourceNotFoundError,
+    );
+  });
+
+  it("should reject a period longer than 90 days", async () => {
+    await expect(
+      useCase.execute({ ...request, endDate: new Date(2099, 3, 1) }),
+    ).rejects.toThrow(ApplicationValidationError);
+    expect(serviceRepository.findById).not.toHaveBeenCalled();
+  });
+});
@@ -0,0 +1,181 @@
+/**
+ * 🧪 GET BATCH AVAILABILITY USE CASE - UNIT TESTS
+ * ✅ Premiers créneaux libres sur plusieurs calendriers
+ * ✅ Clean Architecture - Application Layer Testing
+ */
+
+import type { FreeBusyService } from "@application/services/free-busy.service";
+import { GetBatchAvailabilityUseCase } from "@application/use-cases/appointments/get-batch-availability.use-case";
+import {
+  ApplicationValidationError,
+  ResourceNotFoundError,
+} from "@application/exceptions/application.exceptions";
+import type { CalendarRepository } from "@domain/repositories/calendar.repository.interface";
+import { BusinessId } from "@domain/value-objects/business-id.value-object";
+import { CalendarId } from "@domain/value-objects/calendar-id.value-object";
+import { TimeSlot } from "@domain/value-objects/time-slot.value-object";
+import {
+  createMockI18nService,
+  createMockLogger,
+  createMockServiceRepository,
+} from "../../../mocks";
+
+const BUSINESS_ID = "550e8400-e29b-41d4-a716-446655440000";
+const SERVICE_ID = "770e8400-e29b-41d4-a716-446655440002";
+const CALENDAR_A = "660e8400-e29b-41d4-a716-446655440001";
+const CALENDAR_B = "660e8400-e29b-41d4-a716-446655440005";
+const FOREIGN_CALENDAR = "660e8400-e29b-41d4-a716-446655440009";
+
+const slot = (day: number, hour: number, minute = 0) =>
+  TimeSlot.create(
+    new Date(2099, 0, day, hour, minute),
+    new Date(2099, 0, day, hour, minute + 30),
+  );
+
+describe("GetBatchAvailabilityUseCase", () => {
+  let useCase: GetBatchAvailabilityUseCase;
+  let calendarRepository: jest.Mocked<
+    Pick<CalendarRepository, "findIdsByBusinessId" | "findAvailableSlots">
+  >;
+  let serviceRepository: ReturnType<typeof createMockServiceRepository>;
+
+  beforeEach(() => {
+    calendarRepository = {
+      findIdsByBusinessId: jest
+        .fn()
+        .mockResolvedValue([
+          CalendarId.create(CALENDAR_A),
+          CalendarId.create(CALENDAR_B),
+        ]),
+      findAvailableSlots: jest.fn(),
+    };
+    serviceRepository = createMockServiceRepository();
+    serviceRepository.findById.mockResolvedValue({
+      businessId: BusinessId.create(BUSINESS_ID),
+      getDefaultDuration: () => 30,
+    } as any);
+
+    useCase = new GetBatchAvailabilityUseCase(
+      calendarRepository as unknown as CalendarRepository,
+      serviceRepository,
+      createMockLogger(),
+      createMockI18nService(),
+    );
+  });
+
+  const request = {
+    businessId: BUSINESS_ID,
+    serviceId: SERVICE_ID,
+    calendarIds: [CALENDAR_A, CALENDAR_B, CALENDAR_A],
+    referenceDate: new Date(2099, 0, 14),
+    maxSlotsPerCalendar: 2,
+    requestingUserId: "ec94a1d8-a954-4cfb-b2e6-cbfb5099e4f0",
+  };
+
+  it("should query every calendar in a single repository call", async () => {
+    calendarRepository.findAvailableSlots.mockResolvedValue([]);
+
+    await useCase.execute(request);
+
+    expect(calendarRepository.findAvailableSlots).toHaveBeenCalledTimes(1);
+    const [calendarIds, start, end, duration] =
+      calendarRepository.findAvailableSlots.mock.calls[0];
+    expect(calendarIds.map((id) => id.getValue())).toEqual([
+      CALENDAR_A,
+      CALENDAR_B,
+    ]);
+    expect(start).toEqual(new Date(2099, 0, 12));
+    expect(end).toEqual(new Date(2099, 0, 19));
+    expect(duration).toBe(30);
+  });
+
+  it("should limit slots per calendar and pick the earliest overall", async () => {
+    calendarRepository.findAvailableSlots.mockResolvedValue([
+      {
+        calendarId: CalendarId.create(CALENDAR_A),
+        slots: [slot(13, 10), slot(13, 11), slot(13, 14)],
+      },
+      {
+        calendarId: CalendarId.create(CALENDAR_B),
+        slots: [slot(12, 16)],
+      },
+    ]);
+
+    const response = await useCase.execute(request);
+
+    expect(response.calendars[0].slots).toHaveLength(2);
+    expect(response.calendars[1].slots).toHaveLength(1);
+    expect(response.firstAvailable).toEqual({
+      calendarId: CALENDAR_B,
+      startTime: new Date(2099, 0, 12, 16),
+      endTime: new Date(2099, 0, 12, 16, 30),
+    });
+  });
+
+  it("should return no first slot when every calendar is full", async () => {
+    calendarRepository.findAvailableSlots.mockResolvedValue([
+      { calendarId: CalendarId.create(CALENDAR_A), slots: [] },
+    ]);
+
+    const response = await useCase.execute(request);
+
+    expect(response.firstAvailable).toBeNull();
+  });
+
+  it("should reject a calendar of another business", async () => {
+    await expect(
+      useCase.execute({
+        ...request,
+        calendarIds: [CALENDAR_A, FOREIGN_CALENDAR],
+      }),
+    ).rejects.toThrow(ResourceNotFoundError);
+    expect(calendarRepository.findAvailableSlots).not.toHaveBeenCalled();
+  });
+
+  it("should reject a service of another business", async () => {
+    serviceRepository.findById.mockResolvedValue({
+      businessId: BusinessId.create("550e8400-e29b-41d4-a716-446655440009"),
+      getDefaultDuration: () => 30,
+    } as any);
+
+    await expect(useCase.execute(request)).rejects.toThrow(
+      ResourceNotFoundError,
+    );
+    expect(calendarRepository.findAvailableSlots).not.toHaveBeenCalled();
+  });
+
+  it("should read slots from the free/busy service when provided", async () => {
+    const freeBusyService = {
+      findAvailableSlots: jest.fn().mockResolvedValue([
+        { calendarId: CalendarId.create(CALENDAR_A), slots: [slot(13, 10)] },
+      ]),
+    };
+    useCase = new GetBatchAvailabilityUseCase(
+      calendarRepository as unknown as CalendarRepository,
+      serviceRepository,
+      createMockLogger(),
+      createMockI18nService(),
+      freeBusyService as unknown as FreeBusyService,
+    );
+
+    const response = await useCase.execute(request);
+
+    expect(freeBusyService.findAvailableSlots).toHaveBeenCalledWith(
+      [CalendarId.create(CALENDAR_A), CalendarId.create(CALENDAR_B)],
+      new Date(2099, 0, 12),
+      new Date(2099, 0, 19),
+      30,
+    );
+    expect(calendarRepository.findAvailableSlots).not.toHaveBeenCalled();
+    expect(response.firstAvailable?.startTime).toEqual(
+      new Date(2099, 0, 13, 10),
+    );
+  });
+
+  it("should reject an empty calendar list", async () => {
+    await expect(
+      useCase.execute({ ...request, calendarIds: [] }),
+    ).rejects.toThrow(ApplicationValidationError);
+    expect(calendarRepository.findAvailableSlots).not.toHaveBeenCalled();
+  });
+});
@@ -0,0 +1,147 @@
+/**
+ * 🧪 HOLD SLOT USE CASE - UNIT TESTS
+ * ✅ Retenue atomique avant toute lecture en base
+ * ✅ Clean Architecture - Application Layer Testing
+ */
+
+import {
+  AppointmentConflictError,
+  CalendarNotFoundError,
+  SlotHoldLimitExceededError,
+} from "@application/exceptions/appointment.exceptions";
+import type { ISlotHoldStore } from "@application/ports/slot-hold.port";
+import { HoldSlotUseCase } from "@application/use-cases/appointments/hold-slot.use-case";
+import type { AppointmentRepository } from "@domain/repositories/appointment.repository.interface";
+import type { BusinessRepository } from "@domain/repositories/business.repository.interface";
+import type { CalendarRepository } from "@domain/repositories/calendar.repository.interface";
+import {
+  createMockI18nService,
+  createMockLogger,
+  createMockServiceRepository,
+} from "../../../mocks";
+
+const CALENDAR_ID = "660e8400-e29b-41d4-a716-446655440001";
+
+describe("HoldSlotUseCase", () => {
+  let useCase: HoldSlotUseCase;
+  let slotHolds: jest.Mocked<ISlotHoldStore>;
+  let appointmentRepository: jest.Mocked<
+    Pick<AppointmentRepository, "findConflictingAppointments">
+  >;
+  let businessRepository: jest.Mocked<Pick<BusinessRepository, "findById">>;
+  let calendarRepository: jest.Mocked<Pick<CalendarRepository, "findById">>;
+  let serviceRepository: ReturnType<typeof createMockServiceRepository>;
+
+  const startTime = new Date(Date.now() + 24 * 3_600_000);
+  const endTime = new Date(startTime.getTime() + 30 * 60_000);
+  const request = {
+    businessId: "550e8400-e29b-41d4-a716-446655440000",
+    serviceId: "770e8400-e29b-41d4-a716-446655440002",
+    calendarId: CALENDAR_ID,
+    startTime,
+    endTime,
+    requestingUserId: "ec94a1d8-a954-4cfb-b2e6-cbfb5099e4f0",
+  };
+  const hold = {
+    ...request,
+    token: "3f2b8c1e-6a4d-4f7e-9b1a-2c5d8e7f9a0b",
+    expiresAt: new Date(Date.now() + 120_000),
+  };
+
+  beforeEach(() => {
+    slotHolds = {
+      acquire: jest.fn().mockResolvedValue(hold),
+      find: jest.fn(),
+      isHeld: jest.fn(),
+      release: jest.fn().mockResolvedValue(undefined),
+      countAttempt: jest.fn().mockResolvedValue(1),
+    };
+    appointmentRepository = {
+      findConflictingAppointments: jest.fn().mockResolvedValue([]),
+    };
+    businessRepository = {
+      findById: jest.fn().mockResolvedValue({ isActive: () => true }),
+    };
+    calendarRepository = {
+      findById: jest.fn().mockResolvedValue({}),
+    };
+    serviceRepository = createMockServiceRepository();
+    serviceRepository.findById.mockResolvedValue({
+      isActive: () => true,
+      isBookable: () => true,
+    } as any);
+
+    useCase = new HoldSlotUseCase(
+      slotHolds,
+      appointmentRepository as unknown as AppointmentRepository,
+      serviceRepository,
+      calendarRepository as unknown as CalendarRepository,
+      businessRepository as unknown as BusinessRepository,
+      createMockLogger(),
+      createMockI18nService(),
+    );
+  });
+
+  it("should return a token once the slot is held and verified", async () => {
+    const response = await useCase.execute(request);
+
+    expect(response).toEqual({
+      token: hold.token,
+      calendarId: CALENDAR_ID,
+      startTime,
+      endTime,
+      expiresAt: hold.expiresAt,
+    });
+    expect(slotHolds.acquire).toHaveBeenCalledWith(
+      expect.objectContaining({ calendarId: CALENDAR_ID, startTime, endTime }),
+      120,
+    );
+    expect(slotHolds.release).not.toHaveBeenCalled();
+  });
+
+  it("should fail fast without database reads when already held", async () => {
+    slotHolds.acquire.mockResolvedValue(null);
+
+    await expect(useCase.execute(request)).rejects.toThrow(
+      AppointmentConflictError,
+    );
+    expect(businessRepository.findById).not.toHaveBeenCalled();
+    expect(calendarRepository.findById).not.toHaveBeenCalled();
+    expect(
+      appointmentRepository.findConflictingAppointments,
+    ).not.toHaveBeenCalled();
+  });
+
+  it("should refuse holds beyond the per-user attempt limit", async () => {
+    slotHolds.countAttempt.mockResolvedValue(11);
+
+    await expect(useCase.execute(request)).rejects.toThrow(
+      SlotHoldLimitExceededError,
+    );
+    expect(slotHolds.countAttempt).toHaveBeenCalledWith(
+      request.requestingUserId,
+      60,
+    );
+    expect(slotHolds.acquire).not.toHaveBeenCalled();
+  });
+
+  it("should release the hold when verification fails", async () => {
+    calendarRepository.findById.mockResolvedValue(null);
+
+    await expect(useCase.execute(request)).rejects.toThrow(
+      CalendarNotFoundError,
+    );
+    expect(slotHolds.release).toHaveBeenCalledWith(CALENDAR_ID, hold.token);
+  });
+
+  it("should release the hold when the slot is already booked", async () => {
+    appointmentRepository.findConflictingAppointments.mockResolvedValue([
+      { getId: () => ({ getValue: () => "appointment-1" }) } as any,
+    ]);
+
+    await expect(useCase.execute(request)).rejects.toThrow(
+      AppointmentConflictError,
+    );
+    expect(slotHolds.release).toHaveBeenCalledWith(CALENDAR_ID, hold.token);
+  });
+});
@@ -57,6 +57,8 @@ const mockStaffRepository = {
   delete: jest.fn(),
   findByBusinessId: jest.fn(),
   findByBusinessIdAndRole: jest.fn(),
+  findByIds: jest.fn(),
+  findWithSkills: jest.fn(),
   findAvailableStaff: jest.fn(),
   existsByEmail: jest.fn(),
   getBusinessStaffStatistics: jest.fn(),
@@ -13,6 +13,8 @@ const mockStaffRepository: jest.Mocked<StaffRepository> = {
   findByEmail: jest.fn(),
   findByBusinessId: jest.fn(),
   findByBusinessIdAndRole: jest.fn(),
+  findByIds: jest.fn(),
+  findWithSkills: jest.fn(),
   findAvailableStaff: jest.fn(),
   save: jest.fn(),
   delete: jest.fn(),
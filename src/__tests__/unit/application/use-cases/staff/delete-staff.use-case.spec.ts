@@ -38,6 +38,8 @@ describe("DeleteStaffUseCase", () => {
       search: jest.fn(),
       getBusinessStaffStatistics: jest.fn(),
       findByBusinessIdAndRole: jest.fn(),
+      findByIds: jest.fn(),
+      findWithSkills: jest.fn(),
       findAvailableStaff: jest.fn(),
       existsByEmail: jest.fn(),
     } as jest.Mocked<StaffRepository>;
@@ -0,0 +1,118 @@
+/**
+ * 🧪 Tests GetAvailableStaffUseCase - Filtrage par compétences
+ *
+ * Les compétences exigées sont résolues par l'index avant tout chargement :
+ * seuls les ids qualifiés sont lus depuis le repository.
+ */
+
+import { GetAvailableStaffUseCase } from "@application/use-cases/staff/get-available-staff.use-case";
+import { Staff } from "@domain/entities/staff.entity";
+import { StaffSkillIndex } from "@domain/services/staff-skill-index.service";
+import { BusinessId } from "@domain/value-objects/business-id.value-object";
+import {
+  ProficiencyLevel,
+  SkillAssignment,
+  StaffSkills,
+} from "@domain/value-objects/staff-skills.value-object";
+import { StaffRole } from "@shared/enums/staff-role.enum";
+import { StaffRepository } from "../../../../../domain/repositories/staff.repository.interface";
+
+describe("GetAvailableStaffUseCase", () => {
+  const businessId = "550e8400-e29b-41d4-a716-446655440000";
+  const skillId = "c0ffee00-0000-4000-8000-000000000001";
+
+  let useCase: GetAvailableStaffUseCase;
+  let mockStaffRepository: jest.Mocked<StaffRepository>;
+  let skillIndex: StaffSkillIndex;
+
+  const qualifiedStaff = Staff.create({
+    businessId: BusinessId.create(businessId),
+    profile: { firstName: "John", lastName: "Doe" },
+    role: StaffRole.DOCTOR,
+    email: "john.doe@example.com",
+  });
+
+  const otherStaff = Staff.create({
+    businessId: BusinessId.create(businessId),
+    profile: { firstName: "Jane", lastName: "Smith" },
+    role: StaffRole.DENTIST,
+    email: "jane.smith@example.com",
+  });
+
+  const request = (requiredSkills?: string[]) => ({
+    businessId,
+    dateTime: new Date(Date.now() + 24 * 60 * 60 * 1000),
+    durationMinutes: 30,
+    requiredSkills,
+    requestingUserId: "550e8400-e29b-41d4-a716-446655440001",
+  });
+
+  beforeEach(() => {
+    mockStaffRepository = {
+      findById: jest.fn(),
+      findByEmail: jest.fn(),
+      findByBusinessId: jest.fn(),
+      findByBusinessIdAndRole: jest.fn(),
+      findByIds: jest.fn(),
+      findWithSkills: jest.fn(),
+      findAvailableStaff: jest.fn(),
+      save: jest.fn(),
+      delete: jest.fn(),
+      existsByEmail: jest.fn(),
+      getBusinessStaffStatistics: jest.fn(),
+      search: jest.fn(),
+    };
+
+    skillIndex = new StaffSkillIndex();
+    skillIndex.setStaffSkills(
+      qualifiedStaff.id.getValue(),
+      StaffSkills.create([
+        SkillAssignment.create({
+          skillId,
+          skillName: "Orthodontie",
+          skillCategory: "DENTAL",
+          proficiencyLevel: ProficiencyLevel.ADVANCED,
+          yearsOfExperience: 5,
+        }),
+      ]),
+    );
+
+    useCase = new GetAvailableStaffUseCase(mockStaffRepository, skillIndex);
+  });
+
+  it("should only load the staff qualified by the skill index", async () => {
+    mockStaffRepository.findByIds.mockResolvedValue([qualifiedStaff]);
+
+    await useCase.execute(request([skillId]));
+
+    expect(mockStaffRepository.findByBusinessId).not.toHaveBeenCalled();
+    expect(mockStaffRepository.findByIds).toHaveBeenCalledTimes(1);
+    const [business, ids] = mockStaffRepository.findByIds.mock.calls[0];
+    expect(business.getValue()).toBe(businessId);
+    expect(ids.map((id) => id.getValue())).toEqual([
+      qualifiedStaff.id.getValue(),
+    ]);
+  });
+
+  it("should not hit the repository when nobody has the skill", async () => {
+    const response = await useCase.execute(
+      request(["c0ffee00-0000-4000-8000-000000000002"]),
+    );
+
+    expect(response.availableStaff).toEqual([]);
+    expect(mockStaffRepository.findByIds).not.toHaveBeenCalled();
+    expect(mockStaffRepository.findByBusinessId).not.toHaveBeenCalled();
+  });
+
+  it("should load the whole business when no skill is required", async () => {
+    mockStaffRepository.findByBusinessId.mockResolvedValue([
+      qualifiedStaff,
+      otherStaff,
+    ]);
+
+    await useCase.execute(request());
+
+    expect(mockStaffRepository.findByBusinessId).toHaveBeenCalledTimes(1);
+    expect(mockStaffRepository.findByIds).not.toHaveBeenCalled();
+  });
+});
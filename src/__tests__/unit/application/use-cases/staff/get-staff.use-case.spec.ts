@@ -72,6 +72,8 @@ describe("GetStaffUseCase", () => {
       findByEmail: jest.fn(),
       findByBusinessId: jest.fn(),
       findByBusinessIdAndRole: jest.fn(),
+      findByIds: jest.fn(),
+      findWithSkills: jest.fn(),
       findAvailableStaff: jest.fn(),
       save: jest.fn(),
       delete: jest.fn(),
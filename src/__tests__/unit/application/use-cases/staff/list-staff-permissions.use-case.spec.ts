@@ -56,6 +56,8 @@ describe("ListStaffUseCase - Permission Tests", () => {
       findByEmail: jest.fn(),
       findByBusinessId: jest.fn(),
       findByBusinessIdAndRole: jest.fn(),
+      findByIds: jest.fn(),
+      findWithSkills: jest.fn(),
       findAvailableStaff: jest.fn(),
       existsByEmail: jest.fn(),
       getBusinessStaffStatistics: jest.fn(),
@@ -52,6 +52,8 @@ describe("ListStaffUseCase", () => {
       findByEmail: jest.fn(),
       findByBusinessId: jest.fn(),
       findByBusinessIdAndRole: jest.fn(),
+      findByIds: jest.fn(),
+      findWithSkills: jest.fn(),
       findAvailableStaff: jest.fn(),
       save: jest.fn(),
       delete: jest.fn(),
@@ -39,6 +39,8 @@ describe("UpdateStaffUseCase", () => {
       findByEmail: jest.fn(),
       findByBusinessId: jest.fn(),
       findByBusinessIdAndRole: jest.fn(),
+      findByIds: jest.fn(),
+      findWithSkills: jest.fn(),
       findAvailableStaff: jest.fn(),
       save: jest.fn(),
       delete: jest.fn(),
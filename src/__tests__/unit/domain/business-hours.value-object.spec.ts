@@ -561,4 +561,127 @@ describe("BusinessHours Value Object", () => {
       expect(businessHours.isOpenAt(monday, "23:00")).toBe(false); // Après fermeture
     });
   });
+
+  describe("Weekly Template", () => {
+    it("should compile each weekday into sorted minute ranges", () => {
+      const businessHours = BusinessHours.createStandardWeek(
+        [1, 2, 3, 4, 5],
+        "09:00",
+        "18:00",
+        { start: "12:00", end: "13:30" },
+      );
+
+      const template = businessHours.toWeeklyTemplate();
+
+      expect(Array.from(template.forDay(1))).toEqual([540, 720, 810, 1080]);
+      expect(Array.from(template.forDay(0))).toEqual([]);
+    });
+
+    it("should apply special dates before the weekly schedule", () => {
+      const holiday = new Date("2024-01-01");
+      const businessHours = BusinessHours.createStandardWeek([1, 2, 3, 4, 5])
+        .withSpecialDate({ date: holiday, isOpen: false, reason: "Férié" })
+        .withSpecialDate({
+          date: new Date("2024-01-02"),
+          isOpen: true,
+          timeSlots: [{ start: "10:00", end: "12:00" }],
+          reason: "Formation",
+        });
+
+      const template = businessHours.toWeeklyTemplate();
+
+      expect(Array.from(template.forDate(holiday))).toEqual([]);
+      expect(Array.from(template.forDate(new Date("2024-01-02")))).toEqual([
+        600, 720,
+      ]);
+      expect(Array.from(template.forDate(new Date("2024-01-03")))).toEqual([
+        540, 1020,
+      ]);
+    });
+
+    it("should compile only once per instance", () => {
+      const businessHours = BusinessHours.createStandardWeek([1, 2, 3]);
+
+      expect(businessHours.toWeeklyTemplate()).toBe(
+        businessHours.toWeeklyTemplate(),
+      );
+    });
+  });
+
+  describe("Special Date Index", () => {
+    it("should match special dates on the local day regardless of time", () => {
+      const businessHours = BusinessHours.createStandardWeek([1, 2, 3, 4, 5])
+        .withSpecialDate({
+          date: new Date(2024, 11, 25, 0, 0),
+          isOpen: false,
+          reason: "Noël",
+        });
+
+      expect(businessHours.isOpenOnDate(new Date(2024, 11, 25, 15, 30))).toBe(
+        false,
+      );
+      expect(
+        businessHours.getTimeSlotsForDate(new Date(2024, 11, 25, 23, 59)),
+      ).toEqual([]);
+      expect(businessHours.isOpenOnDate(new Date(2024, 11, 26, 0, 0))).toBe(
+        true,
+      );
+    });
+
+    it("should keep the first special date declared for a day", () => {
+      const businessHours = BusinessHours.createStandardWeek([1, 2, 3, 4, 5])
+        .withSpecialDate({
+          date: new Date(2024, 0, 2),
+          isOpen: true,
+          timeSlots: [{ start: "10:00", end: "12:00" }],
+          reason: "Formation",
+        })
+        .withSpecialDate({
+          date: new Date(2024, 0, 2, 8),
+          isOpen: false,
+          reason: "Fermeture",
+        });
+
+      expect(businessHours.getTimeSlotsForDate(new Date(2024, 0, 2))).toEqual([
+        { start: "10:00", end: "12:00" },
+      ]);
+    });
+
+    it("should handle years of special dates", () => {
+      const specialDates: SpecialDate[] = [];
+      for (let day = 0; day < 3650; day += 3) {
+        specialDates.push({
+          date: new Date(2020, 0, 1 + day),
+          isOpen: false,
+          reason: "Fermeture",
+        });
+      }
+      const businessHours = new BusinessHours(
+        BusinessHours.createStandardWeek([
+          0, 1, 2, 3, 4, 5, 6,
+        ]).getWeeklySchedule(),
+        specialDates,
+      );
+
+      expect(businessHours.isOpenOnDate(new Date(2020, 0, 1 + 3000))).toBe(
+        false,
+      );
+      expect(businessHours.isOpenOnDate(new Date(2020, 0, 1 + 3001))).toBe(
+        true,
+      );
+    });
+
+    it("should remove special dates by local day", () => {
+      const businessHours = BusinessHours.createStandardWeek([1, 2, 3, 4, 5])
+        .withSpecialDate({
+          date: new Date(2024, 0, 2),
+          isOpen: false,
+          reason: "Fermeture",
+        })
+        .withoutSpecialDate(new Date(2024, 0, 2, 18));
+
+      expect(businessHours.getSpecialDates()).toHaveLength(0);
+      expect(businessHours.isOpenOnDate(new Date(2024, 0, 2))).toBe(true);
+    });
+  });
 });
@@ -0,0 +1,124 @@
+/**
+ * 🧪 Tests unitaires pour BusyTimeline / BusyCursor
+ *
+ * - Fusion des intervalles occupés (tri, chevauchements, contiguïté)
+ * - Parcours chronologique par curseur
+ * - Vérification ponctuelle par recherche dichotomique
+ */
+
+import { BusyTimeline } from "@domain/services/slot-availability.service";
+
+const MINUTE = 60000;
+const at = (minutes: number) => Date.UTC(2030, 0, 7) + minutes * MINUTE;
+const range = (start: number, end: number) => ({
+  startMs: at(start),
+  endMs: at(end),
+});
+
+describe("BusyTimeline", () => {
+  it("should merge unsorted, overlapping and adjacent ranges", () => {
+    const timeline = BusyTimeline.fromRanges([
+      range(600, 630),
+      range(540, 570),
+      range(560, 600),
+      range(700, 700),
+    ]);
+
+    expect(timeline.size).toBe(1);
+    expect(timeline.overlaps(at(540), at(630))).toBe(true);
+    expect(timeline.overlaps(at(630), at(660))).toBe(false);
+  });
+
+  it("should build from appointment time slots", () => {
+    const appointment = (start: number, end: number) => ({
+      timeSlot: {
+        getStartTime: () => new Date(at(start)),
+        getEndTime: () => new Date(at(end)),
+      },
+    });
+
+    const timeline = BusyTimeline.fromAppointments([
+      appointment(600, 645),
+      appointment(540, 555),
+    ]);
+
+    expect(timeline.size).toBe(2);
+    expect(timeline.overlaps(at(555), at(600))).toBe(false);
+    expect(timeline.overlaps(at(630), at(660))).toBe(true);
+  });
+
+  it("should treat ranges as half-open", () => {
+    const timeline = BusyTimeline.fromRanges([range(600, 630)]);
+
+    expect(timeline.overlaps(at(570), at(600))).toBe(false);
+    expect(timeline.overlaps(at(630), at(660))).toBe(false);
+    expect(timeline.overlaps(at(590), at(610))).toBe(true);
+    expect(timeline.overlaps(at(610), at(620))).toBe(true);
+    expect(timeline.overlaps(at(500), at(700))).toBe(true);
+  });
+
+  it("should answer like a linear scan when swept with a cursor", () => {
+    const ranges = [
+      range(545, 560),
+      range(600, 700),
+      range(650, 660),
+      range(840, 900),
+      range(1020, 1030),
+    ];
+    const timeline = BusyTimeline.fromRanges(ranges);
+    const cursor = timeline.cursor();
+
+    for (let start = 480; start < 1080; start += 30) {
+      const expected = ranges.some(
+        (busy) => at(start) < busy.endMs && busy.startMs < at(start + 30),
+      );
+
+      expect(cursor.overlaps(at(start), at(start + 30))).toBe(expected);
+      expect(timeline.overlaps(at(start), at(start + 30))).toBe(expected);
+    }
+  });
+
+  it("should list free slots on the step grid of each open range", () => {
+    const timeline = BusyTimeline.fromRanges([range(570, 600)]);
+
+    const slots = timeline.freeSlots(
+      [range(540, 660), range(720, 780)],
+      30 * MINUTE,
+      30 * MINUTE,
+    );
+
+    expect(slots).toEqual([
+      range(540, 570),
+      range(600, 630),
+      range(630, 660),
+      range(720, 750),
+      range(750, 780),
+    ]);
+    expect(
+      timeline.freeSlots([range(540, 660)], 30 * MINUTE, 30 * MINUTE, 2),
+    ).toEqual([range(540, 570), range(600, 630)]);
+  });
+
+  it("should expose the intervals overlapping a window without copy", () => {
+    const timeline = BusyTimeline.fromRanges([
+      range(480, 510),
+      range(540, 600),
+      range(660, 690),
+    ]);
+
+    const { starts, ends } = timeline.within(at(510), at(660));
+
+    expect(Array.from(starts)).toEqual([at(540)]);
+    expect(Array.from(ends)).toEqual([at(600)]);
+    expect(timeline.within(at(500), at(670)).starts.length).toBe(3);
+    expect(timeline.within(at(700), at(720)).starts.length).toBe(0);
+  });
+
+  it("should report nothing busy on an empty timeline", () => {
+    const timeline = BusyTimeline.empty();
+
+    expect(timeline.size).toBe(0);
+    expect(timeline.cursor().overlaps(at(0), at(30))).toBe(false);
+    expect(timeline.overlaps(at(0), at(30))).toBe(false);
+  });
+});
@@ -0,0 +1,154 @@
+/**
+ * 🧪 Tests unitaires pour StaffSkillIndex
+ *
+ * - Recherche par compétence, niveau minimum et certification
+ * - Intersection de plusieurs exigences
+ * - Maintenance sur ajout / mise à jour / retrait de compétences
+ * - Cohérence avec StaffSkills.matchesTeamRequirements
+ */
+
+import { StaffSkillIndex } from "@domain/services/staff-skill-index.service";
+import {
+  ProficiencyLevel,
+  SkillAssignment,
+  StaffSkills,
+} from "@domain/value-objects/staff-skills.value-object";
+
+const assignment = (
+  skillId: string,
+  proficiencyLevel: ProficiencyLevel,
+  options: { category?: string; isCertified?: boolean } = {},
+) =>
+  SkillAssignment.create({
+    skillId,
+    skillName: skillId,
+    skillCategory: options.category ?? "massage",
+    proficiencyLevel,
+    yearsOfExperience: 2,
+    isCertified: options.isCertified,
+  });
+
+describe("StaffSkillIndex", () => {
+  let index: StaffSkillIndex;
+
+  beforeEach(() => {
+    index = new StaffSkillIndex();
+    index.setStaffSkills(
+      "alice",
+      StaffSkills.create([
+        assignment("swedish", ProficiencyLevel.EXPERT, { isCertified: true }),
+        assignment("deep-tissue", ProficiencyLevel.INTERMEDIATE),
+      ]),
+    );
+    index.setStaffSkills(
+      "bob",
+      StaffSkills.create([
+        assignment("swedish", ProficiencyLevel.BEGINNER),
+        assignment("haircut", ProficiencyLevel.MASTER, { category: "hair" }),
+      ]),
+    );
+  });
+
+  it("should find staff by skill and minimum proficiency", () => {
+    expect(index.findStaffWithSkill("swedish")).toEqual(
+      new Set(["alice", "bob"]),
+    );
+    expect(
+      index.findStaffWithSkill("swedish", ProficiencyLevel.ADVANCED),
+    ).toEqual(new Set(["alice"]));
+    expect(index.findStaffWithSkill("unknown").size).toBe(0);
+  });
+
+  it("should intersect several requirements", () => {
+    const qualified = index.findQualifiedStaff([
+      { skillId: "swedish", minimumProficiency: ProficiencyLevel.BEGINNER },
+      {
+        skillId: "deep-tissue",
+        minimumProficiency: ProficiencyLevel.INTERMEDIATE,
+      },
+    ]);
+
+    expect(qualified).toEqual(new Set(["alice"]));
+  });
+
+  it("should require certification when asked", () => {
+    expect(
+      index.findStaffWithSkill("swedish", ProficiencyLevel.BEGINNER, true),
+    ).toEqual(new Set(["alice"]));
+  });
+
+  it("should find staff by category", () => {
+    expect(index.findStaffByCategory("hair")).toEqual(new Set(["bob"]));
+    expect(
+      index.findStaffByCategory("massage", ProficiencyLevel.EXPERT),
+    ).toEqual(new Set(["alice"]));
+  });
+
+  it("should follow skill updates and removals", () => {
+    index.upsertSkill("bob", assignment("swedish", ProficiencyLevel.MASTER));
+    expect(
+      index.findStaffWithSkill("swedish", ProficiencyLevel.EXPERT),
+    ).toEqual(new Set(["alice", "bob"]));
+
+    index.removeSkill("bob", "haircut");
+    expect(index.findStaffByCategory("hair").size).toBe(0);
+
+    index.removeStaff("alice");
+    expect(index.findStaffWithSkill("swedish")).toEqual(new Set(["bob"]));
+    expect(index.findStaffWithSkill("deep-tissue").size).toBe(0);
+    expect(index.staffCount).toBe(1);
+  });
+
+  it("should drop skills missing from a reindexed StaffSkills", () => {
+    index.setStaffSkills(
+      "alice",
+      StaffSkills.create([assignment("deep-tissue", ProficiencyLevel.EXPERT)]),
+    );
+
+    expect(index.findStaffWithSkill("swedish")).toEqual(new Set(["bob"]));
+    expect(
+      index.findStaffWithSkill("deep-tissue", ProficiencyLevel.EXPERT),
+    ).toEqual(new Set(["alice"]));
+  });
+
+  it("should agree with StaffSkills.matchesTeamRequirements", () => {
+    const levels = Object.values(ProficiencyLevel);
+    const staff = new Map<string, StaffSkills>();
+    const reference = new StaffSkillIndex();
+
+    for (let i = 0; i < 30; i++) {
+      const skills = StaffSkills.create(
+        ["a", "b", "c", "d"]
+          .filter((_, s) => (i >> s) % 2 === 1 || s === i % 4)
+          .map((skillId, s) =>
+            assignment(skillId, levels[(i + s) % levels.length], {
+              isCertified: (i + s) % 3 === 0,
+            }),
+          ),
+      );
+      staff.set(`staff-${i}`, skills);
+      reference.setStaffSkills(`staff-${i}`, skills);
+    }
+
+    const requirements = [
+      { skillId: "a", minimumProficiency: ProficiencyLevel.INTERMEDIATE },
+      {
+        skillId: "c",
+        minimumProficiency: ProficiencyLevel.BEGINNER,
+        requiresCertification: true,
+      },
+    ];
+
+    const expected = [...staff.entries()]
+      .filter(
+        ([, skills]) =>
+          skills.matchesTeamRequirements({ requiredSkills: requirements })
+            .matches,
+      )
+      .map(([staffId]) => staffId);
+
+    expect([...reference.findQualifiedStaff(requirements)].sort()).toEqual(
+      expected.sort(),
+    );
+  });
+});
@@ -0,0 +1,93 @@
+/**
+ * 🧪 Tests unitaires pour FreeBusyBitmap
+ *
+ * - Matérialisation depuis les plages d'ouverture
+ * - Occupation / libération incrémentale
+ * - Recherche de créneaux
+ * - Sérialisation compacte pour le cache
+ */
+
+import { ValueObjectValidationError } from "@domain/exceptions/domain.exceptions";
+import { FreeBusyBitmap } from "@domain/value-objects/free-busy-bitmap.value-object";
+
+// 9h-12h et 14h-18h
+const openingHours = () =>
+  FreeBusyBitmap.busy().withFree(540, 720).withFree(840, 1080);
+
+describe("FreeBusyBitmap", () => {
+  it("should mark only opening hours as free", () => {
+    const bitmap = openingHours();
+
+    expect(bitmap.isFree(540, 720)).toBe(true);
+    expect(bitmap.isFree(715, 725)).toBe(false);
+    expect(bitmap.isFree(480, 540)).toBe(false);
+    expect(FreeBusyBitmap.busy().withFree(542, 598).freeRanges()).toEqual([
+      [545, 595],
+    ]);
+  });
+
+  it("should occupy every slot touched by an appointment", () => {
+    const bitmap = openingHours().withBusy(600, 643);
+
+    expect(bitmap.isFree(595, 600)).toBe(true);
+    expect(bitmap.isFree(640, 645)).toBe(false);
+    expect(bitmap.isFree(645, 700)).toBe(true);
+  });
+
+  it("should release a cancelled appointment within opening hours only", () => {
+    const opening = openingHours();
+    const booked = opening.withBusy(600, 645).withBusy(900, 930);
+
+    expect(booked.withFree(600, 645, opening)).toEqual(
+      opening.withBusy(900, 930),
+    );
+    expect(FreeBusyBitmap.busy().withFree(0, 1440, opening)).toEqual(opening);
+  });
+
+  it("should list the starts of free slots of the requested duration", () => {
+    const bitmap = openingHours().withBusy(600, 645).withBusy(900, 1060);
+
+    expect(bitmap.freeStarts(60)).toEqual([
+      540, 645, 650, 655, 660, 840,
+    ]);
+    expect(bitmap.freeStarts(500)).toEqual([]);
+  });
+
+  it("should agree with isFree for every start and duration", () => {
+    const bitmap = FreeBusyBitmap.free()
+      .withBusy(35, 80)
+      .withBusy(400, 405)
+      .withBusy(633, 700)
+      .withBusy(1200, 1390);
+
+    for (const duration of [5, 25, 60, 240]) {
+      const expected: number[] = [];
+      for (let minute = 0; minute + duration <= 1440; minute += 5) {
+        if (bitmap.isFree(minute, minute + duration)) expected.push(minute);
+      }
+
+      expect(bitmap.freeStarts(duration)).toEqual(expected);
+    }
+  });
+
+  it("should list contiguous free ranges", () => {
+    expect(openingHours().withBusy(600, 645).freeRanges()).toEqual([
+      [540, 600],
+      [645, 720],
+      [840, 1080],
+    ]);
+    expect(FreeBusyBitmap.free().freeRanges()).toEqual([[0, 1440]]);
+    expect(FreeBusyBitmap.busy().freeRanges()).toEqual([]);
+  });
+
+  it("should round-trip through its compact serialization", () => {
+    const bitmap = openingHours().withBusy(600, 645);
+    const serialized = bitmap.serialize();
+
+    expect(serialized).toHaveLength(72);
+    expect(FreeBusyBitmap.deserialize(serialized).equals(bitmap)).toBe(true);
+    expect(() => FreeBusyBitmap.deserialize("not-a-bitmap")).toThrow(
+      ValueObjectValidationError,
+    );
+  });
+});
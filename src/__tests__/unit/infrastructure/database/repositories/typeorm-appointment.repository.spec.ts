@@ -0,0 +1,94 @@
+import { QueryFailedError, Repository } from "typeorm";
+
+import { AppointmentOrmEntity } from "@infrastructure/database/sql/postgresql/entities/appointment-orm.entity";
+import { TypeOrmAppointmentRepository } from "@infrastructure/database/sql/postgresql/repositories/typeorm-appointment.repository";
+
+import { Appointment } from "@domain/entities/appointment.entity";
+import { AppointmentSlotTakenError } from "@domain/exceptions/appointment.exceptions";
+import { BusinessId } from "@domain/value-objects/business-id.value-object";
+import { CalendarId } from "@domain/value-objects/calendar-id.value-object";
+import { Email } from "@domain/value-objects/email.value-object";
+import { Money } from "@domain/value-objects/money.value-object";
+import { ServiceId } from "@domain/value-objects/service-id.value-object";
+import { TimeSlot } from "@domain/value-objects/time-slot.value-object";
+
+const CALENDAR_ID = "660e8400-e29b-41d4-a716-446655440001";
+
+describe("TypeOrmAppointmentRepository", () => {
+  let repository: TypeOrmAppointmentRepository;
+  let mockOrmRepository: jest.Mocked<Repository<AppointmentOrmEntity>>;
+
+  const createAppointment = (): Appointment =>
+    Appointment.create({
+      businessId: BusinessId.generate(),
+      calendarId: CalendarId.create(CALENDAR_ID),
+      serviceId: ServiceId.generate(),
+      timeSlot: TimeSlot.create(
+        new Date("2099-01-14T09:00:00.000Z"),
+        new Date("2099-01-14T09:30:00.000Z"),
+      ),
+      clientInfo: {
+        firstName: "Jean",
+        lastName: "Dupont",
+        email: Email.create("jean.dupont@example.com"),
+        isNewClient: false,
+      },
+      pricing: {
+        basePrice: Money.create(50, "EUR"),
+        totalAmount: Money.create(50, "EUR"),
+        paymentStatus: "PENDING" as const,
+      },
+    });
+
+  const overlapError = (constraint: string) =>
+    new QueryFailedError("INSERT INTO appointments ...", [], {
+      code: "23P01",
+      constraint,
+    });
+
+  beforeEach(() => {
+    mockOrmRepository = {
+      insert: jest.fn(),
+      save: jest.fn(),
+    } as any;
+
+    repository = new TypeOrmAppointmentRepository(mockOrmRepository);
+  });
+
+  describe("create", () => {
+    it("should insert the row on the appointment calendar", async () => {
+      await repository.create(createAppointment());
+
+      expect(mockOrmRepository.insert).toHaveBeenCalledWith(
+        expect.objectContaining({ calendar_id: CALENDAR_ID }),
+      );
+    });
+
+    it("should translate an exclusion violation into AppointmentSlotTakenError", async () => {
+      mockOrmRepository.insert.mockRejectedValue(
+        overlapError("appointments_calendar_no_overlap"),
+      );
+
+      await expect(
+        repository.create(createAppointment()),
+      ).rejects.toBeInstanceOf(AppointmentSlotTakenError);
+    });
+
+    it("should rethrow an exclusion violation on another constraint", async () => {
+      const error = overlapError("other_constraint");
+      mockOrmRepository.insert.mockRejectedValue(error);
+
+      await expect(repository.create(createAppointment())).rejects.toBe(error);
+    });
+  });
+
+  describe("save", () => {
+    it("should persist the calendar id", async () => {
+      await repository.save(createAppointment());
+
+      expect(mockOrmRepository.save).toHaveBeenCalledWith(
+        expect.objectContaining({ calendar_id: CALENDAR_ID }),
+      );
+    });
+  });
+});
@@ -0,0 +1,126 @@
+/**
+ * 🧪 REQUEST ENTITY LOADER - UNIT TESTS
+ * ✅ Regroupement par tick et mémoïsation dans la portée de requête
+ */
+
+import {
+  registerRequestEntityScope,
+  RequestEntityLoader,
+} from "@infrastructure/database/sql/postgresql/utils/request-entity-loader";
+import fastify from "fastify";
+
+describe("RequestEntityLoader", () => {
+  const entities = new Map([
+    ["a", { id: "a" }],
+    ["b", { id: "b" }],
+  ]);
+  let batchLoad: jest.Mock;
+
+  beforeEach(() => {
+    batchLoad = jest.fn(async (ids: string[]) => {
+      const found = ids.filter((id) => entities.has(id));
+      return new Map(found.map((id) => [id, entities.get(id)]));
+    });
+  });
+
+  it("should coalesce same-tick loads into one batch", async () => {
+    const results = await RequestEntityLoader.run(() =>
+      Promise.all([
+        RequestEntityLoader.load("test", "a", batchLoad),
+        RequestEntityLoader.load("test", "b", batchLoad),
+        RequestEntityLoader.load("test", "a", batchLoad),
+        RequestEntityLoader.load("test", "missing", batchLoad),
+      ]),
+    );
+
+    expect(results).toEqual([{ id: "a" }, { id: "b" }, { id: "a" }, null]);
+    expect(batchLoad).toHaveBeenCalledTimes(1);
+    expect(batchLoad).toHaveBeenCalledWith(["a", "b", "missing"]);
+  });
+
+  it("should memoize for the lifetime of the scope", async () => {
+    await RequestEntityLoader.run(async () => {
+      await RequestEntityLoader.load("test", "a", batchLoad);
+      await RequestEntityLoader.load("test", "a", batchLoad);
+    });
+
+    expect(batchLoad).toHaveBeenCalledTimes(1);
+  });
+
+  it("should reload after clear", async () => {
+    await RequestEntityLoader.run(async () => {
+      await RequestEntityLoader.load("test", "a", batchLoad);
+      RequestEntityLoader.clear("test", "a");
+      await RequestEntityLoader.load("test", "a", batchLoad);
+    });
+
+    expect(batchLoad).toHaveBeenCalledTimes(2);
+  });
+
+  it("should not share entities between scopes", async () => {
+    await RequestEntityLoader.run(() =>
+      RequestEntityLoader.load("test", "a", batchLoad),
+    );
+    await RequestEntityLoader.run(() =>
+      RequestEntityLoader.load("test", "a", batchLoad),
+    );
+
+    expect(batchLoad).toHaveBeenCalledTimes(2);
+  });
+
+  it("should load directly outside a scope", async () => {
+    await RequestEntityLoader.load("test", "a", batchLoad);
+    await RequestEntityLoader.load("test", "a", batchLoad);
+
+    expect(batchLoad).toHaveBeenCalledTimes(2);
+    expect(batchLoad).toHaveBeenCalledWith(["a"]);
+  });
+
+  it("should not memoize a failed batch", async () => {
+    batchLoad.mockRejectedValueOnce(new Error("connection lost"));
+
+    await RequestEntityLoader.run(async () => {
+      await expect(
+        RequestEntityLoader.load("test", "a", batchLoad),
+      ).rejects.toThrow("connection lost");
+      await expect(
+        RequestEntityLoader.load("test", "a", batchLoad),
+      ).resolves.toEqual({ id: "a" });
+    });
+  });
+
+  describe("registerRequestEntityScope", () => {
+    it("should keep the scope across body parsing", async () => {
+      const app = fastify();
+      registerRequestEntityScope(app);
+      app.post("/load", async () => {
+        await RequestEntityLoader.load("test", "a", batchLoad);
+        await RequestEntityLoader.load("test", "a", batchLoad);
+        return { loads: batchLoad.mock.calls.length };
+      });
+
+      const response = await app.inject({
+        method: "POST",
+        url: "/load",
+        payload: { calendarIds: ["a"] },
+      });
+
+      expect(response.json()).toEqual({ loads: 1 });
+      await app.close();
+    });
+
+    it("should open a fresh scope per request", async () => {
+      const app = fastify();
+      registerRequestEntityScope(app);
+      app.get("/load", async () =>
+        RequestEntityLoader.load("test", "a", batchLoad),
+      );
+
+      await app.inject({ method: "GET", url: "/load" });
+      await app.inject({ method: "GET", url: "/load" });
+
+      expect(batchLoad).toHaveBeenCalledTimes(2);
+      await app.close();
+    });
+  });
+});
@@ -0,0 +1,181 @@
+/**
+ * 🧪 APPOINTMENT CONTROLLER - UNIT TESTS
+ * ✅ Export NDJSON des disponibilités via la réponse Fastify
+ */
+
+import type {
+  ExportAvailabilityUseCase,
+  ExportedDay,
+} from "@application/use-cases/appointments/export-availability.use-case";
+import type { User } from "@domain/entities/user.entity";
+import type { FastifyReply } from "fastify";
+import { Readable } from "stream";
+import { AppointmentController } from "../../../../presentation/controllers/appointment.controller";
+
+describe("AppointmentController", () => {
+  let controller: AppointmentController;
+  let exportAvailabilityUseCase: jest.Mocked<
+    Pick<ExportAvailabilityUseCase, "execute">
+  >;
+  let reply: {
+    status: jest.Mock;
+    header: jest.Mock;
+    send: jest.Mock;
+  };
+
+  const user = { id: "user-1" } as User;
+  const dto = {
+    businessId: "550e8400-e29b-41d4-a716-446655440000",
+    serviceId: "770e8400-e29b-41d4-a716-446655440002",
+    startDate: "2099-01-14",
+    endDate: "2099-01-15",
+  };
+
+  const day = (date: string): ExportedDay => ({
+    date,
+    calendars: [
+      {
+        calendarId: "cal-1",
+        slots: [
+          {
+            startTime: new Date(`${date}T09:00:00.000Z`),
+            endTime: new Date(`${date}T09:30:00.000Z`),
+          },
+        ],
+      },
+    ],
+  });
+
+  const exportResult = (days: AsyncGenerator<ExportedDay>) => ({
+    businessId: dto.businessId,
+    serviceId: dto.serviceId,
+    durationMinutes: 30,
+    periodStart: new Date("2099-01-14T00:00:00.000Z"),
+    periodEnd: new Date("2099-01-15T00:00:00.000Z"),
+    calendarIds: ["cal-1"],
+    days,
+  });
+
+  const readLines = async (stream: Readable): Promise<any[]> => {
+    const lines: any[] = [];
+    for await (const chunk of stream) {
+      lines.push(JSON.parse(String(chunk)));
+    }
+    return lines;
+  };
+
+  beforeEach(() => {
+    exportAvailabilityUseCase = { execute: jest.fn() };
+    reply = {
+      status: jest.fn().mockReturnThis(),
+      header: jest.fn().mockReturnThis(),
+      send: jest.fn(),
+    };
+
+    const unused = {} as any;
+    controller = new AppointmentController(
+      unused,
+      unused,
+      unused,
+      exportAvailabilityUseCase as unknown as ExportAvailabilityUseCase,
+      unused,
+      unused,
+      unused,
+      unused,
+      unused,
+      unused,
+      unused,
+    );
+  });
+
+  describe("exportAvailability", () => {
+    it("should stream meta, day and end lines through the reply", async () => {
+      async function* days() {
+        yield day("2099-01-14");
+        yield day("2099-01-15");
+      }
+      exportAvailabilityUseCase.execute.mockResolvedValue(
+        exportResult(days()),
+      );
+
+      await controller.exportAvailability(
+        dto as any,
+        user,
+        reply as unknown as FastifyReply,
+      );
+
+      expect(reply.status).toHaveBeenCalledWith(200);
+      expect(reply.header).toHaveBeenCalledWith(
+        "Content-Type",
+        "application/x-ndjson; charset=utf-8",
+      );
+      const stream = reply.send.mock.calls[0][0];
+      expect(stream).toBeInstanceOf(Readable);
+
+      const lines = await readLines(stream);
+      expect(lines.map((line) => line.type)).toEqual([
+        "meta",
+        "day",
+        "day",
+        "end",
+      ]);
+      expect(lines[3].days).toBe(2);
+    });
+
+    it("should report a mid-stream failure as an error line", async () => {
+      async function* days(): AsyncGenerator<ExportedDay> {
+        yield day("2099-01-14");
+        throw new Error("database unavailable");
+      }
+      exportAvailabilityUseCase.execute.mockResolvedValue(
+        exportResult(days()),
+      );
+
+      await controller.exportAvailability(
+        dto as any,
+        user,
+        reply as unknown as FastifyReply,
+      );
+
+      const lines = await readLines(reply.send.mock.calls[0][0]);
+      expect(lines[lines.length - 1]).toEqual({
+        type: "error",
+        message: "database unavailable",
+      });
+    });
+
+    it("should stop computing days once the stream is destroyed", async () => {
+      let stopped = false;
+      let produced = 0;
+      async function* days(): AsyncGenerator<ExportedDay> {
+        try {
+          for (;;) {
+            produced++;
+            await new Promise((resolve) => setImmediate(resolve));
+            yield day("2099-01-14");
+          }
+        } finally {
+          stopped = true;
+        }
+      }
+      exportAvailabilityUseCase.execute.mockResolvedValue(
+        exportResult(days()),
+      );
+
+      await controller.exportAvailability(
+        dto as any,
+        user,
+        reply as unknown as FastifyReply,
+      );
+
+      // Client déconnecté : Fastify détruit le flux
+      const stream: Readable = reply.send.mock.calls[0][0];
+      await stream[Symbol.asyncIterator]().next();
+      stream.destroy();
+      await new Promise((resolve) => setTimeout(resolve, 20));
+
+      expect(stopped).toBe(true);
+      expect(produced).toBeLessThan(20);
+    });
+  });
+});
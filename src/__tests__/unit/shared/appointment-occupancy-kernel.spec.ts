@@ -0,0 +1,88 @@
+/**
+ * 🧪 Tests unitaires pour AppointmentOccupancyKernel
+ *
+ * - Comptage par tableau de différences vs vérification créneau par créneau
+ * - Masque des créneaux entièrement contenus dans les plages d'ouverture
+ * - Synthèse d'utilisation (créneaux ouverts, pics)
+ */
+
+import { AppointmentOccupancyKernel } from "@shared/utils/appointment.utils";
+
+const MINUTE = 60000;
+const GRID_START = new Date(2030, 0, 7).getTime();
+const at = (minutes: number) => GRID_START + minutes * MINUTE;
+
+describe("AppointmentOccupancyKernel", () => {
+  it("should match a per-slot overlap check", () => {
+    const slotMs = 15 * MINUTE;
+    const slotCount = 96;
+    const intervals: Array<[number, number]> = [];
+    for (let i = 0; i < 60; i++) {
+      const start = (i * 37) % 1400;
+      intervals.push([start - 20, start + 5 + ((i * 13) % 120)]);
+    }
+    const windows = [
+      [480, 727],
+      [793, 1080],
+    ];
+
+    const occupancy = AppointmentOccupancyKernel.compute(
+      Float64Array.from(intervals.map(([start]) => at(start))),
+      Float64Array.from(intervals.map(([, end]) => at(end))),
+      GRID_START,
+      slotMs,
+      slotCount,
+      Float64Array.from(windows.flat().map(at)),
+    );
+
+    for (let k = 0; k < slotCount; k++) {
+      const slotStart = GRID_START + k * slotMs;
+      const slotEnd = slotStart + slotMs;
+      const expectedCount = intervals.filter(
+        ([start, end]) => at(start) < slotEnd && at(end) > slotStart,
+      ).length;
+      const expectedOpen = windows.some(
+        ([start, end]) => at(start) <= slotStart && slotEnd <= at(end),
+      );
+
+      expect(occupancy.counts[k]).toBe(expectedCount);
+      expect(occupancy.open[k]).toBe(expectedOpen ? 1 : 0);
+    }
+  });
+
+  it("should ignore empty intervals and open every slot by default", () => {
+    const occupancy = AppointmentOccupancyKernel.compute(
+      Float64Array.from([at(60), at(120)]),
+      Float64Array.from([at(60), at(90)]),
+      GRID_START,
+      30 * MINUTE,
+      4,
+    );
+
+    expect(Array.from(occupancy.counts)).toEqual([0, 0, 0, 0]);
+    expect(Array.from(occupancy.open)).toEqual([1, 1, 1, 1]);
+  });
+
+  it("should summarize utilization over open slots", () => {
+    const occupancy = AppointmentOccupancyKernel.compute(
+      Float64Array.from([at(540), at(540), at(600)]),
+      Float64Array.from([at(570), at(600), at(630)]),
+      GRID_START,
+      30 * MINUTE,
+      48,
+      Float64Array.from([at(540), at(660)]),
+    );
+
+    expect(AppointmentOccupancyKernel.summarize(occupancy)).toEqual({
+      totalSlots: 4,
+      bookedSlots: 3,
+      availableSlots: 1,
+      utilizationPercentage: 75,
+      peakTimes: [
+        { time: "09:00", bookingCount: 2 },
+        { time: "09:30", bookingCount: 1 },
+        { time: "10:00", bookingCount: 1 },
+      ],
+    });
+  });
+});
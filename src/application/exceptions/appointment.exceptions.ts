@@ -76,6 +76,28 @@ export class AppointmentConflictError extends AppointmentException {
   }
 }
 
+export class SlotHoldExpiredError extends AppointmentException {
+  constructor(calendarId: string, token: string) {
+    super(
+      `Slot hold ${token} on calendar ${calendarId} is expired or does not match the booking`,
+      "SLOT_HOLD_EXPIRED",
+      { calendarId, token },
+    );
+    this.name = "SlotHoldExpiredError";
+  }
+}
+
+export class SlotHoldLimitExceededError extends AppointmentException {
+  constructor(requestingUserId: string, limit: number, windowSeconds: number) {
+    super(
+      `User ${requestingUserId} exceeded ${limit} slot holds per ${windowSeconds}s`,
+      "SLOT_HOLD_LIMIT_EXCEEDED",
+      { requestingUserId, limit, windowSeconds },
+    );
+    this.name = "SlotHoldLimitExceededError";
+  }
+}
+
 export class InvalidAppointmentStatusError extends AppointmentException {
   constructor(currentStatus: string, attemptedOperation: string) {
     super(
@@ -0,0 +1,35 @@
+/**
+ * 🧮 Free/Busy Store Port - Application Layer
+ * ✅ Journées libre/occupé matérialisées, partagées entre instances
+ * ✅ Clean Architecture - Port pour l'infrastructure
+ *
+ * Chaque calendrier porte un numéro de génération inclus dans les clés de
+ * ses journées : l'incrémenter rend d'un coup toutes ses entrées
+ * inaccessibles, y compris celles écrites en concurrence par un lecteur qui
+ * avait lu la base avant la modification.
+ */
+
+export interface IFreeBusyStore {
+  /**
+   * 🔢 Génération courante de chaque calendrier (0 si jamais invalidé)
+   */
+  getGenerations(calendarIds: readonly string[]): Promise<number[]>;
+
+  /**
+   * ♻️ Invalider toutes les journées en cache d'un calendrier
+   */
+  bumpGeneration(calendarId: string): Promise<void>;
+
+  /**
+   * 🔍 Journées en cache (null si absente ou expirée), dans l'ordre des clés
+   */
+  getDays(keys: readonly string[]): Promise<(string | null)[]>;
+
+  /**
+   * 💾 Enregistrer des journées pour ttlSeconds
+   */
+  setDays(
+    entries: ReadonlyMap<string, string>,
+    ttlSeconds: number,
+  ): Promise<void>;
+}
@@ -0,0 +1,49 @@
+/**
+ * 🖼️ Image Storage Port - Application Layer
+ * ✅ Upload des images business avec variantes et URLs signées
+ * ✅ Clean Architecture - Port pour l'infrastructure
+ */
+
+import type { ImageCategory } from "../../domain/value-objects/business-image.value-object";
+import type { ImageUploadSettings } from "../../domain/value-objects/image-upload-settings.value-object";
+
+export interface UploadImageMetadata {
+  readonly category: ImageCategory;
+  readonly fileName: string;
+  readonly contentType: string;
+  readonly alt?: string;
+  readonly size?: number;
+  readonly dimensions?: {
+    readonly width: number;
+    readonly height: number;
+  };
+}
+
+export interface UploadResult {
+  readonly s3Key: string;
+  readonly variants?: {
+    readonly thumbnail: string;
+    readonly medium: string;
+    readonly large?: string;
+  };
+}
+
+export interface IImageStorage {
+  /**
+   * 📤 Valider l'image selon les réglages puis la stocker avec ses variantes
+   */
+  validateAndUpload(
+    businessId: string,
+    imageBuffer: Buffer,
+    metadata: UploadImageMetadata,
+    uploadSettings: ImageUploadSettings,
+  ): Promise<UploadResult>;
+
+  /**
+   * 🔗 URL de téléchargement signée, valable expirationMinutes
+   */
+  generateDownloadUrl(
+    storageKey: string,
+    expirationMinutes?: number,
+  ): Promise<string>;
+}
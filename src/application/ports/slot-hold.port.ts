@@ -0,0 +1,58 @@
+/**
+ * ⏳ Slot Hold Port - Application Layer
+ * ✅ Retenue temporaire d'un créneau avant réservation
+ * ✅ Clean Architecture - Port pour l'infrastructure
+ */
+
+export interface SlotHoldRequest {
+  readonly businessId: string;
+  readonly serviceId: string;
+  readonly calendarId: string;
+  readonly staffId?: string;
+  readonly startTime: Date;
+  readonly endTime: Date;
+}
+
+export interface SlotHold extends SlotHoldRequest {
+  readonly token: string;
+  readonly expiresAt: Date;
+}
+
+export interface ISlotHoldStore {
+  /**
+   * 🔒 Retenir atomiquement un créneau pour ttlSeconds
+   * @returns La retenue et son jeton, ou null si le créneau chevauche une
+   * retenue active du même calendrier
+   */
+  acquire(
+    request: SlotHoldRequest,
+    ttlSeconds: number,
+  ): Promise<SlotHold | null>;
+
+  /**
+   * 🔍 Retenue active correspondant au jeton (null si inconnue ou expirée)
+   */
+  find(calendarId: string, token: string): Promise<SlotHold | null>;
+
+  /**
+   * ⚡ Vérifier si une retenue active chevauche [startTime, endTime)
+   * @param exceptToken - Retenue à ignorer (celle du demandeur)
+   */
+  isHeld(
+    calendarId: string,
+    startTime: Date,
+    endTime: Date,
+    exceptToken?: string,
+  ): Promise<boolean>;
+
+  /**
+   * 🗑️ Libérer une retenue (réservation effectuée ou abandonnée)
+   */
+  release(calendarId: string, token: string): Promise<void>;
+
+  /**
+   * 🚦 Compter une tentative de retenue du demandeur sur une fenêtre fixe
+   * @returns Nombre de tentatives dans la fenêtre courante, celle-ci comprise
+   */
+  countAttempt(holderId: string, windowSeconds: number): Promise<number>;
+}
@@ -0,0 +1,26 @@
+/**
+ * 📣 Slots Cache Invalidation Port - Application Layer
+ * ✅ Diffusion des invalidations du cache de créneaux entre instances
+ * ✅ Clean Architecture - Port pour l'infrastructure
+ */
+
+export interface SlotsCacheInvalidation {
+  readonly calendarId: string;
+  readonly startTime: Date;
+  readonly endTime: Date;
+}
+
+export interface ISlotsCacheInvalidationBus {
+  /**
+   * Diffuser une invalidation aux autres instances
+   */
+  publish(invalidation: SlotsCacheInvalidation): Promise<void>;
+
+  /**
+   * Recevoir les invalidations émises par les autres instances
+   * (jamais celles de l'instance courante)
+   */
+  subscribe(
+    handler: (invalidation: SlotsCacheInvalidation) => void,
+  ): Promise<void>;
+}
@@ -0,0 +1,283 @@
+/**
+ * 🗃️ Available Slots Cache - Application Layer
+ * ✅ Créneaux calculés par (calendrier, service, praticien, jour, durée)
+ * ✅ TTL + éviction LRU bornée en octets
+ * ✅ Invalidation exacte des jours touchés par une réservation, un
+ *    déplacement ou une annulation sur le calendrier
+ * ✅ Invalidation de tout le calendrier quand les horaires changent
+ *
+ * Le cache conserve la grille brute de la journée (débuts de créneaux et
+ * occupation) : le filtrage « passé » et la mise en forme restent faits à
+ * chaque lecture, une entrée reste donc valable toute la journée.
+ *
+ * Le cache est propre à chaque instance : une fois connecté à un bus
+ * (connect), chaque invalidation est diffusée aux autres instances. Sans
+ * bus, ou si un message se perd, le TTL borne la durée d'une entrée périmée.
+ */
+
+import type {
+  ISlotsCacheInvalidationBus,
+  SlotsCacheInvalidation,
+} from "../ports/slots-cache-invalidation.port";
+
+export interface DaySlotsCacheKey {
+  readonly calendarId: string;
+  readonly serviceId: string;
+  readonly staffId?: string;
+  readonly day: Date;
+  readonly duration?: number;
+}
+
+export interface SlotGrid {
+  readonly slotDurationMs: number;
+  readonly starts: Float64Array;
+  readonly occupied: Uint8Array;
+  readonly price?: number;
+  readonly staffName?: string;
+  readonly staffId?: string;
+}
+
+export interface AvailableSlotsCacheStats {
+  readonly hits: number;
+  readonly misses: number;
+  readonly hitRate: number;
+  readonly evictions: number;
+  readonly invalidations: number;
+  readonly remoteInvalidations: number;
+  readonly broadcastFailures: number;
+  readonly entries: number;
+  readonly bytes: number;
+}
+
+interface CacheEntry {
+  readonly grid: SlotGrid;
+  readonly calendarId: string;
+  readonly day: string;
+  readonly bytes: number;
+  readonly expiresAt: number;
+}
+
+/**
+ * Jour calendaire local, au format yyyy-mm-dd
+ */
+export function toLocalDayKey(date: Date): string {
+  return [
+    date.getFullYear(),
+    String(date.getMonth() + 1).padStart(2, "0"),
+    String(date.getDate()).padStart(2, "0"),
+  ].join("-");
+}
+
+export class AvailableSlotsCache {
+  static readonly DEFAULT_MAX_BYTES = 16 * 1024 * 1024;
+  static readonly DEFAULT_TTL_MS = 10 * 60 * 1000;
+
+  // Plus grande date représentable : fin de plage d'invalidateCalendar
+  private static readonly END_OF_TIME = new Date(8.64e15);
+
+  // Estimation des objets JS (entrée, grille, clés de Map) hors tableaux
+  private static readonly ENTRY_OVERHEAD_BYTES = 256;
+
+  // Ordre d'insertion de la Map = ordre LRU (la plus ancienne en tête)
+  private readonly entries = new Map<string, CacheEntry>();
+
+  // calendarId -> jour -> clés, pour invalider sans parcourir le cache
+  private readonly keysByCalendarDay = new Map<
+    string,
+    Map<string, Set<string>>
+  >();
+
+  private bytes = 0;
+  private hits = 0;
+  private misses = 0;
+  private evictions = 0;
+  private invalidations = 0;
+  private remoteInvalidations = 0;
+  private broadcastFailures = 0;
+  private bus?: ISlotsCacheInvalidationBus;
+
+  constructor(
+    private readonly maxBytes: number = AvailableSlotsCache.DEFAULT_MAX_BYTES,
+    private readonly ttlMs: number = AvailableSlotsCache.DEFAULT_TTL_MS,
+    private readonly now: () => number = Date.now,
+  ) {}
+
+  get(key: DaySlotsCacheKey): SlotGrid | undefined {
+    const cacheKey = this.toCacheKey(key);
+    const entry = this.entries.get(cacheKey);
+
+    if (!entry || entry.expiresAt <= this.now()) {
+      if (entry) this.remove(cacheKey);
+      this.misses++;
+      return undefined;
+    }
+
+    // Remettre en fin de Map : entrée la plus récemment utilisée
+    this.entries.delete(cacheKey);
+    this.entries.set(cacheKey, entry);
+    this.hits++;
+    return entry.grid;
+  }
+
+  set(key: DaySlotsCacheKey, grid: SlotGrid): void {
+    const cacheKey = this.toCacheKey(key);
+    const bytes = this.sizeOf(cacheKey, grid);
+    if (bytes > this.maxBytes) return;
+
+    this.remove(cacheKey);
+
+    const day = toLocalDayKey(key.day);
+    this.entries.set(cacheKey, {
+      grid,
+      calendarId: key.calendarId,
+      day,
+      bytes,
+      expiresAt: this.now() + this.ttlMs,
+    });
+    this.bytes += bytes;
+    this.indexKey(key.calendarId, day).add(cacheKey);
+
+    while (this.bytes > this.maxBytes) {
+      const oldest = this.entries.keys().next().value;
+      if (oldest === undefined) break;
+      this.remove(oldest);
+      this.evictions++;
+    }
+  }
+
+  /**
+   * Recevoir les invalidations des autres instances et leur diffuser
+   * désormais celles de cette instance
+   */
+  async connect(bus: ISlotsCacheInvalidationBus): Promise<void> {
+    this.bus = bus;
+    await bus.subscribe((invalidation) => {
+      this.remoteInvalidations++;
+      this.invalidateLocal(invalidation);
+    });
+  }
+
+  /**
+   * Invalide tous les services, praticiens et durées du calendrier pour
+   * chaque jour touché par [startTime, endTime), ici et sur les autres
+   * instances
+   */
+  invalidate(calendarId: string, startTime: Date, endTime: Date): void {
+    const invalidation = { calendarId, startTime, endTime };
+    this.invalidateLocal(invalidation);
+
+    // Diffusion sans attente : l'écriture appelante ne dépend pas de Redis
+    this.bus?.publish(invalidation).catch(() => {
+      this.broadcastFailures++;
+    });
+  }
+
+  /**
+   * Invalide tous les jours en cache du calendrier (horaires hebdomadaires
+   * modifiés), ici et sur les autres instances
+   */
+  invalidateCalendar(calendarId: string): void {
+    this.invalidate(calendarId, new Date(0), AvailableSlotsCache.END_OF_TIME);
+  }
+
+  stats(): AvailableSlotsCacheStats {
+    const lookups = this.hits + this.misses;
+    return {
+      hits: this.hits,
+      misses: this.misses,
+      hitRate: lookups === 0 ? 0 : this.hits / lookups,
+      evictions: this.evictions,
+      invalidations: this.invalidations,
+      remoteInvalidations: this.remoteInvalidations,
+      broadcastFailures: this.broadcastFailures,
+      entries: this.entries.size,
+      bytes: this.bytes,
+    };
+  }
+
+  private invalidateLocal({
+    calendarId,
+    startTime,
+    endTime,
+  }: SlotsCacheInvalidation): void {
+    const days = this.keysByCalendarDay.get(calendarId);
+    if (!days) return;
+
+    // Jours en cache du calendrier (et non jours de la plage) : une plage
+    // large, comme celle d'invalidateCalendar, reste bornée par le cache
+    const firstDay = new Date(
+      startTime.getFullYear(),
+      startTime.getMonth(),
+      startTime.getDate(),
+    ).getTime();
+    for (const [day, keys] of [...days]) {
+      const dayStart = this.dayStart(day);
+      const touched =
+        dayStart === firstDay ||
+        (dayStart > firstDay && dayStart < endTime.getTime());
+      if (!touched) continue;
+
+      for (const cacheKey of [...keys]) {
+        this.remove(cacheKey);
+        this.invalidations++;
+      }
+    }
+  }
+
+  private dayStart(day: string): number {
+    const [year, month, date] = day.split("-").map(Number);
+    return new Date(year, month - 1, date).getTime();
+  }
+
+  private remove(cacheKey: string): void {
+    const entry = this.entries.get(cacheKey);
+    if (!entry) return;
+
+    this.entries.delete(cacheKey);
+    this.bytes -= entry.bytes;
+
+    const days = this.keysByCalendarDay.get(entry.calendarId);
+    const keys = days?.get(entry.day);
+    keys?.delete(cacheKey);
+    if (days && keys?.size === 0) {
+      days.delete(entry.day);
+      if (days.size === 0) this.keysByCalendarDay.delete(entry.calendarId);
+    }
+  }
+
+  private indexKey(calendarId: string, day: string): Set<string> {
+    let days = this.keysByCalendarDay.get(calendarId);
+    if (!days) {
+      days = new Map();
+      this.keysByCalendarDay.set(calendarId, days);
+    }
+
+    let keys = days.get(day);
+    if (!keys) {
+      keys = new Set();
+      days.set(day, keys);
+    }
+    return keys;
+  }
+
+  private toCacheKey(key: DaySlotsCacheKey): string {
+    return [
+      key.calendarId,
+      key.serviceId,
+      key.staffId ?? "-",
+      toLocalDayKey(key.day),
+      key.duration ?? "default",
+    ].join("|");
+  }
+
+  private sizeOf(cacheKey: string, grid: SlotGrid): number {
+    return (
+      AvailableSlotsCache.ENTRY_OVERHEAD_BYTES +
+      grid.starts.byteLength +
+      grid.occupied.byteLength +
+      // Chaînes JS en UTF-16 : la clé est stockée dans la Map et l'index
+      cacheKey.length * 4 +
+      ((grid.staffName?.length ?? 0) + (grid.staffId?.length ?? 0)) * 2
+    );
+  }
+}
@@ -0,0 +1,359 @@
+/**
+ * 🧮 Free/Busy Service - Application Layer
+ * ✅ Bitmaps libre/occupé par calendrier et par jour (pas de 5 minutes)
+ * ✅ Matérialisés depuis les horaires du calendrier et les rendez-vous
+ * ✅ Partagés entre instances (IFreeBusyStore) et servis à la disponibilité
+ *
+ * Chaque journée en cache porte deux bitmaps : l'ouverture, qui donne
+ * l'alignement des créneaux, et l'ouverture moins les rendez-vous. Une
+ * réservation, une annulation ou un déplacement incrémente la génération du
+ * calendrier au lieu de patcher les journées : aucune écriture concurrente
+ * ne peut réintroduire une journée périmée.
+ *
+ * Les bitmaps sont au pas de 5 minutes : un rendez-vous qui finit à 9h07
+ * bloque jusqu'à 9h10. Le résultat est donc au plus aussi permissif que le
+ * calcul exact du repository, et la réservation revérifie toujours en base.
+ */
+
+import type {
+  CalendarFreeBusy,
+  CalendarRepository,
+} from "../../domain/repositories/calendar.repository.interface";
+import { CalendarId } from "../../domain/value-objects/calendar-id.value-object";
+import { FreeBusyBitmap } from "../../domain/value-objects/free-busy-bitmap.value-object";
+import { TimeSlot } from "../../domain/value-objects/time-slot.value-object";
+import type { IFreeBusyStore } from "../ports/free-busy-store.port";
+import type { Logger } from "../ports/logger.port";
+
+interface DayWindow {
+  readonly key: string;
+  readonly year: number;
+  readonly month: number;
+  readonly date: number;
+  readonly startMs: number;
+  readonly endMs: number;
+}
+
+interface CachedDay {
+  readonly stepMinutes: number | null;
+  readonly opening: FreeBusyBitmap;
+  readonly free: FreeBusyBitmap;
+}
+
+export interface CalendarSlots {
+  readonly calendarId: CalendarId;
+  readonly slots: TimeSlot[];
+}
+
+export class FreeBusyService {
+  private static readonly TTL_SECONDS = 10 * 60;
+  private static readonly MAX_DAYS = 62;
+
+  constructor(
+    private readonly calendarRepository: CalendarRepository,
+    private readonly store: IFreeBusyStore,
+    private readonly logger: Logger,
+  ) {}
+
+  /**
+   * Même contrat que CalendarRepository.findAvailableSlots : créneaux libres
+   * de `durationMinutes` par calendrier, dans l'ordre demandé, calendriers
+   * inconnus omis. Deux lectures groupées quand tout est en cache ; sinon
+   * une seule requête repository pour toutes les journées manquantes.
+   */
+  async findAvailableSlots(
+    calendarIds: CalendarId[],
+    periodStart: Date,
+    periodEnd: Date,
+    durationMinutes: number,
+  ): Promise<CalendarSlots[]> {
+    if (calendarIds.length === 0 || periodStart >= periodEnd) {
+      return [];
+    }
+
+    const days = this.dayWindows(periodStart, periodEnd);
+    const ids = calendarIds.map((calendarId) => calendarId.getValue());
+    const storeKeys = await this.dayKeys(ids, days);
+    const cacheable = storeKeys !== null;
+    const keys =
+      storeKeys ??
+      ids.map((id) => days.map((day) => `${id}:uncached:${day.key}`));
+    const cached = cacheable
+      ? await this.read(keys.flat())
+      : new Map<string, CachedDay>();
+
+    const missing = ids
+      .map((_, index) => index)
+      .filter((index) => keys[index].some((key) => !cached.has(key)));
+    const unknown = new Set<number>();
+
+    if (missing.length > 0) {
+      const loaded = await this.materialize(
+        missing.map((index) => calendarIds[index]),
+        days,
+      );
+      const entries = new Map<string, string>();
+
+      for (const index of missing) {
+        const freeBusy = loaded.get(ids[index]);
+        if (!freeBusy) {
+          unknown.add(index);
+          continue;
+        }
+
+        days.forEach((day, dayIndex) => {
+          const key = keys[index][dayIndex];
+          if (!cached.has(key)) {
+            const cachedDay = this.buildDay(freeBusy, day);
+            cached.set(key, cachedDay);
+            entries.set(key, this.serialize(cachedDay));
+          }
+        });
+      }
+
+      if (cacheable) {
+        await this.write(entries);
+      }
+    }
+
+    const results: CalendarSlots[] = [];
+    ids.forEach((_, index) => {
+      if (unknown.has(index)) return;
+
+      const slots: TimeSlot[] = [];
+      days.forEach((day, dayIndex) => {
+        this.collectSlots(
+          cached.get(keys[index][dayIndex])!,
+          day,
+          periodStart.getTime(),
+          periodEnd.getTime(),
+          durationMinutes,
+          slots,
+        );
+      });
+      results.push({ calendarId: calendarIds[index], slots });
+    });
+
+    return results;
+  }
+
+  /**
+   * Rend périmées toutes les journées en cache du calendrier, sur toutes
+   * les instances. Sans effet sur l'opération appelante en cas d'échec.
+   */
+  async invalidate(calendarId: CalendarId): Promise<void> {
+    try {
+      await this.store.bumpGeneration(calendarId.getValue());
+    } catch (error) {
+      this.logger.warn("Free/busy invalidation failed", {
+        calendarId: calendarId.getValue(),
+        error: error instanceof Error ? error.message : String(error),
+      });
+    }
+  }
+
+  /**
+   * Créneaux alignés sur le pas depuis le début de chaque plage d'ouverture,
+   * comme le calcul repository ; une plage entamée reprend au pas suivant.
+   * Pas multiple de 5 minutes : les débuts libres de la journée sont
+   * extraits en un seul parcours du bitmap, puis filtrés par plage.
+   */
+  private collectSlots(
+    cachedDay: CachedDay,
+    day: DayWindow,
+    periodStartMs: number,
+    periodEndMs: number,
+    durationMinutes: number,
+    slots: TimeSlot[],
+  ): void {
+    const step = cachedDay.stepMinutes ?? durationMinutes;
+    const at = (minute: number): Date =>
+      new Date(day.year, day.month, day.date, 0, minute);
+    const fits = (minute: number, rangeEnd: number): boolean =>
+      minute + durationMinutes <= rangeEnd &&
+      at(minute + durationMinutes).getTime() <= periodEndMs;
+
+    const freeStarts =
+      step % FreeBusyBitmap.SLOT_MINUTES === 0
+        ? cachedDay.free.freeStarts(durationMinutes)
+        : null;
+    let next = 0;
+
+    for (const [rangeStart, rangeEnd] of cachedDay.opening.freeRanges()) {
+      let minute = rangeStart;
+      const openMs = at(rangeStart).getTime();
+      if (openMs < periodStartMs) {
+        minute += Math.ceil((periodStartMs - openMs) / 60000 / step) * step;
+      }
+
+      if (freeStarts) {
+        // Plages et débuts libres croissants : un curseur pour la journée
+        while (next < freeStarts.length && freeStarts[next] < minute) next++;
+        for (; next < freeStarts.length; next++) {
+          const start = freeStarts[next];
+          if (!fits(start, rangeEnd)) break;
+          if ((start - minute) % step === 0) {
+            slots.push(TimeSlot.create(at(start), at(start + durationMinutes)));
+          }
+        }
+        continue;
+      }
+
+      for (; fits(minute, rangeEnd); minute += step) {
+        if (cachedDay.free.isFree(minute, minute + durationMinutes)) {
+          slots.push(
+            TimeSlot.create(at(minute), at(minute + durationMinutes)),
+          );
+        }
+      }
+    }
+  }
+
+  private async materialize(
+    calendarIds: CalendarId[],
+    days: DayWindow[],
+  ): Promise<Map<string, CalendarFreeBusy>> {
+    const freeBusy = await this.calendarRepository.findFreeBusy(
+      calendarIds,
+      new Date(days[0].startMs),
+      new Date(days[days.length - 1].endMs),
+    );
+    return new Map(
+      freeBusy.map((entry) => [entry.calendarId.getValue(), entry]),
+    );
+  }
+
+  private buildDay(freeBusy: CalendarFreeBusy, day: DayWindow): CachedDay {
+    let opening = FreeBusyBitmap.busy();
+    for (const range of freeBusy.openRanges) {
+      if (range.endMs > day.startMs && range.startMs < day.endMs) {
+        const [start, end] = this.minutesWithin(day, range);
+        opening = opening.withFree(start, end);
+      }
+    }
+
+    let free = opening;
+    for (const range of freeBusy.busyRanges) {
+      if (range.endMs > day.startMs && range.startMs < day.endMs) {
+        const [start, end] = this.minutesWithin(day, range);
+        free = free.withBusy(start, end);
+      }
+    }
+
+    return { stepMinutes: freeBusy.slotStepMinutes, opening, free };
+  }
+
+  /**
+   * Clés `calendrier:génération:jour`, une ligne par calendrier ; null si
+   * les générations sont illisibles (le cache est alors contourné)
+   */
+  private async dayKeys(
+    ids: string[],
+    days: DayWindow[],
+  ): Promise<string[][] | null> {
+    try {
+      const generations = await this.store.getGenerations(ids);
+      return ids.map((id, index) =>
+        days.map((day) => `${id}:${generations[index]}:${day.key}`),
+      );
+    } catch (error) {
+      this.logger.warn("Free/busy generation read failed", {
+        error: error instanceof Error ? error.message : String(error),
+      });
+      return null;
+    }
+  }
+
+  private async read(keys: string[]): Promise<Map<string, CachedDay>> {
+    const days = new Map<string, CachedDay>();
+    try {
+      const values = await this.store.getDays(keys);
+      keys.forEach((key, index) => {
+        const value = values[index];
+        if (value) {
+          days.set(key, this.deserialize(value));
+        }
+      });
+    } catch (error) {
+      this.logger.warn("Free/busy cache read failed", {
+        error: error instanceof Error ? error.message : String(error),
+      });
+    }
+    return days;
+  }
+
+  private async write(entries: Map<string, string>): Promise<void> {
+    try {
+      await this.store.setDays(entries, FreeBusyService.TTL_SECONDS);
+    } catch (error) {
+      this.logger.warn("Free/busy cache write failed", {
+        entryCount: entries.size,
+        error: error instanceof Error ? error.message : String(error),
+      });
+    }
+  }
+
+  private serialize(day: CachedDay): string {
+    return [
+      day.stepMinutes ?? 0,
+      day.opening.serialize(),
+      day.free.serialize(),
+    ].join("|");
+  }
+
+  private deserialize(value: string): CachedDay {
+    const [step, opening, free] = value.split("|");
+    return {
+      stepMinutes: Number(step) > 0 ? Number(step) : null,
+      opening: FreeBusyBitmap.deserialize(opening),
+      free: FreeBusyBitmap.deserialize(free),
+    };
+  }
+
+  /**
+   * Minutes (heure locale) de la plage bornées à la journée
+   */
+  private minutesWithin(
+    day: DayWindow,
+    range: { startMs: number; endMs: number },
+  ): [number, number] {
+    const toMinute = (ms: number): number => {
+      if (ms <= day.startMs) return 0;
+      if (ms >= day.endMs) return 24 * 60;
+      const time = new Date(ms);
+      return time.getHours() * 60 + time.getMinutes();
+    };
+    return [toMinute(range.startMs), toMinute(range.endMs)];
+  }
+
+  private dayWindows(periodStart: Date, periodEnd: Date): DayWindow[] {
+    const days: DayWindow[] = [];
+    const date = new Date(periodStart);
+    date.setHours(0, 0, 0, 0);
+
+    while (
+      date.getTime() < periodEnd.getTime() &&
+      days.length < FreeBusyService.MAX_DAYS
+    ) {
+      const next = new Date(
+        date.getFullYear(),
+        date.getMonth(),
+        date.getDate() + 1,
+      );
+      days.push({
+        key: [
+          date.getFullYear(),
+          String(date.getMonth() + 1).padStart(2, "0"),
+          String(date.getDate()).padStart(2, "0"),
+        ].join("-"),
+        year: date.getFullYear(),
+        month: date.getMonth(),
+        date: date.getDate(),
+        startMs: date.getTime(),
+        endMs: next.getTime(),
+      });
+      date.setTime(next.getTime());
+    }
+    return days;
+  }
+}
@@ -0,0 +1,178 @@
+/**
+ * ⏭️ Next Available Slot Index Service - Application Layer
+ * ✅ Index du premier créneau libre par (entreprise, service, calendrier)
+ * ✅ Invalidé par les réservations et changements d'horaires
+ * ✅ Recalculé hors requête par le worker (refreshPending)
+ *
+ * Les listings lisent l'index en une requête ; le recalcul d'un couple
+ * (entreprise, service) coûte deux requêtes ensemblistes via
+ * CalendarRepository.findAvailableSlots, quel que soit le nombre de
+ * calendriers.
+ */
+
+import type {
+  NextAvailableSlot,
+  NextAvailableSlotRefreshKey,
+  NextAvailableSlotRepository,
+} from "../../domain/repositories/next-available-slot.repository.interface";
+import type { CalendarRepository } from "../../domain/repositories/calendar.repository.interface";
+import type { ServiceRepository } from "../../domain/repositories/service.repository.interface";
+import { BusinessId } from "../../domain/value-objects/business-id.value-object";
+import { CalendarId } from "../../domain/value-objects/calendar-id.value-object";
+import { ServiceId } from "../../domain/value-objects/service-id.value-object";
+import type { Logger } from "../ports/logger.port";
+
+export class NextAvailableSlotIndexService {
+  static readonly SEARCH_HORIZON_DAYS = 30;
+  // Sans créneau dans l'horizon : nouvel essai au plus tôt une heure après
+  static readonly EMPTY_RETRY_MS = 60 * 60 * 1000;
+
+  constructor(
+    private readonly nextSlotRepository: NextAvailableSlotRepository,
+    private readonly calendarRepository: CalendarRepository,
+    private readonly serviceRepository: ServiceRepository,
+    private readonly logger: Logger,
+  ) {}
+
+  /**
+   * Premier créneau indexé de chaque entreprise, en une lecture
+   */
+  async findForBusinesses(
+    businessIds: BusinessId[],
+    serviceId?: ServiceId,
+  ): Promise<NextAvailableSlot[]> {
+    return this.nextSlotRepository.findEarliestByBusinessIds(
+      businessIds,
+      new Date(),
+      serviceId,
+    );
+  }
+
+  async findForService(
+    businessId: BusinessId,
+    serviceId: ServiceId,
+  ): Promise<NextAvailableSlot | null> {
+    return this.nextSlotRepository.findEarliest(
+      businessId,
+      serviceId,
+      new Date(),
+    );
+  }
+
+  /**
+   * Marque à recalculer les entrées de l'entreprise (ou d'un calendrier).
+   * Une entreprise absente de l'index y est inscrite.
+   */
+  async invalidate(
+    businessId: BusinessId,
+    calendarId?: CalendarId,
+  ): Promise<void> {
+    try {
+      const flagged = await this.nextSlotRepository.markStale(
+        businessId,
+        calendarId,
+      );
+      if (flagged === 0) {
+        await this.enqueueBusiness(businessId);
+      }
+    } catch (error) {
+      // L'index est dérivé : une invalidation manquée se rattrape au
+      // prochain recalcul, elle ne doit pas faire échouer l'écriture
+      this.logger.warn("Next available slot invalidation failed", {
+        businessId: businessId.getValue(),
+        error: error instanceof Error ? error.message : String(error),
+      });
+    }
+  }
+
+  /**
+   * Recalcule jusqu'à `limit` couples (entreprise, service) en attente,
+   * puis indexe les services actifs encore absents de l'index (créés ou
+   * activés depuis). Retourne le nombre de couples traités.
+   */
+  async refreshPending(limit: number): Promise<number> {
+    const now = new Date();
+    const keys = await this.nextSlotRepository.findRefreshKeys(
+      limit,
+      now,
+      new Date(now.getTime() - NextAvailableSlotIndexService.EMPTY_RETRY_MS),
+    );
+    if (keys.length < limit) {
+      keys.push(
+        ...(await this.nextSlotRepository.findUnindexedKeys(
+          limit - keys.length,
+        )),
+      );
+    }
+
+    for (const key of keys) {
+      try {
+        await this.refresh(key);
+      } catch (error) {
+        this.logger.error(
+          "Next available slot refresh failed",
+          error instanceof Error ? error : new Error(String(error)),
+          {
+            businessId: key.businessId.getValue(),
+            serviceId: key.serviceId.getValue(),
+          },
+        );
+      }
+    }
+
+    return keys.length;
+  }
+
+  async refresh(key: NextAvailableSlotRefreshKey): Promise<void> {
+    const startedAt = new Date();
+
+    const [service, calendarIds] = await Promise.all([
+      this.serviceRepository.findById(key.serviceId),
+      this.calendarRepository.findIdsByBusinessId(key.businessId),
+    ]);
+
+    // Service supprimé ou désactivé, entreprise sans calendrier : on vide
+    if (!service || !service.isActive() || calendarIds.length === 0) {
+      await this.nextSlotRepository.replace(key, [], startedAt);
+      return;
+    }
+
+    const horizonEnd = new Date(startedAt);
+    horizonEnd.setDate(
+      horizonEnd.getDate() + NextAvailableSlotIndexService.SEARCH_HORIZON_DAYS,
+    );
+
+    const availability = await this.calendarRepository.findAvailableSlots(
+      calendarIds,
+      startedAt,
+      horizonEnd,
+      service.getDefaultDuration(),
+    );
+
+    const entries: NextAvailableSlot[] = availability.map(
+      ({ calendarId, slots }) => ({
+        businessId: key.businessId,
+        serviceId: key.serviceId,
+        calendarId,
+        startTime: slots[0]?.getStartTime() ?? null,
+        endTime: slots[0]?.getEndTime() ?? null,
+        computedAt: startedAt,
+      }),
+    );
+
+    await this.nextSlotRepository.replace(key, entries, startedAt);
+  }
+
+  private async enqueueBusiness(businessId: BusinessId): Promise<void> {
+    const [services, calendarIds] = await Promise.all([
+      this.serviceRepository.findActiveByBusinessId(businessId),
+      this.calendarRepository.findIdsByBusinessId(businessId),
+    ]);
+
+    await this.nextSlotRepository.enqueue(
+      businessId,
+      services.map((service) => service.id),
+      calendarIds,
+    );
+  }
+}
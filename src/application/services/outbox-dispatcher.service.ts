@@ -0,0 +1,181 @@
+/**
+ * 📤 Outbox Dispatcher Service - Application Layer
+ * ✅ Distribue les effets de bord enregistrés dans l'outbox transactionnelle
+ *    (confirmations, rappels, audit) hors du chemin des requêtes
+ * ✅ Livraison au moins une fois : un message en échec est reprogrammé avec
+ *    un délai exponentiel, puis écarté une fois les tentatives épuisées
+ *
+ * Un message par effet : l'échec de l'audit ne renvoie pas l'email déjà
+ * parti.
+ */
+
+import type {
+  OutboxRepository,
+  PendingOutboxMessage,
+} from "../../domain/repositories/outbox.repository.interface";
+import type { IAuditService } from "../ports/audit.port";
+import type { Logger } from "../ports/logger.port";
+import {
+  INotificationService,
+  NotificationChannel,
+  NotificationPriority,
+  NotificationType,
+} from "../ports/notification.port";
+
+export enum OutboxMessageType {
+  APPOINTMENT_CONFIRMATION = "APPOINTMENT_CONFIRMATION",
+  APPOINTMENT_REMINDER = "APPOINTMENT_REMINDER",
+  APPOINTMENT_AUDIT = "APPOINTMENT_AUDIT",
+}
+
+/**
+ * Contenu d'un message de notification de rendez-vous
+ */
+export interface AppointmentNotificationPayload {
+  readonly channel: NotificationChannel;
+  readonly recipientId: string;
+  readonly recipientEmail?: string;
+  readonly recipientPhone?: string;
+  readonly clientName: string;
+  readonly businessName: string;
+  readonly serviceName: string;
+  readonly startTime: string;
+  readonly endTime: string;
+  readonly scheduledAt?: string;
+}
+
+export class OutboxDispatcherService {
+  // Bail d'un lot : au-delà, un autre worker reprend les messages
+  static readonly LEASE_MS = 5 * 60 * 1000;
+  static readonly MAX_ATTEMPTS = 8;
+  static readonly RETRY_BASE_MS = 30_000;
+  static readonly RETRY_MAX_MS = 60 * 60 * 1000;
+
+  constructor(
+    private readonly outboxRepository: OutboxRepository,
+    private readonly notificationService: INotificationService,
+    private readonly auditService: IAuditService,
+    private readonly logger: Logger,
+  ) {}
+
+  /**
+   * Réserve et distribue un lot ; retourne le nombre de messages distribués
+   */
+  async dispatchPending(limit: number): Promise<number> {
+    const messages = await this.outboxRepository.claimBatch(
+      limit,
+      OutboxDispatcherService.LEASE_MS,
+    );
+    if (messages.length === 0) {
+      return 0;
+    }
+
+    const results = await Promise.allSettled(
+      messages.map((message) => this.dispatch(message)),
+    );
+
+    const dispatched: string[] = [];
+    for (const [index, result] of results.entries()) {
+      const message = messages[index];
+      if (result.status === "fulfilled") {
+        dispatched.push(message.id);
+      } else {
+        await this.recordFailure(message, result.reason);
+      }
+    }
+
+    await this.outboxRepository.complete(dispatched);
+    return dispatched.length;
+  }
+
+  private async dispatch(message: PendingOutboxMessage): Promise<void> {
+    switch (message.type) {
+      case OutboxMessageType.APPOINTMENT_CONFIRMATION:
+        return this.notify(message, NotificationType.APPOINTMENT_CONFIRMATION);
+      case OutboxMessageType.APPOINTMENT_REMINDER:
+        return this.notify(message, NotificationType.APPOINTMENT_REMINDER);
+      case OutboxMessageType.APPOINTMENT_AUDIT:
+        return this.audit(message);
+      default:
+        throw new Error(`Unknown outbox message type: ${message.type}`);
+    }
+  }
+
+  private async notify(
+    message: PendingOutboxMessage,
+    type: NotificationType,
+  ): Promise<void> {
+    const payload =
+      message.payload as unknown as AppointmentNotificationPayload;
+
+    const result = await this.notificationService.sendNotification({
+      id: message.id,
+      recipientId: payload.recipientId,
+      recipientEmail: payload.recipientEmail,
+      recipientPhone: payload.recipientPhone,
+      type,
+      channel: payload.channel,
+      content: `${payload.serviceName} - ${payload.businessName}`,
+      templateData: {
+        clientName: payload.clientName,
+        businessName: payload.businessName,
+        serviceName: payload.serviceName,
+        startTime: payload.startTime,
+        endTime: payload.endTime,
+      },
+      priority: NotificationPriority.NORMAL,
+      scheduledAt: payload.scheduledAt
+        ? new Date(payload.scheduledAt)
+        : undefined,
+      metadata: { appointmentId: message.aggregateId, outboxId: message.id },
+    });
+
+    if (!result.success) {
+      throw new Error(result.error ?? "Notification not sent");
+    }
+  }
+
+  private async audit(message: PendingOutboxMessage): Promise<void> {
+    const payload = message.payload;
+
+    await this.auditService.logOperation({
+      operation: String(payload.operation),
+      entityType: "APPOINTMENT",
+      entityId: message.aggregateId,
+      businessId: payload.businessId as string | undefined,
+      userId: String(payload.userId),
+      // L'identifiant du message est stable entre deux tentatives
+      correlationId: message.id,
+      changes: { created: payload.created },
+      timestamp: message.createdAt,
+    });
+  }
+
+  private async recordFailure(
+    message: PendingOutboxMessage,
+    reason: unknown,
+  ): Promise<void> {
+    const error = reason instanceof Error ? reason : new Error(String(reason));
+    const exhausted = message.attempts >= OutboxDispatcherService.MAX_ATTEMPTS;
+    const retryAt = exhausted
+      ? null
+      : new Date(Date.now() + OutboxDispatcherService.retryDelay(message));
+
+    this.logger.warn("Outbox message dispatch failed", {
+      outboxId: message.id,
+      type: message.type,
+      attempts: message.attempts,
+      exhausted,
+      error: error.message,
+    });
+
+    await this.outboxRepository.fail(message.id, error.message, retryAt);
+  }
+
+  private static retryDelay(message: PendingOutboxMessage): number {
+    return Math.min(
+      OutboxDispatcherService.RETRY_BASE_MS * 2 ** (message.attempts - 1),
+      OutboxDispatcherService.RETRY_MAX_MS,
+    );
+  }
+}
@@ -0,0 +1,576 @@
+/**
+ * 🔁 BOOK APPOINTMENT SERIES USE CASE
+ * ✅ Clean Architecture - Application Layer
+ * ✅ Réservation d'une série récurrente en un aller-retour d'écriture
+ *
+ * Réserver N occurrences avec BookAppointmentUseCase coûte N chargements
+ * des entités, N lectures de conflits et N INSERT. Ici : entités chargées
+ * une fois, une seule lecture des rendez-vous sur l'étendue de la série
+ * (BusyTimeline, O(log n) par occurrence) et un INSERT multi-lignes.
+ * Chaque occurrence est rapportée réservée ou en conflit.
+ * Confirmations, rappels et audit de chaque occurrence sont écrits dans
+ * l'outbox, dans la même transaction que l'INSERT.
+ */
+
+import type { AppointmentRepository } from "../../../domain/repositories/appointment.repository.interface";
+import type { OutboxMessage } from "../../../domain/repositories/outbox.repository.interface";
+import type { BusinessRepository } from "../../../domain/repositories/business.repository.interface";
+import type { CalendarRepository } from "../../../domain/repositories/calendar.repository.interface";
+import type { ServiceRepository } from "../../../domain/repositories/service.repository.interface";
+import type { StaffRepository } from "../../../domain/repositories/staff.repository.interface";
+import type { I18nService } from "../../ports/i18n.port";
+import type { Logger } from "../../ports/logger.port";
+import type { AvailableSlotsCache } from "../../services/available-slots-cache.service";
+import type { FreeBusyService } from "../../services/free-busy.service";
+import type { NextAvailableSlotIndexService } from "../../services/next-available-slot-index.service";
+import {
+  AppointmentNotificationPayload,
+  OutboxMessageType,
+} from "../../services/outbox-dispatcher.service";
+import { NotificationChannel } from "../../ports/notification.port";
+
+import type { Business } from "../../../domain/entities/business.entity";
+import type { Service } from "../../../domain/entities/service.entity";
+import {
+  Appointment,
+  AppointmentStatus,
+  ClientInfo,
+} from "../../../domain/entities/appointment.entity";
+import { AppointmentSlotTakenError } from "../../../domain/exceptions/appointment.exceptions";
+import { BusyTimeline } from "../../../domain/services/slot-availability.service";
+import { BusinessId } from "../../../domain/value-objects/business-id.value-object";
+import { CalendarId } from "../../../domain/value-objects/calendar-id.value-object";
+import { Email } from "../../../domain/value-objects/email.value-object";
+import { Phone } from "../../../domain/value-objects/phone.value-object";
+import {
+  RecurrencePattern,
+  RecurrenceRule,
+} from "../../../domain/value-objects/recurrence-pattern.value-object";
+import { ServiceId } from "../../../domain/value-objects/service-id.value-object";
+import { TimeSlot } from "../../../domain/value-objects/time-slot.value-object";
+import { UserId } from "../../../domain/value-objects/user-id.value-object";
+
+import {
+  AppointmentConflictError,
+  AppointmentValidationError,
+  BusinessNotFoundError,
+  CalendarNotFoundError,
+  ServiceNotBookableOnlineError,
+  ServiceNotFoundError,
+} from "../../exceptions/appointment.exceptions";
+
+export interface BookAppointmentSeriesRequest {
+  readonly businessId: string;
+  readonly serviceId: string;
+  readonly calendarId: string;
+  readonly staffId?: string;
+
+  // Première occurrence : la durée est reprise pour toute la série
+  readonly startTime: Date;
+  readonly endTime: Date;
+  readonly recurrence: RecurrenceRule;
+
+  readonly clientInfo: {
+    readonly firstName: string;
+    readonly lastName: string;
+    readonly email: string;
+    readonly phone?: string;
+    readonly dateOfBirth?: Date;
+    readonly isNewClient: boolean;
+    readonly notes?: string;
+  };
+
+  readonly title?: string;
+  readonly description?: string;
+
+  // true : aucune occurrence réservée si l'une d'elles est en conflit
+  readonly allOrNothing?: boolean;
+
+  readonly source: "ONLINE" | "PHONE" | "WALK_IN" | "ADMIN";
+  readonly requestingUserId: string;
+}
+
+export type SeriesOccurrenceStatus = "BOOKED" | "CONFLICT";
+
+export interface SeriesOccurrenceResult {
+  readonly startTime: Date;
+  readonly endTime: Date;
+  readonly status: SeriesOccurrenceStatus;
+  readonly appointmentId?: string;
+}
+
+export interface BookAppointmentSeriesResponse {
+  readonly calendarId: string;
+  readonly occurrences: SeriesOccurrenceResult[];
+  readonly bookedCount: number;
+  readonly conflictCount: number;
+}
+
+interface Occurrence {
+  readonly startTime: Date;
+  readonly endTime: Date;
+}
+
+interface SeriesEntities {
+  readonly business: Business;
+  readonly service: Service;
+}
+
+export class BookAppointmentSeriesUseCase {
+  private static readonly MAX_OCCURRENCES = 100;
+  // Même préavis que BookAppointmentUseCase
+  private static readonly MINIMUM_NOTICE_MS = 2 * 60 * 60 * 1000;
+  // Rappel par défaut de BookAppointmentUseCase
+  private static readonly REMINDER_HOURS = 24;
+  // Une relecture si une réservation concurrente prend un créneau entre la
+  // lecture des conflits et l'INSERT
+  private static readonly MAX_ATTEMPTS = 2;
+  private static readonly NON_BLOCKING_STATUSES = new Set<AppointmentStatus>([
+    AppointmentStatus.CANCELLED,
+    AppointmentStatus.NO_SHOW,
+  ]);
+
+  constructor(
+    private readonly appointmentRepository: AppointmentRepository,
+    private readonly serviceRepository: ServiceRepository,
+    private readonly calendarRepository: CalendarRepository,
+    private readonly staffRepository: StaffRepository,
+    private readonly businessRepository: BusinessRepository,
+    private readonly logger: Logger,
+    private readonly i18n: I18nService,
+    private readonly freeBusyService?: FreeBusyService,
+    private readonly slotsCache?: AvailableSlotsCache,
+    private readonly nextSlotIndex?: NextAvailableSlotIndexService,
+  ) {}
+
+  async execute(
+    request: BookAppointmentSeriesRequest,
+  ): Promise<BookAppointmentSeriesResponse> {
+    // 1. Validation et dépliage de la récurrence
+    const occurrences = this.expandOccurrences(request);
+
+    // 2. Entités chargées une seule fois pour toute la série
+    const entities = await this.loadRequiredEntities(request);
+
+    // 3. Conflits, création et INSERT (relu une fois en cas de course)
+    const appointments = await this.bookFreeOccurrences(
+      request,
+      entities,
+      occurrences,
+      1,
+    );
+    await this.afterInsert([...appointments.values()]);
+
+    const response = this.buildResponse(request, occurrences, appointments);
+    this.logger.info(
+      this.i18n.translate("operations.booking.series_completed"),
+      {
+        calendarId: request.calendarId,
+        bookedCount: response.bookedCount,
+        conflictCount: response.conflictCount,
+        requestingUserId: request.requestingUserId,
+      },
+    );
+    return response;
+  }
+
+  private async bookFreeOccurrences(
+    request: BookAppointmentSeriesRequest,
+    entities: SeriesEntities,
+    occurrences: Occurrence[],
+    attempt: number,
+  ): Promise<Map<Occurrence, Appointment>> {
+    const free = await this.findFreeOccurrences(
+      CalendarId.create(request.calendarId),
+      occurrences,
+    );
+
+    if (request.allOrNothing && free.size < occurrences.length) {
+      const conflict = occurrences.find(
+        (occurrence) => !free.has(occurrence),
+      )!;
+      throw new AppointmentConflictError({
+        startTime: conflict.startTime,
+        endTime: conflict.endTime,
+      });
+    }
+
+    const appointments = new Map<Occurrence, Appointment>();
+    for (const occurrence of occurrences) {
+      if (free.has(occurrence)) {
+        appointments.set(
+          occurrence,
+          this.createAppointment(request, entities, occurrence),
+        );
+      }
+    }
+
+    // Un INSERT multi-lignes, atomique, avec les messages d'outbox
+    const booked = [...appointments.values()];
+    try {
+      await this.appointmentRepository.createMany(
+        booked,
+        booked.flatMap((appointment) =>
+          this.buildOutboxMessages(appointment, entities, request),
+        ),
+      );
+    } catch (error) {
+      if (!(error instanceof AppointmentSlotTakenError)) {
+        throw error;
+      }
+      if (attempt < BookAppointmentSeriesUseCase.MAX_ATTEMPTS) {
+        this.logger.warn("Series overlapped a concurrent booking, retrying", {
+          calendarId: request.calendarId,
+          attempt,
+        });
+        return this.bookFreeOccurrences(
+          request,
+          entities,
+          occurrences,
+          attempt + 1,
+        );
+      }
+      throw new AppointmentConflictError({
+        startTime: occurrences[0].startTime,
+        endTime: occurrences[occurrences.length - 1].endTime,
+      });
+    }
+
+    return appointments;
+  }
+
+  private expandOccurrences(
+    request: BookAppointmentSeriesRequest,
+  ): Occurrence[] {
+    if (
+      !request.businessId?.trim() ||
+      !request.serviceId?.trim() ||
+      !request.calendarId?.trim()
+    ) {
+      throw new AppointmentValidationError(
+        "ids",
+        {
+          businessId: request.businessId,
+          serviceId: request.serviceId,
+          calendarId: request.calendarId,
+        },
+        this.i18n.translate("errors.validation.ids_required"),
+      );
+    }
+
+    if (
+      !request.startTime ||
+      !request.endTime ||
+      request.startTime >= request.endTime
+    ) {
+      throw new AppointmentValidationError(
+        "timeSlot",
+        { startTime: request.startTime, endTime: request.endTime },
+        this.i18n.translate("errors.validation.invalid_time_slot"),
+      );
+    }
+
+    if (
+      request.startTime.getTime() <
+      Date.now() + BookAppointmentSeriesUseCase.MINIMUM_NOTICE_MS
+    ) {
+      throw new AppointmentValidationError(
+        "startTime",
+        request.startTime,
+        this.i18n.translate("errors.booking.insufficient_notice"),
+      );
+    }
+
+    let starts: Date[];
+    try {
+      starts = new RecurrencePattern(request.recurrence).generateDates(
+        request.startTime,
+        BookAppointmentSeriesUseCase.MAX_OCCURRENCES,
+      );
+    } catch (error) {
+      throw new AppointmentValidationError(
+        "recurrence",
+        request.recurrence,
+        error instanceof Error ? error.message : String(error),
+      );
+    }
+
+    // Exceptions ou date de fin avant le début : aucune occurrence
+    if (starts.length === 0) {
+      throw new AppointmentValidationError(
+        "recurrence",
+        request.recurrence,
+        this.i18n.translate("errors.validation.empty_recurrence"),
+      );
+    }
+
+    const durationMs = request.endTime.getTime() - request.startTime.getTime();
+    return starts.map((startTime) => ({
+      startTime,
+      endTime: new Date(startTime.getTime() + durationMs),
+    }));
+  }
+
+  private async loadRequiredEntities(
+    request: BookAppointmentSeriesRequest,
+  ): Promise<SeriesEntities> {
+    const businessId = BusinessId.create(request.businessId);
+    const serviceId = ServiceId.create(request.serviceId);
+    const calendarId = CalendarId.create(request.calendarId);
+
+    const [business, service, calendar, staff] = await Promise.all([
+      this.businessRepository.findById(businessId),
+      this.serviceRepository.findById(serviceId),
+      this.calendarRepository.findById(calendarId),
+      request.staffId
+        ? this.staffRepository.findById(UserId.create(request.staffId))
+        : Promise.resolve(null),
+    ]);
+
+    if (!business) {
+      throw new BusinessNotFoundError(businessId.getValue());
+    }
+
+    if (!service) {
+      throw new ServiceNotFoundError(serviceId.getValue());
+    }
+
+    if (!calendar) {
+      throw new CalendarNotFoundError(calendarId.getValue());
+    }
+
+    if (request.staffId && !staff) {
+      throw new AppointmentValidationError(
+        "staffId",
+        request.staffId,
+        this.i18n.translate("errors.staff.not_found"),
+      );
+    }
+
+    if (!business.isActive()) {
+      throw new AppointmentValidationError(
+        "businessStatus",
+        "inactive",
+        this.i18n.translate("errors.business.inactive"),
+      );
+    }
+
+    if (!service.isActive()) {
+      throw new AppointmentValidationError(
+        "serviceStatus",
+        "inactive",
+        this.i18n.translate("errors.service.inactive"),
+      );
+    }
+
+    if (!service.isBookable()) {
+      throw new ServiceNotBookableOnlineError(serviceId.getValue());
+    }
+
+    return { business, service };
+  }
+
+  /**
+   * Occurrences libres : une seule requête sur [première, dernière], puis
+   * recherche dichotomique par occurrence. Une occurrence qui chevauche
+   * la précédente occurrence retenue de la série est aussi en conflit.
+   */
+  private async findFreeOccurrences(
+    calendarId: CalendarId,
+    occurrences: Occurrence[],
+  ): Promise<Set<Occurrence>> {
+    const existing = await this.appointmentRepository.findByCalendarId(
+      calendarId,
+      occurrences[0].startTime,
+      occurrences[occurrences.length - 1].endTime,
+    );
+    const busy = BusyTimeline.fromAppointments(
+      existing.filter(
+        (appointment) =>
+          !BookAppointmentSeriesUseCase.NON_BLOCKING_STATUSES.has(
+            appointment.status,
+          ),
+      ),
+    );
+
+    const free = new Set<Occurrence>();
+    let lastFreeEndMs = Number.NEGATIVE_INFINITY;
+    for (const occurrence of occurrences) {
+      const startMs = occurrence.startTime.getTime();
+      const endMs = occurrence.endTime.getTime();
+      if (startMs >= lastFreeEndMs && !busy.overlaps(startMs, endMs)) {
+        free.add(occurrence);
+        lastFreeEndMs = endMs;
+      }
+    }
+    return free;
+  }
+
+  private createAppointment(
+    request: BookAppointmentSeriesRequest,
+    entities: SeriesEntities,
+    occurrence: Occurrence,
+  ): Appointment {
+    const { business, service } = entities;
+    const clientInfo: ClientInfo = {
+      firstName: request.clientInfo.firstName.trim(),
+      lastName: request.clientInfo.lastName.trim(),
+      email: Email.create(request.clientInfo.email.trim()),
+      phone: request.clientInfo.phone
+        ? Phone.create(request.clientInfo.phone.trim())
+        : undefined,
+      dateOfBirth: request.clientInfo.dateOfBirth,
+      isNewClient: request.clientInfo.isNewClient,
+      notes: request.clientInfo.notes,
+    };
+
+    const basePrice = service.getBasePrice();
+    return Appointment.create({
+      businessId: business.getId(),
+      calendarId: CalendarId.create(request.calendarId),
+      serviceId: service.getId(),
+      timeSlot: new TimeSlot(occurrence.startTime, occurrence.endTime),
+      clientInfo,
+      pricing: {
+        basePrice,
+        finalPrice: basePrice,
+        totalAmount: basePrice,
+        paymentStatus: "PENDING" as const,
+        discounts: [],
+      },
+      title: request.title,
+      description: request.description,
+    });
+  }
+
+  /**
+   * Mêmes messages qu'une réservation unique : confirmation par canal,
+   * rappel par email s'il reste dans le futur, audit
+   */
+  private buildOutboxMessages(
+    appointment: Appointment,
+    entities: SeriesEntities,
+    request: BookAppointmentSeriesRequest,
+  ): OutboxMessage[] {
+    const { business, service } = entities;
+    const appointmentId = appointment.getId().getValue();
+    const clientInfo = appointment.getClientInfo();
+    const clientEmail = clientInfo.email.getValue();
+    const clientPhone = clientInfo.phone?.getValue();
+    const timeSlot = appointment.getTimeSlot();
+
+    const notification = (
+      type: OutboxMessageType,
+      channel: NotificationChannel,
+      scheduledAt?: Date,
+    ): OutboxMessage => {
+      const payload: AppointmentNotificationPayload = {
+        channel,
+        recipientId: clientEmail,
+        recipientEmail: clientEmail,
+        recipientPhone: clientPhone,
+        clientName: `${clientInfo.firstName} ${clientInfo.lastName}`,
+        businessName: business.name.getValue(),
+        serviceName: service.name,
+        startTime: timeSlot.getStartTime().toISOString(),
+        endTime: timeSlot.getEndTime().toISOString(),
+        scheduledAt: scheduledAt?.toISOString(),
+      };
+      return { type, aggregateId: appointmentId, payload: { ...payload } };
+    };
+
+    const messages: OutboxMessage[] = [
+      notification(
+        OutboxMessageType.APPOINTMENT_CONFIRMATION,
+        NotificationChannel.EMAIL,
+      ),
+    ];
+    if (clientPhone) {
+      messages.push(
+        notification(
+          OutboxMessageType.APPOINTMENT_CONFIRMATION,
+          NotificationChannel.SMS,
+        ),
+      );
+    }
+
+    const reminderAt = new Date(
+      timeSlot.getStartTime().getTime() -
+        BookAppointmentSeriesUseCase.REMINDER_HOURS * 60 * 60 * 1000,
+    );
+    if (reminderAt.getTime() > Date.now()) {
+      messages.push(
+        notification(
+          OutboxMessageType.APPOINTMENT_REMINDER,
+          NotificationChannel.EMAIL,
+          reminderAt,
+        ),
+      );
+    }
+
+    messages.push({
+      type: OutboxMessageType.APPOINTMENT_AUDIT,
+      aggregateId: appointmentId,
+      payload: {
+        operation: "BOOK_APPOINTMENT_SERIES",
+        businessId: appointment.getBusinessId().getValue(),
+        userId: request.requestingUserId,
+        created: {
+          calendarId: appointment.calendarId.getValue(),
+          serviceId: appointment.getServiceId().getValue(),
+          startTime: timeSlot.getStartTime().toISOString(),
+          endTime: timeSlot.getEndTime().toISOString(),
+          source: request.source,
+        },
+      },
+    });
+
+    return messages;
+  }
+
+  private async afterInsert(appointments: Appointment[]): Promise<void> {
+    if (appointments.length === 0) return;
+
+    const first = appointments[0];
+    const last = appointments[appointments.length - 1];
+    await this.freeBusyService?.invalidate(first.calendarId);
+    this.slotsCache?.invalidate(
+      first.calendarId.getValue(),
+      first.getTimeSlot().getStartTime(),
+      last.getTimeSlot().getEndTime(),
+    );
+    await this.nextSlotIndex?.invalidate(
+      first.getBusinessId(),
+      first.calendarId,
+    );
+  }
+
+  private buildResponse(
+    request: BookAppointmentSeriesRequest,
+    occurrences: Occurrence[],
+    appointments: Map<Occurrence, Appointment>,
+  ): BookAppointmentSeriesResponse {
+    const results = occurrences.map((occurrence): SeriesOccurrenceResult => {
+      const appointment = appointments.get(occurrence);
+      return appointment
+        ? {
+            startTime: occurrence.startTime,
+            endTime: occurrence.endTime,
+            status: "BOOKED",
+            appointmentId: appointment.getId().getValue(),
+          }
+        : {
+            startTime: occurrence.startTime,
+            endTime: occurrence.endTime,
+            status: "CONFLICT",
+          };
+    });
+
+    return {
+      calendarId: request.calendarId,
+      occurrences: results,
+      bookedCount: appointments.size,
+      conflictCount: occurrences.length - appointments.size,
+    };
+  }
+}
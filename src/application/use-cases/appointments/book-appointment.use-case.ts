@@ -3,9 +3,12 @@
  * ✅ Clean Architecture - Application Layer
  * ✅ Inspiré du flow Doctolib
  * ✅ Gestion complète de la réservation
+ * ✅ Notifications, rappels et audit écrits dans l'outbox, dans la même
+ *    transaction que le rendez-vous : la réservation ne coûte que l'INSERT
  */
 
 import type { AppointmentRepository } from "../../../domain/repositories/appointment.repository.interface";
+import type { OutboxMessage } from "../../../domain/repositories/outbox.repository.interface";
 import type { BusinessRepository } from "../../../domain/repositories/business.repository.interface";
 import type { CalendarRepository } from "../../../domain/repositories/calendar.repository.interface";
 import type { ServiceRepository } from "../../../domain/repositories/service.repository.interface";
@@ -14,12 +17,22 @@ import type { I18nService } from "../../ports/i18n.port";
 import type { Logger } from "../../ports/logger.port";
 import type { IEmailService } from "../../ports/email.port";
 import type { INotificationService } from "../../ports/notification.port";
+import type { AvailableSlotsCache } from "../../services/available-slots-cache.service";
+import type { FreeBusyService } from "../../services/free-busy.service";
+import type { NextAvailableSlotIndexService } from "../../services/next-available-slot-index.service";
+import type { ISlotHoldStore, SlotHold } from "../../ports/slot-hold.port";
+import {
+  AppointmentNotificationPayload,
+  OutboxMessageType,
+} from "../../services/outbox-dispatcher.service";
+import { NotificationChannel } from "../../ports/notification.port";
 
 import {
   Appointment,
   AppointmentPricing,
   ClientInfo,
 } from "../../../domain/entities/appointment.entity";
+import { AppointmentSlotTakenError } from "../../../domain/exceptions/appointment.exceptions";
 import { BusinessId } from "../../../domain/value-objects/business-id.value-object";
 import { CalendarId } from "../../../domain/value-objects/calendar-id.value-object";
 import { Email } from "../../../domain/value-objects/email.value-object";
@@ -35,6 +48,7 @@ import {
   CalendarNotFoundError,
   ServiceNotBookableOnlineError,
   ServiceNotFoundError,
+  SlotHoldExpiredError,
 } from "../../exceptions/appointment.exceptions";
 
 export interface BookAppointmentRequest {
@@ -46,6 +60,9 @@ export interface BookAppointmentRequest {
   readonly startTime: Date;
   readonly endTime: Date;
 
+  // Jeton de retenue (HoldSlotUseCase) : créneau et entités déjà vérifiés
+  readonly holdToken?: string;
+
   // Informations client (comme sur Doctolib)
   readonly clientInfo: {
     readonly firstName: string;
@@ -141,6 +158,10 @@ export class BookAppointmentUseCase {
     private readonly businessRepository: BusinessRepository,
     private readonly logger: Logger,
     private readonly i18n: I18nService,
+    private readonly freeBusyService?: FreeBusyService,
+    private readonly slotsCache?: AvailableSlotsCache,
+    private readonly nextSlotIndex?: NextAvailableSlotIndexService,
+    private readonly slotHolds?: ISlotHoldStore,
   ) {}
 
   async execute(
@@ -158,32 +179,55 @@ export class BookAppointmentUseCase {
       // 1. Validation de la requête
       await this.validateRequest(request);
 
-      // 2. Vérification de la disponibilité (double-check)
-      await this.verifySlotAvailability(request);
+      // 2. Retenue valide : vérifications déjà faites à la prise de retenue.
+      // Sinon vérification du calendrier (conflits arbitrés à l'INSERT)
+      const hold = await this.resolveHold(request);
+      if (!hold) {
+        await this.verifySlotAvailability(request);
+      }
 
       // 3. Récupération des données métier
-      const entities = await this.loadRequiredEntities(request);
+      const entities = hold
+        ? await this.loadHeldEntities(request)
+        : await this.loadRequiredEntities(request);
 
       // 4. Création de l'appointment
       const appointment = await this.createAppointment(request, entities);
 
-      // 5. Sauvegarde en base
-      await this.appointmentRepository.save(appointment);
-      const savedAppointment = appointment; // 6. Envoi des notifications
-      const notifications = await this.sendNotifications(
-        savedAppointment,
-        request,
+      // 5. Insertion en base (contrainte d'exclusion = contrôle de conflit),
+      // effets de bord enregistrés dans la même transaction
+      const outbox = this.buildOutboxMessages(appointment, entities, request);
+      await this.insertAppointment(appointment, outbox);
+      if (hold) {
+        await this.releaseHold(hold);
+      }
+      await this.freeBusyService?.invalidate(appointment.calendarId);
+      this.slotsCache?.invalidate(
+        appointment.calendarId.getValue(),
+        appointment.getTimeSlot().getStartTime(),
+        appointment.getTimeSlot().getEndTime(),
+      );
+      await this.nextSlotIndex?.invalidate(
+        appointment.getBusinessId(),
+        appointment.calendarId,
       );
 
-      // 7. Génération de la réponse
+      // 6. Génération de la réponse (notifications en file dans l'outbox)
+      const notifications = {
+        confirmationEmailSent: true,
+        confirmationSmsSent: !!request.clientInfo.phone,
+        reminderScheduled: outbox.some(
+          (message) => message.type === OutboxMessageType.APPOINTMENT_REMINDER,
+        ),
+      };
       const response = await this.buildResponse(
-        savedAppointment,
+        appointment,
         entities,
         notifications,
       );
 
       this.logger.info(this.i18n.translate("operations.booking.completed"), {
-        appointmentId: savedAppointment.getId().getValue(),
+        appointmentId: appointment.getId().getValue(),
         confirmationNumber: response.confirmationNumber,
         clientEmail: request.clientInfo.email,
       });
@@ -308,39 +352,83 @@ export class BookAppointmentUseCase {
     }
   }
 
-  private async verifySlotAvailability(
+  /**
+   * Retenue du demandeur si un jeton valide est fourni. Sans jeton, un
+   * créneau retenu par un autre client échoue ici, avant tout chargement.
+   * Redis indisponible : parcours complet, la base reste l'arbitre.
+   */
+  private async resolveHold(
     request: BookAppointmentRequest,
-  ): Promise<void> {
-    const calendarId = CalendarId.create(request.calendarId);
-
-    // Vérifier qu'aucun autre rendez-vous n'existe sur ce créneau
-    const conflictingAppointments =
-      await this.appointmentRepository.findConflictingAppointments(
-        calendarId,
-        request.startTime,
-        request.endTime,
-      );
+  ): Promise<SlotHold | null> {
+    const token = request.holdToken;
+    if (!this.slotHolds) {
+      return null;
+    }
 
-    if (conflictingAppointments.length > 0) {
-      // Si un staff spécifique est demandé, vérifier le conflit sur ce staff
-      if (request.staffId) {
-        const staffConflict = conflictingAppointments.some(
-          (apt: Appointment) => false, // ❌ getAssignedStaffId() n'existe pas - à implémenter si nécessaire
+    let hold: SlotHold | null = null;
+    let held = false;
+    try {
+      if (token) {
+        hold = await this.slotHolds.find(request.calendarId, token);
+      } else {
+        held = await this.slotHolds.isHeld(
+          request.calendarId,
+          request.startTime,
+          request.endTime,
         );
+      }
+    } catch (error) {
+      this.logger.warn("Slot hold store unavailable, full validation", {
+        calendarId: request.calendarId,
+        error: error instanceof Error ? error.message : String(error),
+      });
+      return null;
+    }
 
-        if (staffConflict) {
-          throw new AppointmentConflictError(
-            { startTime: request.startTime, endTime: request.endTime },
-            conflictingAppointments[0].getId().getValue(),
-          );
-        }
-      } else {
+    if (!token) {
+      if (held) {
         throw new AppointmentConflictError({
           startTime: request.startTime,
           endTime: request.endTime,
         });
       }
+      return null;
+    }
+
+    const matches =
+      hold !== null &&
+      hold.businessId === request.businessId &&
+      hold.serviceId === request.serviceId &&
+      (hold.staffId ?? null) === (request.staffId ?? null) &&
+      hold.startTime.getTime() === request.startTime.getTime() &&
+      hold.endTime.getTime() === request.endTime.getTime();
+    if (!matches) {
+      throw new SlotHoldExpiredError(request.calendarId, token);
+    }
+
+    return hold;
+  }
+
+  private async releaseHold(hold: SlotHold): Promise<void> {
+    try {
+      await this.slotHolds?.release(hold.calendarId, hold.token);
+    } catch (error) {
+      // Sans conséquence : la retenue expire d'elle-même
+      this.logger.warn("Failed to release slot hold", {
+        calendarId: hold.calendarId,
+        error: error instanceof Error ? error.message : String(error),
+      });
     }
+  }
+
+  private async verifySlotAvailability(
+    request: BookAppointmentRequest,
+  ): Promise<void> {
+    const calendarId = CalendarId.create(request.calendarId);
+
+    // Pas de lecture des rendez-vous en conflit ici : entre cette lecture et
+    // l'écriture, une réservation concurrente pourrait prendre le créneau.
+    // La contrainte d'exclusion de la base tranche à l'INSERT.
 
     // Vérifier que le calendrier accepte les réservations à cette heure
     const calendar = await this.calendarRepository.findById(calendarId);
@@ -358,6 +446,28 @@ export class BookAppointmentUseCase {
     // }
   }
 
+  /**
+   * Un seul INSERT : un créneau déjà pris (y compris par une réservation
+   * concurrente) remonte en AppointmentConflictError
+   */
+  private async insertAppointment(
+    appointment: Appointment,
+    outbox: OutboxMessage[],
+  ): Promise<void> {
+    try {
+      await this.appointmentRepository.create(appointment, outbox);
+    } catch (error) {
+      if (error instanceof AppointmentSlotTakenError) {
+        const timeSlot = appointment.getTimeSlot();
+        throw new AppointmentConflictError({
+          startTime: timeSlot.getStartTime(),
+          endTime: timeSlot.getEndTime(),
+        });
+      }
+      throw error;
+    }
+  }
+
   private async loadRequiredEntities(request: BookAppointmentRequest) {
     const businessId = BusinessId.create(request.businessId);
     const serviceId = ServiceId.create(request.serviceId);
@@ -438,6 +548,42 @@ export class BookAppointmentUseCase {
     return { business, service, calendar, staff };
   }
 
+  /**
+   * Créneau retenu : existence et état du business, du service et du
+   * calendrier ont été vérifiés par HoldSlotUseCase. Seuls les entités
+   * utiles à la création et à la réponse sont chargées.
+   */
+  private async loadHeldEntities(request: BookAppointmentRequest) {
+    const businessId = BusinessId.create(request.businessId);
+    const serviceId = ServiceId.create(request.serviceId);
+
+    const [business, service, staff] = await Promise.all([
+      this.businessRepository.findById(businessId),
+      this.serviceRepository.findById(serviceId),
+      request.staffId
+        ? this.staffRepository.findById(UserId.create(request.staffId))
+        : Promise.resolve(null),
+    ]);
+
+    if (!business) {
+      throw new BusinessNotFoundError(businessId.getValue());
+    }
+
+    if (!service) {
+      throw new ServiceNotFoundError(serviceId.getValue());
+    }
+
+    if (request.staffId && !staff) {
+      throw new AppointmentValidationError(
+        "staffId",
+        request.staffId,
+        this.i18n.translate("errors.staff.not_found"),
+      );
+    }
+
+    return { business, service, calendar: null, staff };
+  }
+
   private async createAppointment(
     request: BookAppointmentRequest,
     entities: any,
@@ -483,7 +629,7 @@ export class BookAppointmentUseCase {
     // Création de l'appointment (type déterminé par le service lié)
     const appointment = Appointment.create({
       businessId: business.getId(),
-      calendarId: CalendarId.generate(), // TODO: Récupérer le vrai calendarId depuis le business
+      calendarId: CalendarId.create(request.calendarId),
       serviceId: service.getId(),
       timeSlot: timeSlot,
       clientInfo,
@@ -505,20 +651,102 @@ export class BookAppointmentUseCase {
     return appointment;
   }
 
-  private async sendNotifications(
+  /**
+   * Un message par effet (confirmation et rappel par canal, audit), distribués
+   * par le worker de l'outbox
+   */
+  private buildOutboxMessages(
     appointment: Appointment,
+    entities: any,
     request: BookAppointmentRequest,
-  ) {
-    // TODO: Implémenter l'envoi des notifications
-    // - Email de confirmation
-    // - SMS de confirmation si demandé
-    // - Programmer les rappels
-
-    return {
-      confirmationEmailSent: true,
-      confirmationSmsSent: !!request.clientInfo.phone,
-      reminderScheduled: true,
+  ): OutboxMessage[] {
+    const { business, service } = entities;
+    const appointmentId = appointment.getId().getValue();
+    const clientInfo = appointment.getClientInfo();
+    const clientEmail = clientInfo.email.getValue();
+    const clientPhone = clientInfo.phone?.getValue();
+    const timeSlot = appointment.getTimeSlot();
+
+    const notification = (
+      type: OutboxMessageType,
+      channel: NotificationChannel,
+      scheduledAt?: Date,
+    ): OutboxMessage => {
+      const payload: AppointmentNotificationPayload = {
+        channel,
+        recipientId: clientEmail,
+        recipientEmail: clientEmail,
+        recipientPhone: clientPhone,
+        clientName: `${clientInfo.firstName} ${clientInfo.lastName}`,
+        businessName: business.getName(),
+        serviceName: service.getName(),
+        startTime: timeSlot.getStartTime().toISOString(),
+        endTime: timeSlot.getEndTime().toISOString(),
+        scheduledAt: scheduledAt?.toISOString(),
+      };
+      return { type, aggregateId: appointmentId, payload: { ...payload } };
     };
+
+    const messages: OutboxMessage[] = [
+      notification(
+        OutboxMessageType.APPOINTMENT_CONFIRMATION,
+        NotificationChannel.EMAIL,
+      ),
+    ];
+    if (clientPhone) {
+      messages.push(
+        notification(
+          OutboxMessageType.APPOINTMENT_CONFIRMATION,
+          NotificationChannel.SMS,
+        ),
+      );
+    }
+
+    // Rappel par défaut par email 24 h avant, s'il reste dans le futur
+    const preferences = request.notificationPreferences;
+    const reminderAt = new Date(
+      timeSlot.getStartTime().getTime() -
+        (preferences?.reminderHours ?? 24) * 60 * 60 * 1000,
+    );
+    if (reminderAt.getTime() > Date.now()) {
+      if (preferences?.emailReminder ?? true) {
+        messages.push(
+          notification(
+            OutboxMessageType.APPOINTMENT_REMINDER,
+            NotificationChannel.EMAIL,
+            reminderAt,
+          ),
+        );
+      }
+      if (preferences?.smsReminder && clientPhone) {
+        messages.push(
+          notification(
+            OutboxMessageType.APPOINTMENT_REMINDER,
+            NotificationChannel.SMS,
+            reminderAt,
+          ),
+        );
+      }
+    }
+
+    messages.push({
+      type: OutboxMessageType.APPOINTMENT_AUDIT,
+      aggregateId: appointmentId,
+      payload: {
+        operation: "BOOK_APPOINTMENT",
+        businessId: appointment.getBusinessId().getValue(),
+        userId: appointment.getCreatedBy() ?? clientEmail,
+        created: {
+          calendarId: appointment.calendarId.getValue(),
+          serviceId: appointment.getServiceId().getValue(),
+          startTime: timeSlot.getStartTime().toISOString(),
+          endTime: timeSlot.getEndTime().toISOString(),
+          source: request.source,
+        },
+      },
+    });
+
+    return messages;
   }
 
   private async buildResponse(
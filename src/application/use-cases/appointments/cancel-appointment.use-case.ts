@@ -12,6 +12,9 @@ import {
   AppointmentAlreadyCancelledError,
   AppointmentNotFoundError,
 } from "../../exceptions/appointment.exceptions";
+import type { AvailableSlotsCache } from "../../services/available-slots-cache.service";
+import type { FreeBusyService } from "../../services/free-busy.service";
+import type { NextAvailableSlotIndexService } from "../../services/next-available-slot-index.service";
 
 export interface CancelAppointmentRequest {
   readonly appointmentId: string;
@@ -28,7 +31,12 @@ export interface CancelAppointmentResponse {
 }
 
 export class CancelAppointmentUseCase {
-  constructor(private readonly appointmentRepository: AppointmentRepository) {}
+  constructor(
+    private readonly appointmentRepository: AppointmentRepository,
+    private readonly freeBusyService?: FreeBusyService,
+    private readonly slotsCache?: AvailableSlotsCache,
+    private readonly nextSlotIndex?: NextAvailableSlotIndexService,
+  ) {}
 
   async execute(
     request: CancelAppointmentRequest,
@@ -55,6 +63,16 @@ export class CancelAppointmentUseCase {
 
     // 6. Sauvegarde
     await this.appointmentRepository.save(appointment);
+    await this.freeBusyService?.invalidate(appointment.calendarId);
+    this.slotsCache?.invalidate(
+      appointment.calendarId.getValue(),
+      appointment.getTimeSlot().getStartTime(),
+      appointment.getTimeSlot().getEndTime(),
+    );
+    await this.nextSlotIndex?.invalidate(
+      appointment.getBusinessId(),
+      appointment.calendarId,
+    );
 
     // 7. TODO: Notification du client si demandé
     if (request.notifyClient) {
@@ -0,0 +1,251 @@
+/**
+ * 📤 EXPORT AVAILABILITY USE CASE
+ * ✅ Clean Architecture - Application Layer
+ * ✅ Disponibilités de tous les calendriers d'une entreprise, jusqu'à 90 jours
+ * ✅ Génération jour par jour (AsyncGenerator) : mémoire constante quelle
+ *    que soit la longueur de la période
+ *
+ * execute() valide et charge le contexte avant de rendre la main : les
+ * erreurs de requête remontent normalement, avant le début du flux.
+ */
+
+import type { CalendarRepository } from "../../../domain/repositories/calendar.repository.interface";
+import type { ServiceRepository } from "../../../domain/repositories/service.repository.interface";
+import { BusinessId } from "../../../domain/value-objects/business-id.value-object";
+import { CalendarId } from "../../../domain/value-objects/calendar-id.value-object";
+import { ServiceId } from "../../../domain/value-objects/service-id.value-object";
+import {
+  ApplicationValidationError,
+  ResourceNotFoundError,
+} from "../../exceptions/application.exceptions";
+import type { I18nService } from "../../ports/i18n.port";
+import type { Logger } from "../../ports/logger.port";
+import { toLocalDayKey } from "../../services/available-slots-cache.service";
+
+export interface ExportAvailabilityRequest {
+  readonly businessId: string;
+  readonly serviceId: string;
+  readonly startDate: Date;
+  readonly endDate: Date; // Inclus
+  readonly calendarIds?: string[];
+  readonly requestingUserId: string;
+}
+
+export interface ExportedSlot {
+  readonly startTime: Date;
+  readonly endTime: Date;
+}
+
+export interface ExportedDay {
+  readonly date: string; // YYYY-MM-DD (jour local)
+  readonly calendars: {
+    readonly calendarId: string;
+    readonly slots: ExportedSlot[];
+  }[];
+}
+
+export interface ExportAvailabilityResponse {
+  readonly businessId: string;
+  readonly serviceId: string;
+  readonly durationMinutes: number;
+  readonly periodStart: Date;
+  readonly periodEnd: Date;
+  readonly calendarIds: string[];
+  readonly days: AsyncGenerator<ExportedDay>;
+}
+
+export class ExportAvailabilityUseCase {
+  static readonly MAX_DAYS = 90;
+
+  constructor(
+    private readonly calendarRepository: CalendarRepository,
+    private readonly serviceRepository: ServiceRepository,
+    private readonly logger: Logger,
+    private readonly i18n: I18nService,
+  ) {}
+
+  async execute(
+    request: ExportAvailabilityRequest,
+  ): Promise<ExportAvailabilityResponse> {
+    this.validateRequest(request);
+
+    const businessId = BusinessId.create(request.businessId);
+    const service = await this.serviceRepository.findById(
+      ServiceId.create(request.serviceId),
+    );
+    // Ressource d'une autre entreprise : traitée comme introuvable
+    if (!service || !service.businessId.equals(businessId)) {
+      throw new ResourceNotFoundError("Service", request.serviceId);
+    }
+
+    const calendarIds = await this.resolveCalendarIds(businessId, request);
+    const durationMinutes = service.getDefaultDuration();
+
+    const periodStart = new Date(request.startDate);
+    periodStart.setHours(0, 0, 0, 0);
+    const periodEnd = new Date(request.endDate);
+    periodEnd.setHours(0, 0, 0, 0);
+    periodEnd.setDate(periodEnd.getDate() + 1);
+
+    this.logger.info(
+      this.i18n.translate("operations.availability.fetching_slots"),
+      {
+        businessId: request.businessId,
+        serviceId: request.serviceId,
+        calendarCount: calendarIds.length,
+        periodStart: periodStart.toISOString(),
+        periodEnd: periodEnd.toISOString(),
+      },
+    );
+
+    return {
+      businessId: request.businessId,
+      serviceId: request.serviceId,
+      durationMinutes,
+      periodStart,
+      periodEnd,
+      calendarIds: calendarIds.map((id) => id.getValue()),
+      days: this.generateDays(
+        calendarIds,
+        periodStart,
+        periodEnd,
+        durationMinutes,
+      ),
+    };
+  }
+
+  /**
+   * Un jour à la fois : seul le jour courant est en mémoire, et le
+   * consommateur règle le rythme (le jour suivant n'est calculé qu'à sa
+   * demande)
+   */
+  private async *generateDays(
+    calendarIds: CalendarId[],
+    periodStart: Date,
+    periodEnd: Date,
+    durationMinutes: number,
+  ): AsyncGenerator<ExportedDay> {
+    const now = new Date();
+    const dayStart = new Date(periodStart);
+
+    while (dayStart < periodEnd) {
+      const dayEnd = new Date(dayStart);
+      dayEnd.setDate(dayEnd.getDate() + 1);
+
+      const date = toLocalDayKey(dayStart);
+
+      if (calendarIds.length === 0 || dayEnd <= now) {
+        yield {
+          date,
+          calendars: calendarIds.map((id) => ({
+            calendarId: id.getValue(),
+            slots: [],
+          })),
+        };
+      } else {
+        const availability = await this.calendarRepository.findAvailableSlots(
+          calendarIds,
+          dayStart < now ? now : dayStart,
+          dayEnd,
+          durationMinutes,
+        );
+
+        yield {
+          date,
+          calendars: availability.map(({ calendarId, slots }) => ({
+            calendarId: calendarId.getValue(),
+            slots: slots.map((slot) => ({
+              startTime: slot.getStartTime(),
+              endTime: slot.getEndTime(),
+            })),
+          })),
+        };
+      }
+
+      dayStart.setDate(dayStart.getDate() + 1);
+    }
+  }
+
+  /**
+   * Calendriers demandés, tous rattachés à l'entreprise ; à défaut, tous
+   * ceux de l'entreprise
+   */
+  private async resolveCalendarIds(
+    businessId: BusinessId,
+    request: ExportAvailabilityRequest,
+  ): Promise<CalendarId[]> {
+    const calendarIds =
+      await this.calendarRepository.findIdsByBusinessId(businessId);
+    if (!request.calendarIds || request.calendarIds.length === 0) {
+      return calendarIds;
+    }
+
+    const ownedCalendarIds = new Set(
+      calendarIds.map((calendarId) => calendarId.getValue()),
+    );
+    return [...new Set(request.calendarIds)].map((id) => {
+      if (!ownedCalendarIds.has(id)) {
+        throw new ResourceNotFoundError("Calendar", id);
+      }
+      return CalendarId.create(id);
+    });
+  }
+
+  private validateRequest(request: ExportAvailabilityRequest): void {
+    if (!request.businessId?.trim()) {
+      throw new ApplicationValidationError(
+        "businessId",
+        request.businessId,
+        "business_id_required",
+      );
+    }
+
+    if (!request.serviceId?.trim()) {
+      throw new ApplicationValidationError(
+        "serviceId",
+        request.serviceId,
+        "service_id_required",
+      );
+    }
+
+    if (!request.startDate || isNaN(request.startDate.getTime())) {
+      throw new ApplicationValidationError(
+        "startDate",
+        request.startDate,
+        "start_date_required",
+      );
+    }
+
+    if (!request.endDate || isNaN(request.endDate.getTime())) {
+      throw new ApplicationValidationError(
+        "endDate",
+        request.endDate,
+        "end_date_required",
+      );
+    }
+
+    if (request.endDate < request.startDate) {
+      throw new ApplicationValidationError(
+        "endDate",
+        request.endDate.toISOString(),
+        "end_date_before_start_date",
+      );
+    }
+
+    const days =
+      Math.round(
+        (request.endDate.getTime() - request.startDate.getTime()) / 86_400_000,
+      ) + 1;
+    if (days > ExportAvailabilityUseCase.MAX_DAYS) {
+      throw new ApplicationValidationError("endDate", days, "period_too_long");
+    }
+
+    if (request.calendarIds && request.calendarIds.length > 100) {
+      throw new ApplicationValidationError(
+        "calendarIds",
+        request.calendarIds.length,
+        "too_many_calendars",
+      );
+    }
+  }
+}
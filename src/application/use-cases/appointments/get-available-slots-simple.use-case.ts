@@ -17,21 +17,32 @@
       }
     } */
 
+import { AppointmentStatus } from "../../../domain/entities/appointment.entity";
+import type { Business } from "../../../domain/entities/business.entity";
 import type { AppointmentRepository } from "../../../domain/repositories/appointment.repository.interface";
+import type { BusinessRepository } from "../../../domain/repositories/business.repository.interface";
 import type { CalendarRepository } from "../../../domain/repositories/calendar.repository.interface";
 import type { ServiceRepository } from "../../../domain/repositories/service.repository.interface";
 import type { StaffRepository } from "../../../domain/repositories/staff.repository.interface";
-import { ViewMode } from "../../../presentation/dtos/appointment.dto";
 import {
   ApplicationValidationError,
   ResourceNotFoundError,
 } from "../../exceptions/application.exceptions";
 import type { I18nService } from "../../ports/i18n.port";
 import type { Logger } from "../../ports/logger.port";
-
+import type {
+  AvailableSlotsCache,
+  SlotGrid,
+} from "../../services/available-slots-cache.service";
+
+import { BusyTimeline } from "../../../domain/services/slot-availability.service";
+import { BusinessId } from "../../../domain/value-objects/business-id.value-object";
+import type { WeeklyOpeningTemplate } from "../../../domain/value-objects/business-hours.value-object";
 import { CalendarId } from "../../../domain/value-objects/calendar-id.value-object";
 import { ServiceId } from "../../../domain/value-objects/service-id.value-object";
 import { UserId } from "../../../domain/value-objects/user-id.value-object";
+import { ViewMode } from "../../../shared/enums/view-mode.enum";
+import { AppointmentOccupancyKernel } from "../../../shared/utils/appointment.utils";
 
 export interface GetAvailableSlotsRequest {
   readonly businessId: string;
@@ -81,13 +92,24 @@ export interface GetAvailableSlotsResponse {
 }
 
 export class GetAvailableSlotsUseCase {
+  private static readonly SLOT_DURATION_MINUTES = 30;
+  private static readonly MAX_CACHED_TEMPLATES = 500;
+
+  // Horaires compilés par entreprise, invalidés quand updatedAt change
+  private readonly openingTemplates = new Map<
+    string,
+    { version: number; template: WeeklyOpeningTemplate }
+  >();
+
   constructor(
     private readonly calendarRepository: CalendarRepository,
     private readonly serviceRepository: ServiceRepository,
     private readonly appointmentRepository: AppointmentRepository,
     private readonly staffRepository: StaffRepository,
+    private readonly businessRepository: BusinessRepository,
     private readonly logger: Logger,
     private readonly i18n: I18nService,
+    private readonly slotsCache?: AvailableSlotsCache,
   ) {}
 
   async execute(
@@ -108,23 +130,17 @@ export class GetAvailableSlotsUseCase {
       // 1. Validation de la requête
       await this.validateRequest(request);
 
-      // 2. Récupération des entités nécessaires
-      const entities = await this.loadRequiredEntities(request);
-
-      // 3. Calcul de la période à afficher
+      // 2. Calcul de la période à afficher
       const period = this.calculatePeriod(
         request.viewMode,
         request.referenceDate,
       );
 
-      // 4. Génération des créneaux disponibles
-      const slotsData = await this.generateAvailableSlots(
-        request,
-        entities,
-        period,
-      );
+      // 3. Génération des créneaux disponibles (entités chargées seulement
+      // pour les jours absents du cache)
+      const slotsData = await this.generateAvailableSlots(request, period);
 
-      // 5. Construction de la réponse
+      // 4. Construction de la réponse
       const response: GetAvailableSlotsResponse = {
         viewMode: request.viewMode,
         currentPeriod: this.formatPeriodLabel(period, request.viewMode),
@@ -153,6 +169,7 @@ export class GetAvailableSlotsUseCase {
           totalSlots: response.metadata.totalSlots,
           availableSlots: response.metadata.availableSlots,
           utilizationRate: response.metadata.utilizationRate,
+          cacheHitRate: this.slotsCache?.stats().hitRate,
         },
       );
 
@@ -223,7 +240,8 @@ export class GetAvailableSlotsUseCase {
     const calendarId = CalendarId.create(request.calendarId);
 
     // Charger en parallèle pour optimiser
-    const [service, calendar, staff] = await Promise.all([
+    const [business, service, calendar, staff] = await Promise.all([
+      this.businessRepository.findById(BusinessId.create(request.businessId)),
       this.serviceRepository.findById(serviceId),
       this.calendarRepository.findById(calendarId),
       request.staffId
@@ -231,6 +249,10 @@ export class GetAvailableSlotsUseCase {
         : Promise.resolve(null),
     ]);
 
+    if (!business) {
+      throw new ResourceNotFoundError("Business", request.businessId);
+    }
+
     if (!service) {
       throw new ResourceNotFoundError("Service", request.serviceId);
     }
@@ -243,7 +265,37 @@ export class GetAvailableSlotsUseCase {
       throw new ResourceNotFoundError("Staff", request.staffId);
     }
 
-    return { service, calendar, staff };
+    return {
+      service,
+      calendar,
+      staff,
+      openingTemplate: this.getOpeningTemplate(business),
+    };
+  }
+
+  private getOpeningTemplate(business: Business): WeeklyOpeningTemplate {
+    const key = business.id.getValue();
+    const version = business.updatedAt.getTime();
+    const cached = this.openingTemplates.get(key);
+
+    if (cached && cached.version === version) {
+      return cached.template;
+    }
+
+    const template = business.businessHours.toWeeklyTemplate();
+
+    // Réinsérer en fin de Map : la plus ancienne entrée est évincée d'abord
+    const maxEntries = GetAvailableSlotsUseCase.MAX_CACHED_TEMPLATES;
+    this.openingTemplates.delete(key);
+    if (this.openingTemplates.size >= maxEntries) {
+      const oldest = this.openingTemplates.keys().next().value;
+      if (oldest !== undefined) {
+        this.openingTemplates.delete(oldest);
+      }
+    }
+    this.openingTemplates.set(key, { version, template });
+
+    return template;
   }
 
   private calculatePeriod(viewMode: ViewMode, referenceDate: Date) {
@@ -294,50 +346,56 @@ export class GetAvailableSlotsUseCase {
 
   private async generateAvailableSlots(
     request: GetAvailableSlotsRequest,
-    entities: any,
     period: { startDate: Date; endDate: Date },
   ) {
-    const { service, calendar, staff } = entities;
-    const duration = request.duration || service.getDefaultDuration();
+    const days: Date[] = [];
+    const currentDate = new Date(period.startDate);
+    while (currentDate <= period.endDate) {
+      days.push(new Date(currentDate));
+      currentDate.setDate(currentDate.getDate() + 1);
+    }
 
-    // Récupérer les rendez-vous existants sur la période
-    const existingAppointments =
-      await this.appointmentRepository.findByCalendarId(
-        CalendarId.create(request.calendarId),
-        period.startDate,
-        period.endDate,
-      );
+    const grids = days.map((day) =>
+      this.slotsCache?.get(this.toCacheKey(request, day)),
+    );
+    const missing = days.filter((_, index) => !grids[index]);
+
+    if (missing.length > 0) {
+      const computed = await this.computeSlotGrids(request, missing);
+      let next = 0;
+      for (let index = 0; index < days.length; index++) {
+        if (grids[index]) continue;
+        const grid = computed[next++];
+        grids[index] = grid;
+        this.slotsCache?.set(this.toCacheKey(request, days[index]), grid);
+      }
+    }
 
+    const nowMs = Date.now();
     const dailySlots: DaySlots[] = [];
     let totalSlots = 0;
     let availableCount = 0;
     let bookedCount = 0;
 
-    // Générer les créneaux pour chaque jour de la période
-    const currentDate = new Date(period.startDate);
-    while (currentDate <= period.endDate) {
-      const daySlots = await this.generateSlotsForDay(
-        currentDate,
-        service,
-        calendar,
-        staff,
-        duration,
-        existingAppointments,
+    for (let index = 0; index < days.length; index++) {
+      const daySlots = this.toDaySlots(
+        days[index],
+        grids[index] as SlotGrid,
+        nowMs,
         request.includeUnavailableReasons,
       );
 
       if (daySlots.slots.length > 0) {
         dailySlots.push(daySlots);
         totalSlots += daySlots.slots.length;
-        availableCount += daySlots.slots.filter(
-          (slot) => slot.isAvailable,
-        ).length;
-        bookedCount += daySlots.slots.filter(
-          (slot) => !slot.isAvailable,
-        ).length;
+        for (const slot of daySlots.slots) {
+          if (slot.isAvailable) {
+            availableCount++;
+          } else {
+            bookedCount++;
+          }
+        }
       }
-
-      currentDate.setDate(currentDate.getDate() + 1);
     }
 
     return {
@@ -348,70 +406,140 @@ export class GetAvailableSlotsUseCase {
     };
   }
 
-  private async generateSlotsForDay(
+  /**
+   * Grilles brutes (créneaux + occupation) des jours demandés, triés
+   */
+  private async computeSlotGrids(
+    request: GetAvailableSlotsRequest,
+    days: Date[],
+  ): Promise<SlotGrid[]> {
+    const { service, staff, openingTemplate } =
+      await this.loadRequiredEntities(request);
+
+    // Journées complètes : une grille en cache ne dépend pas de l'heure
+    // de référence de la requête
+    const first = days[0];
+    const last = days[days.length - 1];
+    const existingAppointments = (
+      await this.appointmentRepository.findByCalendarId(
+        CalendarId.create(request.calendarId),
+        new Date(first.getFullYear(), first.getMonth(), first.getDate()),
+        new Date(last.getFullYear(), last.getMonth(), last.getDate() + 1),
+      )
+    ).filter(
+      // Un rendez-vous annulé ou non honoré libère le créneau
+      (appointment) =>
+        appointment.status !== AppointmentStatus.CANCELLED &&
+        appointment.status !== AppointmentStatus.NO_SHOW,
+    );
+
+    // Trier/fusionner une seule fois pour toute la période ; chaque plage
+    // d'ouverture n'en lit ensuite qu'une vue
+    const busy = BusyTimeline.fromAppointments(existingAppointments);
+
+    // Identiques pour tous les créneaux de la période
+    const price = service.getBasePrice()?.getAmount();
+    const staffName = staff
+      ? `${staff.profile.firstName} ${staff.profile.lastName}`
+      : undefined;
+    const staffId = staff?.id.getValue();
+
+    return days.map((day) => ({
+      ...this.buildSlotGrid(day, openingTemplate, busy),
+      price,
+      staffName,
+      staffId,
+    }));
+  }
+
+  private buildSlotGrid(
     date: Date,
-    service: any,
-    _calendar: any,
-    staff: any,
-    _duration: number,
-    existingAppointments: any[],
-    includeUnavailable = false,
-  ): Promise<DaySlots> {
-    const dayOfWeek = date.getDay();
+    openingTemplate: WeeklyOpeningTemplate,
+    busy: BusyTimeline,
+  ): Pick<SlotGrid, "slotDurationMs" | "starts" | "occupied"> {
+    // Plages d'ouverture du jour en minutes depuis minuit (dates spéciales
+    // comprises) : [début0, fin0, début1, fin1, ...]
+    const openingRanges = openingTemplate.forDate(date);
+
+    const slotDurationMs =
+      GetAvailableSlotsUseCase.SLOT_DURATION_MINUTES * 60000;
+    const year = date.getFullYear();
+    const month = date.getMonth();
+    const day = date.getDate();
+
+    const starts: number[] = [];
+    const occupied: number[] = [];
+
+    for (let i = 0; i < openingRanges.length; i += 2) {
+      // Date locale (gère les changements d'heure) une fois par plage
+      const rangeStartMs = new Date(
+        year,
+        month,
+        day,
+        0,
+        openingRanges[i],
+      ).getTime();
+      const rangeEndMs = new Date(
+        year,
+        month,
+        day,
+        0,
+        openingRanges[i + 1],
+      ).getTime();
+
+      const slotCount = Math.floor(
+        (rangeEndMs - rangeStartMs) / slotDurationMs,
+      );
+      if (slotCount <= 0) continue;
+
+      // Occupation de toute la plage en une passe (tableau de différences)
+      const rangeBusy = busy.within(rangeStartMs, rangeEndMs);
+      const { counts } = AppointmentOccupancyKernel.compute(
+        rangeBusy.starts,
+        rangeBusy.ends,
+        rangeStartMs,
+        slotDurationMs,
+        slotCount,
+      );
 
-    // TODO: Vérifier les horaires d'ouverture du calendrier pour ce jour
-    // const workingHours = calendar.getWorkingHoursForDay(dayOfWeek);
+      for (let slot = 0; slot < slotCount; slot++) {
+        starts.push(rangeStartMs + slot * slotDurationMs);
+        occupied.push(counts[slot] > 0 ? 1 : 0);
+      }
+    }
 
-    // Pour l'instant, horaires par défaut 9h-18h
-    const workingHours = {
-      start: { hour: 9, minute: 0 },
-      end: { hour: 18, minute: 0 },
+    return {
+      slotDurationMs,
+      starts: Float64Array.from(starts),
+      occupied: Uint8Array.from(occupied),
     };
+  }
 
+  private toDaySlots(
+    date: Date,
+    grid: SlotGrid,
+    nowMs: number,
+    includeUnavailable = false,
+  ): DaySlots {
+    const { starts, occupied, slotDurationMs, price, staffName, staffId } =
+      grid;
     const slots: SlotDetails[] = [];
 
-    // Générer des créneaux de 30 minutes par défaut
-    const slotDuration = 30;
-    const startTime = new Date(date);
-    startTime.setHours(
-      workingHours.start.hour,
-      workingHours.start.minute,
-      0,
-      0,
-    );
-
-    const endOfDay = new Date(date);
-    endOfDay.setHours(workingHours.end.hour, workingHours.end.minute, 0, 0);
-
-    const currentSlot = new Date(startTime);
-
-    while (currentSlot < endOfDay) {
-      const slotEnd = new Date(currentSlot.getTime() + slotDuration * 60000);
+    for (let index = 0; index < starts.length; index++) {
+      const slotStartMs = starts[index];
 
       // Vérifier si le créneau est libre
-      const isOccupied = existingAppointments.some((appointment: any) => {
-        const appointmentStart = appointment.timeSlot.getStartTime();
-        const appointmentEnd = appointment.timeSlot.getEndTime();
-
-        return (
-          (currentSlot >= appointmentStart && currentSlot < appointmentEnd) ||
-          (slotEnd > appointmentStart && slotEnd <= appointmentEnd) ||
-          (currentSlot <= appointmentStart && slotEnd >= appointmentEnd)
-        );
-      });
-
-      const isAvailable = !isOccupied && currentSlot > new Date();
+      const isOccupied = occupied[index] === 1;
+      const isAvailable = !isOccupied && slotStartMs > nowMs;
 
       if (isAvailable || includeUnavailable) {
         slots.push({
-          startTime: new Date(currentSlot),
-          endTime: new Date(slotEnd),
+          startTime: new Date(slotStartMs),
+          endTime: new Date(slotStartMs + slotDurationMs),
           isAvailable,
-          price: service.getBasePrice()?.getAmount(),
-          staffName: staff
-            ? `${staff.getProfile().firstName} ${staff.getProfile().lastName}`
-            : undefined,
-          staffId: staff?.getId().getValue(),
+          price,
+          staffName,
+          staffId,
           unavailableReason: !isAvailable
             ? isOccupied
               ? "Créneau occupé"
@@ -419,17 +547,25 @@ export class GetAvailableSlotsUseCase {
             : undefined,
         });
       }
-
-      currentSlot.setTime(currentSlot.getTime() + slotDuration * 60000);
     }
 
     return {
       date: date.toISOString().split("T")[0],
-      dayOfWeek,
+      dayOfWeek: date.getDay(),
       slots,
     };
   }
 
+  private toCacheKey(request: GetAvailableSlotsRequest, day: Date) {
+    return {
+      calendarId: request.calendarId,
+      serviceId: request.serviceId,
+      staffId: request.staffId,
+      day,
+      duration: request.duration,
+    };
+  }
+
   private formatPeriodLabel(
     period: { startDate: Date; endDate: Date },
     viewMode: ViewMode,
@@ -0,0 +1,250 @@
+/**
+ * 📅 GET BATCH AVAILABILITY USE CASE
+ * ✅ Clean Architecture - Application Layer
+ * ✅ Premiers créneaux libres sur N calendriers/praticiens pour un service
+ * ✅ Deux requêtes ensemblistes côté repository, quel que soit N
+ * ✅ Service et calendriers restreints à l'entreprise demandée
+ * ✅ Bitmaps libre/occupé partagés quand FreeBusyService est fourni
+ */
+
+import type { CalendarRepository } from "../../../domain/repositories/calendar.repository.interface";
+import type { ServiceRepository } from "../../../domain/repositories/service.repository.interface";
+import { BusinessId } from "../../../domain/value-objects/business-id.value-object";
+import { CalendarId } from "../../../domain/value-objects/calendar-id.value-object";
+import { ServiceId } from "../../../domain/value-objects/service-id.value-object";
+import {
+  ApplicationValidationError,
+  ResourceNotFoundError,
+} from "../../exceptions/application.exceptions";
+import type { I18nService } from "../../ports/i18n.port";
+import type { Logger } from "../../ports/logger.port";
+import type { FreeBusyService } from "../../services/free-busy.service";
+
+export interface GetBatchAvailabilityRequest {
+  readonly businessId: string;
+  readonly serviceId: string;
+  readonly calendarIds: string[];
+  readonly referenceDate: Date;
+  readonly maxSlotsPerCalendar?: number;
+  readonly requestingUserId: string;
+}
+
+export interface BatchSlot {
+  readonly calendarId: string;
+  readonly startTime: Date;
+  readonly endTime: Date;
+}
+
+export interface CalendarAvailability {
+  readonly calendarId: string;
+  readonly slots: BatchSlot[];
+}
+
+export interface GetBatchAvailabilityResponse {
+  readonly periodStart: Date;
+  readonly periodEnd: Date;
+  readonly durationMinutes: number;
+  readonly calendars: CalendarAvailability[];
+  readonly firstAvailable: BatchSlot | null;
+}
+
+export class GetBatchAvailabilityUseCase {
+  private static readonly MAX_CALENDARS = 100;
+  private static readonly DEFAULT_SLOTS_PER_CALENDAR = 5;
+
+  constructor(
+    private readonly calendarRepository: CalendarRepository,
+    private readonly serviceRepository: ServiceRepository,
+    private readonly logger: Logger,
+    private readonly i18n: I18nService,
+    private readonly freeBusyService?: FreeBusyService,
+  ) {}
+
+  async execute(
+    request: GetBatchAvailabilityRequest,
+  ): Promise<GetBatchAvailabilityResponse> {
+    this.logger.info(
+      this.i18n.translate("operations.availability.fetching_slots"),
+      {
+        businessId: request.businessId,
+        serviceId: request.serviceId,
+        calendarCount: request.calendarIds?.length ?? 0,
+        referenceDate: request.referenceDate?.toISOString(),
+      },
+    );
+
+    try {
+      this.validateRequest(request);
+
+      const businessId = BusinessId.create(request.businessId);
+      const [service, businessCalendarIds] = await Promise.all([
+        this.serviceRepository.findById(ServiceId.create(request.serviceId)),
+        this.calendarRepository.findIdsByBusinessId(businessId),
+      ]);
+      // Ressource d'une autre entreprise : traitée comme introuvable
+      if (!service || !service.businessId.equals(businessId)) {
+        throw new ResourceNotFoundError("Service", request.serviceId);
+      }
+
+      const durationMinutes = service.getDefaultDuration();
+      const { periodStart, periodEnd } = this.calculateWeek(
+        request.referenceDate,
+      );
+      const limit =
+        request.maxSlotsPerCalendar ??
+        GetBatchAvailabilityUseCase.DEFAULT_SLOTS_PER_CALENDAR;
+
+      // Dédupliquer en conservant l'ordre demandé
+      const ownedCalendarIds = new Set(
+        businessCalendarIds.map((calendarId) => calendarId.getValue()),
+      );
+      const calendarIds = [...new Set(request.calendarIds)].map((id) => {
+        if (!ownedCalendarIds.has(id)) {
+          throw new ResourceNotFoundError("Calendar", id);
+        }
+        return CalendarId.create(id);
+      });
+
+      // Bitmaps partagés si disponibles, calcul exact en base sinon
+      const source = this.freeBusyService ?? this.calendarRepository;
+      const availability = await source.findAvailableSlots(
+        calendarIds,
+        periodStart,
+        periodEnd,
+        durationMinutes,
+      );
+
+      const calendars: CalendarAvailability[] = [];
+      let firstAvailable: BatchSlot | null = null;
+
+      for (const entry of availability) {
+        const calendarId = entry.calendarId.getValue();
+        const slots: BatchSlot[] = [];
+
+        for (const timeSlot of entry.slots) {
+          if (slots.length >= limit) break;
+          slots.push({
+            calendarId,
+            startTime: timeSlot.getStartTime(),
+            endTime: timeSlot.getEndTime(),
+          });
+        }
+
+        if (
+          slots.length > 0 &&
+          (!firstAvailable || slots[0].startTime < firstAvailable.startTime)
+        ) {
+          firstAvailable = slots[0];
+        }
+
+        calendars.push({ calendarId, slots });
+      }
+
+      this.logger.info(
+        this.i18n.translate("operations.availability.slots_fetched"),
+        {
+          businessId: request.businessId,
+          calendarCount: calendars.length,
+          firstAvailable: firstAvailable?.startTime.toISOString(),
+        },
+      );
+
+      return {
+        periodStart,
+        periodEnd,
+        durationMinutes,
+        calendars,
+        firstAvailable,
+      };
+    } catch (error) {
+      this.logger.error(
+        this.i18n.translate("operations.availability.fetch_failed"),
+        error instanceof Error ? error : new Error(String(error)),
+        {
+          businessId: request.businessId,
+          serviceId: request.serviceId,
+        },
+      );
+      throw error;
+    }
+  }
+
+  private validateRequest(request: GetBatchAvailabilityRequest): void {
+    if (!request.businessId?.trim()) {
+      throw new ApplicationValidationError(
+        "businessId",
+        request.businessId,
+        "business_id_required",
+      );
+    }
+
+    if (!request.serviceId?.trim()) {
+      throw new ApplicationValidationError(
+        "serviceId",
+        request.serviceId,
+        "service_id_required",
+      );
+    }
+
+    if (
+      !Array.isArray(request.calendarIds) ||
+      request.calendarIds.length === 0
+    ) {
+      throw new ApplicationValidationError(
+        "calendarIds",
+        request.calendarIds,
+        "calendar_ids_required",
+      );
+    }
+
+    const maxCalendars = GetBatchAvailabilityUseCase.MAX_CALENDARS;
+    if (request.calendarIds.length > maxCalendars) {
+      throw new ApplicationValidationError(
+        "calendarIds",
+        request.calendarIds.length,
+        "too_many_calendars",
+      );
+    }
+
+    if (!request.referenceDate || isNaN(request.referenceDate.getTime())) {
+      throw new ApplicationValidationError(
+        "referenceDate",
+        request.referenceDate,
+        "reference_date_required",
+      );
+    }
+
+    if (
+      request.maxSlotsPerCalendar !== undefined &&
+      (request.maxSlotsPerCalendar < 1 || request.maxSlotsPerCalendar > 100)
+    ) {
+      throw new ApplicationValidationError(
+        "maxSlotsPerCalendar",
+        request.maxSlotsPerCalendar,
+        "invalid_max_slots",
+      );
+    }
+  }
+
+  /**
+   * Semaine (lundi-dimanche) de la date de référence, sans remonter avant
+   * l'instant présent
+   */
+  private calculateWeek(referenceDate: Date): {
+    periodStart: Date;
+    periodEnd: Date;
+  } {
+    const monday = new Date(referenceDate);
+    const dayOfWeek = monday.getDay();
+    monday.setDate(monday.getDate() - (dayOfWeek === 0 ? 6 : dayOfWeek - 1));
+    monday.setHours(0, 0, 0, 0);
+
+    const periodEnd = new Date(monday);
+    periodEnd.setDate(monday.getDate() + 7);
+
+    const now = new Date();
+    const periodStart = monday < now ? now : monday;
+
+    return { periodStart, periodEnd };
+  }
+}
@@ -0,0 +1,115 @@
+/**
+ * ⏭️ GET NEXT AVAILABLE SLOTS USE CASE
+ * ✅ Clean Architecture - Application Layer
+ * ✅ Premier créneau libre de N entreprises pour les listings
+ * ✅ Une lecture de l'index précalculé, sans calcul de disponibilité
+ */
+
+import { BusinessId } from "../../../domain/value-objects/business-id.value-object";
+import { ServiceId } from "../../../domain/value-objects/service-id.value-object";
+import { ApplicationValidationError } from "../../exceptions/application.exceptions";
+import type { I18nService } from "../../ports/i18n.port";
+import type { Logger } from "../../ports/logger.port";
+import type { NextAvailableSlotIndexService } from "../../services/next-available-slot-index.service";
+
+export interface GetNextAvailableSlotsRequest {
+  readonly businessIds: string[];
+  readonly serviceId?: string;
+  readonly requestingUserId: string;
+}
+
+export interface BusinessNextSlot {
+  readonly businessId: string;
+  readonly serviceId: string;
+  readonly calendarId: string;
+  readonly startTime: Date;
+  readonly endTime: Date;
+}
+
+export interface GetNextAvailableSlotsResponse {
+  // Dans l'ordre demandé ; null si aucun créneau indexé
+  readonly businesses: {
+    readonly businessId: string;
+    readonly nextSlot: BusinessNextSlot | null;
+  }[];
+}
+
+export class GetNextAvailableSlotsUseCase {
+  private static readonly MAX_BUSINESSES = 100;
+
+  constructor(
+    private readonly nextSlotIndex: NextAvailableSlotIndexService,
+    private readonly logger: Logger,
+    private readonly i18n: I18nService,
+  ) {}
+
+  async execute(
+    request: GetNextAvailableSlotsRequest,
+  ): Promise<GetNextAvailableSlotsResponse> {
+    this.validateRequest(request);
+
+    const businessIds = [...new Set(request.businessIds)];
+    const indexed = await this.nextSlotIndex.findForBusinesses(
+      businessIds.map((id) => BusinessId.create(id)),
+      request.serviceId ? ServiceId.create(request.serviceId) : undefined,
+    );
+
+    const byBusiness = new Map<string, BusinessNextSlot>();
+    for (const entry of indexed) {
+      if (!entry.startTime || !entry.endTime) continue;
+      byBusiness.set(entry.businessId.getValue(), {
+        businessId: entry.businessId.getValue(),
+        serviceId: entry.serviceId.getValue(),
+        calendarId: entry.calendarId.getValue(),
+        startTime: entry.startTime,
+        endTime: entry.endTime,
+      });
+    }
+
+    this.logger.info(
+      this.i18n.translate("operations.availability.slots_fetched"),
+      {
+        businessCount: businessIds.length,
+        indexedCount: byBusiness.size,
+        serviceId: request.serviceId,
+      },
+    );
+
+    return {
+      businesses: businessIds.map((businessId) => ({
+        businessId,
+        nextSlot: byBusiness.get(businessId) ?? null,
+      })),
+    };
+  }
+
+  private validateRequest(request: GetNextAvailableSlotsRequest): void {
+    if (
+      !Array.isArray(request.businessIds) ||
+      request.businessIds.length === 0
+    ) {
+      throw new ApplicationValidationError(
+        "businessIds",
+        request.businessIds,
+        "business_ids_required",
+      );
+    }
+
+    const maxBusinesses = GetNextAvailableSlotsUseCase.MAX_BUSINESSES;
+    if (request.businessIds.length > maxBusinesses) {
+      throw new ApplicationValidationError(
+        "businessIds",
+        request.businessIds.length,
+        "too_many_businesses",
+      );
+    }
+
+    if (request.serviceId !== undefined && !request.serviceId.trim()) {
+      throw new ApplicationValidationError(
+        "serviceId",
+        request.serviceId,
+        "service_id_required",
+      );
+    }
+  }
+}
@@ -0,0 +1,233 @@
+/**
+ * ⏳ HOLD SLOT USE CASE
+ * ✅ Clean Architecture - Application Layer
+ * ✅ Retenue d'un créneau quelques minutes avant la réservation
+ *
+ * À l'ouverture d'un agenda très demandé, des centaines de clients visent
+ * les mêmes créneaux. La retenue est prise dans Redis avant toute lecture
+ * en base : les perdants échouent en un aller-retour, seul le gagnant
+ * charge et vérifie business, service, calendrier et conflits. Le jeton
+ * retourné permet ensuite à BookAppointmentUseCase de sauter ces
+ * vérifications. Une retenue non utilisée expire d'elle-même.
+ *
+ * Chaque utilisateur est limité en tentatives par fenêtre : sans cela, un
+ * seul compte pourrait retenir tout un agenda en boucle.
+ */
+
+import type { AppointmentRepository } from "../../../domain/repositories/appointment.repository.interface";
+import type { BusinessRepository } from "../../../domain/repositories/business.repository.interface";
+import type { CalendarRepository } from "../../../domain/repositories/calendar.repository.interface";
+import type { ServiceRepository } from "../../../domain/repositories/service.repository.interface";
+import type { I18nService } from "../../ports/i18n.port";
+import type { Logger } from "../../ports/logger.port";
+import type { ISlotHoldStore } from "../../ports/slot-hold.port";
+
+import { BusinessId } from "../../../domain/value-objects/business-id.value-object";
+import { CalendarId } from "../../../domain/value-objects/calendar-id.value-object";
+import { ServiceId } from "../../../domain/value-objects/service-id.value-object";
+
+import {
+  AppointmentConflictError,
+  AppointmentValidationError,
+  BusinessNotFoundError,
+  CalendarNotFoundError,
+  ServiceNotBookableOnlineError,
+  ServiceNotFoundError,
+  SlotHoldLimitExceededError,
+} from "../../exceptions/appointment.exceptions";
+
+export interface HoldSlotRequest {
+  readonly businessId: string;
+  readonly serviceId: string;
+  readonly calendarId: string;
+  readonly staffId?: string;
+  readonly startTime: Date;
+  readonly endTime: Date;
+  readonly requestingUserId: string;
+}
+
+export interface HoldSlotResponse {
+  readonly token: string;
+  readonly calendarId: string;
+  readonly startTime: Date;
+  readonly endTime: Date;
+  readonly expiresAt: Date;
+}
+
+export class HoldSlotUseCase {
+  private static readonly HOLD_SECONDS = 120;
+  static readonly MAX_ATTEMPTS_PER_WINDOW = 10;
+  static readonly ATTEMPT_WINDOW_SECONDS = 60;
+  // Même préavis que BookAppointmentUseCase
+  private static readonly MINIMUM_NOTICE_MS = 2 * 60 * 60 * 1000;
+
+  constructor(
+    private readonly slotHolds: ISlotHoldStore,
+    private readonly appointmentRepository: AppointmentRepository,
+    private readonly serviceRepository: ServiceRepository,
+    private readonly calendarRepository: CalendarRepository,
+    private readonly businessRepository: BusinessRepository,
+    private readonly logger: Logger,
+    private readonly i18n: I18nService,
+  ) {}
+
+  async execute(request: HoldSlotRequest): Promise<HoldSlotResponse> {
+    this.validateRequest(request);
+    await this.checkAttemptQuota(request.requestingUserId);
+
+    // 1. Retenue atomique : créneau déjà retenu = échec sans lecture en base
+    const hold = await this.slotHolds.acquire(
+      {
+        businessId: request.businessId,
+        serviceId: request.serviceId,
+        calendarId: request.calendarId,
+        staffId: request.staffId,
+        startTime: request.startTime,
+        endTime: request.endTime,
+      },
+      HoldSlotUseCase.HOLD_SECONDS,
+    );
+    if (!hold) {
+      throw new AppointmentConflictError({
+        startTime: request.startTime,
+        endTime: request.endTime,
+      });
+    }
+
+    // 2. Vérifications complètes, une seule fois, par le détenteur
+    try {
+      await this.verifySlot(request);
+    } catch (error) {
+      await this.slotHolds.release(request.calendarId, hold.token);
+      throw error;
+    }
+
+    this.logger.info(this.i18n.translate("operations.booking.slot_held"), {
+      calendarId: request.calendarId,
+      startTime: request.startTime.toISOString(),
+      expiresAt: hold.expiresAt.toISOString(),
+      requestingUserId: request.requestingUserId,
+    });
+
+    return {
+      token: hold.token,
+      calendarId: hold.calendarId,
+      startTime: hold.startTime,
+      endTime: hold.endTime,
+      expiresAt: hold.expiresAt,
+    };
+  }
+
+  private async checkAttemptQuota(requestingUserId: string): Promise<void> {
+    const attempts = await this.slotHolds.countAttempt(
+      requestingUserId,
+      HoldSlotUseCase.ATTEMPT_WINDOW_SECONDS,
+    );
+    if (attempts > HoldSlotUseCase.MAX_ATTEMPTS_PER_WINDOW) {
+      throw new SlotHoldLimitExceededError(
+        requestingUserId,
+        HoldSlotUseCase.MAX_ATTEMPTS_PER_WINDOW,
+        HoldSlotUseCase.ATTEMPT_WINDOW_SECONDS,
+      );
+    }
+  }
+
+  private validateRequest(request: HoldSlotRequest): void {
+    if (
+      !request.businessId?.trim() ||
+      !request.serviceId?.trim() ||
+      !request.calendarId?.trim() ||
+      !request.requestingUserId?.trim()
+    ) {
+      throw new AppointmentValidationError(
+        "ids",
+        {
+          businessId: request.businessId,
+          serviceId: request.serviceId,
+          calendarId: request.calendarId,
+          requestingUserId: request.requestingUserId,
+        },
+        this.i18n.translate("errors.validation.ids_required"),
+      );
+    }
+
+    if (
+      !request.startTime ||
+      !request.endTime ||
+      request.startTime >= request.endTime
+    ) {
+      throw new AppointmentValidationError(
+        "timeSlot",
+        { startTime: request.startTime, endTime: request.endTime },
+        this.i18n.translate("errors.validation.invalid_time_slot"),
+      );
+    }
+
+    if (
+      request.startTime.getTime() <
+      Date.now() + HoldSlotUseCase.MINIMUM_NOTICE_MS
+    ) {
+      throw new AppointmentValidationError(
+        "startTime",
+        request.startTime,
+        this.i18n.translate("errors.booking.insufficient_notice"),
+      );
+    }
+  }
+
+  private async verifySlot(request: HoldSlotRequest): Promise<void> {
+    const businessId = BusinessId.create(request.businessId);
+    const serviceId = ServiceId.create(request.serviceId);
+    const calendarId = CalendarId.create(request.calendarId);
+
+    const [business, service, calendar, conflicts] = await Promise.all([
+      this.businessRepository.findById(businessId),
+      this.serviceRepository.findById(serviceId),
+      this.calendarRepository.findById(calendarId),
+      this.appointmentRepository.findConflictingAppointments(
+        calendarId,
+        request.startTime,
+        request.endTime,
+      ),
+    ]);
+
+    if (!business) {
+      throw new BusinessNotFoundError(businessId.getValue());
+    }
+
+    if (!service) {
+      throw new ServiceNotFoundError(serviceId.getValue());
+    }
+
+    if (!calendar) {
+      throw new CalendarNotFoundError(calendarId.getValue());
+    }
+
+    if (!business.isActive()) {
+      throw new AppointmentValidationError(
+        "businessStatus",
+        "inactive",
+        this.i18n.translate("errors.business.inactive"),
+      );
+    }
+
+    if (!service.isActive()) {
+      throw new AppointmentValidationError(
+        "serviceStatus",
+        "inactive",
+        this.i18n.translate("errors.service.inactive"),
+      );
+    }
+
+    if (!service.isBookable()) {
+      throw new ServiceNotBookableOnlineError(serviceId.getValue());
+    }
+
+    if (conflicts.length > 0) {
+      throw new AppointmentConflictError(
+        { startTime: request.startTime, endTime: request.endTime },
+        conflicts[0].getId().getValue(),
+      );
+    }
+  }
+}
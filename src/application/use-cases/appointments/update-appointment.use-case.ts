@@ -11,6 +11,9 @@ import {
 } from "../../../domain/entities/appointment.entity";
 import { AppointmentRepository } from "../../../domain/repositories/appointment.repository.interface";
 import { AppointmentNotFoundError } from "../../exceptions/appointment.exceptions";
+import type { AvailableSlotsCache } from "../../services/available-slots-cache.service";
+import type { FreeBusyService } from "../../services/free-busy.service";
+import type { NextAvailableSlotIndexService } from "../../services/next-available-slot-index.service";
 
 export interface UpdateAppointmentRequest {
   readonly appointmentId: string;
@@ -28,7 +31,12 @@ export interface UpdateAppointmentResponse {
 }
 
 export class UpdateAppointmentUseCase {
-  constructor(private readonly appointmentRepository: AppointmentRepository) {}
+  constructor(
+    private readonly appointmentRepository: AppointmentRepository,
+    private readonly slotsCache?: AvailableSlotsCache,
+    private readonly nextSlotIndex?: NextAvailableSlotIndexService,
+    private readonly freeBusyService?: FreeBusyService,
+  ) {}
 
   async execute(
     request: UpdateAppointmentRequest,
@@ -74,6 +82,26 @@ export class UpdateAppointmentUseCase {
     // 5. Sauvegarde
     await this.appointmentRepository.save(updatedAppointment);
 
+    // 6. Invalidation des créneaux en cache : ancien et nouveau créneau
+    const calendarId = updatedAppointment.calendarId.getValue();
+    this.slotsCache?.invalidate(
+      calendarId,
+      appointment.getTimeSlot().getStartTime(),
+      appointment.getTimeSlot().getEndTime(),
+    );
+    if (request.startTime && request.endTime) {
+      this.slotsCache?.invalidate(
+        calendarId,
+        request.startTime,
+        request.endTime,
+      );
+    }
+    await this.nextSlotIndex?.invalidate(
+      updatedAppointment.getBusinessId(),
+      updatedAppointment.calendarId,
+    );
+    await this.freeBusyService?.invalidate(updatedAppointment.calendarId);
+
     return {
       appointment: updatedAppointment,
       message: "Rendez-vous mis à jour avec succès",
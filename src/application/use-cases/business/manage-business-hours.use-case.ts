@@ -9,6 +9,7 @@
  */
 
 import { BusinessRepository } from "../../../domain/repositories/business.repository.interface";
+import type { CalendarRepository } from "../../../domain/repositories/calendar.repository.interface";
 import {
   BusinessHours,
   DaySchedule,
@@ -21,6 +22,8 @@ import {
 } from "../../exceptions/application.exceptions";
 import { I18nService } from "../../ports/i18n.port";
 import { Logger } from "../../ports/logger.port";
+import type { AvailableSlotsCache } from "../../services/available-slots-cache.service";
+import type { NextAvailableSlotIndexService } from "../../services/next-available-slot-index.service";
 
 // Request & Response DTOs
 export interface GetBusinessHoursRequest {
@@ -94,6 +97,9 @@ export class ManageBusinessHoursUseCase {
     private readonly businessRepository: BusinessRepository,
     private readonly logger: Logger,
     private readonly i18n: I18nService,
+    private readonly nextSlotIndex?: NextAvailableSlotIndexService,
+    private readonly calendarRepository?: CalendarRepository,
+    private readonly slotsCache?: AvailableSlotsCache,
   ) {}
 
   async getBusinessHours(
@@ -190,6 +196,10 @@ export class ManageBusinessHoursUseCase {
 
       // 5. Sauvegarder
       await this.businessRepository.save(business);
+      await this.nextSlotIndex?.invalidate(
+        BusinessId.create(request.businessId),
+      );
+      await this.invalidateSlotsCache(businessId);
 
       const response: UpdateBusinessHoursResponse = {
         businessId: request.businessId,
@@ -265,6 +275,10 @@ export class ManageBusinessHoursUseCase {
 
       // 5. Sauvegarder
       await this.businessRepository.save(business);
+      await this.nextSlotIndex?.invalidate(
+        BusinessId.create(request.businessId),
+      );
+      await this.invalidateSlotsCache(businessId, request.date);
 
       const response: AddSpecialDateResponse = {
         businessId: request.businessId,
@@ -351,6 +365,35 @@ export class ManageBusinessHoursUseCase {
   }
 
   // Private helper methods
+
+  /**
+   * Créneaux en cache calculés avec les anciens horaires : tous les jours
+   * des calendriers du business, ou seulement le jour de la date spéciale
+   */
+  private async invalidateSlotsCache(
+    businessId: BusinessId,
+    day?: Date,
+  ): Promise<void> {
+    if (!this.slotsCache || !this.calendarRepository) {
+      return;
+    }
+
+    const calendars =
+      await this.calendarRepository.findByBusinessId(businessId);
+    for (const calendar of calendars) {
+      const calendarId = calendar.id.getValue();
+      if (!day) {
+        this.slotsCache.invalidateCalendar(calendarId);
+        continue;
+      }
+
+      const start = new Date(day.getFullYear(), day.getMonth(), day.getDate());
+      const end = new Date(start);
+      end.setDate(end.getDate() + 1);
+      this.slotsCache.invalidate(calendarId, start, end);
+    }
+  }
+
   private async checkBusinessAccessPermission(
     business: any,
     requestingUserId: string,
@@ -13,13 +13,13 @@ import {
   ImageCategory,
 } from "../../../domain/value-objects/business-image.value-object";
 import { ImageUploadSettings } from "../../../domain/value-objects/image-upload-settings.value-object";
-import { AwsS3ImageService } from "../../../infrastructure/services/aws-s3-image.service";
 import {
   BusinessValidationError,
   ExternalServiceError,
   InsufficientPermissionsError,
   ResourceNotFoundError,
 } from "../../exceptions/application.exceptions";
+import type { IImageStorage } from "../../ports/image-storage.port";
 
 export interface UploadBusinessImageRequest {
   readonly businessId: string;
@@ -55,7 +55,7 @@ export interface UploadBusinessImageResponse {
 export class UploadBusinessImageUseCase {
   constructor(
     private readonly businessRepository: BusinessRepository,
-    private readonly imageService: AwsS3ImageService,
+    private readonly imageService: IImageStorage,
   ) {}
 
   async execute(
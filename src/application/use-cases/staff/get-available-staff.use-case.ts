@@ -1,6 +1,9 @@
 import { Staff } from "../../../domain/entities/staff.entity";
 import { StaffRepository } from "../../../domain/repositories/staff.repository.interface";
+import type { StaffSkillIndex } from "../../../domain/services/staff-skill-index.service";
+import { ProficiencyLevel } from "../../../domain/value-objects/staff-skills.value-object";
 import { BusinessId } from "../../../domain/value-objects/business-id.value-object";
+import { UserId } from "../../../domain/value-objects/user-id.value-object";
 import { ApplicationValidationError } from "../../exceptions/application.exceptions";
 
 export interface GetAvailableStaffRequest {
@@ -8,6 +11,7 @@ export interface GetAvailableStaffRequest {
   readonly dateTime: Date;
   readonly durationMinutes: number;
   readonly serviceId?: string; // Optionnel : pour filtrer par compétence
+  readonly requiredSkills?: string[]; // IDs de compétences, toutes requises
   readonly requestingUserId: string;
   readonly correlationId?: string;
 }
@@ -52,7 +56,10 @@ export interface GetAvailableStaffResponse {
  * - Données publiques uniquement (pour booking)
  */
 export class GetAvailableStaffUseCase {
-  constructor(private readonly staffRepository: StaffRepository) {}
+  constructor(
+    private readonly staffRepository: StaffRepository,
+    private readonly skillIndex?: StaffSkillIndex,
+  ) {}
 
   async execute(
     request: GetAvailableStaffRequest,
@@ -60,9 +67,13 @@ export class GetAvailableStaffUseCase {
     // 🔍 1. Valider la requête
     this.validateRequest(request);
 
-    // 🏢 2. Récupérer tous les staff de l'entreprise
+    // 🏢 2. Récupérer le staff de l'entreprise (qualifié seulement si
+    // des compétences sont exigées)
     const businessId = BusinessId.create(request.businessId);
-    const allStaff = await this.staffRepository.findByBusinessId(businessId);
+    const allStaff = await this.loadCandidates(
+      businessId,
+      request.requiredSkills,
+    );
 
     // 🎯 3. Filtrer le staff disponible
     const availableStaff = await this.filterAvailableStaff(
@@ -118,6 +129,35 @@ export class GetAvailableStaffUseCase {
     }
   }
 
+  /**
+   * Intersection via l'index inversé des compétences, avant tout chargement :
+   * seuls les ids qualifiés sont lus. Sans index ou sans exigence, tout le
+   * staff de l'entreprise est chargé.
+   */
+  private async loadCandidates(
+    businessId: BusinessId,
+    requiredSkills?: string[],
+  ): Promise<Staff[]> {
+    if (!this.skillIndex || !requiredSkills || requiredSkills.length === 0) {
+      return this.staffRepository.findByBusinessId(businessId);
+    }
+
+    const qualified = this.skillIndex.findQualifiedStaff(
+      requiredSkills.map((skillId) => ({
+        skillId,
+        minimumProficiency: ProficiencyLevel.BEGINNER,
+      })),
+    );
+    if (qualified.size === 0) {
+      return [];
+    }
+
+    return this.staffRepository.findByIds(
+      businessId,
+      [...qualified].map((staffId) => UserId.create(staffId)),
+    );
+  }
+
   private async filterAvailableStaff(
     allStaff: Staff[],
     dateTime: Date,
@@ -13,6 +13,10 @@ import {
 import { StaffNotFoundError } from "../../../domain/exceptions/staff.exceptions";
 import { StaffRepository } from "../../../domain/repositories/staff.repository.interface";
 import { Email } from "../../../domain/value-objects/email.value-object";
+import {
+  SkillAssignment,
+  StaffSkills,
+} from "../../../domain/value-objects/staff-skills.value-object";
 import { UserId } from "../../../domain/value-objects/user-id.value-object";
 import { Permission } from "../../../shared/enums/permission.enum";
 import { ApplicationValidationError } from "../../exceptions/application.exceptions";
@@ -28,6 +32,10 @@ export interface UpdateStaffRequest {
     readonly email?: string;
     readonly status?: StaffStatus;
     readonly availability?: any; // TODO: Define proper type
+    // Remplace toutes les compétences ; tableau vide = aucune compétence
+    readonly skills?: ReadonlyArray<
+      Parameters<typeof SkillAssignment.create>[0]
+    >;
   };
 }
 
@@ -226,6 +234,17 @@ export class UpdateStaffUseCase {
       (staff as any)._status = updates.status;
     }
 
+    // Apply skills updates
+    if (updates.skills) {
+      staff.updateSkills(
+        updates.skills.length > 0
+          ? StaffSkills.create(
+              updates.skills.map((skill) => SkillAssignment.create(skill)),
+            )
+          : undefined,
+      );
+    }
+
     // Update timestamp
     (staff as any)._updatedAt = new Date();
   }
@@ -3,6 +3,7 @@ import { BusinessId } from "../value-objects/business-id.value-object";
 import { Email } from "../value-objects/email.value-object";
 import { FileUrl } from "../value-objects/file-url.value-object";
 import { Phone } from "../value-objects/phone.value-object";
+import type { StaffSkills } from "../value-objects/staff-skills.value-object";
 import { UserId } from "../value-objects/user-id.value-object";
 
 export enum StaffStatus {
@@ -70,6 +71,7 @@ export class Staff {
     private readonly _createdAt: Date = new Date(),
     private _updatedAt: Date = new Date(),
     private _calendarIntegration?: StaffCalendarIntegration,
+    private _skills?: StaffSkills,
   ) {}
 
   // Getters
@@ -117,6 +119,10 @@ export class Staff {
     return this._updatedAt;
   }
 
+  get skills(): StaffSkills | undefined {
+    return this._skills;
+  }
+
   get calendarIntegration(): StaffCalendarIntegration | undefined {
     return this._calendarIntegration;
   }
@@ -134,6 +140,7 @@ export class Staff {
     phone?: string;
     availability?: StaffAvailability;
     calendarIntegration?: StaffCalendarIntegration;
+    skills?: StaffSkills;
   }): Staff {
     return new Staff(
       UserId.generate(),
@@ -148,6 +155,7 @@ export class Staff {
       new Date(),
       new Date(),
       data.calendarIntegration,
+      data.skills,
     );
   }
 
@@ -231,6 +239,14 @@ export class Staff {
     this._updatedAt = new Date();
   }
 
+  /**
+   * Remplace les compétences (undefined : aucune compétence)
+   */
+  public updateSkills(skills: StaffSkills | undefined): void {
+    this._skills = skills;
+    this._updatedAt = new Date();
+  }
+
   public updateAvailability(availability: StaffAvailability): void {
     this._availability = availability;
     this._updatedAt = new Date();
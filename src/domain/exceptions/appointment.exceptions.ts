@@ -37,6 +37,20 @@ export class AppointmentConflictError extends AppointmentException {
   }
 }
 
+/**
+ * Le créneau chevauche un rendez-vous actif du même calendrier
+ * (levée à l'écriture, garantie par la base même sous concurrence)
+ */
+export class AppointmentSlotTakenError extends AppointmentException {
+  constructor(calendarId: string, startTime: Date, endTime: Date) {
+    super(
+      `Calendar ${calendarId} already has an active appointment between ${startTime.toISOString()} and ${endTime.toISOString()}`,
+      "APPOINTMENT_SLOT_TAKEN",
+      { calendarId, startTime, endTime },
+    );
+  }
+}
+
 export class AppointmentStatusError extends AppointmentException {
   constructor(
     currentStatus: string,
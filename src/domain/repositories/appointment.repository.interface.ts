@@ -9,7 +9,9 @@ import { CalendarId } from "../value-objects/calendar-id.value-object";
 import { Email } from "../value-objects/email.value-object";
 import { ServiceId } from "../value-objects/service-id.value-object";
 import { StatisticsPeriod } from "../value-objects/statistics-period.vo";
+import { TimeSlot } from "../value-objects/time-slot.value-object";
 import { UserId } from "../value-objects/user-id.value-object";
+import type { OutboxMessage } from "./outbox.repository.interface";
 
 /**
  * 📅 APPOINTMENT REPOSITORY INTERFACE
@@ -36,6 +38,15 @@ export interface AppointmentSearchCriteria {
   offset?: number;
 }
 
+/**
+ * Projection légère d'un rendez-vous pour le calcul libre/occupé
+ */
+export interface AppointmentTimeRange {
+  id: AppointmentId;
+  timeSlot: TimeSlot;
+  status: AppointmentStatus;
+}
+
 export interface AppointmentStatisticsCriteria {
   businessId?: BusinessId; // Optional pour PLATFORM_ADMIN
   staffId?: UserId;
@@ -78,13 +89,14 @@ export interface AppointmentRepository {
   ): Promise<Appointment[]>;
 
   /**
-   * Find appointments by calendar
+   * Find appointments by calendar overlapping [startDate, endDate),
+   * ordered by start time (free/busy projection only)
    */
   findByCalendarId(
     calendarId: CalendarId,
     startDate?: Date,
     endDate?: Date,
-  ): Promise<Appointment[]>;
+  ): Promise<AppointmentTimeRange[]>;
 
   /**
    * Find appointments by service
@@ -131,6 +143,23 @@ export interface AppointmentRepository {
    */
   save(appointment: Appointment): Promise<void>;
 
+  /**
+   * Insert a new appointment in a single write. Active appointments of a
+   * calendar may not overlap: a taken slot throws AppointmentSlotTakenError.
+   * Outbox messages are written in the same transaction as the appointment
+   */
+  create(appointment: Appointment, outbox?: OutboxMessage[]): Promise<void>;
+
+  /**
+   * Insert several new appointments atomically (all or none). Any overlap
+   * with an active appointment throws AppointmentSlotTakenError.
+   * Outbox messages are written in the same transaction as the appointments
+   */
+  createMany(
+    appointments: Appointment[],
+    outbox?: OutboxMessage[],
+  ): Promise<void>;
+
   /**
    * Delete appointment
    */
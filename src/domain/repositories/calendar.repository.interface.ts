@@ -3,9 +3,24 @@ import { CalendarId } from "../value-objects/calendar-id.value-object";
 import { BusinessId } from "../value-objects/business-id.value-object";
 import { UserId } from "../value-objects/user-id.value-object";
 import { TimeSlot } from "../value-objects/time-slot.value-object";
+import type { BusyRange } from "../services/slot-availability.service";
 
 export const CALENDAR_REPOSITORY = "CALENDAR_REPOSITORY";
 
+/**
+ * Données brutes libre/occupé d'un calendrier sur une période, en
+ * millisecondes epoch : de quoi matérialiser ses journées sans autre lecture
+ */
+export interface CalendarFreeBusy {
+  readonly calendarId: CalendarId;
+  // Pas de la grille de créneaux du calendrier (null : durée du service)
+  readonly slotStepMinutes: number | null;
+  // Horaires d'ouverture, pauses et exceptions déduites, triés
+  readonly openRanges: BusyRange[];
+  // Rendez-vous actifs
+  readonly busyRanges: BusyRange[];
+}
+
 export interface CalendarRepository {
   /**
    * Find calendar by ID
@@ -17,6 +32,11 @@ export interface CalendarRepository {
    */
   findByBusinessId(businessId: BusinessId): Promise<Calendar[]>;
 
+  /**
+   * Ids of all calendars of a business (single indexed read)
+   */
+  findIdsByBusinessId(businessId: BusinessId): Promise<CalendarId[]>;
+
   /**
    * Find calendar by owner (staff member)
    */
@@ -52,6 +72,16 @@ export interface CalendarRepository {
     }[]
   >;
 
+  /**
+   * Opening hours and active bookings of several calendars over a period,
+   * in two set-based queries. Unknown calendars are left out
+   */
+  findFreeBusy(
+    calendarIds: CalendarId[],
+    startDate: Date,
+    endDate: Date,
+  ): Promise<CalendarFreeBusy[]>;
+
   /**
    * Get booked time slots for a calendar
    */
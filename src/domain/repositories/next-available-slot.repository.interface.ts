@@ -0,0 +1,88 @@
+import { BusinessId } from "../value-objects/business-id.value-object";
+import { CalendarId } from "../value-objects/calendar-id.value-object";
+import { ServiceId } from "../value-objects/service-id.value-object";
+
+/**
+ * Premier créneau libre précalculé pour (entreprise, service, calendrier).
+ * startTime/endTime sont null si aucun créneau n'a été trouvé dans l'horizon
+ * de recherche lors du dernier calcul.
+ */
+export interface NextAvailableSlot {
+  readonly businessId: BusinessId;
+  readonly serviceId: ServiceId;
+  readonly calendarId: CalendarId;
+  readonly startTime: Date | null;
+  readonly endTime: Date | null;
+  readonly computedAt: Date;
+}
+
+/**
+ * Couple (entreprise, service) à recalculer, tous calendriers confondus
+ */
+export interface NextAvailableSlotRefreshKey {
+  readonly businessId: BusinessId;
+  readonly serviceId: ServiceId;
+}
+
+export interface NextAvailableSlotRepository {
+  /**
+   * Earliest indexed slot starting after `after` for each business, in a
+   * single read (businesses without a future slot are omitted)
+   */
+  findEarliestByBusinessIds(
+    businessIds: BusinessId[],
+    after: Date,
+    serviceId?: ServiceId,
+  ): Promise<NextAvailableSlot[]>;
+
+  /**
+   * Earliest indexed slot for one (business, service), or null
+   */
+  findEarliest(
+    businessId: BusinessId,
+    serviceId: ServiceId,
+    after: Date,
+  ): Promise<NextAvailableSlot | null>;
+
+  /**
+   * Replace the computed entries of a (business, service). Calendars absent
+   * from `entries` are removed. The stale flag is cleared only on entries
+   * not flagged again after `startedAt` (start of the computation).
+   */
+  replace(
+    key: NextAvailableSlotRefreshKey,
+    entries: NextAvailableSlot[],
+    startedAt: Date,
+  ): Promise<void>;
+
+  /**
+   * Register (business, service, calendar) entries to compute, flagged stale
+   */
+  enqueue(
+    businessId: BusinessId,
+    serviceIds: ServiceId[],
+    calendarIds: CalendarId[],
+  ): Promise<void>;
+
+  /**
+   * Flag the entries of a business (optionally one calendar) for
+   * recomputation. Returns the number of flagged entries.
+   */
+  markStale(businessId: BusinessId, calendarId?: CalendarId): Promise<number>;
+
+  /**
+   * Keys needing recomputation: flagged stale, whose indexed slot is no
+   * longer in the future, or computed without result before `retryBefore`
+   */
+  findRefreshKeys(
+    limit: number,
+    now: Date,
+    retryBefore: Date,
+  ): Promise<NextAvailableSlotRefreshKey[]>;
+
+  /**
+   * Active services of businesses with calendars that have no entry yet:
+   * created or activated since the business was indexed
+   */
+  findUnindexedKeys(limit: number): Promise<NextAvailableSlotRefreshKey[]>;
+}
@@ -0,0 +1,40 @@
+/**
+ * Effet de bord à exécuter après une écriture (notification, rappel,
+ * audit). Enregistré dans la même transaction que l'écriture, puis
+ * distribué hors requête par le worker : aucun effet perdu au redémarrage.
+ */
+export interface OutboxMessage {
+  readonly type: string;
+  readonly aggregateId: string;
+  readonly payload: Record<string, unknown>;
+}
+
+/**
+ * Message réservé par un worker, avec son nombre de tentatives
+ * (celle en cours incluse)
+ */
+export interface PendingOutboxMessage extends OutboxMessage {
+  readonly id: string;
+  readonly attempts: number;
+  readonly createdAt: Date;
+}
+
+export interface OutboxRepository {
+  /**
+   * Reserve up to `limit` due messages for `leaseMs`. Messages reserved by
+   * another worker are skipped; an expired lease makes a message due again
+   * (delivery is at least once)
+   */
+  claimBatch(limit: number, leaseMs: number): Promise<PendingOutboxMessage[]>;
+
+  /**
+   * Remove dispatched messages
+   */
+  complete(ids: string[]): Promise<void>;
+
+  /**
+   * Record a failed attempt. The message is retried at `retryAt`, or parked
+   * for inspection when `retryAt` is null
+   */
+  fail(id: string, error: string, retryAt: Date | null): Promise<void>;
+}
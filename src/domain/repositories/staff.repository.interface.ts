@@ -21,6 +21,16 @@ export interface StaffRepository {
    */
   findByBusinessId(businessId: BusinessId): Promise<Staff[]>;
 
+  /**
+   * Find staff members of a business among the given ids
+   */
+  findByIds(businessId: BusinessId, ids: UserId[]): Promise<Staff[]>;
+
+  /**
+   * Find all staff members with skills assigned (skill index warm-up)
+   */
+  findWithSkills(): Promise<Staff[]>;
+
   /**
    * Find staff by role in a business
    */
@@ -0,0 +1,197 @@
+/**
+ * 🗓️ Slot Availability Service
+ * ✅ Clean Architecture - Domain Layer
+ * ✅ Occupation d'un calendrier sur une période, en millisecondes epoch
+ * ✅ Pas de dépendances externes - logique métier uniquement
+ *
+ * Les rendez-vous de la période sont triés et fusionnés une seule fois en
+ * intervalles occupés disjoints. Les créneaux étant générés dans l'ordre
+ * chronologique, un curseur avance ensuite de façon monotone sur ces
+ * intervalles : une vue semaine coûte O(créneaux + rendez-vous) au lieu de
+ * O(créneaux × rendez-vous), sans allouer de Date par comparaison.
+ */
+
+export interface BusyRange {
+  readonly startMs: number;
+  readonly endMs: number;
+}
+
+interface TimeSlotLike {
+  getStartTime(): Date;
+  getEndTime(): Date;
+}
+
+export class BusyTimeline {
+  private constructor(
+    private readonly starts: Float64Array,
+    private readonly ends: Float64Array,
+  ) {}
+
+  static empty(): BusyTimeline {
+    return new BusyTimeline(new Float64Array(0), new Float64Array(0));
+  }
+
+  /**
+   * Construit la timeline à partir d'intervalles quelconques (non triés,
+   * éventuellement chevauchants). Les intervalles vides sont ignorés.
+   */
+  static fromRanges(ranges: readonly BusyRange[]): BusyTimeline {
+    const sorted = ranges
+      .filter((range) => range.endMs > range.startMs)
+      .sort((a, b) => a.startMs - b.startMs);
+
+    const starts = new Float64Array(sorted.length);
+    const ends = new Float64Array(sorted.length);
+    let size = 0;
+
+    for (const range of sorted) {
+      // Intervalles semi-ouverts : un intervalle contigu ou chevauchant
+      // prolonge le précédent, ce qui garantit des fins strictement croissantes
+      if (size > 0 && range.startMs <= ends[size - 1]) {
+        if (range.endMs > ends[size - 1]) {
+          ends[size - 1] = range.endMs;
+        }
+        continue;
+      }
+      starts[size] = range.startMs;
+      ends[size] = range.endMs;
+      size++;
+    }
+
+    return new BusyTimeline(starts.slice(0, size), ends.slice(0, size));
+  }
+
+  static fromAppointments(
+    appointments: ReadonlyArray<{ timeSlot: TimeSlotLike }>,
+  ): BusyTimeline {
+    return BusyTimeline.fromRanges(
+      appointments.map((appointment) => ({
+        startMs: appointment.timeSlot.getStartTime().getTime(),
+        endMs: appointment.timeSlot.getEndTime().getTime(),
+      })),
+    );
+  }
+
+  get size(): number {
+    return this.starts.length;
+  }
+
+  /**
+   * Vérification ponctuelle par recherche dichotomique, O(log n)
+   */
+  overlaps(startMs: number, endMs: number): boolean {
+    const index = this.firstEndingAfter(startMs);
+    return index < this.starts.length && this.starts[index] < endMs;
+  }
+
+  /**
+   * Intervalles chevauchant [startMs, endMs), en vues sans copie des
+   * tableaux triés (recherche dichotomique des deux bornes)
+   */
+  within(
+    startMs: number,
+    endMs: number,
+  ): { starts: Float64Array; ends: Float64Array } {
+    const from = this.firstEndingAfter(startMs);
+    let to = from;
+    let high = this.starts.length;
+
+    // Premier intervalle commençant à endMs ou après
+    while (to < high) {
+      const mid = (to + high) >>> 1;
+      if (this.starts[mid] < endMs) {
+        to = mid + 1;
+      } else {
+        high = mid;
+      }
+    }
+
+    return {
+      starts: this.starts.subarray(from, to),
+      ends: this.ends.subarray(from, to),
+    };
+  }
+
+  /**
+   * Créneaux libres de durationMs, espacés de stepMs depuis le début de
+   * chaque plage d'ouverture. Les plages doivent être triées et disjointes.
+   */
+  freeSlots(
+    openRanges: readonly BusyRange[],
+    durationMs: number,
+    stepMs: number,
+    limit = Number.POSITIVE_INFINITY,
+  ): BusyRange[] {
+    const slots: BusyRange[] = [];
+    const cursor = this.cursor();
+
+    for (const range of openRanges) {
+      for (
+        let startMs = range.startMs;
+        startMs + durationMs <= range.endMs;
+        startMs += stepMs
+      ) {
+        if (!cursor.overlaps(startMs, startMs + durationMs)) {
+          slots.push({ startMs, endMs: startMs + durationMs });
+          if (slots.length >= limit) {
+            return slots;
+          }
+        }
+      }
+    }
+
+    return slots;
+  }
+
+  /**
+   * Curseur pour un parcours chronologique des créneaux
+   */
+  cursor(): BusyCursor {
+    return new BusyCursor(this.starts, this.ends);
+  }
+
+  /**
+   * Premier intervalle dont la fin est strictement après startMs
+   * (les fins sont strictement croissantes)
+   */
+  private firstEndingAfter(startMs: number): number {
+    let low = 0;
+    let high = this.ends.length;
+
+    while (low < high) {
+      const mid = (low + high) >>> 1;
+      if (this.ends[mid] <= startMs) {
+        low = mid + 1;
+      } else {
+        high = mid;
+      }
+    }
+
+    return low;
+  }
+}
+
+export class BusyCursor {
+  private index = 0;
+
+  constructor(
+    private readonly starts: Float64Array,
+    private readonly ends: Float64Array,
+  ) {}
+
+  /**
+   * Indique si [startMs, endMs) chevauche un intervalle occupé.
+   * Les appels doivent se faire avec des startMs croissants.
+   */
+  overlaps(startMs: number, endMs: number): boolean {
+    const ends = this.ends;
+    let index = this.index;
+
+    while (index < ends.length && ends[index] <= startMs) {
+      index++;
+    }
+    this.index = index;
+
+    return index < ends.length && this.starts[index] < endMs;
+  }
+}
@@ -0,0 +1,282 @@
+/**
+ * 🎯 Staff Skill Index
+ * ✅ Clean Architecture - Domain Layer
+ * ✅ Index inversé compétence / catégorie → staff, par niveau de maîtrise
+ * ✅ Pas de dépendances externes - logique métier uniquement
+ *
+ * StaffSkills répond aux questions « ce membre du staff sait-il faire X ? ».
+ * L'index répond à la question inverse, « qui sait faire X ? », sans charger
+ * ni parcourir chaque agrégat : pour chaque compétence, les staff sont rangés
+ * dans un ensemble par niveau de maîtrise. « Niveau ≥ N » est l'union des
+ * ensembles des niveaux N et supérieurs ; plusieurs exigences se résolvent
+ * en parcourant le plus petit candidat et en testant les autres en O(1).
+ */
+
+import {
+  ProficiencyLevel,
+  SkillAssignment,
+  StaffSkills,
+} from "../value-objects/staff-skills.value-object";
+
+export interface SkillRequirement {
+  readonly skillId: string;
+  readonly minimumProficiency: ProficiencyLevel;
+  readonly requiresCertification?: boolean;
+}
+
+// Même ordre que SkillAssignment.meetsMinimumProficiency
+const PROFICIENCY_ORDER: readonly ProficiencyLevel[] = [
+  ProficiencyLevel.BEGINNER,
+  ProficiencyLevel.INTERMEDIATE,
+  ProficiencyLevel.ADVANCED,
+  ProficiencyLevel.EXPERT,
+  ProficiencyLevel.MASTER,
+];
+
+interface Posting {
+  readonly rank: number;
+  readonly certified: boolean;
+}
+
+interface SkillPostings {
+  category: string;
+  readonly byStaff: Map<string, Posting>;
+  readonly byRank: Set<string>[];
+}
+
+export class StaffSkillIndex {
+  private readonly skills = new Map<string, SkillPostings>();
+  private readonly categories = new Map<string, Set<string>>();
+  private readonly staffSkillIds = new Map<string, Set<string>>();
+
+  /**
+   * (Ré)indexe toutes les compétences d'un membre du staff. Les compétences
+   * absentes de `skills` sont retirées de l'index.
+   */
+  setStaffSkills(staffId: string, skills: StaffSkills): void {
+    const assignments = skills.getSkillAssignments();
+    const kept = new Set(assignments.map((a) => a.getSkillId()));
+
+    for (const skillId of [...(this.staffSkillIds.get(staffId) ?? [])]) {
+      if (!kept.has(skillId)) {
+        this.removeSkill(staffId, skillId);
+      }
+    }
+    for (const assignment of assignments) {
+      this.upsertSkill(staffId, assignment);
+    }
+  }
+
+  /**
+   * Ajout ou mise à jour d'une compétence (StaffSkills.addSkill/updateSkill)
+   */
+  upsertSkill(staffId: string, assignment: SkillAssignment): void {
+    const skillId = assignment.getSkillId();
+    const rank = this.rankOf(assignment.getProficiencyLevel());
+    const postings = this.postingsFor(skillId, assignment.getSkillCategory());
+
+    const previous = postings.byStaff.get(staffId);
+    if (previous && previous.rank !== rank) {
+      postings.byRank[previous.rank].delete(staffId);
+    }
+    postings.byRank[rank].add(staffId);
+    postings.byStaff.set(staffId, {
+      rank,
+      certified: assignment.isCertified(),
+    });
+
+    let skillIds = this.staffSkillIds.get(staffId);
+    if (!skillIds) {
+      skillIds = new Set();
+      this.staffSkillIds.set(staffId, skillIds);
+    }
+    skillIds.add(skillId);
+  }
+
+  /**
+   * Retrait d'une compétence (StaffSkills.removeSkill)
+   */
+  removeSkill(staffId: string, skillId: string): void {
+    const postings = this.skills.get(skillId);
+    const posting = postings?.byStaff.get(staffId);
+    if (!postings || !posting) {
+      return;
+    }
+
+    postings.byStaff.delete(staffId);
+    postings.byRank[posting.rank].delete(staffId);
+    if (postings.byStaff.size === 0) {
+      this.dropSkill(skillId, postings.category);
+    }
+
+    const skillIds = this.staffSkillIds.get(staffId);
+    skillIds?.delete(skillId);
+    if (skillIds?.size === 0) {
+      this.staffSkillIds.delete(staffId);
+    }
+  }
+
+  /**
+   * Retrait d'un membre du staff (départ, désactivation)
+   */
+  removeStaff(staffId: string): void {
+    for (const skillId of [...(this.staffSkillIds.get(staffId) ?? [])]) {
+      this.removeSkill(staffId, skillId);
+    }
+  }
+
+  /**
+   * Staff ayant la compétence au niveau minimum demandé
+   */
+  findStaffWithSkill(
+    skillId: string,
+    minimumProficiency: ProficiencyLevel = ProficiencyLevel.BEGINNER,
+    requiresCertification = false,
+  ): Set<string> {
+    return this.findQualifiedStaff([
+      { skillId, minimumProficiency, requiresCertification },
+    ]);
+  }
+
+  /**
+   * Staff ayant au moins une compétence de la catégorie au niveau demandé
+   */
+  findStaffByCategory(
+    category: string,
+    minimumProficiency: ProficiencyLevel = ProficiencyLevel.BEGINNER,
+  ): Set<string> {
+    const result = new Set<string>();
+    const minRank = this.rankOf(minimumProficiency);
+
+    for (const skillId of this.categories.get(category) ?? []) {
+      const postings = this.skills.get(skillId);
+      if (!postings) continue;
+      for (let rank = minRank; rank < PROFICIENCY_ORDER.length; rank++) {
+        for (const staffId of postings.byRank[rank]) {
+          result.add(staffId);
+        }
+      }
+    }
+
+    return result;
+  }
+
+  /**
+   * Staff satisfaisant toutes les exigences (même règle que
+   * StaffSkills.matchesTeamRequirements). Une liste vide ne filtre pas :
+   * tous les staff indexés sont retournés.
+   */
+  findQualifiedStaff(requirements: readonly SkillRequirement[]): Set<string> {
+    if (requirements.length === 0) {
+      return new Set(this.staffSkillIds.keys());
+    }
+
+    const resolved: Array<{
+      postings: SkillPostings;
+      minRank: number;
+      requiresCertification: boolean;
+      estimate: number;
+    }> = [];
+
+    for (const requirement of requirements) {
+      const postings = this.skills.get(requirement.skillId);
+      if (!postings) {
+        return new Set();
+      }
+      const minRank = this.rankOf(requirement.minimumProficiency);
+      let estimate = 0;
+      for (let rank = minRank; rank < PROFICIENCY_ORDER.length; rank++) {
+        estimate += postings.byRank[rank].size;
+      }
+      if (estimate === 0) {
+        return new Set();
+      }
+      resolved.push({
+        postings,
+        minRank,
+        requiresCertification: requirement.requiresCertification ?? false,
+        estimate,
+      });
+    }
+
+    // Parcours de la liste la plus courte, test des autres par lookup
+    resolved.sort((a, b) => a.estimate - b.estimate);
+    const [driver, ...others] = resolved;
+    const result = new Set<string>();
+
+    for (let rank = driver.minRank; rank < PROFICIENCY_ORDER.length; rank++) {
+      for (const staffId of driver.postings.byRank[rank]) {
+        const qualifies =
+          this.satisfies(driver, staffId) &&
+          others.every((other) => this.satisfies(other, staffId));
+        if (qualifies) {
+          result.add(staffId);
+        }
+      }
+    }
+
+    return result;
+  }
+
+  /**
+   * Nombre de staff indexés
+   */
+  get staffCount(): number {
+    return this.staffSkillIds.size;
+  }
+
+  private satisfies(
+    requirement: {
+      postings: SkillPostings;
+      minRank: number;
+      requiresCertification: boolean;
+    },
+    staffId: string,
+  ): boolean {
+    const posting = requirement.postings.byStaff.get(staffId);
+    return (
+      posting !== undefined &&
+      posting.rank >= requirement.minRank &&
+      (!requirement.requiresCertification || posting.certified)
+    );
+  }
+
+  private postingsFor(skillId: string, category: string): SkillPostings {
+    let postings = this.skills.get(skillId);
+    if (!postings) {
+      postings = {
+        category,
+        byStaff: new Map(),
+        byRank: PROFICIENCY_ORDER.map(() => new Set<string>()),
+      };
+      this.skills.set(skillId, postings);
+    } else if (postings.category !== category) {
+      // Compétence recatégorisée
+      this.categories.get(postings.category)?.delete(skillId);
+      postings.category = category;
+    }
+
+    let skillIds = this.categories.get(category);
+    if (!skillIds) {
+      skillIds = new Set();
+      this.categories.set(category, skillIds);
+    }
+    skillIds.add(skillId);
+
+    return postings;
+  }
+
+  private dropSkill(skillId: string, category: string): void {
+    this.skills.delete(skillId);
+    const skillIds = this.categories.get(category);
+    skillIds?.delete(skillId);
+    if (skillIds?.size === 0) {
+      this.categories.delete(category);
+    }
+  }
+
+  private rankOf(level: ProficiencyLevel): number {
+    const rank = PROFICIENCY_ORDER.indexOf(level);
+    return rank === -1 ? 0 : rank;
+  }
+}
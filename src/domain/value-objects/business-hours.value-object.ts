@@ -30,6 +30,35 @@ export interface SpecialDate {
   reason: string; // Raison (ex: "Jour férié", "Formation", "Événement spécial")
 }
 
+/**
+ * Numéro de jour calendaire local (équivalent à toDateString, sans allouer
+ * de chaîne) : deux dates du même jour local ont la même clé.
+ */
+function toDayKey(date: Date): number {
+  return (date.getFullYear() << 9) | (date.getMonth() << 5) | date.getDate();
+}
+
+/**
+ * Horaires compilés : pour chaque jour, les plages d'ouverture en minutes
+ * depuis minuit, à plat et triées ([début0, fin0, début1, fin1, ...]).
+ * La génération de créneaux devient de l'arithmétique sur des entiers au
+ * lieu d'analyser des chaînes HH:MM pour chaque date.
+ */
+export class WeeklyOpeningTemplate {
+  constructor(
+    private readonly weekly: readonly Int32Array[],
+    private readonly special: ReadonlyMap<number, Int32Array>,
+  ) {}
+
+  forDay(dayOfWeek: number): Int32Array {
+    return this.weekly[dayOfWeek];
+  }
+
+  forDate(date: Date): Int32Array {
+    return this.special.get(toDayKey(date)) ?? this.weekly[date.getDay()];
+  }
+}
+
 export class BusinessHours {
   private static readonly TIME_REGEX = /^([0-1]?[0-9]|2[0-3]):[0-5][0-9]$/;
   private static readonly DAY_NAMES = [
@@ -48,8 +77,15 @@ export class BusinessHours {
     private readonly timezone: string = "Europe/Paris",
   ) {
     this.validate();
+    this.specialDatesByDay = this.indexSpecialDates();
   }
 
+  // Index des dates spéciales par jour, construit une fois à la création
+  private readonly specialDatesByDay: ReadonlyMap<number, SpecialDate>;
+
+  // Compilé à la demande ; l'objet étant immuable, il reste valide
+  private openingTemplate?: WeeklyOpeningTemplate;
+
   private validate(): void {
     // Vérifier que nous avons 7 jours
     if (this.weeklySchedule.length !== 7) {
@@ -78,6 +114,18 @@ export class BusinessHours {
     this.specialDates.forEach((special) => this.validateSpecialDate(special));
   }
 
+  private indexSpecialDates(): Map<number, SpecialDate> {
+    const index = new Map<number, SpecialDate>();
+    for (const special of this.specialDates) {
+      const key = toDayKey(special.date);
+      // La première date spéciale déclarée pour un jour l'emporte
+      if (!index.has(key)) {
+        index.set(key, special);
+      }
+    }
+    return index;
+  }
+
   private validateDaySchedule(day: DaySchedule): void {
     if (day.dayOfWeek < 0 || day.dayOfWeek > 6) {
       throw new ValueOutOfRangeError("dayOfWeek", day.dayOfWeek, 0, 6);
@@ -185,6 +233,22 @@ export class BusinessHours {
     return hours * 60 + minutes;
   }
 
+  private compileTimeSlots(slots: TimeSlot[]): Int32Array {
+    const ranges = slots
+      .map((slot) => [
+        this.timeToMinutes(slot.start),
+        this.timeToMinutes(slot.end),
+      ])
+      .sort((a, b) => a[0] - b[0]);
+
+    const compiled = new Int32Array(ranges.length * 2);
+    ranges.forEach(([start, end], i) => {
+      compiled[i * 2] = start;
+      compiled[i * 2 + 1] = end;
+    });
+    return compiled;
+  }
+
   // Factory methods
   static createStandardWeek(
     openDays: number[], // [1, 2, 3, 4, 5] pour Lun-Ven
@@ -328,9 +392,7 @@ export class BusinessHours {
 
   isOpenOnDate(date: Date): boolean {
     // Vérifier d'abord les dates spéciales
-    const specialDate = this.specialDates.find(
-      (special) => special.date.toDateString() === date.toDateString(),
-    );
+    const specialDate = this.specialDatesByDay.get(toDayKey(date));
 
     if (specialDate) {
       return specialDate.isOpen;
@@ -349,9 +411,7 @@ export class BusinessHours {
 
   getTimeSlotsForDate(date: Date): TimeSlot[] {
     // Vérifier d'abord les dates spéciales
-    const specialDate = this.specialDates.find(
-      (special) => special.date.toDateString() === date.toDateString(),
-    );
+    const specialDate = this.specialDatesByDay.get(toDayKey(date));
 
     if (specialDate) {
       return specialDate.timeSlots ? [...specialDate.timeSlots] : [];
@@ -361,6 +421,24 @@ export class BusinessHours {
     return this.getTimeSlotsForDay(date.getDay());
   }
 
+  /**
+   * Horaires compilés en minutes (calculés une seule fois par instance)
+   */
+  toWeeklyTemplate(): WeeklyOpeningTemplate {
+    if (!this.openingTemplate) {
+      const special = new Map<number, Int32Array>();
+      this.specialDatesByDay.forEach((specialDate, key) => {
+        special.set(key, this.compileTimeSlots(specialDate.timeSlots ?? []));
+      });
+
+      this.openingTemplate = new WeeklyOpeningTemplate(
+        this.weeklySchedule.map((day) => this.compileTimeSlots(day.timeSlots)),
+        special,
+      );
+    }
+    return this.openingTemplate;
+  }
+
   isOpenAt(date: Date, time: string): boolean {
     if (!BusinessHours.TIME_REGEX.test(time)) {
       throw new InvalidValueError(
@@ -434,8 +512,9 @@ export class BusinessHours {
   }
 
   withoutSpecialDate(date: Date): BusinessHours {
+    const key = toDayKey(date);
     const newSpecialDates = this.specialDates.filter(
-      (special) => special.date.toDateString() !== date.toDateString(),
+      (special) => toDayKey(special.date) !== key,
     );
     return new BusinessHours(
       this.weeklySchedule,
@@ -0,0 +1,250 @@
+/**
+ * 🧮 FREE/BUSY BITMAP - Value Object
+ * ✅ Clean Architecture - Domain Layer
+ * ✅ Disponibilité d'un calendrier sur une journée, par pas de 5 minutes
+ *
+ * Une journée = 288 créneaux de 5 minutes = 9 mots de 32 bits (36 octets).
+ * Le bit i vaut 1 si le créneau [i × 5 min, (i + 1) × 5 min) est libre.
+ * Les minutes sont comptées depuis minuit, heure locale de la journée.
+ *
+ * Chercher un créneau de N minutes revient à un AND décalé sur les
+ * créneaux consécutifs, mot à mot.
+ */
+
+import { ValueObjectValidationError } from "../exceptions/domain.exceptions";
+
+const WORD_BITS = 32;
+
+export class FreeBusyBitmap {
+  static readonly SLOT_MINUTES = 5;
+  static readonly SLOTS_PER_DAY = (24 * 60) / FreeBusyBitmap.SLOT_MINUTES;
+  static readonly WORD_COUNT = Math.ceil(
+    FreeBusyBitmap.SLOTS_PER_DAY / WORD_BITS,
+  );
+
+  private static readonly HEX_LENGTH = FreeBusyBitmap.WORD_COUNT * 8;
+
+  private constructor(private readonly words: Uint32Array) {}
+
+  /**
+   * Journée entièrement occupée (ou fermée)
+   */
+  static busy(): FreeBusyBitmap {
+    return new FreeBusyBitmap(new Uint32Array(FreeBusyBitmap.WORD_COUNT));
+  }
+
+  /**
+   * Journée entièrement libre
+   */
+  static free(): FreeBusyBitmap {
+    const words = new Uint32Array(FreeBusyBitmap.WORD_COUNT);
+    fill(words, 0, FreeBusyBitmap.SLOTS_PER_DAY, true);
+    return new FreeBusyBitmap(words);
+  }
+
+  static deserialize(value: string): FreeBusyBitmap {
+    if (
+      value.length !== FreeBusyBitmap.HEX_LENGTH ||
+      !/^[0-9a-f]+$/.test(value)
+    ) {
+      throw new ValueObjectValidationError(
+        "FREE_BUSY_BITMAP_INVALID",
+        "Free/busy bitmap must be a hexadecimal string of fixed length",
+        { length: value.length },
+      );
+    }
+
+    const words = new Uint32Array(FreeBusyBitmap.WORD_COUNT);
+    for (let word = 0; word < words.length; word++) {
+      words[word] = parseInt(value.slice(word * 8, word * 8 + 8), 16);
+    }
+    // Les bits au-delà du dernier créneau restent à zéro
+    words[words.length - 1] &= lastWordMask();
+
+    return new FreeBusyBitmap(words);
+  }
+
+  /**
+   * Marque occupés tous les créneaux touchés par [startMinute, endMinute)
+   */
+  withBusy(startMinute: number, endMinute: number): FreeBusyBitmap {
+    const words = this.words.slice();
+    fill(words, floorSlot(startMinute), ceilSlot(endMinute), false);
+    return new FreeBusyBitmap(words);
+  }
+
+  /**
+   * Libère les créneaux entièrement compris dans [startMinute, endMinute),
+   * sans dépasser les créneaux libres de `within` (typiquement l'ouverture)
+   */
+  withFree(
+    startMinute: number,
+    endMinute: number,
+    within: FreeBusyBitmap = FreeBusyBitmap.free(),
+  ): FreeBusyBitmap {
+    const released = new Uint32Array(FreeBusyBitmap.WORD_COUNT);
+    fill(released, ceilSlot(startMinute), floorSlot(endMinute), true);
+
+    const words = this.words.slice();
+    for (let word = 0; word < words.length; word++) {
+      words[word] |= released[word] & within.words[word];
+    }
+    return new FreeBusyBitmap(words);
+  }
+
+  /**
+   * Vrai si tous les créneaux touchés par [startMinute, endMinute) sont libres
+   */
+  isFree(startMinute: number, endMinute: number): boolean {
+    const from = floorSlot(startMinute);
+    const to = ceilSlot(endMinute);
+    if (from >= to) return false;
+
+    for (let slot = from; slot < to; ) {
+      const word = slot >>> 5;
+      const bit = slot & 31;
+      const count = Math.min(WORD_BITS - bit, to - slot);
+      const mask = rangeMask(bit, count);
+      if ((this.words[word] & mask) >>> 0 !== mask) return false;
+      slot += count;
+    }
+    return true;
+  }
+
+  /**
+   * Minutes de début (multiples de 5) des créneaux libres de
+   * `durationMinutes`, dans l'ordre ; même résultat que isFree pour chaque
+   * début, en un seul parcours du bitmap
+   */
+  freeStarts(durationMinutes: number): number[] {
+    const starts: number[] = [];
+    const runs = this.runStarts(ceilSlot(durationMinutes));
+
+    for (let word = 0; word < runs.length; word++) {
+      let bits = runs[word];
+      while (bits !== 0) {
+        const lowest = bits & -bits;
+        bits ^= lowest;
+        starts.push(
+          (word * WORD_BITS + 31 - Math.clz32(lowest)) *
+            FreeBusyBitmap.SLOT_MINUTES,
+        );
+      }
+    }
+    return starts;
+  }
+
+  /**
+   * Plages libres contiguës [début, fin) en minutes, dans l'ordre
+   */
+  freeRanges(): [number, number][] {
+    const ranges: [number, number][] = [];
+    let start = -1;
+
+    for (let slot = 0; slot <= FreeBusyBitmap.SLOTS_PER_DAY; slot++) {
+      const free =
+        slot < FreeBusyBitmap.SLOTS_PER_DAY &&
+        ((this.words[slot >>> 5] >>> (slot & 31)) & 1) === 1;
+
+      if (free && start < 0) {
+        start = slot;
+      } else if (!free && start >= 0) {
+        ranges.push([
+          start * FreeBusyBitmap.SLOT_MINUTES,
+          slot * FreeBusyBitmap.SLOT_MINUTES,
+        ]);
+        start = -1;
+      }
+    }
+    return ranges;
+  }
+
+  /**
+   * Représentation hexadécimale compacte (72 caractères), stockable en cache
+   */
+  serialize(): string {
+    let value = "";
+    for (const word of this.words) {
+      value += word.toString(16).padStart(8, "0");
+    }
+    return value;
+  }
+
+  equals(other: FreeBusyBitmap): boolean {
+    return this.words.every((word, index) => word === other.words[index]);
+  }
+
+  /**
+   * Bit i à 1 si les créneaux i .. i + length - 1 sont tous libres.
+   * AND successifs avec des copies décalées, en doublant la longueur couverte.
+   */
+  private runStarts(length: number): Uint32Array {
+    let runs = this.words.slice();
+    if (length <= 0) return runs;
+
+    let covered = 1;
+    while (covered < length) {
+      const shift = Math.min(covered, length - covered);
+      const shifted = shiftDown(runs, shift);
+      for (let word = 0; word < runs.length; word++) {
+        runs[word] &= shifted[word];
+      }
+      covered += shift;
+    }
+    return runs;
+  }
+}
+
+function floorSlot(minute: number): number {
+  return clampSlot(Math.floor(minute / FreeBusyBitmap.SLOT_MINUTES));
+}
+
+function ceilSlot(minute: number): number {
+  return clampSlot(Math.ceil(minute / FreeBusyBitmap.SLOT_MINUTES));
+}
+
+function clampSlot(slot: number): number {
+  return Math.max(0, Math.min(FreeBusyBitmap.SLOTS_PER_DAY, slot));
+}
+
+function rangeMask(bit: number, count: number): number {
+  return count >= WORD_BITS ? 0xffffffff : (((1 << count) - 1) << bit) >>> 0;
+}
+
+function lastWordMask(): number {
+  const used = FreeBusyBitmap.SLOTS_PER_DAY % WORD_BITS;
+  return used === 0 ? 0xffffffff : rangeMask(0, used);
+}
+
+function fill(words: Uint32Array, from: number, to: number, free: boolean) {
+  for (let slot = from; slot < to; ) {
+    const word = slot >>> 5;
+    const bit = slot & 31;
+    const count = Math.min(WORD_BITS - bit, to - slot);
+    const mask = rangeMask(bit, count);
+    words[word] = free ? words[word] | mask : words[word] & ~mask;
+    slot += count;
+  }
+}
+
+/**
+ * Décale le bitmap de `shift` créneaux vers les indices faibles
+ * (le créneau i + shift se retrouve en position i)
+ */
+function shiftDown(words: Uint32Array, shift: number): Uint32Array {
+  const result = new Uint32Array(words.length);
+  const wordShift = Math.floor(shift / WORD_BITS);
+  const bitShift = shift % WORD_BITS;
+
+  for (let word = 0; word < words.length; word++) {
+    const source = word + wordShift;
+    if (source >= words.length) break;
+
+    let value = words[source] >>> bitShift;
+    if (bitShift > 0 && source + 1 < words.length) {
+      value |= words[source + 1] << (WORD_BITS - bitShift);
+    }
+    result[word] = value;
+  }
+  return result;
+}
@@ -7,14 +7,19 @@ import { SimpleCacheService } from '@infrastructure/services/simple-cache.servic
 import { Module } from '@nestjs/common';
 import { ConfigModule } from '@nestjs/config';
 import Redis from 'ioredis';
+import { RedisFreeBusyAdapter } from './redis-free-busy.adapter';
+import { RedisSlotHoldAdapter } from './redis-slot-hold.adapter';
+import { RedisSlotsCacheInvalidationAdapter } from './redis-slots-cache-invalidation.adapter';
 import { RedisUserCacheAdapter } from './redis-user-cache.adapter';
 
 import type { I18nService } from '@application/ports/i18n.port';
+import type { Logger } from '@application/ports/logger.port';
 import { PinoLoggerModule } from '@infrastructure/logging/pino-logger.module';
 import { TOKENS } from '@shared/constants/injection-tokens';
 import { AuthInfrastructureModule } from '../modules/auth-infrastructure.module';
 
 // Application Services
+import { AvailableSlotsCache } from '@application/services/available-slots-cache.service';
 import { UserCacheService } from '@application/services/user-cache.service';
 
 /**
@@ -121,6 +126,35 @@ class InfrastructureI18nService implements I18nService {
       },
       inject: ['REDIS_CLIENT', AppConfigService],
     },
+    // ⏳ Retenues de créneaux avant réservation
+    {
+      provide: TOKENS.SLOT_HOLD_STORE,
+      useFactory: (redisClient: Redis) => new RedisSlotHoldAdapter(redisClient),
+      inject: ['REDIS_CLIENT'],
+    },
+    // 🗃️ Créneaux calculés, invalidations diffusées aux autres instances
+    {
+      provide: TOKENS.AVAILABLE_SLOTS_CACHE,
+      useFactory: (redisClient: Redis, logger: Logger) => {
+        const cache = new AvailableSlotsCache();
+        // Sans abonnement, le cache reste local et borné par son TTL
+        cache
+          .connect(new RedisSlotsCacheInvalidationAdapter(redisClient))
+          .catch((error: unknown) =>
+            logger.warn('Slots cache invalidation subscribe failed', {
+              error: error instanceof Error ? error.message : String(error),
+            }),
+          );
+        return cache;
+      },
+      inject: ['REDIS_CLIENT', TOKENS.LOGGER],
+    },
+    // 🧮 Journées libre/occupé partagées entre instances
+    {
+      provide: TOKENS.FREE_BUSY_STORE,
+      useFactory: (redisClient: Redis) => new RedisFreeBusyAdapter(redisClient),
+      inject: ['REDIS_CLIENT'],
+    },
 
     // 👤 Service de cache utilisateur (Application Layer)
     {
@@ -138,6 +172,9 @@ class InfrastructureI18nService implements I18nService {
   exports: [
     TOKENS.CACHE_SERVICE,
     TOKENS.USER_CACHE,
+    TOKENS.SLOT_HOLD_STORE,
+    TOKENS.FREE_BUSY_STORE,
+    TOKENS.AVAILABLE_SLOTS_CACHE,
     TOKENS.USER_CACHE_SERVICE, // ✅ Export UserCacheService
   ],
 })
@@ -0,0 +1,68 @@
+/**
+ * 🧮 Redis Free/Busy Adapter - Infrastructure Layer
+ * ✅ Journées libre/occupé partagées entre instances, avec TTL
+ * ✅ Clean Architecture - Infrastructure Adapter
+ *
+ * Lectures et écritures groupées (MGET, pipeline) : une semaine de 50
+ * calendriers coûte deux allers-retours. Les compteurs de génération
+ * vivent plus longtemps que les journées, si bien qu'une remise à zéro
+ * par expiration ne peut pas ressusciter une journée périmée.
+ */
+
+import type { Redis } from 'ioredis';
+import type { IFreeBusyStore } from '../../application/ports/free-busy-store.port';
+
+export class RedisFreeBusyAdapter implements IFreeBusyStore {
+  private static readonly GENERATION_TTL_SECONDS = 24 * 60 * 60;
+
+  private readonly keyPrefix = 'freebusy:';
+
+  constructor(private readonly redisClient: Redis) {}
+
+  async getGenerations(calendarIds: readonly string[]): Promise<number[]> {
+    if (calendarIds.length === 0) {
+      return [];
+    }
+
+    const values = await this.redisClient.mget(
+      calendarIds.map((calendarId) => this.generationKey(calendarId)),
+    );
+    return values.map((value) => (value ? Number(value) : 0));
+  }
+
+  async bumpGeneration(calendarId: string): Promise<void> {
+    const key = this.generationKey(calendarId);
+    await this.redisClient
+      .multi()
+      .incr(key)
+      .expire(key, RedisFreeBusyAdapter.GENERATION_TTL_SECONDS)
+      .exec();
+  }
+
+  async getDays(keys: readonly string[]): Promise<(string | null)[]> {
+    if (keys.length === 0) {
+      return [];
+    }
+
+    return this.redisClient.mget(keys.map((key) => this.keyPrefix + key));
+  }
+
+  async setDays(
+    entries: ReadonlyMap<string, string>,
+    ttlSeconds: number,
+  ): Promise<void> {
+    if (entries.size === 0) {
+      return;
+    }
+
+    const pipeline = this.redisClient.pipeline();
+    for (const [key, value] of entries) {
+      pipeline.set(this.keyPrefix + key, value, 'EX', ttlSeconds);
+    }
+    await pipeline.exec();
+  }
+
+  private generationKey(calendarId: string): string {
+    return `${this.keyPrefix}gen:${calendarId}`;
+  }
+}
@@ -0,0 +1,175 @@
+/**
+ * ⏳ Redis Slot Hold Adapter - Infrastructure Layer
+ * ✅ Retenues de créneaux avec TTL, une table de hachage Redis par calendrier
+ * ✅ Clean Architecture - Infrastructure Adapter
+ *
+ * Champ = jeton, valeur = retenue JSON avec son échéance. La prise de
+ * retenue est un script Lua : purge des retenues expirées, contrôle de
+ * chevauchement et écriture s'exécutent atomiquement côté Redis. La clé
+ * expire avec la dernière retenue active, les retenues expirées sont
+ * purgées à la prise suivante et ignorées en lecture.
+ */
+
+import { randomUUID } from 'crypto';
+import type { Redis } from 'ioredis';
+import type {
+  ISlotHoldStore,
+  SlotHold,
+  SlotHoldRequest,
+} from '../../application/ports/slot-hold.port';
+
+interface StoredHold {
+  token: string;
+  businessId: string;
+  serviceId: string;
+  calendarId: string;
+  staffId?: string;
+  startMs: number;
+  endMs: number;
+  expiresAtMs: number;
+}
+
+// KEYS[1] = clé du calendrier
+// ARGV = maintenant, début, fin, échéance (ms epoch), jeton, retenue JSON
+const ACQUIRE_SCRIPT = `
+local now = tonumber(ARGV[1])
+local startMs = tonumber(ARGV[2])
+local endMs = tonumber(ARGV[3])
+local keyExpiresAt = tonumber(ARGV[4])
+local fields = redis.call('HGETALL', KEYS[1])
+for i = 1, #fields, 2 do
+  local hold = cjson.decode(fields[i + 1])
+  if hold.expiresAtMs <= now then
+    redis.call('HDEL', KEYS[1], fields[i])
+  elseif hold.startMs < endMs and startMs < hold.endMs then
+    return 0
+  elseif hold.expiresAtMs > keyExpiresAt then
+    keyExpiresAt = hold.expiresAtMs
+  end
+end
+redis.call('HSET', KEYS[1], ARGV[5], ARGV[6])
+redis.call('PEXPIREAT', KEYS[1], keyExpiresAt)
+return 1
+`;
+
+// KEYS[1] = compteur du demandeur, ARGV[1] = fenêtre (secondes)
+const COUNT_ATTEMPT_SCRIPT = `
+local count = redis.call('INCR', KEYS[1])
+if count == 1 then
+  redis.call('EXPIRE', KEYS[1], tonumber(ARGV[1]))
+end
+return count
+`;
+
+export class RedisSlotHoldAdapter implements ISlotHoldStore {
+  private readonly keyPrefix = 'slot-hold:';
+
+  constructor(private readonly redisClient: Redis) {}
+
+  async acquire(
+    request: SlotHoldRequest,
+    ttlSeconds: number,
+  ): Promise<SlotHold | null> {
+    const now = Date.now();
+    const stored: StoredHold = {
+      token: randomUUID(),
+      businessId: request.businessId,
+      serviceId: request.serviceId,
+      calendarId: request.calendarId,
+      staffId: request.staffId,
+      startMs: request.startTime.getTime(),
+      endMs: request.endTime.getTime(),
+      expiresAtMs: now + ttlSeconds * 1000,
+    };
+
+    const acquired = await this.redisClient.eval(
+      ACQUIRE_SCRIPT,
+      1,
+      this.buildKey(request.calendarId),
+      now,
+      stored.startMs,
+      stored.endMs,
+      stored.expiresAtMs,
+      stored.token,
+      JSON.stringify(stored),
+    );
+
+    return acquired === 1 ? this.toSlotHold(stored) : null;
+  }
+
+  async find(calendarId: string, token: string): Promise<SlotHold | null> {
+    const result = await this.redisClient.hget(
+      this.buildKey(calendarId),
+      token,
+    );
+    const stored = result ? this.parse(result) : null;
+
+    return stored && stored.expiresAtMs > Date.now()
+      ? this.toSlotHold(stored)
+      : null;
+  }
+
+  async isHeld(
+    calendarId: string,
+    startTime: Date,
+    endTime: Date,
+    exceptToken?: string,
+  ): Promise<boolean> {
+    const holds = await this.redisClient.hgetall(this.buildKey(calendarId));
+    const now = Date.now();
+    const startMs = startTime.getTime();
+    const endMs = endTime.getTime();
+
+    return Object.entries(holds).some(([token, value]) => {
+      if (token === exceptToken) return false;
+      const stored = this.parse(value);
+      return (
+        stored !== null &&
+        stored.expiresAtMs > now &&
+        stored.startMs < endMs &&
+        startMs < stored.endMs
+      );
+    });
+  }
+
+  async release(calendarId: string, token: string): Promise<void> {
+    await this.redisClient.hdel(this.buildKey(calendarId), token);
+  }
+
+  async countAttempt(holderId: string, windowSeconds: number): Promise<number> {
+    const count = await this.redisClient.eval(
+      COUNT_ATTEMPT_SCRIPT,
+      1,
+      `${this.keyPrefix}attempts:${holderId}`,
+      windowSeconds,
+    );
+    return Number(count);
+  }
+
+  private buildKey(calendarId: string): string {
+    // Hash tag : toutes les retenues d'un calendrier sur le même slot cluster
+    return `${this.keyPrefix}{${calendarId}}`;
+  }
+
+  private parse(value: string): StoredHold | null {
+    try {
+      return JSON.parse(value) as StoredHold;
+    } catch {
+      // Valeur illisible : considérée comme absente
+      return null;
+    }
+  }
+
+  private toSlotHold(stored: StoredHold): SlotHold {
+    return {
+      token: stored.token,
+      businessId: stored.businessId,
+      serviceId: stored.serviceId,
+      calendarId: stored.calendarId,
+      staffId: stored.staffId,
+      startTime: new Date(stored.startMs),
+      endTime: new Date(stored.endMs),
+      expiresAt: new Date(stored.expiresAtMs),
+    };
+  }
+}
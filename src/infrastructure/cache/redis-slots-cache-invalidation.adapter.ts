@@ -0,0 +1,81 @@
+/**
+ * 📣 Redis Slots Cache Invalidation Adapter - Infrastructure Layer
+ * ✅ Invalidations du cache de créneaux diffusées en pub/sub Redis
+ * ✅ Clean Architecture - Infrastructure Adapter
+ *
+ * Le pub/sub n'est pas durable : un message perdu (déconnexion) laisse
+ * l'entrée vivre jusqu'à son TTL, comme avant la diffusion. L'abonnement
+ * utilise une connexion dédiée, une connexion abonnée ne pouvant plus
+ * émettre d'autres commandes.
+ */
+
+import { randomUUID } from 'crypto';
+import type { Redis } from 'ioredis';
+import type {
+  ISlotsCacheInvalidationBus,
+  SlotsCacheInvalidation,
+} from '../../application/ports/slots-cache-invalidation.port';
+
+interface InvalidationMessage {
+  origin: string;
+  calendarId: string;
+  startMs: number;
+  endMs: number;
+}
+
+export class RedisSlotsCacheInvalidationAdapter
+  implements ISlotsCacheInvalidationBus
+{
+  private static readonly CHANNEL = 'slots-cache:invalidate';
+
+  // Identifie les messages de cette instance, déjà appliqués localement
+  private readonly instanceId = randomUUID();
+  private subscriber?: Redis;
+
+  constructor(private readonly redisClient: Redis) {}
+
+  async publish(invalidation: SlotsCacheInvalidation): Promise<void> {
+    const message: InvalidationMessage = {
+      origin: this.instanceId,
+      calendarId: invalidation.calendarId,
+      startMs: invalidation.startTime.getTime(),
+      endMs: invalidation.endTime.getTime(),
+    };
+    await this.redisClient.publish(
+      RedisSlotsCacheInvalidationAdapter.CHANNEL,
+      JSON.stringify(message),
+    );
+  }
+
+  async subscribe(
+    handler: (invalidation: SlotsCacheInvalidation) => void,
+  ): Promise<void> {
+    this.subscriber ??= this.redisClient.duplicate();
+    this.subscriber.on('message', (channel: string, raw: string) => {
+      if (channel !== RedisSlotsCacheInvalidationAdapter.CHANNEL) return;
+
+      const message = this.parse(raw);
+      if (!message || message.origin === this.instanceId) return;
+
+      handler({
+        calendarId: message.calendarId,
+        startTime: new Date(message.startMs),
+        endTime: new Date(message.endMs),
+      });
+    });
+    await this.subscriber.subscribe(RedisSlotsCacheInvalidationAdapter.CHANNEL);
+  }
+
+  private parse(raw: string): InvalidationMessage | null {
+    try {
+      const message = JSON.parse(raw) as InvalidationMessage;
+      return typeof message.calendarId === 'string' &&
+        Number.isFinite(message.startMs) &&
+        Number.isFinite(message.endMs)
+        ? message
+        : null;
+    } catch {
+      return null;
+    }
+  }
+}
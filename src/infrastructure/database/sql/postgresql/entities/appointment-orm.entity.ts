@@ -22,7 +22,10 @@ import { UserOrmEntity } from './user-orm.entity';
 
 @Entity('appointments')
 @Index(['business_id', 'calendar_id'])
-@Index(['calendar_id', 'start_time', 'end_time'])
+// INCLUDE (end_time, status) posé par migration, hors synchronisation
+@Index('idx_appointments_calendar_start_time', ['calendar_id', 'start_time'], {
+  synchronize: false,
+})
 @Index(['client_email'])
 @Index(['status'])
 @Index(['start_time'])
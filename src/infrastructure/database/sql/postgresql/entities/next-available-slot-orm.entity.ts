@@ -0,0 +1,40 @@
+import { Column, Entity, Index, PrimaryColumn } from 'typeorm';
+
+/**
+ * ⏭️ Entité ORM Next Available Slot - Index du premier créneau libre
+ *
+ * RÈGLES :
+ * - Une ligne par (business, service, calendar), recalculée par le worker
+ * - start_time/end_time nuls si aucun créneau dans l'horizon de recherche
+ * - stale_since positionné par les réservations / changements d'horaires ;
+ *   le worker ne l'efface que s'il n'a pas bougé depuis le début du calcul
+ * - Lecture des listings : (business_id, start_time) en parcours d'index
+ */
+@Entity('next_available_slots')
+@Index('idx_next_available_slots_business_start', ['businessId', 'startTime'])
+@Index('idx_next_available_slots_stale', ['businessId', 'serviceId'], {
+  where: 'stale_since IS NOT NULL',
+})
+@Index('idx_next_available_slots_start', ['startTime'])
+export class NextAvailableSlotOrmEntity {
+  @PrimaryColumn({ type: 'uuid', name: 'business_id' })
+  businessId!: string;
+
+  @PrimaryColumn({ type: 'uuid', name: 'service_id' })
+  serviceId!: string;
+
+  @PrimaryColumn({ type: 'uuid', name: 'calendar_id' })
+  calendarId!: string;
+
+  @Column({ type: 'timestamptz', name: 'start_time', nullable: true })
+  startTime!: Date | null;
+
+  @Column({ type: 'timestamptz', name: 'end_time', nullable: true })
+  endTime!: Date | null;
+
+  @Column({ type: 'timestamptz', name: 'stale_since', nullable: true })
+  staleSince!: Date | null;
+
+  @Column({ type: 'timestamptz', name: 'computed_at', nullable: true })
+  computedAt!: Date | null;
+}
@@ -0,0 +1,57 @@
+import {
+  Column,
+  CreateDateColumn,
+  Entity,
+  Index,
+  PrimaryGeneratedColumn,
+} from 'typeorm';
+
+/**
+ * 📤 Entité ORM Outbox Message - Effets de bord en attente de distribution
+ *
+ * RÈGLES :
+ * - Écrite dans la même transaction que l'agrégat (rendez-vous, ...)
+ * - Réservée par un worker jusqu'à locked_until (bail), supprimée une fois
+ *   distribuée ; un bail expiré rend le message à nouveau disponible
+ * - failed_at positionné quand les tentatives sont épuisées : le message
+ *   reste en table pour inspection, hors file
+ */
+@Entity('outbox_messages')
+@Index('idx_outbox_messages_due', ['availableAt'], {
+  where: 'failed_at IS NULL',
+})
+export class OutboxMessageOrmEntity {
+  @PrimaryGeneratedColumn('uuid')
+  id!: string;
+
+  @Column({ type: 'varchar', length: 100 })
+  type!: string;
+
+  @Column({ type: 'uuid', name: 'aggregate_id' })
+  aggregateId!: string;
+
+  @Column({ type: 'jsonb' })
+  payload!: Record<string, unknown>;
+
+  @Column({ type: 'integer', default: 0 })
+  attempts!: number;
+
+  @Column({
+    type: 'timestamptz',
+    name: 'available_at',
+    default: () => 'CURRENT_TIMESTAMP',
+  })
+  availableAt!: Date;
+
+  @Column({ type: 'timestamptz', name: 'locked_until', nullable: true })
+  lockedUntil!: Date | null;
+
+  @Column({ type: 'timestamptz', name: 'failed_at', nullable: true })
+  failedAt!: Date | null;
+
+  @Column({ type: 'text', name: 'last_error', nullable: true })
+  lastError!: string | null;
+
+  @CreateDateColumn({ type: 'timestamptz', name: 'created_at' })
+  createdAt!: Date;
+}
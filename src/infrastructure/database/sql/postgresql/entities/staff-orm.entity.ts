@@ -115,6 +115,21 @@ export class StaffOrmEntity {
     };
   } | null;
 
+  // Skills as JSON (StaffSkills.fromPersistence)
+  @Column({ type: 'jsonb', nullable: true })
+  skills!: Array<{
+    skill_id: string;
+    skill_name: string;
+    skill_category: string;
+    proficiency_level: string;
+    certification_level?: string;
+    years_of_experience: number;
+    last_used?: string; // ISO string
+    is_certified: boolean;
+    certification_expiry_date?: string; // ISO string
+    notes?: string;
+  }> | null;
+
   // Relations
   @ManyToOne(() => BusinessOrmEntity, { onDelete: 'CASCADE' })
   @JoinColumn({ name: 'business_id' })
@@ -0,0 +1,62 @@
+import { MigrationInterface, QueryRunner } from 'typeorm';
+
+/**
+ * 📈 MIGRATION : Add Appointment Calendar Range Index
+ *
+ * 🎯 OBJECTIF : Servir la requête libre/occupé de findByCalendarId
+ *
+ * 📊 IMPACT :
+ * - Index (calendar_id, start_time) couvrant end_time et status
+ * - La requête par période devient un parcours d'index borné sur
+ *   start_time, sans lecture de la table (index-only scan)
+ * - Remplace idx_appointments_time_slot (calendar_id, start_time,
+ *   end_time), dont il couvre toutes les recherches : un seul index à
+ *   maintenir par INSERT
+ *
+ * 🛡️ MESURES DE SÉCURITÉ :
+ * - IF NOT EXISTS / IF EXISTS : migration rejouable
+ * - Pas de CONCURRENTLY : les migrations s'exécutent en transaction unique
+ */
+export class AddAppointmentCalendarRangeIndex1760600000000
+  implements MigrationInterface
+{
+  name = 'AddAppointmentCalendarRangeIndex1760600000000';
+
+  private getSchemaName(): string {
+    const schema = process.env.DB_SCHEMA || 'public';
+
+    // Validation du nom de schéma (sécurité)
+    if (!/^[a-zA-Z_][a-zA-Z0-9_]*$/.test(schema)) {
+      throw new Error(`Invalid schema name format: ${schema}`);
+    }
+
+    return schema;
+  }
+
+  public async up(queryRunner: QueryRunner): Promise<void> {
+    const schema = this.getSchemaName();
+
+    await queryRunner.query(`
+      CREATE INDEX IF NOT EXISTS "idx_appointments_calendar_start_time"
+      ON "${schema}"."appointments" ("calendar_id", "start_time")
+      INCLUDE ("end_time", "status")
+    `);
+
+    await queryRunner.query(`
+      DROP INDEX IF EXISTS "${schema}"."idx_appointments_time_slot"
+    `);
+  }
+
+  public async down(queryRunner: QueryRunner): Promise<void> {
+    const schema = this.getSchemaName();
+
+    await queryRunner.query(`
+      CREATE INDEX IF NOT EXISTS "idx_appointments_time_slot"
+      ON "${schema}"."appointments" ("calendar_id", "start_time", "end_time")
+    `);
+
+    await queryRunner.query(`
+      DROP INDEX IF EXISTS "${schema}"."idx_appointments_calendar_start_time"
+    `);
+  }
+}
@@ -0,0 +1,77 @@
+import { MigrationInterface, QueryRunner } from 'typeorm';
+
+/**
+ * ⏭️ MIGRATION : Create Next Available Slots Table
+ *
+ * 🎯 OBJECTIF : Index du premier créneau libre par (business, service,
+ * calendar), maintenu par le worker de recalcul
+ *
+ * 📊 IMPACT :
+ * - Listings : premier créneau de N entreprises en une lecture indexée
+ *   sur (business_id, start_time)
+ * - File de recalcul : index partiel sur les lignes marquées (stale_since)
+ *   et index sur start_time pour les créneaux dépassés
+ *
+ * 🛡️ MESURES DE SÉCURITÉ :
+ * - IF NOT EXISTS / IF EXISTS : migration rejouable
+ * - Table dérivée : peut être vidée, le worker la reconstruit
+ */
+export class CreateNextAvailableSlotsTable1760700000000
+  implements MigrationInterface
+{
+  name = 'CreateNextAvailableSlotsTable1760700000000';
+
+  private getSchemaName(): string {
+    const schema = process.env.DB_SCHEMA || 'public';
+
+    // Validation du nom de schéma (sécurité)
+    if (!/^[a-zA-Z_][a-zA-Z0-9_]*$/.test(schema)) {
+      throw new Error(`Invalid schema name format: ${schema}`);
+    }
+
+    return schema;
+  }
+
+  public async up(queryRunner: QueryRunner): Promise<void> {
+    const schema = this.getSchemaName();
+
+    await queryRunner.query(`
+      CREATE TABLE IF NOT EXISTS "${schema}"."next_available_slots" (
+        "business_id" uuid NOT NULL,
+        "service_id" uuid NOT NULL,
+        "calendar_id" uuid NOT NULL,
+        "start_time" timestamp with time zone NULL,
+        "end_time" timestamp with time zone NULL,
+        "stale_since" timestamp with time zone NULL,
+        "computed_at" timestamp with time zone NULL,
+        CONSTRAINT "pk_next_available_slots"
+          PRIMARY KEY ("business_id", "service_id", "calendar_id")
+      )
+    `);
+
+    await queryRunner.query(`
+      CREATE INDEX IF NOT EXISTS "idx_next_available_slots_business_start"
+      ON "${schema}"."next_available_slots" ("business_id", "start_time")
+      INCLUDE ("service_id", "calendar_id", "end_time")
+    `);
+
+    await queryRunner.query(`
+      CREATE INDEX IF NOT EXISTS "idx_next_available_slots_stale"
+      ON "${schema}"."next_available_slots" ("business_id", "service_id")
+      WHERE "stale_since" IS NOT NULL
+    `);
+
+    await queryRunner.query(`
+      CREATE INDEX IF NOT EXISTS "idx_next_available_slots_start"
+      ON "${schema}"."next_available_slots" ("start_time")
+    `);
+  }
+
+  public async down(queryRunner: QueryRunner): Promise<void> {
+    const schema = this.getSchemaName();
+
+    await queryRunner.query(`
+      DROP TABLE IF EXISTS "${schema}"."next_available_slots"
+    `);
+  }
+}
@@ -0,0 +1,63 @@
+import { MigrationInterface, QueryRunner } from 'typeorm';
+
+/**
+ * 🛡️ MIGRATION : Add Appointment No-Overlap Constraint
+ *
+ * 🎯 OBJECTIF : Empêcher la double réservation au niveau de la base
+ *
+ * 📊 IMPACT :
+ * - Contrainte d'exclusion GiST sur (calendar_id, tstzrange(start_time,
+ *   end_time)) pour les rendez-vous actifs (hors CANCELLED / NO_SHOW)
+ * - Une réservation se fait en un seul INSERT : deux réservations
+ *   concurrentes du même créneau ne peuvent pas être validées toutes les
+ *   deux, la seconde échoue en exclusion_violation (23P01)
+ * - Extension btree_gist requise pour l'égalité sur calendar_id en GiST
+ *
+ * 🛡️ MESURES DE SÉCURITÉ :
+ * - La migration échoue si des chevauchements actifs existent déjà : ils
+ *   doivent être résolus (annulation / replanification) avant déploiement
+ * - down() conserve l'extension, potentiellement utilisée ailleurs
+ */
+export class AddAppointmentNoOverlapConstraint1760800000000
+  implements MigrationInterface
+{
+  name = 'AddAppointmentNoOverlapConstraint1760800000000';
+
+  private getSchemaName(): string {
+    const schema = process.env.DB_SCHEMA || 'public';
+
+    // Validation du nom de schéma (sécurité)
+    if (!/^[a-zA-Z_][a-zA-Z0-9_]*$/.test(schema)) {
+      throw new Error(`Invalid schema name format: ${schema}`);
+    }
+
+    return schema;
+  }
+
+  public async up(queryRunner: QueryRunner): Promise<void> {
+    const schema = this.getSchemaName();
+
+    await queryRunner.query(
+      `CREATE EXTENSION IF NOT EXISTS "btree_gist" SCHEMA "${schema}"`,
+    );
+
+    await queryRunner.query(`
+      ALTER TABLE "${schema}"."appointments"
+      ADD CONSTRAINT "appointments_calendar_no_overlap"
+      EXCLUDE USING gist (
+        "calendar_id" WITH =,
+        tstzrange("start_time", "end_time", '[)') WITH &&
+      )
+      WHERE ("status" NOT IN ('CANCELLED', 'NO_SHOW'))
+    `);
+  }
+
+  public async down(queryRunner: QueryRunner): Promise<void> {
+    const schema = this.getSchemaName();
+
+    await queryRunner.query(`
+      ALTER TABLE "${schema}"."appointments"
+      DROP CONSTRAINT IF EXISTS "appointments_calendar_no_overlap"
+    `);
+  }
+}
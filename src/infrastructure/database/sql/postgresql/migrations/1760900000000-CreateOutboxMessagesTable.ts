@@ -0,0 +1,68 @@
+import { MigrationInterface, QueryRunner } from 'typeorm';
+
+/**
+ * 📤 MIGRATION : Create Outbox Messages Table
+ *
+ * 🎯 OBJECTIF : Outbox transactionnelle des effets de bord (notifications,
+ * rappels, audit) écrite avec le rendez-vous, vidée par un worker
+ *
+ * 📊 IMPACT :
+ * - La réservation ne porte plus la latence email / SMS : un INSERT de plus
+ *   dans la transaction du rendez-vous
+ * - Index partiel sur available_at pour la file (messages non abandonnés) ;
+ *   les messages distribués sont supprimés, la table reste petite
+ *
+ * 🛡️ MESURES DE SÉCURITÉ :
+ * - IF NOT EXISTS / IF EXISTS : migration rejouable
+ * - down() supprime les messages non distribués
+ */
+export class CreateOutboxMessagesTable1760900000000
+  implements MigrationInterface
+{
+  name = 'CreateOutboxMessagesTable1760900000000';
+
+  private getSchemaName(): string {
+    const schema = process.env.DB_SCHEMA || 'public';
+
+    // Validation du nom de schéma (sécurité)
+    if (!/^[a-zA-Z_][a-zA-Z0-9_]*$/.test(schema)) {
+      throw new Error(`Invalid schema name format: ${schema}`);
+    }
+
+    return schema;
+  }
+
+  public async up(queryRunner: QueryRunner): Promise<void> {
+    const schema = this.getSchemaName();
+
+    await queryRunner.query(`
+      CREATE TABLE IF NOT EXISTS "${schema}"."outbox_messages" (
+        "id" uuid NOT NULL DEFAULT uuid_generate_v4(),
+        "type" varchar(100) NOT NULL,
+        "aggregate_id" uuid NOT NULL,
+        "payload" jsonb NOT NULL,
+        "attempts" integer NOT NULL DEFAULT 0,
+        "available_at" timestamp with time zone NOT NULL DEFAULT now(),
+        "locked_until" timestamp with time zone NULL,
+        "failed_at" timestamp with time zone NULL,
+        "last_error" text NULL,
+        "created_at" timestamp with time zone NOT NULL DEFAULT now(),
+        CONSTRAINT "pk_outbox_messages" PRIMARY KEY ("id")
+      )
+    `);
+
+    await queryRunner.query(`
+      CREATE INDEX IF NOT EXISTS "idx_outbox_messages_due"
+      ON "${schema}"."outbox_messages" ("available_at")
+      WHERE "failed_at" IS NULL
+    `);
+  }
+
+  public async down(queryRunner: QueryRunner): Promise<void> {
+    const schema = this.getSchemaName();
+
+    await queryRunner.query(`
+      DROP TABLE IF EXISTS "${schema}"."outbox_messages"
+    `);
+  }
+}
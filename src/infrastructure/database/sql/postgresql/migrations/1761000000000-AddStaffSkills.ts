@@ -0,0 +1,46 @@
+import { MigrationInterface, QueryRunner } from 'typeorm';
+
+/**
+ * 🎯 MIGRATION : Add Staff Skills
+ *
+ * 🎯 OBJECTIF : Persister les compétences du staff (StaffSkills) pour
+ * alimenter l'index inversé compétence → staff
+ *
+ * 📊 IMPACT :
+ * - Colonne jsonb nullable : aucune réécriture des lignes existantes
+ *
+ * 🛡️ MESURES DE SÉCURITÉ :
+ * - IF NOT EXISTS / IF EXISTS : migration rejouable
+ * - down() supprime les compétences enregistrées
+ */
+export class AddStaffSkills1761000000000 implements MigrationInterface {
+  name = 'AddStaffSkills1761000000000';
+
+  private getSchemaName(): string {
+    const schema = process.env.DB_SCHEMA || 'public';
+
+    // Validation du nom de schéma (sécurité)
+    if (!/^[a-zA-Z_][a-zA-Z0-9_]*$/.test(schema)) {
+      throw new Error(`Invalid schema name format: ${schema}`);
+    }
+
+    return schema;
+  }
+
+  public async up(queryRunner: QueryRunner): Promise<void> {
+    const schema = this.getSchemaName();
+
+    await queryRunner.query(`
+      ALTER TABLE "${schema}"."staff"
+      ADD COLUMN IF NOT EXISTS "skills" jsonb
+    `);
+  }
+
+  public async down(queryRunner: QueryRunner): Promise<void> {
+    const schema = this.getSchemaName();
+
+    await queryRunner.query(`
+      ALTER TABLE "${schema}"."staff" DROP COLUMN IF EXISTS "skills"
+    `);
+  }
+}
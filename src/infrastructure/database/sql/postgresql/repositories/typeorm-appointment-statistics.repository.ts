@@ -11,6 +11,7 @@ import { Repository } from 'typeorm';
 import { AppointmentStatisticsCriteria } from '../../../../../domain/repositories/appointment.repository.interface';
 import { AppointmentStatisticsData } from '../../../../../domain/value-objects/appointment-statistics.vo';
 import { AppointmentOrmEntity } from '../entities/appointment-orm.entity';
+import { InfrastructureException } from '@shared/exceptions/shared.exceptions';
 
 @Injectable()
 export class TypeOrmAppointmentStatisticsRepository {
@@ -87,7 +88,10 @@ export class TypeOrmAppointmentStatisticsRepository {
     } catch (error) {
       const errorMessage =
         error instanceof Error ? error.message : 'Unknown error';
-      throw new Error(`Failed to get appointment statistics: ${errorMessage}`);
+      throw new InfrastructureException(
+        `Failed to get appointment statistics: ${errorMessage}`,
+        'INFRASTRUCTURE_ERROR',
+      );
     }
   }
 
@@ -1,26 +1,43 @@
 import { Injectable } from '@nestjs/common';
 import { InjectRepository } from '@nestjs/typeorm';
-import { Repository } from 'typeorm';
+import { QueryFailedError, Repository } from 'typeorm';
 import {
   Appointment,
   AppointmentId,
   AppointmentStatus,
 } from '../../../../../domain/entities/appointment.entity';
+import { AppointmentSlotTakenError } from '../../../../../domain/exceptions/appointment.exceptions';
 import {
   AppointmentRepository,
   AppointmentSearchCriteria,
   AppointmentStatistics,
   AppointmentStatisticsCriteria,
+  AppointmentTimeRange,
 } from '../../../../../domain/repositories/appointment.repository.interface';
+import { OutboxMessage } from '../../../../../domain/repositories/outbox.repository.interface';
 import { AppointmentStatisticsData } from '../../../../../domain/value-objects/appointment-statistics.vo';
 import { BusinessId } from '../../../../../domain/value-objects/business-id.value-object';
 import { CalendarId } from '../../../../../domain/value-objects/calendar-id.value-object';
 import { Email } from '../../../../../domain/value-objects/email.value-object';
 import { ServiceId } from '../../../../../domain/value-objects/service-id.value-object';
+import { TimeSlot } from '../../../../../domain/value-objects/time-slot.value-object';
 import { UserId } from '../../../../../domain/value-objects/user-id.value-object';
 import { AppointmentOrmMapper } from '../../../../mappers/appointment-orm.mapper';
 import { InfrastructureException } from '../../../../../shared/exceptions/shared.exceptions';
+import { AppointmentOccupancyKernel } from '../../../../../shared/utils/appointment.utils';
 import { AppointmentOrmEntity } from '../entities/appointment-orm.entity';
+import { CalendarOrmEntity } from '../entities/calendar-orm.entity';
+import { OutboxMessageOrmEntity } from '../entities/outbox-message-orm.entity';
+import { getCalendarOpenRanges } from '../utils/calendar-open-ranges';
+
+// Durée maximale d'un rendez-vous (TimeSlot refuse plus de 8h) : borne basse
+// du parcours d'index sur start_time pour les requêtes par période
+const MAX_APPOINTMENT_DURATION_MS = 8 * 60 * 60 * 1000;
+
+// Contrainte d'exclusion (migration AddAppointmentNoOverlapConstraint) et
+// code PostgreSQL exclusion_violation
+const NO_OVERLAP_CONSTRAINT = 'appointments_calendar_no_overlap';
+const EXCLUSION_VIOLATION = '23P01';
 
 /**
  * 📅 APPOINTMENT REPOSITORY - TypeORM Implementation
@@ -44,7 +61,109 @@ export class TypeOrmAppointmentRepository implements AppointmentRepository {
     const ormEntity = AppointmentOrmMapper.toOrmEntity(appointment);
 
     // 2. Persistence en base
-    await this.repository.save(ormEntity);
+    try {
+      await this.repository.save(ormEntity);
+    } catch (error) {
+      throw this.translateOverlap(
+        error,
+        appointment.calendarId,
+        appointment.getTimeSlot().getStartTime(),
+        appointment.getTimeSlot().getEndTime(),
+      );
+    }
+  }
+
+  /**
+   * ➕ CREATE - Insertion d'un nouveau rendez-vous en un seul INSERT
+   * La contrainte d'exclusion arbitre les réservations concurrentes :
+   * ni lecture préalable des conflits, ni verrou applicatif.
+   * Les messages d'outbox sont insérés dans la même transaction
+   */
+  async create(
+    appointment: Appointment,
+    outbox: OutboxMessage[] = [],
+  ): Promise<void> {
+    const ormEntity = AppointmentOrmMapper.toOrmEntity(appointment);
+
+    try {
+      if (outbox.length === 0) {
+        await this.repository.insert(ormEntity);
+        return;
+      }
+
+      await this.repository.manager.transaction(async (manager) => {
+        await manager.insert(AppointmentOrmEntity, ormEntity);
+        await manager.insert(
+          OutboxMessageOrmEntity,
+          outbox.map((message) => ({
+            type: message.type,
+            aggregateId: message.aggregateId,
+            payload: message.payload,
+          })),
+        );
+      });
+    } catch (error) {
+      throw this.translateOverlap(
+        error,
+        appointment.calendarId,
+        appointment.getTimeSlot().getStartTime(),
+        appointment.getTimeSlot().getEndTime(),
+      );
+    }
+  }
+
+  /**
+   * ➕ CREATE MANY - Insertion d'une série en un seul INSERT multi-lignes
+   * Une instruction unique est atomique : un chevauchement sur une ligne
+   * (contrainte d'exclusion) annule toute la série, messages d'outbox compris
+   */
+  async createMany(
+    appointments: Appointment[],
+    outbox: OutboxMessage[] = [],
+  ): Promise<void> {
+    if (appointments.length === 0) return;
+
+    const ormEntities = appointments.map((appointment) =>
+      AppointmentOrmMapper.toOrmEntity(appointment),
+    );
+    const slots = appointments.map((appointment) => appointment.getTimeSlot());
+
+    try {
+      if (outbox.length === 0) {
+        await this.repository
+          .createQueryBuilder()
+          .insert()
+          .into(AppointmentOrmEntity)
+          .values(ormEntities)
+          .execute();
+        return;
+      }
+
+      await this.repository.manager.transaction(async (manager) => {
+        await manager
+          .createQueryBuilder()
+          .insert()
+          .into(AppointmentOrmEntity)
+          .values(ormEntities)
+          .execute();
+        await manager.insert(
+          OutboxMessageOrmEntity,
+          outbox.map((message) => ({
+            type: message.type,
+            aggregateId: message.aggregateId,
+            payload: message.payload,
+          })),
+        );
+      });
+    } catch (error) {
+      // Ligne fautive non identifiable : erreur sur l'étendue de la série
+      throw this.translateOverlap(
+        error,
+        appointments[0].calendarId,
+        slots[0].getStartTime(),
+        slots[slots.length - 1].getEndTime(),
+      );
+    }
   }
 
   /**
@@ -159,15 +278,54 @@ export class TypeOrmAppointmentRepository implements AppointmentRepository {
     );
   }
 
+  /**
+   * 🔍 FIND BY CALENDAR - Rendez-vous d'un calendrier sur une période
+   * Projection libre/occupé (id, start_time, end_time, status) servie par
+   * l'index (calendar_id, start_time) INCLUDE (end_time, status)
+   */
   async findByCalendarId(
-    _calendarId: CalendarId,
-    _startDate?: Date,
-    _endDate?: Date,
-  ): Promise<Appointment[]> {
-    throw new InfrastructureException(
-      'findByCalendarId not implemented yet - TODO Phase 2',
-      'NOT_IMPLEMENTED',
-    );
+    calendarId: CalendarId,
+    startDate?: Date,
+    endDate?: Date,
+  ): Promise<AppointmentTimeRange[]> {
+    const queryBuilder = this.repository
+      .createQueryBuilder('appointment')
+      .select('appointment.id', 'id')
+      .addSelect('appointment.start_time', 'start_time')
+      .addSelect('appointment.end_time', 'end_time')
+      .addSelect('appointment.status', 'status')
+      .where('appointment.calendar_id = :calendarId', {
+        calendarId: calendarId.getValue(),
+      });
+
+    if (startDate) {
+      // Un rendez-vous qui chevauche startDate a commencé au plus 8h avant :
+      // la condition sur start_time borne le parcours de l'index
+      queryBuilder
+        .andWhere('appointment.start_time > :scanFrom', {
+          scanFrom: new Date(startDate.getTime() - MAX_APPOINTMENT_DURATION_MS),
+        })
+        .andWhere('appointment.end_time > :startDate', { startDate });
+    }
+
+    if (endDate) {
+      queryBuilder.andWhere('appointment.start_time < :endDate', { endDate });
+    }
+
+    const rows: Array<{
+      id: string;
+      start_time: Date;
+      end_time: Date;
+      status: string;
+    }> = await queryBuilder
+      .orderBy('appointment.start_time', 'ASC')
+      .getRawMany();
+
+    return rows.map((row) => ({
+      id: AppointmentId.create(row.id),
+      timeSlot: new TimeSlot(new Date(row.start_time), new Date(row.end_time)),
+      status: row.status as AppointmentStatus,
+    }));
   }
 
   async findByServiceId(
@@ -313,10 +471,16 @@ export class TypeOrmAppointmentRepository implements AppointmentRepository {
     );
   }
 
+  /**
+   * 📊 CALENDAR UTILIZATION - Occupation des créneaux ouverts sur la période
+   * Grille du calendrier alignée sur minuit ; seuls start_time/end_time des
+   * rendez-vous bloquants sont lus, puis comptés en une passe par
+   * AppointmentOccupancyKernel (tableau de différences)
+   */
   async getCalendarUtilization(
-    _calendarId: CalendarId,
-    _startDate: Date,
-    _endDate: Date,
+    calendarId: CalendarId,
+    startDate: Date,
+    endDate: Date,
   ): Promise<{
     totalSlots: number;
     bookedSlots: number;
@@ -324,9 +488,73 @@ export class TypeOrmAppointmentRepository implements AppointmentRepository {
     utilizationPercentage: number;
     peakTimes: { time: string; bookingCount: number }[];
   }> {
-    throw new InfrastructureException(
-      'getCalendarUtilization not implemented yet - TODO Phase 2',
-      'NOT_IMPLEMENTED',
+    const id = calendarId.getValue();
+    const [calendar, rows] = await Promise.all([
+      this.repository.manager.findOne(CalendarOrmEntity, {
+        select: ['id', 'settings', 'availability'],
+        where: { id },
+      }),
+      this.repository
+        .createQueryBuilder('appointment')
+        .select('appointment.start_time', 'start_time')
+        .addSelect('appointment.end_time', 'end_time')
+        .where('appointment.calendar_id = :calendarId', { calendarId: id })
+        .andWhere('appointment.start_time > :scanFrom', {
+          scanFrom: new Date(startDate.getTime() - MAX_APPOINTMENT_DURATION_MS),
+        })
+        .andWhere('appointment.start_time < :endDate', { endDate })
+        .andWhere('appointment.end_time > :startDate', { startDate })
+        .andWhere('appointment.status NOT IN (:...statuses)', {
+          statuses: [AppointmentStatus.CANCELLED, AppointmentStatus.NO_SHOW],
+        })
+        .getRawMany<{ start_time: Date; end_time: Date }>(),
+    ]);
+
+    if (!calendar) {
+      throw new InfrastructureException(
+        `Calendar ${id} not found`,
+        'CALENDAR_NOT_FOUND',
+      );
+    }
+
+    const slotMinutes = calendar.settings?.default_slot_duration;
+    const slotMs = (slotMinutes && slotMinutes > 0 ? slotMinutes : 30) * 60000;
+    const gridStart = new Date(startDate);
+    gridStart.setHours(0, 0, 0, 0);
+    const gridStartMs = gridStart.getTime();
+    const slotCount = Math.max(
+      0,
+      Math.ceil((endDate.getTime() - gridStartMs) / slotMs),
+    );
+
+    const openRanges = getCalendarOpenRanges(
+      calendar.availability,
+      startDate,
+      endDate,
+      slotMs,
+    );
+    const openWindows = new Float64Array(openRanges.length * 2);
+    openRanges.forEach((range, index) => {
+      openWindows[index * 2] = range.startMs;
+      openWindows[index * 2 + 1] = range.endMs;
+    });
+
+    const starts = new Float64Array(rows.length);
+    const ends = new Float64Array(rows.length);
+    rows.forEach((row, index) => {
+      starts[index] = new Date(row.start_time).getTime();
+      ends[index] = new Date(row.end_time).getTime();
+    });
+
+    return AppointmentOccupancyKernel.summarize(
+      AppointmentOccupancyKernel.compute(
+        starts,
+        ends,
+        gridStartMs,
+        slotMs,
+        slotCount,
+        openWindows,
+      ),
     );
   }
 
@@ -465,4 +693,33 @@ export class TypeOrmAppointmentRepository implements AppointmentRepository {
 
     return statusCounts;
   }
+
+  /**
+   * Violation de la contrainte d'exclusion → erreur de domaine typée ;
+   * toute autre erreur est propagée telle quelle
+   */
+  private translateOverlap(
+    error: unknown,
+    calendarId: CalendarId,
+    startTime: Date,
+    endTime: Date,
+  ): unknown {
+    const driverError =
+      error instanceof QueryFailedError
+        ? (error.driverError as { code?: string; constraint?: string })
+        : undefined;
+
+    if (
+      driverError?.code !== EXCLUSION_VIOLATION ||
+      driverError.constraint !== NO_OVERLAP_CONSTRAINT
+    ) {
+      return error;
+    }
+
+    return new AppointmentSlotTakenError(
+      calendarId.getValue(),
+      startTime,
+      endTime,
+    );
+  }
 }
@@ -12,13 +12,16 @@
 import { Injectable } from '@nestjs/common';
 import { InjectRepository } from '@nestjs/typeorm';
 import { InfrastructureException } from '@shared/exceptions/shared.exceptions';
-import { Repository } from 'typeorm';
+import { In, Repository } from 'typeorm';
 import { Business } from '../../../../../domain/entities/business.entity';
 import { BusinessRepository } from '../../../../../domain/repositories/business.repository.interface';
 import { BusinessId } from '../../../../../domain/value-objects/business-id.value-object';
 import { BusinessName } from '../../../../../domain/value-objects/business-name.value-object';
 import { BusinessMapper } from '../../../../mappers/domain-mappers';
 import { BusinessOrmEntity } from '../entities/business-orm.entity';
+import { RequestEntityLoader } from '../utils/request-entity-loader';
+
+const LOADER_NAMESPACE = 'business';
 
 @Injectable()
 export class TypeOrmBusinessRepository implements BusinessRepository {
@@ -29,13 +32,11 @@ export class TypeOrmBusinessRepository implements BusinessRepository {
 
   async findById(id: BusinessId): Promise<Business | null> {
     try {
-      const businessId = id.getValue();
-      const ormEntity = await this.ormRepository.findOne({
-        where: { id: businessId },
-        // TODO: Add relations back when fixed
-      });
-
-      return ormEntity ? BusinessMapper.fromTypeOrmEntity(ormEntity) : null;
+      return await RequestEntityLoader.load(
+        LOADER_NAMESPACE,
+        id.getValue(),
+        (ids) => this.findManyByIds(ids),
+      );
     } catch (error) {
       throw new InfrastructureException(
         `Failed to find business by id: ${error instanceof Error ? error.message : 'Unknown error'}`,
@@ -153,6 +154,7 @@ export class TypeOrmBusinessRepository implements BusinessRepository {
 
       // Sauvegarder dans la base
       await this.ormRepository.save(ormEntity);
+      RequestEntityLoader.clear(LOADER_NAMESPACE, ormEntity.id);
     } catch (error) {
       throw new InfrastructureException(
         `Failed to save business: ${error instanceof Error ? error.message : 'Unknown error'}`,
@@ -165,6 +167,7 @@ export class TypeOrmBusinessRepository implements BusinessRepository {
     try {
       const businessId = id.getValue();
       const result = await this.ormRepository.delete(businessId);
+      RequestEntityLoader.clear(LOADER_NAMESPACE, businessId);
 
       if (result.affected === 0) {
         throw new InfrastructureException(
@@ -310,4 +313,21 @@ export class TypeOrmBusinessRepository implements BusinessRepository {
   private deg2rad(deg: number): number {
     return deg * (Math.PI / 180);
   }
+
+  /**
+   * 🧺 Chargement groupé pour RequestEntityLoader (WHERE id IN (...))
+   */
+  private async findManyByIds(ids: string[]): Promise<Map<string, Business>> {
+    const ormEntities = await this.ormRepository.find({
+      where: { id: In(ids) },
+      // TODO: Add relations back when fixed
+    });
+
+    return new Map(
+      ormEntities.map((entity) => [
+        entity.id,
+        BusinessMapper.fromTypeOrmEntity(entity),
+      ]),
+    );
+  }
 }
@@ -10,18 +10,40 @@
  */
 
 import { InfrastructureException } from '@shared/exceptions/shared.exceptions';
-import { Repository } from 'typeorm';
+import { In, Repository } from 'typeorm';
 
 import { Injectable } from '@nestjs/common';
 import { InjectRepository } from '@nestjs/typeorm';
+import { AppointmentStatus } from '../../../../../domain/entities/appointment.entity';
 import { Calendar } from '../../../../../domain/entities/calendar.entity';
-import { CalendarRepository } from '../../../../../domain/repositories/calendar.repository.interface';
+import {
+  CalendarFreeBusy,
+  CalendarRepository,
+} from '../../../../../domain/repositories/calendar.repository.interface';
+import {
+  BusyRange,
+  BusyTimeline,
+} from '../../../../../domain/services/slot-availability.service';
 import { BusinessId } from '../../../../../domain/value-objects/business-id.value-object';
 import { CalendarId } from '../../../../../domain/value-objects/calendar-id.value-object';
 import { TimeSlot } from '../../../../../domain/value-objects/time-slot.value-object';
 import { UserId } from '../../../../../domain/value-objects/user-id.value-object';
 import { CalendarOrmMapper } from '../../../../mappers/calendar-orm.mapper';
+import { AppointmentOrmEntity } from '../entities/appointment-orm.entity';
 import { CalendarOrmEntity } from '../entities/calendar-orm.entity';
+import { getCalendarOpenRanges } from '../utils/calendar-open-ranges';
+import { RequestEntityLoader } from '../utils/request-entity-loader';
+
+const LOADER_NAMESPACE = 'calendar';
+
+// Granularité des journées libre/occupé (FreeBusyBitmap.SLOT_MINUTES)
+const FREE_BUSY_STEP_MS = 5 * 60000;
+
+// Statuts qui libèrent le créneau (même règle que la détection de conflits)
+const NON_BLOCKING_STATUSES = [
+  AppointmentStatus.CANCELLED,
+  AppointmentStatus.NO_SHOW,
+];
 
 @Injectable()
 export class TypeOrmCalendarRepository implements CalendarRepository {
@@ -32,14 +54,11 @@ export class TypeOrmCalendarRepository implements CalendarRepository {
 
   async findById(id: CalendarId): Promise<Calendar | null> {
     try {
-      const calendarId = id.getValue();
-      const ormEntity = await this.ormRepository.findOne({
-        where: { id: calendarId },
-      });
-
-      return ormEntity
-        ? CalendarOrmMapper.toDomainPlainObject(ormEntity)
-        : null;
+      return await RequestEntityLoader.load(
+        LOADER_NAMESPACE,
+        id.getValue(),
+        (ids) => this.findManyByIds(ids),
+      );
     } catch (error) {
       throw new InfrastructureException(
         `Failed to find calendar by id: ${error instanceof Error ? error.message : 'Unknown error'}`,
@@ -64,6 +83,22 @@ export class TypeOrmCalendarRepository implements CalendarRepository {
     }
   }
 
+  async findIdsByBusinessId(businessId: BusinessId): Promise<CalendarId[]> {
+    try {
+      const rows = await this.ormRepository.find({
+        select: ['id'],
+        where: { business_id: businessId.getValue() },
+      });
+
+      return rows.map((row) => CalendarId.create(row.id));
+    } catch (error) {
+      throw new InfrastructureException(
+        `Failed to find calendar ids by business id: ${error instanceof Error ? error.message : 'Unknown error'}`,
+        'CALENDAR_FIND_IDS_BY_BUSINESS_ID_ERROR',
+      );
+    }
+  }
+
   async findByOwnerId(ownerId: UserId): Promise<Calendar[]> {
     try {
       const ownerIdValue = ownerId.getValue();
@@ -106,6 +141,7 @@ export class TypeOrmCalendarRepository implements CalendarRepository {
 
       // Sauvegarder dans la base
       await this.ormRepository.save(ormEntity);
+      RequestEntityLoader.clear(LOADER_NAMESPACE, ormEntity.id);
     } catch (error) {
       throw new InfrastructureException(
         `Failed to save calendar: ${error instanceof Error ? error.message : 'Unknown error'}`,
@@ -118,6 +154,7 @@ export class TypeOrmCalendarRepository implements CalendarRepository {
     try {
       const calendarId = id.getValue();
       const result = await this.ormRepository.delete(calendarId);
+      RequestEntityLoader.clear(LOADER_NAMESPACE, calendarId);
 
       if (result.affected === 0) {
         throw new InfrastructureException(
@@ -133,6 +170,11 @@ export class TypeOrmCalendarRepository implements CalendarRepository {
     }
   }
 
+  /**
+   * Disponibilités de plusieurs calendriers en deux requêtes ensemblistes :
+   * les calendriers, puis tous les rendez-vous qui chevauchent la période.
+   * L'intersection libre/occupé est calculée en mémoire.
+   */
   async findAvailableSlots(
     calendarIds: CalendarId[],
     startDate: Date,
@@ -145,33 +187,54 @@ export class TypeOrmCalendarRepository implements CalendarRepository {
     }[]
   > {
     try {
+      if (calendarIds.length === 0) {
+        return [];
+      }
+
+      const ids = calendarIds.map((id) => id.getValue());
+      const [calendars, busyByCalendar] = await Promise.all([
+        this.ormRepository.find({
+          select: ['id', 'settings', 'availability'],
+          where: { id: In(ids) },
+        }),
+        this.loadBusyRanges(ids, startDate, endDate),
+      ]);
+
+      const calendarsById = new Map(
+        calendars.map((calendar) => [calendar.id, calendar]),
+      );
+      const durationMs = duration * 60000;
       const results: { calendarId: CalendarId; slots: TimeSlot[] }[] = [];
 
       for (const calendarId of calendarIds) {
-        const calendar = await this.findById(calendarId);
+        const calendar = calendarsById.get(calendarId.getValue());
         if (!calendar) {
           continue;
         }
 
-        // Logique simple pour trouver les créneaux disponibles
-        const slots: TimeSlot[] = [];
-        const current = new Date(startDate);
-
-        while (current < endDate) {
-          const slotEnd = new Date(current.getTime() + duration * 60 * 1000);
-
-          // Vérifier si le créneau est dans les heures de travail
-          if (this.isWithinWorkingHours(calendar, current, slotEnd)) {
-            // Créer un TimeSlot - implémentation simplifiée
-            const timeSlot = TimeSlot.create(new Date(current), slotEnd);
-            slots.push(timeSlot);
-          }
-
-          // Avancer d'une heure
-          current.setHours(current.getHours() + 1);
-        }
+        const slotStep = calendar.settings?.default_slot_duration ?? 0;
+        const stepMinutes = slotStep > 0 ? slotStep : duration;
+        const timeline = BusyTimeline.fromRanges(
+          busyByCalendar.get(calendar.id) ?? [],
+        );
+        const stepMs = stepMinutes * 60000;
+        const freeRanges = timeline.freeSlots(
+          getCalendarOpenRanges(
+            calendar.availability,
+            startDate,
+            endDate,
+            stepMs,
+          ),
+          durationMs,
+          stepMs,
+        );
 
-        results.push({ calendarId, slots });
+        results.push({
+          calendarId,
+          slots: freeRanges.map((range) =>
+            TimeSlot.create(new Date(range.startMs), new Date(range.endMs)),
+          ),
+        });
       }
 
       return results;
@@ -183,15 +246,65 @@ export class TypeOrmCalendarRepository implements CalendarRepository {
     }
   }
 
+  async findFreeBusy(
+    calendarIds: CalendarId[],
+    startDate: Date,
+    endDate: Date,
+  ): Promise<CalendarFreeBusy[]> {
+    try {
+      if (calendarIds.length === 0) {
+        return [];
+      }
+
+      const ids = calendarIds.map((id) => id.getValue());
+      const [calendars, busyByCalendar] = await Promise.all([
+        this.ormRepository.find({
+          select: ['id', 'settings', 'availability'],
+          where: { id: In(ids) },
+        }),
+        this.loadBusyRanges(ids, startDate, endDate),
+      ]);
+
+      return calendars.map((calendar) => {
+        const slotStep = calendar.settings?.default_slot_duration ?? 0;
+        return {
+          calendarId: CalendarId.create(calendar.id),
+          slotStepMinutes: slotStep > 0 ? slotStep : null,
+          openRanges: getCalendarOpenRanges(
+            calendar.availability,
+            startDate,
+            endDate,
+            FREE_BUSY_STEP_MS,
+          ),
+          busyRanges: busyByCalendar.get(calendar.id) ?? [],
+        };
+      });
+    } catch (error) {
+      throw new InfrastructureException(
+        `Failed to find free/busy data: ${error instanceof Error ? error.message : 'Unknown error'}`,
+        'CALENDAR_FIND_FREE_BUSY_ERROR',
+      );
+    }
+  }
+
   async getBookedSlots(
-    _calendarId: CalendarId,
-    _startDate: Date,
-    _endDate: Date,
+    calendarId: CalendarId,
+    startDate: Date,
+    endDate: Date,
   ): Promise<TimeSlot[]> {
     try {
-      // Pour l'instant, retourner un tableau vide
-      // À implémenter quand l'entité Appointment sera intégrée
-      return [];
+      const id = calendarId.getValue();
+      const busyByCalendar = await this.loadBusyRanges(
+        [id],
+        startDate,
+        endDate,
+      );
+
+      return (busyByCalendar.get(id) ?? [])
+        .sort((a, b) => a.startMs - b.startMs)
+        .map((range) =>
+          TimeSlot.create(new Date(range.startMs), new Date(range.endMs)),
+        );
     } catch (error) {
       throw new InfrastructureException(
         `Failed to get booked slots: ${error instanceof Error ? error.message : 'Unknown error'}`,
@@ -320,22 +433,59 @@ export class TypeOrmCalendarRepository implements CalendarRepository {
   }
 
   /**
-   * Vérifier si un créneau est dans les heures de travail
-   * Logique simplifiée - à améliorer selon les besoins métier
+   * Rendez-vous bloquants de la période, groupés par calendrier.
+   * Seules les colonnes utiles au calcul libre/occupé sont lues.
+   */
+  private async loadBusyRanges(
+    calendarIds: string[],
+    startDate: Date,
+    endDate: Date,
+  ): Promise<Map<string, BusyRange[]>> {
+    const rows: Array<{
+      calendar_id: string;
+      start_time: Date;
+      end_time: Date;
+    }> = await this.ormRepository.manager
+      .createQueryBuilder(AppointmentOrmEntity, 'appointment')
+      .select('appointment.calendar_id', 'calendar_id')
+      .addSelect('appointment.start_time', 'start_time')
+      .addSelect('appointment.end_time', 'end_time')
+      .where('appointment.calendar_id IN (:...calendarIds)', { calendarIds })
+      .andWhere('appointment.start_time < :endDate', { endDate })
+      .andWhere('appointment.end_time > :startDate', { startDate })
+      .andWhere('appointment.status NOT IN (:...statuses)', {
+        statuses: NON_BLOCKING_STATUSES,
+      })
+      .getRawMany();
+
+    const busyByCalendar = new Map<string, BusyRange[]>();
+    for (const row of rows) {
+      let ranges = busyByCalendar.get(row.calendar_id);
+      if (!ranges) {
+        ranges = [];
+        busyByCalendar.set(row.calendar_id, ranges);
+      }
+      ranges.push({
+        startMs: new Date(row.start_time).getTime(),
+        endMs: new Date(row.end_time).getTime(),
+      });
+    }
+    return busyByCalendar;
+  }
+
+  /**
+   * 🧺 Chargement groupé pour RequestEntityLoader (WHERE id IN (...))
    */
-  private isWithinWorkingHours(
-    _calendar: Calendar,
-    start: Date,
-    end: Date,
-  ): boolean {
-    const startHour = start.getHours();
-    const endHour = end.getHours();
-
-    // Horaires par défaut : 9h-17h en semaine
-    const workingStart = 9;
-    const workingEnd = 17;
-    const isWeekday = start.getDay() >= 1 && start.getDay() <= 5;
-
-    return isWeekday && startHour >= workingStart && endHour <= workingEnd;
+  private async findManyByIds(ids: string[]): Promise<Map<string, Calendar>> {
+    const ormEntities = await this.ormRepository.find({
+      where: { id: In(ids) },
+    });
+
+    return new Map(
+      ormEntities.map((entity) => [
+        entity.id,
+        CalendarOrmMapper.toDomainPlainObject(entity),
+      ]),
+    );
   }
 }
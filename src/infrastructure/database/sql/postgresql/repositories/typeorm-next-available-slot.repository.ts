@@ -0,0 +1,245 @@
+import { Injectable } from '@nestjs/common';
+import { InjectRepository } from '@nestjs/typeorm';
+import { Brackets, In, Not, Repository } from 'typeorm';
+import {
+  NextAvailableSlot,
+  NextAvailableSlotRefreshKey,
+  NextAvailableSlotRepository,
+} from '../../../../../domain/repositories/next-available-slot.repository.interface';
+import { BusinessId } from '../../../../../domain/value-objects/business-id.value-object';
+import { CalendarId } from '../../../../../domain/value-objects/calendar-id.value-object';
+import { ServiceId } from '../../../../../domain/value-objects/service-id.value-object';
+import { NextAvailableSlotOrmEntity } from '../entities/next-available-slot-orm.entity';
+
+/**
+ * ⏭️ NEXT AVAILABLE SLOT REPOSITORY - TypeORM Implementation
+ * ✅ Clean Architecture compliant - Infrastructure layer
+ * ✅ Lecture des listings en une requête DISTINCT ON indexée
+ * ✅ File de recalcul portée par la colonne stale_since
+ */
+@Injectable()
+export class TypeOrmNextAvailableSlotRepository
+  implements NextAvailableSlotRepository
+{
+  constructor(
+    @InjectRepository(NextAvailableSlotOrmEntity)
+    private readonly repository: Repository<NextAvailableSlotOrmEntity>,
+  ) {}
+
+  async findEarliestByBusinessIds(
+    businessIds: BusinessId[],
+    after: Date,
+    serviceId?: ServiceId,
+  ): Promise<NextAvailableSlot[]> {
+    if (businessIds.length === 0) {
+      return [];
+    }
+
+    const queryBuilder = this.repository
+      .createQueryBuilder('slot')
+      .distinctOn(['slot.businessId'])
+      .where('slot.businessId IN (:...businessIds)', {
+        businessIds: businessIds.map((id) => id.getValue()),
+      })
+      .andWhere('slot.startTime > :after', { after });
+
+    if (serviceId) {
+      queryBuilder.andWhere('slot.serviceId = :serviceId', {
+        serviceId: serviceId.getValue(),
+      });
+    }
+
+    // DISTINCT ON garde la première ligne de chaque entreprise : la plus tôt
+    const rows = await queryBuilder
+      .orderBy('slot.businessId', 'ASC')
+      .addOrderBy('slot.startTime', 'ASC')
+      .getMany();
+
+    return rows.map((row) => this.toDomain(row));
+  }
+
+  async findEarliest(
+    businessId: BusinessId,
+    serviceId: ServiceId,
+    after: Date,
+  ): Promise<NextAvailableSlot | null> {
+    const row = await this.repository
+      .createQueryBuilder('slot')
+      .where('slot.businessId = :businessId', {
+        businessId: businessId.getValue(),
+      })
+      .andWhere('slot.serviceId = :serviceId', {
+        serviceId: serviceId.getValue(),
+      })
+      .andWhere('slot.startTime > :after', { after })
+      .orderBy('slot.startTime', 'ASC')
+      .getOne();
+
+    return row ? this.toDomain(row) : null;
+  }
+
+  async replace(
+    key: NextAvailableSlotRefreshKey,
+    entries: NextAvailableSlot[],
+    startedAt: Date,
+  ): Promise<void> {
+    const businessId = key.businessId.getValue();
+    const serviceId = key.serviceId.getValue();
+    const calendarIds = entries.map((entry) => entry.calendarId.getValue());
+
+    await this.repository.manager.transaction(async (manager) => {
+      const repository = manager.getRepository(NextAvailableSlotOrmEntity);
+
+      if (entries.length > 0) {
+        await repository
+          .createQueryBuilder()
+          .insert()
+          .values(
+            entries.map((entry) => ({
+              businessId,
+              serviceId,
+              calendarId: entry.calendarId.getValue(),
+              startTime: entry.startTime,
+              endTime: entry.endTime,
+              computedAt: entry.computedAt,
+            })),
+          )
+          .orUpdate(
+            ['start_time', 'end_time', 'computed_at'],
+            ['business_id', 'service_id', 'calendar_id'],
+          )
+          .execute();
+      }
+
+      // Calendriers supprimés depuis le dernier calcul
+      await repository.delete({
+        businessId,
+        serviceId,
+        ...(calendarIds.length > 0
+          ? { calendarId: Not(In(calendarIds)) }
+          : {}),
+      });
+
+      // Une réservation pendant le calcul a pu repositionner stale_since :
+      // la ligne reste alors à recalculer
+      await repository
+        .createQueryBuilder()
+        .update()
+        .set({ staleSince: null })
+        .where('business_id = :businessId', { businessId })
+        .andWhere('service_id = :serviceId', { serviceId })
+        .andWhere('stale_since <= :startedAt', { startedAt })
+        .execute();
+    });
+  }
+
+  async enqueue(
+    businessId: BusinessId,
+    serviceIds: ServiceId[],
+    calendarIds: CalendarId[],
+  ): Promise<void> {
+    if (serviceIds.length === 0 || calendarIds.length === 0) {
+      return;
+    }
+
+    const staleSince = new Date();
+    const values = serviceIds.flatMap((serviceId) =>
+      calendarIds.map((calendarId) => ({
+        businessId: businessId.getValue(),
+        serviceId: serviceId.getValue(),
+        calendarId: calendarId.getValue(),
+        staleSince,
+      })),
+    );
+
+    await this.repository
+      .createQueryBuilder()
+      .insert()
+      .values(values)
+      .orUpdate(['stale_since'], ['business_id', 'service_id', 'calendar_id'])
+      .execute();
+  }
+
+  async markStale(
+    businessId: BusinessId,
+    calendarId?: CalendarId,
+  ): Promise<number> {
+    const result = await this.repository.update(
+      {
+        businessId: businessId.getValue(),
+        ...(calendarId ? { calendarId: calendarId.getValue() } : {}),
+      },
+      { staleSince: new Date() },
+    );
+
+    return result.affected ?? 0;
+  }
+
+  async findRefreshKeys(
+    limit: number,
+    now: Date,
+    retryBefore: Date,
+  ): Promise<NextAvailableSlotRefreshKey[]> {
+    const rows: Array<{ business_id: string; service_id: string }> =
+      await this.repository
+        .createQueryBuilder('slot')
+        .select('slot.businessId', 'business_id')
+        .addSelect('slot.serviceId', 'service_id')
+        .where(
+          new Brackets((where) => {
+            where
+              .where('slot.staleSince IS NOT NULL')
+              .orWhere('slot.startTime <= :now', { now })
+              .orWhere(
+                'slot.startTime IS NULL AND slot.computedAt < :retryBefore',
+                { retryBefore },
+              );
+          }),
+        )
+        .groupBy('slot.businessId')
+        .addGroupBy('slot.serviceId')
+        .limit(limit)
+        .getRawMany();
+
+    return rows.map((row) => ({
+      businessId: BusinessId.create(row.business_id),
+      serviceId: ServiceId.create(row.service_id),
+    }));
+  }
+
+  async findUnindexedKeys(
+    limit: number,
+  ): Promise<NextAvailableSlotRefreshKey[]> {
+    const rows: Array<{ business_id: string; service_id: string }> =
+      await this.repository.manager
+        .createQueryBuilder()
+        .select('service.business_id', 'business_id')
+        .addSelect('service.id', 'service_id')
+        .from('services', 'service')
+        .where('service.status = :status', { status: 'ACTIVE' })
+        .andWhere(
+          'EXISTS (SELECT 1 FROM calendars calendar WHERE calendar.business_id = service.business_id)',
+        )
+        .andWhere(
+          'NOT EXISTS (SELECT 1 FROM next_available_slots slot WHERE slot.service_id = service.id)',
+        )
+        .limit(limit)
+        .getRawMany();
+
+    return rows.map((row) => ({
+      businessId: BusinessId.create(row.business_id),
+      serviceId: ServiceId.create(row.service_id),
+    }));
+  }
+
+  private toDomain(row: NextAvailableSlotOrmEntity): NextAvailableSlot {
+    return {
+      businessId: BusinessId.create(row.businessId),
+      serviceId: ServiceId.create(row.serviceId),
+      calendarId: CalendarId.create(row.calendarId),
+      startTime: row.startTime,
+      endTime: row.endTime,
+      computedAt: row.computedAt ?? new Date(0),
+    };
+  }
+}
@@ -0,0 +1,89 @@
+import { Injectable } from '@nestjs/common';
+import { InjectRepository } from '@nestjs/typeorm';
+import { Brackets, In, Repository } from 'typeorm';
+import {
+  OutboxRepository,
+  PendingOutboxMessage,
+} from '../../../../../domain/repositories/outbox.repository.interface';
+import { OutboxMessageOrmEntity } from '../entities/outbox-message-orm.entity';
+
+/**
+ * 📤 OUTBOX REPOSITORY - TypeORM Implementation
+ * ✅ Clean Architecture compliant - Infrastructure layer
+ * ✅ Réservation par bail : SELECT ... FOR UPDATE SKIP LOCKED, plusieurs
+ *    workers se partagent la file sans se bloquer
+ */
+@Injectable()
+export class TypeOrmOutboxRepository implements OutboxRepository {
+  constructor(
+    @InjectRepository(OutboxMessageOrmEntity)
+    private readonly repository: Repository<OutboxMessageOrmEntity>,
+  ) {}
+
+  async claimBatch(
+    limit: number,
+    leaseMs: number,
+  ): Promise<PendingOutboxMessage[]> {
+    return this.repository.manager.transaction(async (manager) => {
+      const repository = manager.getRepository(OutboxMessageOrmEntity);
+      const now = new Date();
+
+      const rows = await repository
+        .createQueryBuilder('message')
+        .where('message.failedAt IS NULL')
+        .andWhere('message.availableAt <= :now', { now })
+        .andWhere(
+          new Brackets((qb) =>
+            qb
+              .where('message.lockedUntil IS NULL')
+              .orWhere('message.lockedUntil < :now', { now }),
+          ),
+        )
+        .orderBy('message.availableAt', 'ASC')
+        .limit(limit)
+        .setLock('pessimistic_write')
+        .setOnLocked('skip_locked')
+        .getMany();
+
+      if (rows.length === 0) {
+        return [];
+      }
+
+      await repository
+        .createQueryBuilder()
+        .update()
+        .set({
+          lockedUntil: new Date(now.getTime() + leaseMs),
+          attempts: () => 'attempts + 1',
+        })
+        .whereInIds(rows.map((row) => row.id))
+        .execute();
+
+      return rows.map((row) => ({
+        id: row.id,
+        type: row.type,
+        aggregateId: row.aggregateId,
+        payload: row.payload,
+        attempts: row.attempts + 1,
+        createdAt: row.createdAt,
+      }));
+    });
+  }
+
+  async complete(ids: string[]): Promise<void> {
+    if (ids.length === 0) {
+      return;
+    }
+
+    await this.repository.delete({ id: In(ids) });
+  }
+
+  async fail(id: string, error: string, retryAt: Date | null): Promise<void> {
+    await this.repository.update(
+      { id },
+      retryAt
+        ? { lockedUntil: null, availableAt: retryAt, lastError: error }
+        : { lockedUntil: null, failedAt: new Date(), lastError: error },
+    );
+  }
+}
@@ -12,7 +12,7 @@
 
 import { Injectable } from '@nestjs/common';
 import { InjectRepository } from '@nestjs/typeorm';
-import { Repository } from 'typeorm';
+import { In, Repository } from 'typeorm';
 import {
   Service,
   ServiceStatus,
@@ -23,6 +23,9 @@ import { ServiceId } from '../../../../../domain/value-objects/service-id.value-
 import { UserId } from '../../../../../domain/value-objects/user-id.value-object';
 import { ServiceMapper } from '../../../../mappers/domain-mappers';
 import { ServiceOrmEntity } from '../entities/service-orm.entity';
+import { RequestEntityLoader } from '../utils/request-entity-loader';
+
+const LOADER_NAMESPACE = 'service';
 
 @Injectable()
 export class TypeOrmServiceRepository implements ServiceRepository {
@@ -32,11 +35,9 @@ export class TypeOrmServiceRepository implements ServiceRepository {
   ) {}
 
   async findById(id: ServiceId): Promise<Service | null> {
-    const ormEntity = await this.repository.findOne({
-      where: { id: id.getValue() },
-    });
-
-    return ormEntity ? ServiceMapper.fromTypeOrmEntity(ormEntity) : null;
+    return RequestEntityLoader.load(LOADER_NAMESPACE, id.getValue(), (ids) =>
+      this.findManyByIds(ids),
+    );
   }
 
   async findByBusinessId(businessId: BusinessId): Promise<Service[]> {
@@ -185,10 +186,12 @@ export class TypeOrmServiceRepository implements ServiceRepository {
   async save(service: Service): Promise<void> {
     const ormEntity = ServiceMapper.toTypeOrmEntity(service);
     await this.repository.save(ormEntity);
+    RequestEntityLoader.clear(LOADER_NAMESPACE, ormEntity.id);
   }
 
   async delete(id: ServiceId): Promise<void> {
     await this.repository.delete({ id: id.getValue() });
+    RequestEntityLoader.clear(LOADER_NAMESPACE, id.getValue());
   }
 
   async findByName(
@@ -309,4 +312,18 @@ export class TypeOrmServiceRepository implements ServiceRepository {
       averageDuration: parseFloat(avgDurationResult?.avgDuration || '0'),
     };
   }
+
+  /**
+   * 🧺 Chargement groupé pour RequestEntityLoader (WHERE id IN (...))
+   */
+  private async findManyByIds(ids: string[]): Promise<Map<string, Service>> {
+    const ormEntities = await this.repository.find({ where: { id: In(ids) } });
+
+    return new Map(
+      ormEntities.map((entity) => [
+        entity.id,
+        ServiceMapper.fromTypeOrmEntity(entity),
+      ]),
+    );
+  }
 }
@@ -10,34 +10,40 @@
  * - Convertit entre entités Domain et ORM
  */
 
-import { Injectable } from '@nestjs/common';
+import { Inject, Injectable, Optional } from '@nestjs/common';
 import { InjectRepository } from '@nestjs/typeorm';
-import { Repository } from 'typeorm';
+import { In, Repository } from 'typeorm';
 import {
   Staff,
   StaffStatus,
 } from '../../../../../domain/entities/staff.entity';
 import { StaffRepository } from '../../../../../domain/repositories/staff.repository.interface';
+import { StaffSkillIndex } from '../../../../../domain/services/staff-skill-index.service';
 import { BusinessId } from '../../../../../domain/value-objects/business-id.value-object';
 import { Email } from '../../../../../domain/value-objects/email.value-object';
 import { UserId } from '../../../../../domain/value-objects/user-id.value-object';
+import { TOKENS } from '../../../../../shared/constants/injection-tokens';
 import { StaffRole } from '../../../../../shared/enums/staff-role.enum';
 import { StaffMapper } from '../../../../mappers/domain-mappers';
 import { StaffOrmEntity } from '../entities/staff-orm.entity';
+import { RequestEntityLoader } from '../utils/request-entity-loader';
+
+const LOADER_NAMESPACE = 'staff';
 
 @Injectable()
 export class TypeOrmStaffRepository implements StaffRepository {
   constructor(
     @InjectRepository(StaffOrmEntity)
     private readonly repository: Repository<StaffOrmEntity>,
+    @Optional()
+    @Inject(TOKENS.STAFF_SKILL_INDEX)
+    private readonly skillIndex?: StaffSkillIndex,
   ) {}
 
   async findById(id: UserId): Promise<Staff | null> {
-    const ormEntity = await this.repository.findOne({
-      where: { id: id.getValue() },
-    });
-
-    return ormEntity ? StaffMapper.fromTypeOrmEntity(ormEntity) : null;
+    return RequestEntityLoader.load(LOADER_NAMESPACE, id.getValue(), (ids) =>
+      this.findManyByIds(ids),
+    );
   }
 
   async findByEmail(email: Email): Promise<Staff | null> {
@@ -57,6 +63,31 @@ export class TypeOrmStaffRepository implements StaffRepository {
     return ormEntities.map((entity) => StaffMapper.fromTypeOrmEntity(entity));
   }
 
+  async findByIds(businessId: BusinessId, ids: UserId[]): Promise<Staff[]> {
+    if (ids.length === 0) {
+      return [];
+    }
+
+    const ormEntities = await this.repository.find({
+      where: {
+        business_id: businessId.getValue(),
+        id: In(ids.map((id) => id.getValue())),
+      },
+      order: { created_at: 'DESC' },
+    });
+
+    return ormEntities.map((entity) => StaffMapper.fromTypeOrmEntity(entity));
+  }
+
+  async findWithSkills(): Promise<Staff[]> {
+    const ormEntities = await this.repository
+      .createQueryBuilder('staff')
+      .where('staff.skills IS NOT NULL')
+      .getMany();
+
+    return ormEntities.map((entity) => StaffMapper.fromTypeOrmEntity(entity));
+  }
+
   async findByBusinessIdAndRole(
     businessId: BusinessId,
     role: string,
@@ -154,10 +185,20 @@ export class TypeOrmStaffRepository implements StaffRepository {
   async save(staff: Staff): Promise<void> {
     const ormEntity = StaffMapper.toTypeOrmEntity(staff);
     await this.repository.save(ormEntity);
+    RequestEntityLoader.clear(LOADER_NAMESPACE, ormEntity.id);
+
+    // 🎯 Index des compétences maintenu à chaque écriture
+    if (staff.skills) {
+      this.skillIndex?.setStaffSkills(ormEntity.id, staff.skills);
+    } else {
+      this.skillIndex?.removeStaff(ormEntity.id);
+    }
   }
 
   async delete(id: UserId): Promise<void> {
     await this.repository.delete({ id: id.getValue() });
+    RequestEntityLoader.clear(LOADER_NAMESPACE, id.getValue());
+    this.skillIndex?.removeStaff(id.getValue());
   }
 
   async existsByEmail(email: Email, excludeId?: UserId): Promise<boolean> {
@@ -221,4 +262,18 @@ export class TypeOrmStaffRepository implements StaffRepository {
       averageExperience,
     };
   }
+
+  /**
+   * 🧺 Chargement groupé pour RequestEntityLoader (WHERE id IN (...))
+   */
+  private async findManyByIds(ids: string[]): Promise<Map<string, Staff>> {
+    const ormEntities = await this.repository.find({ where: { id: In(ids) } });
+
+    return new Map(
+      ormEntities.map((entity) => [
+        entity.id,
+        StaffMapper.fromTypeOrmEntity(entity),
+      ]),
+    );
+  }
 }
@@ -0,0 +1,110 @@
+/**
+ * 🗓️ Calendar Open Ranges
+ * ✅ Clean Architecture - Infrastructure Layer
+ * ✅ Horaires JSONB d'un calendrier compilés en plages epoch ms
+ */
+
+import { BusyRange } from '../../../../../domain/services/slot-availability.service';
+import { CalendarOrmEntity } from '../entities/calendar-orm.entity';
+
+/**
+ * Plages d'ouverture du calendrier sur la période (pauses et exceptions
+ * prises en compte), triées, en millisecondes epoch. Une plage entamée
+ * reprend au prochain pas de la grille pour garder des horaires ronds.
+ */
+export function getCalendarOpenRanges(
+  availability: CalendarOrmEntity['availability'] | undefined,
+  startDate: Date,
+  endDate: Date,
+  stepMs: number,
+): BusyRange[] {
+  // Horaires compilés une fois en minutes par jour de semaine
+  const weekly: number[][] = Array.from({ length: 7 }, () => []);
+  for (const day of availability?.working_hours ?? []) {
+    if (day.is_working && day.start_time && day.end_time) {
+      weekly[day.day_of_week] = toMinuteRanges(
+        day.start_time,
+        day.end_time,
+        day.breaks ?? [],
+      );
+    }
+  }
+
+  const exceptions = new Map<string, number[]>();
+  for (const exception of availability?.exceptions ?? []) {
+    exceptions.set(
+      exception.date.slice(0, 10),
+      exception.is_available && exception.start_time && exception.end_time
+        ? toMinuteRanges(exception.start_time, exception.end_time, [])
+        : [],
+    );
+  }
+
+  const startMs = startDate.getTime();
+  const endMs = endDate.getTime();
+  const ranges: BusyRange[] = [];
+  const day = new Date(startDate);
+  day.setHours(0, 0, 0, 0);
+
+  while (day.getTime() < endMs) {
+    const year = day.getFullYear();
+    const month = day.getMonth();
+    const date = day.getDate();
+    const key = `${year}-${String(month + 1).padStart(2, '0')}-${String(date).padStart(2, '0')}`;
+    const minutes = exceptions.get(key) ?? weekly[day.getDay()];
+
+    for (let i = 0; i < minutes.length; i += 2) {
+      const rangeStart = new Date(year, month, date, 0, minutes[i]);
+      const rangeEnd = new Date(year, month, date, 0, minutes[i + 1]);
+      let openMs = rangeStart.getTime();
+      if (openMs < startMs) {
+        openMs += Math.ceil((startMs - openMs) / stepMs) * stepMs;
+      }
+      const closeMs = Math.min(rangeEnd.getTime(), endMs);
+      if (openMs < closeMs) {
+        ranges.push({ startMs: openMs, endMs: closeMs });
+      }
+    }
+
+    day.setDate(date + 1);
+  }
+
+  return ranges;
+}
+
+/**
+ * [début, fin] moins les pauses, à plat : [début0, fin0, début1, fin1, ...]
+ */
+function toMinuteRanges(
+  start: string,
+  end: string,
+  breaks: Array<{ start_time: string; end_time: string }>,
+): number[] {
+  const toMinutes = (time: string): number => {
+    const [hours, minutes] = time.split(':').map(Number);
+    return hours * 60 + minutes;
+  };
+
+  const ranges: number[] = [];
+  let current = toMinutes(start);
+  const close = toMinutes(end);
+
+  const sortedBreaks = breaks
+    .map((breakTime) => [
+      toMinutes(breakTime.start_time),
+      toMinutes(breakTime.end_time),
+    ])
+    .sort((a, b) => a[0] - b[0]);
+
+  for (const [breakStart, breakEnd] of sortedBreaks) {
+    if (breakStart > current) {
+      ranges.push(current, Math.min(breakStart, close));
+    }
+    current = Math.max(current, breakEnd);
+  }
+  if (current < close) {
+    ranges.push(current, close);
+  }
+
+  return ranges;
+}
@@ -0,0 +1,146 @@
+/**
+ * 🧺 Request Entity Loader - Infrastructure Layer
+ * ✅ Regroupement et mémoïsation des findById pour une requête HTTP
+ *
+ * Une même requête charge souvent plusieurs fois les mêmes entités :
+ * garde de permissions, use case, services appelés par le use case. Dans
+ * une portée de requête (AsyncLocalStorage) :
+ * - les findById émis dans le même tick sont regroupés en un seul
+ *   WHERE id IN (...) par type d'entité
+ * - le résultat est mémoïsé jusqu'à la fin de la requête
+ * Hors portée (workers, scripts, tests), chaque appel charge directement.
+ * Les écritures d'un repository doivent appeler clear() sur l'entité.
+ *
+ * ⚠️ Tous les appelants d'une requête reçoivent la même instance d'agrégat.
+ * Une modification faite sans save() (validation interrompue, exception)
+ * reste visible des lectures suivantes de la même requête : un use case qui
+ * modifie un agrégat doit le sauvegarder ou abandonner la requête.
+ */
+
+import { AsyncLocalStorage, AsyncResource } from 'async_hooks';
+import type { FastifyInstance, FastifyRequest } from 'fastify';
+
+export type BatchLoadFn<V> = (ids: string[]) => Promise<Map<string, V>>;
+
+interface PendingLoad<V> {
+  resolve: (value: V | null) => void;
+  reject: (error: unknown) => void;
+}
+
+interface LoaderNamespace<V> {
+  cache: Map<string, Promise<V | null>>;
+  pending: Map<string, PendingLoad<V>[]>;
+}
+
+type LoaderScope = Map<string, LoaderNamespace<unknown>>;
+
+export class RequestEntityLoader {
+  private static readonly storage = new AsyncLocalStorage<LoaderScope>();
+
+  /**
+   * Exécuter fn dans une nouvelle portée (une par requête HTTP)
+   */
+  static run<T>(fn: () => T): T {
+    return this.storage.run(new Map(), fn);
+  }
+
+  /**
+   * Charger une entité par identifiant, regroupée avec les autres
+   * chargements du même namespace émis dans le même tick
+   */
+  static load<V>(
+    namespace: string,
+    id: string,
+    batchLoad: BatchLoadFn<V>,
+  ): Promise<V | null> {
+    const scope = this.storage.getStore();
+    if (!scope) {
+      return batchLoad([id]).then((entities) => entities.get(id) ?? null);
+    }
+
+    const state = this.getNamespace<V>(scope, namespace);
+    const cached = state.cache.get(id);
+    if (cached) return cached;
+
+    const promise = new Promise<V | null>((resolve, reject) => {
+      const waiting = state.pending.get(id);
+      if (waiting) {
+        waiting.push({ resolve, reject });
+        return;
+      }
+      if (state.pending.size === 0) {
+        // Premier chargement du tick : un seul lot pour tout le tick
+        process.nextTick(() => this.flush(state, batchLoad));
+      }
+      state.pending.set(id, [{ resolve, reject }]);
+    });
+    state.cache.set(id, promise);
+    return promise;
+  }
+
+  /**
+   * Oublier une entité mémoïsée (après écriture ou suppression)
+   */
+  static clear(namespace: string, id: string): void {
+    this.storage.getStore()?.get(namespace)?.cache.delete(id);
+  }
+
+  private static getNamespace<V>(
+    scope: LoaderScope,
+    namespace: string,
+  ): LoaderNamespace<V> {
+    let state = scope.get(namespace) as LoaderNamespace<V> | undefined;
+    if (!state) {
+      state = { cache: new Map(), pending: new Map() };
+      scope.set(namespace, state as LoaderNamespace<unknown>);
+    }
+    return state;
+  }
+
+  private static async flush<V>(
+    state: LoaderNamespace<V>,
+    batchLoad: BatchLoadFn<V>,
+  ): Promise<void> {
+    const batch = new Map(state.pending);
+    state.pending.clear();
+
+    try {
+      const entities = await batchLoad([...batch.keys()]);
+      for (const [id, waiting] of batch) {
+        const entity = entities.get(id) ?? null;
+        waiting.forEach(({ resolve }) => resolve(entity));
+      }
+    } catch (error) {
+      for (const [id, waiting] of batch) {
+        // Un échec n'est pas mémoïsé : un appel suivant recharge
+        state.cache.delete(id);
+        waiting.forEach(({ reject }) => reject(error));
+      }
+    }
+  }
+}
+
+/**
+ * Ouvre une portée par requête HTTP. Fastify lit le corps hors du contexte
+ * async de onRequest : la portée est capturée dans une AsyncResource et
+ * restaurée en preValidation, avant guards, pipes et handlers.
+ */
+export function registerRequestEntityScope(fastify: FastifyInstance): void {
+  const scopes = new WeakMap<FastifyRequest, AsyncResource>();
+
+  fastify.addHook('onRequest', (request, _reply, done) => {
+    RequestEntityLoader.run(() => {
+      scopes.set(request, new AsyncResource('RequestEntityLoader'));
+      done();
+    });
+  });
+
+  fastify.addHook('preValidation', (request, _reply, done) => {
+    const scope = scopes.get(request);
+    if (scope) {
+      scope.runInAsyncScope(done);
+    } else {
+      done();
+    }
+  });
+}
@@ -12,11 +12,14 @@ import { SimplePermissionService } from '../../application/services/simple-permi
 import { Module } from '@nestjs/common';
 import { TypeOrmModule, getRepositoryToken } from '@nestjs/typeorm';
 
+import { StaffSkillIndex } from '../../domain/services/staff-skill-index.service';
 import { TOKENS } from '../../shared/constants/injection-tokens';
 import { PinoLoggerModule } from '../logging/pino-logger.module';
 
 // Entities TypeORM
 import { AppointmentOrmEntity } from './sql/postgresql/entities/appointment-orm.entity';
+import { NextAvailableSlotOrmEntity } from './sql/postgresql/entities/next-available-slot-orm.entity';
+import { OutboxMessageOrmEntity } from './sql/postgresql/entities/outbox-message-orm.entity';
 import { BusinessOrmEntity } from './sql/postgresql/entities/business-orm.entity';
 import { BusinessSectorOrmEntity } from './sql/postgresql/entities/business-sector-orm.entity';
 import { CalendarOrmEntity } from './sql/postgresql/entities/calendar-orm.entity';
@@ -43,6 +46,8 @@ import { UserPermissionOrmEntity } from './sql/postgresql/entities/user-permissi
 import { PasswordResetCodeRepository } from './sql/postgresql/repositories/password-reset-code.repository';
 import { RefreshTokenOrmRepository } from './sql/postgresql/repositories/refresh-token-orm.repository';
 import { TypeOrmAppointmentRepository } from './sql/postgresql/repositories/typeorm-appointment.repository';
+import { TypeOrmNextAvailableSlotRepository } from './sql/postgresql/repositories/typeorm-next-available-slot.repository';
+import { TypeOrmOutboxRepository } from './sql/postgresql/repositories/typeorm-outbox.repository';
 import { TypeOrmBusinessRepository } from './sql/postgresql/repositories/typeorm-business.repository';
 import { TypeOrmCalendarTypeRepository } from './sql/postgresql/repositories/typeorm-calendar-type.repository';
 import { TypeOrmCalendarRepository } from './sql/postgresql/repositories/typeorm-calendar.repository';
@@ -85,6 +90,8 @@ import { SimplePermissionService } from '../../application/services/simple-permi
       RefreshTokenOrmEntity,
       PasswordResetCodeEntity,
       AppointmentOrmEntity,
+      NextAvailableSlotOrmEntity, // ✅ Next available slot index
+      OutboxMessageOrmEntity, // ✅ Transactional outbox
       BusinessOrmEntity,
       BusinessSectorOrmEntity, // Décommenté pour activer la relation
       PermissionOrmEntity,
@@ -162,6 +169,12 @@ import { SimplePermissionService } from '../../application/services/simple-permi
       useClass: TypeOrmStaffRepository,
     },
 
+    // 🎯 Index des compétences du staff (partagé repository / use cases)
+    {
+      provide: TOKENS.STAFF_SKILL_INDEX,
+      useFactory: () => new StaffSkillIndex(),
+    },
+
     // Calendar Repository
     {
       provide: TOKENS.CALENDAR_REPOSITORY,
@@ -180,6 +193,18 @@ import { SimplePermissionService } from '../../application/services/simple-permi
       useClass: TypeOrmAppointmentRepository,
     },
 
+    // Next Available Slot Index Repository
+    {
+      provide: TOKENS.NEXT_AVAILABLE_SLOT_REPOSITORY,
+      useClass: TypeOrmNextAvailableSlotRepository,
+    },
+
+    // Outbox Repository (effets de bord post-réservation)
+    {
+      provide: TOKENS.OUTBOX_REPOSITORY,
+      useClass: TypeOrmOutboxRepository,
+    },
+
     // Prospect Repository (✅ Prospect entity for sales organization)
     {
       provide: TOKENS.PROSPECT_REPOSITORY,
@@ -260,9 +285,12 @@ import { SimplePermissionService } from '../../application/services/simple-permi
     TOKENS.SERVICE_TYPE_REPOSITORY, // ✅ ServiceType repository
     TOKENS.SKILL_REPOSITORY, // ✅ Skill repository
     TOKENS.STAFF_REPOSITORY,
+    TOKENS.STAFF_SKILL_INDEX,
     TOKENS.CALENDAR_REPOSITORY,
     TOKENS.CALENDAR_TYPE_REPOSITORY,
     TOKENS.APPOINTMENT_REPOSITORY,
+    TOKENS.NEXT_AVAILABLE_SLOT_REPOSITORY,
+    TOKENS.OUTBOX_REPOSITORY,
     TOKENS.PROSPECT_REPOSITORY, // ✅ Prospect repository for sales organization
     TOKENS.PROFESSIONAL_ROLE_REPOSITORY, // ✅ Professional Role repository
     TOKENS.PERMISSION_REPOSITORY,
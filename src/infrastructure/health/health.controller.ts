@@ -1,4 +1,5 @@
-import { Controller, Get, Logger } from '@nestjs/common';
+import type { AvailableSlotsCache } from '@application/services/available-slots-cache.service';
+import { Controller, Get, Inject, Logger } from '@nestjs/common';
 import { ConfigService } from '@nestjs/config';
 import { ApiOperation, ApiResponse, ApiTags } from '@nestjs/swagger';
 import {
@@ -7,6 +8,7 @@ import {
   MemoryHealthIndicator,
   TypeOrmHealthIndicator,
 } from '@nestjs/terminus';
+import { TOKENS } from '@shared/constants/injection-tokens';
 import { Public } from '../../presentation/security/decorators/public.decorator';
 
 /**
@@ -17,6 +19,7 @@ import { Public } from '../../presentation/security/decorators/public.decorator'
  * - Base de données MongoDB
  * - Mémoire système
  * - Informations système
+ * - Statistiques des caches applicatifs (taux de succès, évictions)
  */
 @ApiTags('🏥 Health')
 @Controller('health')
@@ -28,6 +31,8 @@ export class HealthController {
     private readonly db: TypeOrmHealthIndicator,
     private readonly memory: MemoryHealthIndicator,
     private readonly configService: ConfigService,
+    @Inject(TOKENS.AVAILABLE_SLOTS_CACHE)
+    private readonly slotsCache: AvailableSlotsCache,
   ) {}
 
   /**
@@ -106,6 +111,9 @@ export class HealthController {
         services: {
           database: dbCheck,
         },
+        caches: {
+          availableSlots: this.slotsCache.stats(),
+        },
         system: {
           memory: memoryInfo,
           node: systemInfo,
@@ -124,6 +132,19 @@ export class HealthController {
     }
   }
 
+  /**
+   * 🗃️ Statistiques du cache de créneaux de cette instance
+   */
+  @Get('cache')
+  @ApiOperation({ summary: 'Available slots cache metrics' })
+  getCacheMetrics() {
+    return {
+      timestamp: new Date().toISOString(),
+      pid: process.pid,
+      availableSlots: this.slotsCache.stats(),
+    };
+  }
+
   /**
    * ⚡ Readiness Probe (pour Kubernetes)
    */
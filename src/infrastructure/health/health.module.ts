@@ -1,6 +1,7 @@
 import { Module } from '@nestjs/common';
 import { TerminusModule } from '@nestjs/terminus';
 import { ConfigModule } from '@nestjs/config';
+import { CacheModule } from '../cache/cache.module';
 import { HealthController } from './health.controller';
 
 /**
@@ -15,6 +16,8 @@ import { HealthController } from './health.controller';
     TerminusModule,
     // Module de configuration
     ConfigModule,
+    // Caches applicatifs dont les statistiques sont exposées
+    CacheModule,
   ],
   controllers: [HealthController],
   providers: [],
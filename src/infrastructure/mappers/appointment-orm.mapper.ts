@@ -7,7 +7,7 @@ export class AppointmentOrmMapper {
     const orm = new AppointmentOrmEntity();
     orm.id = domain.getId().getValue();
     orm.business_id = domain.getBusinessId().getValue();
-    // orm.calendar_id = domain.getCalendarId()?.getValue(); // TODO: Vérifier si getCalendarId existe
+    orm.calendar_id = domain.calendarId.getValue();
     orm.service_id = domain.getServiceId().getValue();
 
     const clientInfo = domain.getClientInfo(); // ✅ Utiliser le getter
@@ -3,7 +3,7 @@
  *
  * Mappers statiques pour conversion entre couches :
  * - Domain ↔ Infrastructure (TypeORM, MongoDB)
- * - Domain ↔ Presentation (DTOs)
+ * - Les DTOs de réponse sont produits par src/presentation/mappers
  *
  * ✅ Respect strict de Clean Architecture
  * ✅ Performance optimisée (pas de reflection)
@@ -39,6 +39,11 @@ import { Money } from "../../domain/value-objects/money.value-object";
 import { Phone } from "../../domain/value-objects/phone.value-object";
 import { PricingConfig } from "../../domain/value-objects/pricing-config.value-object";
 import { ServiceId } from "../../domain/value-objects/service-id.value-object";
+import {
+  CertificationLevel,
+  ProficiencyLevel,
+  StaffSkills,
+} from "../../domain/value-objects/staff-skills.value-object";
 import { UserId } from "../../domain/value-objects/user-id.value-object";
 
 // Shared Enums
@@ -51,15 +56,8 @@ import { ServiceOrmEntity } from "../database/sql/postgresql/entities/service-or
 import { StaffOrmEntity } from "../database/sql/postgresql/entities/staff-orm.entity";
 import { UserOrmEntity } from "../database/sql/postgresql/entities/user-orm.entity";
 
-// Presentation DTOs
-import {
-  LoginResponseDto,
-  RegisterResponseDto,
-} from "../../presentation/dtos/auth.dto";
-import { UserResponseDto } from "../../presentation/dtos/user.dto";
-
 /**
- * 🏛️ USER MAPPERS - Domain ↔ Infrastructure ↔ Presentation
+ * 🏛️ USER MAPPERS - Domain ↔ Infrastructure
  */
 export class UserMapper {
   /**
@@ -112,38 +110,6 @@ export class UserMapper {
     );
   }
 
-  /**
-   * Domain User → UserResponseDto (Presentation)
-   */
-  static toResponseDto(domainUser: User): UserResponseDto {
-    // Parse du nom complet en prénom/nom
-    const nameParts = domainUser.name.split(" ");
-    const firstName = nameParts[0] || "";
-    const lastName = nameParts.slice(1).join(" ") || "";
-
-    return {
-      id: domainUser.id,
-      email: domainUser.email.getValue(),
-      firstName,
-      lastName,
-      role: domainUser.role as any, // Cast temporaire pour éviter les erreurs d'enum
-      phone: undefined, // Optionnel
-      isActive: domainUser.isActive ?? true,
-      isVerified: domainUser.isVerified ?? false,
-      createdAt: domainUser.createdAt.toISOString(),
-      updatedAt:
-        domainUser.updatedAt?.toISOString() ??
-        domainUser.createdAt.toISOString(),
-    };
-  }
-
-  /**
-   * Array mapping - Domain Users → UserResponseDto[]
-   */
-  static toResponseDtoArray(domainUsers: User[]): UserResponseDto[] {
-    return domainUsers.map((user) => this.toResponseDto(user));
-  }
-
   /**
    * Array mapping - TypeORM Entities → Domain Users
    */
@@ -152,40 +118,6 @@ export class UserMapper {
   }
 }
 
-/**
- * 🔐 AUTH RESPONSE MAPPERS - Use Cases Results → DTOs
- */
-export class AuthResponseMapper {
-  /**
-   * Login Use Case Result → LoginResponseDto
-   */
-  static toLoginResponseDto(
-    user: User,
-    message: string,
-    // tokens ne sont pas exposés dans la réponse (HttpOnly cookies)
-  ): LoginResponseDto {
-    return {
-      user: UserMapper.toResponseDto(user),
-      message,
-      // tokens omis volontairement - gérés par cookies HttpOnly
-    };
-  }
-
-  /**
-   * Register Use Case Result → RegisterResponseDto
-   */
-  static toRegisterResponseDto(
-    user: User,
-    message: string,
-  ): RegisterResponseDto {
-    return {
-      user: UserMapper.toResponseDto(user),
-      message,
-      // tokens omis volontairement - gérés par cookies HttpOnly
-    };
-  }
-}
-
 /**
  * 🎯 SERVICE MAPPERS - Domain ↔ Infrastructure
  */
@@ -426,6 +358,24 @@ export class StaffMapper {
       entity.calendar_integration = null;
     }
 
+    // Mapper les compétences
+    entity.skills = domainStaff.skills
+      ? domainStaff.skills.getSkillAssignments().map((sa) => ({
+          skill_id: sa.getSkillId(),
+          skill_name: sa.getSkillName(),
+          skill_category: sa.getSkillCategory(),
+          proficiency_level: sa.getProficiencyLevel(),
+          certification_level: sa.getCertificationLevel(),
+          years_of_experience: sa.getYearsOfExperience(),
+          last_used: sa.getLastUsed()?.toISOString(),
+          is_certified: sa.isCertified(),
+          certification_expiry_date: sa
+            .getCertificationExpiryDate()
+            ?.toISOString(),
+          notes: sa.getNotes() || undefined,
+        }))
+      : null;
+
     return entity;
   }
 
@@ -519,6 +469,37 @@ export class StaffMapper {
       entity.created_at,
       entity.updated_at,
       calendarIntegration,
+      StaffMapper.skillsFromTypeOrm(entity.skills),
+    );
+  }
+
+  /**
+   * Colonne skills → StaffSkills (undefined si aucune compétence)
+   */
+  static skillsFromTypeOrm(
+    skills: StaffOrmEntity["skills"],
+  ): StaffSkills | undefined {
+    if (!skills || skills.length === 0) {
+      return undefined;
+    }
+
+    return StaffSkills.fromPersistence(
+      skills.map((skill) => ({
+        skillId: skill.skill_id,
+        skillName: skill.skill_name,
+        skillCategory: skill.skill_category,
+        proficiencyLevel: skill.proficiency_level as ProficiencyLevel,
+        certificationLevel: skill.certification_level as
+          | CertificationLevel
+          | undefined,
+        yearsOfExperience: skill.years_of_experience,
+        lastUsed: skill.last_used ? new Date(skill.last_used) : undefined,
+        isCertified: skill.is_certified,
+        certificationExpiryDate: skill.certification_expiry_date
+          ? new Date(skill.certification_expiry_date)
+          : undefined,
+        notes: skill.notes,
+      })),
     );
   }
 
@@ -6,7 +6,7 @@
  */
 
 import { Module } from "@nestjs/common";
-import { AuthResponseMapper, UserMapper } from "./domain-mappers";
+import { UserMapper } from "./domain-mappers";
 
 @Module({
   providers: [
@@ -15,11 +15,7 @@ import { AuthResponseMapper, UserMapper } from "./domain-mappers";
       provide: "USER_MAPPER",
       useValue: UserMapper,
     },
-    {
-      provide: "AUTH_RESPONSE_MAPPER",
-      useValue: AuthResponseMapper,
-    },
   ],
-  exports: ["USER_MAPPER", "AUTH_RESPONSE_MAPPER"],
+  exports: ["USER_MAPPER"],
 })
 export class MappersModule {}
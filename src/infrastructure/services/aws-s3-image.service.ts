@@ -16,29 +16,15 @@ import {
   ExternalServiceError,
   ImageProcessingError,
 } from "@infrastructure/exceptions/infrastructure.exceptions";
+import type {
+  IImageStorage,
+  UploadImageMetadata,
+  UploadResult,
+} from "../../application/ports/image-storage.port";
 import { ImageCategory } from "../../domain/value-objects/business-image.value-object";
 import { ImageUploadSettings } from "../../domain/value-objects/image-upload-settings.value-object";
 
-export interface UploadImageMetadata {
-  readonly category: ImageCategory;
-  readonly fileName: string;
-  readonly contentType: string;
-  readonly alt?: string;
-  readonly size?: number;
-  readonly dimensions?: {
-    readonly width: number;
-    readonly height: number;
-  };
-}
-
-export interface UploadResult {
-  readonly s3Key: string;
-  readonly variants?: {
-    readonly thumbnail: string;
-    readonly medium: string;
-    readonly large?: string;
-  };
-}
+export type { UploadImageMetadata, UploadResult };
 
 export interface ImageListOptions {
   readonly page: number;
@@ -46,7 +32,7 @@ export interface ImageListOptions {
   readonly category?: ImageCategory;
 }
 
-export class AwsS3ImageService {
+export class AwsS3ImageService implements IImageStorage {
   private readonly s3Client: S3Client;
   private readonly bucketName: string;
   private readonly region: string;
@@ -0,0 +1,75 @@
+import { IConfigService } from "@application/ports/config.port";
+import { Logger } from "@application/ports/logger.port";
+import { NextAvailableSlotIndexService } from "@application/services/next-available-slot-index.service";
+import {
+  Inject,
+  Injectable,
+  OnModuleDestroy,
+  OnModuleInit,
+} from "@nestjs/common";
+import { TOKENS } from "@shared/constants/injection-tokens";
+
+/**
+ * ⏭️ Worker de recalcul de l'index des prochains créneaux libres
+ * Vide périodiquement la file (stale_since) hors du chemin des requêtes ;
+ * un seul passage à la fois par instance.
+ */
+@Injectable()
+export class NextAvailableSlotRefreshService
+  implements OnModuleInit, OnModuleDestroy
+{
+  private static readonly INTERVAL_MS = 30_000;
+  private static readonly BATCH_SIZE = 50;
+
+  private timer: NodeJS.Timeout | null = null;
+  private running = false;
+
+  constructor(
+    @Inject(TOKENS.NEXT_AVAILABLE_SLOT_INDEX_SERVICE)
+    private readonly nextSlotIndex: NextAvailableSlotIndexService,
+    @Inject(TOKENS.APP_CONFIG) private readonly config: IConfigService,
+    @Inject(TOKENS.LOGGER) private readonly logger: Logger,
+  ) {}
+
+  onModuleInit(): void {
+    if (this.config.isTest()) {
+      return;
+    }
+
+    this.timer = setInterval(
+      () => void this.tick(),
+      NextAvailableSlotRefreshService.INTERVAL_MS,
+    );
+    this.timer.unref();
+  }
+
+  onModuleDestroy(): void {
+    if (this.timer) {
+      clearInterval(this.timer);
+      this.timer = null;
+    }
+  }
+
+  /**
+   * Un lot par passage : une clé en échec reste en file sans bloquer le cycle
+   */
+  async tick(): Promise<void> {
+    if (this.running) {
+      return;
+    }
+    this.running = true;
+
+    try {
+      await this.nextSlotIndex.refreshPending(
+        NextAvailableSlotRefreshService.BATCH_SIZE,
+      );
+    } catch (error) {
+      this.logger.error(
+        "Next available slot refresh cycle failed",
+        error instanceof Error ? error : new Error(String(error)),
+      );
+    } finally {
+      this.running = false;
+    }
+  }
+}
@@ -0,0 +1,80 @@
+import { IConfigService } from "@application/ports/config.port";
+import { Logger } from "@application/ports/logger.port";
+import { OutboxDispatcherService } from "@application/services/outbox-dispatcher.service";
+import {
+  Inject,
+  Injectable,
+  OnModuleDestroy,
+  OnModuleInit,
+} from "@nestjs/common";
+import { TOKENS } from "@shared/constants/injection-tokens";
+
+/**
+ * 📤 Worker de distribution de l'outbox transactionnelle
+ * Vide la file par lots tant qu'elle est pleine ; les messages survivent aux
+ * redémarrages, un bail expiré les rend à un autre worker.
+ */
+@Injectable()
+export class OutboxDispatchService implements OnModuleInit, OnModuleDestroy {
+  private static readonly INTERVAL_MS = 2_000;
+  private static readonly BATCH_SIZE = 50;
+  // Borne d'un passage : laisse respirer la boucle d'événements
+  private static readonly MAX_BATCHES_PER_TICK = 10;
+
+  private timer: NodeJS.Timeout | null = null;
+  private running = false;
+
+  constructor(
+    @Inject(TOKENS.OUTBOX_DISPATCHER_SERVICE)
+    private readonly dispatcher: OutboxDispatcherService,
+    @Inject(TOKENS.APP_CONFIG) private readonly config: IConfigService,
+    @Inject(TOKENS.LOGGER) private readonly logger: Logger,
+  ) {}
+
+  onModuleInit(): void {
+    if (this.config.isTest()) {
+      return;
+    }
+
+    this.timer = setInterval(
+      () => void this.tick(),
+      OutboxDispatchService.INTERVAL_MS,
+    );
+    this.timer.unref();
+  }
+
+  onModuleDestroy(): void {
+    if (this.timer) {
+      clearInterval(this.timer);
+      this.timer = null;
+    }
+  }
+
+  /**
+   * Enchaîne les lots tant qu'ils sont complets
+   */
+  async tick(): Promise<void> {
+    if (this.running) {
+      return;
+    }
+    this.running = true;
+
+    try {
+      for (let i = 0; i < OutboxDispatchService.MAX_BATCHES_PER_TICK; i++) {
+        const dispatched = await this.dispatcher.dispatchPending(
+          OutboxDispatchService.BATCH_SIZE,
+        );
+        if (dispatched < OutboxDispatchService.BATCH_SIZE) {
+          break;
+        }
+      }
+    } catch (error) {
+      this.logger.error(
+        "Outbox dispatch cycle failed",
+        error instanceof Error ? error : new Error(String(error)),
+      );
+    } finally {
+      this.running = false;
+    }
+  }
+}
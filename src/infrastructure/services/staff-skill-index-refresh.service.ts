@@ -0,0 +1,89 @@
+import { IConfigService } from "@application/ports/config.port";
+import { Logger } from "@application/ports/logger.port";
+import { StaffRepository } from "@domain/repositories/staff.repository.interface";
+import { StaffSkillIndex } from "@domain/services/staff-skill-index.service";
+import {
+  Inject,
+  Injectable,
+  OnModuleDestroy,
+  OnModuleInit,
+} from "@nestjs/common";
+import { TOKENS } from "@shared/constants/injection-tokens";
+
+/**
+ * 🎯 Chargement de l'index des compétences du staff
+ * Remplit l'index au démarrage puis le reconstruit périodiquement, pour
+ * reprendre les écritures faites par les autres instances ; les écritures
+ * locales passent par le repository et sont indexées immédiatement.
+ */
+@Injectable()
+export class StaffSkillIndexRefreshService
+  implements OnModuleInit, OnModuleDestroy
+{
+  private static readonly INTERVAL_MS = 5 * 60_000;
+
+  private timer: NodeJS.Timeout | null = null;
+  private running = false;
+
+  constructor(
+    @Inject(TOKENS.STAFF_SKILL_INDEX)
+    private readonly skillIndex: StaffSkillIndex,
+    @Inject(TOKENS.STAFF_REPOSITORY)
+    private readonly staffRepository: StaffRepository,
+    @Inject(TOKENS.APP_CONFIG) private readonly config: IConfigService,
+    @Inject(TOKENS.LOGGER) private readonly logger: Logger,
+  ) {}
+
+  onModuleInit(): void {
+    if (this.config.isTest()) {
+      return;
+    }
+
+    void this.tick();
+    this.timer = setInterval(
+      () => void this.tick(),
+      StaffSkillIndexRefreshService.INTERVAL_MS,
+    );
+    this.timer.unref();
+  }
+
+  onModuleDestroy(): void {
+    if (this.timer) {
+      clearInterval(this.timer);
+      this.timer = null;
+    }
+  }
+
+  /**
+   * Réindexe le staff ayant des compétences et retire ceux qui n'en ont plus
+   */
+  async tick(): Promise<void> {
+    if (this.running) {
+      return;
+    }
+    this.running = true;
+
+    try {
+      const staffWithSkills = await this.staffRepository.findWithSkills();
+      const stale = this.skillIndex.findQualifiedStaff([]);
+
+      for (const staff of staffWithSkills) {
+        const staffId = staff.id.getValue();
+        stale.delete(staffId);
+        if (staff.skills) {
+          this.skillIndex.setStaffSkills(staffId, staff.skills);
+        }
+      }
+      for (const staffId of stale) {
+        this.skillIndex.removeStaff(staffId);
+      }
+    } catch (error) {
+      this.logger.error(
+        "Staff skill index refresh failed",
+        error instanceof Error ? error : new Error(String(error)),
+      );
+    } finally {
+      this.running = false;
+    }
+  }
+}
@@ -9,6 +9,7 @@
  */
 
 import { AppConfigService } from "@infrastructure/config/app-config.service";
+import { registerRequestEntityScope } from "@infrastructure/database/sql/postgresql/utils/request-entity-loader";
 import { I18nValidationPipe } from "@infrastructure/validation/i18n-validation.pipe";
 import { Logger } from "@nestjs/common";
 import { NestFactory } from "@nestjs/core";
@@ -119,6 +120,9 @@ async function bootstrap(): Promise<void> {
     }),
   });
 
+  // 🧺 Portée par requête : findById regroupés et mémoïsés par les repositories
+  registerRequestEntityScope(fastifyInstance);
+
   logger.log("Configuring global settings...");
   app.useGlobalPipes(new I18nValidationPipe());
 
@@ -16,24 +16,36 @@ import {
   Param,
   Post,
   Put,
+  Res,
 } from "@nestjs/common";
 import {
   ApiBearerAuth,
   ApiOperation,
   ApiParam,
+  ApiProduces,
   ApiResponse,
   ApiTags,
 } from "@nestjs/swagger";
+import type { FastifyReply } from "fastify";
+import { Readable } from "stream";
 
 import { User } from "@domain/entities/user.entity";
 import { TOKENS } from "@shared/constants/injection-tokens";
 import { GetUser } from "../security/decorators/get-user.decorator";
 
 // Use Cases
+import { BookAppointmentSeriesUseCase } from "@application/use-cases/appointments/book-appointment-series.use-case";
 import { BookAppointmentUseCase } from "@application/use-cases/appointments/book-appointment.use-case";
 import { CancelAppointmentUseCase } from "@application/use-cases/appointments/cancel-appointment.use-case";
+import {
+  ExportAvailabilityResponse,
+  ExportAvailabilityUseCase,
+} from "@application/use-cases/appointments/export-availability.use-case";
 import { GetAppointmentByIdUseCase } from "@application/use-cases/appointments/get-appointment-by-id.use-case";
 import { GetAvailableSlotsUseCase } from "@application/use-cases/appointments/get-available-slots-simple.use-case";
+import { GetBatchAvailabilityUseCase } from "@application/use-cases/appointments/get-batch-availability.use-case";
+import { GetNextAvailableSlotsUseCase } from "@application/use-cases/appointments/get-next-available-slots.use-case";
+import { HoldSlotUseCase } from "@application/use-cases/appointments/hold-slot.use-case";
 import { ListAppointmentsUseCase } from "@application/use-cases/appointments/list-appointments.use-case";
 import { UpdateAppointmentUseCase } from "@application/use-cases/appointments/update-appointment.use-case";
 
@@ -43,9 +55,18 @@ import {
   AvailableSlotResponseDto,
   BookAppointmentDto,
   BookAppointmentResponseDto,
+  BookAppointmentSeriesDto,
+  BookAppointmentSeriesResponseDto,
   CancelAppointmentDto,
   CancelAppointmentResponseDto,
+  ExportAvailabilityDto,
   GetAvailableSlotsDto,
+  GetBatchAvailabilityDto,
+  GetBatchAvailabilityResponseDto,
+  GetNextAvailableSlotsDto,
+  GetNextAvailableSlotsResponseDto,
+  HoldSlotDto,
+  HoldSlotResponseDto,
   ListAppointmentsDto,
   ListAppointmentsResponseDto,
   UpdateAppointmentDto,
@@ -61,8 +82,18 @@ export class AppointmentController {
   constructor(
     @Inject(TOKENS.GET_AVAILABLE_SLOTS_USE_CASE)
     private readonly getAvailableSlotsUseCase: GetAvailableSlotsUseCase,
+    @Inject(TOKENS.GET_BATCH_AVAILABILITY_USE_CASE)
+    private readonly getBatchAvailabilityUseCase: GetBatchAvailabilityUseCase,
+    @Inject(TOKENS.GET_NEXT_AVAILABLE_SLOTS_USE_CASE)
+    private readonly getNextAvailableSlotsUseCase: GetNextAvailableSlotsUseCase,
+    @Inject(TOKENS.EXPORT_AVAILABILITY_USE_CASE)
+    private readonly exportAvailabilityUseCase: ExportAvailabilityUseCase,
+    @Inject(TOKENS.HOLD_SLOT_USE_CASE)
+    private readonly holdSlotUseCase: HoldSlotUseCase,
     @Inject(TOKENS.BOOK_APPOINTMENT_USE_CASE)
     private readonly bookAppointmentUseCase: BookAppointmentUseCase,
+    @Inject(TOKENS.BOOK_APPOINTMENT_SERIES_USE_CASE)
+    private readonly bookAppointmentSeriesUseCase: BookAppointmentSeriesUseCase,
     @Inject(TOKENS.LIST_APPOINTMENTS_USE_CASE)
     private readonly listAppointmentsUseCase: ListAppointmentsUseCase,
     @Inject(TOKENS.GET_APPOINTMENT_BY_ID_USE_CASE)
@@ -115,6 +146,242 @@ export class AppointmentController {
     );
   }
 
+  /**
+   * 🗓️ GET BATCH AVAILABILITY
+   * Premiers créneaux libres de la semaine sur plusieurs calendriers
+   */
+  @Post("available-slots/batch")
+  @HttpCode(HttpStatus.OK)
+  @ApiOperation({
+    summary: "🗓️ Get Availability Across Calendars",
+    description: `
+    Premiers créneaux libres de la semaine pour un service, sur plusieurs
+    calendriers / praticiens à la fois.
+
+    ✅ Fonctionnalités :
+    - Jusqu'à 100 calendriers par requête
+    - Deux requêtes en base quel que soit le nombre de calendriers
+    - Premier créneau disponible tous calendriers confondus
+
+    🔐 Permissions requises :
+    - BOOK_APPOINTMENTS ou READ_APPOINTMENTS
+    `,
+  })
+  @ApiResponse({
+    status: HttpStatus.OK,
+    description: "✅ Availability computed successfully",
+    type: GetBatchAvailabilityResponseDto,
+  })
+  @ApiResponse({
+    status: HttpStatus.BAD_REQUEST,
+    description: "❌ Invalid request parameters",
+  })
+  async getBatchAvailability(
+    @Body() dto: GetBatchAvailabilityDto,
+    @GetUser() user: User,
+  ): Promise<GetBatchAvailabilityResponseDto> {
+    const request = AppointmentMapper.toGetBatchAvailabilityRequest(
+      dto,
+      user.id,
+    );
+    const response = await this.getBatchAvailabilityUseCase.execute(request);
+    return AppointmentMapper.toGetBatchAvailabilityResponseDto(response);
+  }
+
+  /**
+   * ⏭️ GET NEXT AVAILABLE SLOTS
+   * Premier créneau libre de plusieurs entreprises (listings)
+   */
+  @Post("next-available")
+  @HttpCode(HttpStatus.OK)
+  @ApiOperation({
+    summary: "⏭️ Get Next Available Slot per Business",
+    description: `
+    Premier créneau libre connu pour chaque entreprise d'un listing.
+
+    ✅ Fonctionnalités :
+    - Jusqu'à 100 entreprises par requête
+    - Une seule lecture de l'index précalculé
+    - Filtre optionnel par service
+
+    🔐 Permissions requises :
+    - BOOK_APPOINTMENTS ou READ_APPOINTMENTS
+    `,
+  })
+  @ApiResponse({
+    status: HttpStatus.OK,
+    description: "✅ Next available slots retrieved successfully",
+    type: GetNextAvailableSlotsResponseDto,
+  })
+  @ApiResponse({
+    status: HttpStatus.BAD_REQUEST,
+    description: "❌ Invalid request parameters",
+  })
+  async getNextAvailableSlots(
+    @Body() dto: GetNextAvailableSlotsDto,
+    @GetUser() user: User,
+  ): Promise<GetNextAvailableSlotsResponseDto> {
+    const request = AppointmentMapper.toGetNextAvailableSlotsRequest(
+      dto,
+      user.id,
+    );
+    const response = await this.getNextAvailableSlotsUseCase.execute(request);
+    return AppointmentMapper.toGetNextAvailableSlotsResponseDto(response);
+  }
+
+  /**
+   * 📤 EXPORT AVAILABILITY
+   * Disponibilités jusqu'à 90 jours, en flux NDJSON
+   */
+  @Post("available-slots/export")
+  @HttpCode(HttpStatus.OK)
+  @ApiProduces("application/x-ndjson")
+  @ApiOperation({
+    summary: "📤 Export Availability (NDJSON stream)",
+    description: `
+    Créneaux libres de tous les calendriers d'une entreprise sur une
+    période allant jusqu'à 90 jours, en NDJSON (une ligne JSON par jour).
+
+    ✅ Format :
+    - Ligne "meta" : période, durée du service, calendriers
+    - Une ligne "day" par jour, envoyée dès qu'elle est calculée
+    - Ligne "end" en fin de flux, ou "error" si le calcul échoue en cours
+
+    🔐 Permissions requises :
+    - READ_APPOINTMENTS
+    `,
+  })
+  @ApiResponse({
+    status: HttpStatus.OK,
+    description: "✅ NDJSON stream of daily availability",
+  })
+  @ApiResponse({
+    status: HttpStatus.BAD_REQUEST,
+    description: "❌ Invalid request parameters (period over 90 days...)",
+  })
+  async exportAvailability(
+    @Body() dto: ExportAvailabilityDto,
+    @GetUser() user: User,
+    @Res() reply: FastifyReply,
+  ): Promise<void> {
+    const request = AppointmentMapper.toExportAvailabilityRequest(
+      dto,
+      user.id,
+    );
+    // Les erreurs de validation remontent avant l'envoi des en-têtes
+    const result = await this.exportAvailabilityUseCase.execute(request);
+
+    // Fastify pilote le flux : contre-pression, et destruction du flux (donc
+    // arrêt du générateur) si le client se déconnecte
+    await reply
+      .status(HttpStatus.OK)
+      .header("Content-Type", "application/x-ndjson; charset=utf-8")
+      .header("Cache-Control", "no-store")
+      .send(Readable.from(this.exportLines(result)));
+  }
+
+  private async *exportLines(
+    result: ExportAvailabilityResponse,
+  ): AsyncGenerator<string> {
+    yield AppointmentMapper.toExportAvailabilityHeaderLine(result);
+
+    let dayCount = 0;
+    try {
+      for await (const day of result.days) {
+        dayCount++;
+        yield AppointmentMapper.toExportAvailabilityDayLine(day);
+      }
+      yield JSON.stringify({ type: "end", days: dayCount }) + "\n";
+    } catch (error) {
+      // En-têtes déjà envoyés : l'erreur est signalée dans le flux
+      yield JSON.stringify({
+        type: "error",
+        message: error instanceof Error ? error.message : String(error),
+      }) + "\n";
+    }
+  }
+
+  /**
+   * ⏳ HOLD SLOT
+   * Retenue d'un créneau quelques minutes avant la réservation
+   */
+  @Post("holds")
+  @HttpCode(HttpStatus.CREATED)
+  @ApiOperation({
+    summary: "⏳ Hold a Slot Before Booking",
+    description: `
+    Retient un créneau pendant 2 minutes et retourne un jeton.
+
+    ✅ Fonctionnalités :
+    - Retenue atomique : un créneau déjà retenu échoue immédiatement
+    - Vérifications complètes faites une seule fois, à la retenue
+    - Réservation avec holdToken sans nouvelle vérification
+    - Retenue libérée à la réservation ou à expiration
+
+    🔐 Permissions requises :
+    - BOOK_APPOINTMENTS
+    `,
+  })
+  @ApiResponse({
+    status: HttpStatus.CREATED,
+    description: "✅ Slot held",
+    type: HoldSlotResponseDto,
+  })
+  @ApiResponse({
+    status: HttpStatus.CONFLICT,
+    description: "❌ Slot already held or booked",
+  })
+  async holdSlot(
+    @Body() dto: HoldSlotDto,
+    @GetUser() user: User,
+  ): Promise<HoldSlotResponseDto> {
+    const request = AppointmentMapper.toHoldSlotRequest(dto, user.id);
+    const response = await this.holdSlotUseCase.execute(request);
+    return AppointmentMapper.toHoldSlotResponseDto(response);
+  }
+
+  /**
+   * 🔁 BOOK APPOINTMENT SERIES
+   * Réservation d'une série récurrente en une seule écriture
+   */
+  @Post("series")
+  @HttpCode(HttpStatus.CREATED)
+  @ApiOperation({
+    summary: "🔁 Book a Recurring Appointment Series",
+    description: `
+    Réserve toutes les occurrences d'une règle de récurrence (100 maximum).
+
+    ✅ Fonctionnalités :
+    - Entités et conflits lus une seule fois pour toute la série
+    - Occurrences libres insérées en un seul INSERT, tout ou rien
+    - Statut BOOKED / CONFLICT rapporté pour chaque occurrence
+    - allOrNothing : aucune réservation si une occurrence est en conflit
+
+    🔐 Permissions requises :
+    - BOOK_APPOINTMENTS
+    `,
+  })
+  @ApiResponse({
+    status: HttpStatus.CREATED,
+    description: "✅ Series booked, with per-occurrence outcome",
+    type: BookAppointmentSeriesResponseDto,
+  })
+  @ApiResponse({
+    status: HttpStatus.CONFLICT,
+    description: "❌ allOrNothing requested and an occurrence conflicts",
+  })
+  async bookSeries(
+    @Body() dto: BookAppointmentSeriesDto,
+    @GetUser() user: User,
+  ): Promise<BookAppointmentSeriesResponseDto> {
+    const request = AppointmentMapper.toBookAppointmentSeriesRequest(
+      dto,
+      user.id,
+    );
+    const response = await this.bookAppointmentSeriesUseCase.execute(request);
+    return AppointmentMapper.toBookAppointmentSeriesResponseDto(response);
+  }
+
   /**
    * 📅 BOOK APPOINTMENT
    * Réservation d'un nouveau rendez-vous
@@ -155,6 +422,10 @@ export class AppointmentController {
     status: HttpStatus.CONFLICT,
     description: "❌ Time slot no longer available",
   })
+  @ApiResponse({
+    status: HttpStatus.GONE,
+    description: "❌ Slot hold expired or not matching the booking",
+  })
   async bookAppointment(
     @Body() dto: BookAppointmentDto,
     @GetUser() user: User,
@@ -279,6 +279,7 @@ export class StaffAvailabilityController {
       dateTime: startDate,
       durationMinutes: durationMinutes,
       serviceId: dto.serviceType, // Mapping serviceType -> serviceId
+      requiredSkills: dto.requiredSkills,
       requestingUserId: user.id,
       correlationId: dto.correlationId,
     });
@@ -23,6 +23,7 @@ import {
   Min,
   ValidateNested,
 } from "class-validator";
+import { ViewMode } from "@shared/enums/view-mode.enum";
 
 // ✅ AppointmentType removed - type now determined by Service
 
@@ -30,11 +31,7 @@ import {
 // GET AVAILABLE SLOTS DTOs
 // =====================================
 
-export enum ViewMode {
-  DAY = "day",
-  WEEK = "week",
-  NEXT_WEEK = "next_week",
-}
+export { ViewMode };
 
 export class GetAvailableSlotsDto {
   @ApiProperty({
@@ -12,6 +12,9 @@ import {
   Min,
   Max,
   Length,
+  ArrayMaxSize,
+  ArrayNotEmpty,
+  IsArray,
 } from "class-validator";
 
 export class GetAvailableSlotsDto {
@@ -49,6 +52,128 @@ export class GetAvailableSlotsDto {
   readonly preferredStaffId?: string;
 }
 
+export class GetBatchAvailabilityDto {
+  @ApiProperty({
+    description: "UUID of the business",
+    example: "550e8400-e29b-41d4-a716-446655440000",
+    format: "uuid",
+  })
+  @IsUUID()
+  readonly businessId!: string;
+
+  @ApiProperty({
+    description: "UUID of the service",
+    example: "770e8400-e29b-41d4-a716-446655440002",
+    format: "uuid",
+  })
+  @IsUUID()
+  readonly serviceId!: string;
+
+  @ApiProperty({
+    description: "UUIDs of the calendars (practitioners) to compare",
+    example: [
+      "660e8400-e29b-41d4-a716-446655440001",
+      "660e8400-e29b-41d4-a716-446655440005",
+    ],
+    type: [String],
+  })
+  @IsArray()
+  @ArrayNotEmpty()
+  @ArrayMaxSize(100)
+  @IsUUID("all", { each: true })
+  readonly calendarIds!: string[];
+
+  @ApiProperty({
+    description: "Any date within the requested week (ISO 8601 date)",
+    example: "2025-01-15",
+    format: "date",
+  })
+  @IsDateString()
+  readonly date!: string;
+
+  @ApiPropertyOptional({
+    description: "Maximum number of free slots returned per calendar",
+    minimum: 1,
+    maximum: 100,
+    default: 5,
+    example: 5,
+  })
+  @IsOptional()
+  @IsInt()
+  @Min(1)
+  @Max(100)
+  readonly maxSlotsPerCalendar?: number;
+}
+
+export class ExportAvailabilityDto {
+  @ApiProperty({
+    description: "UUID of the business",
+    example: "550e8400-e29b-41d4-a716-446655440000",
+    format: "uuid",
+  })
+  @IsUUID()
+  readonly businessId!: string;
+
+  @ApiProperty({
+    description: "UUID of the service (gives the slot duration)",
+    example: "770e8400-e29b-41d4-a716-446655440002",
+    format: "uuid",
+  })
+  @IsUUID()
+  readonly serviceId!: string;
+
+  @ApiProperty({
+    description: "First day of the export (ISO 8601 date)",
+    example: "2025-01-01",
+    format: "date",
+  })
+  @IsDateString()
+  readonly startDate!: string;
+
+  @ApiProperty({
+    description: "Last day of the export, included (max 90 days)",
+    example: "2025-03-31",
+    format: "date",
+  })
+  @IsDateString()
+  readonly endDate!: string;
+
+  @ApiPropertyOptional({
+    description: "Restrict to these calendars (default: all of the business)",
+    type: [String],
+  })
+  @IsOptional()
+  @IsArray()
+  @ArrayMaxSize(100)
+  @IsUUID("all", { each: true })
+  readonly calendarIds?: string[];
+}
+
+export class GetNextAvailableSlotsDto {
+  @ApiProperty({
+    description: "UUIDs of the businesses to list",
+    example: [
+      "550e8400-e29b-41d4-a716-446655440000",
+      "550e8400-e29b-41d4-a716-446655440003",
+    ],
+    type: [String],
+  })
+  @IsArray()
+  @ArrayNotEmpty()
+  @ArrayMaxSize(100)
+  @IsUUID("all", { each: true })
+  readonly businessIds!: string[];
+
+  @ApiPropertyOptional({
+    description: "Restrict to one service (UUID)",
+    example: "770e8400-e29b-41d4-a716-446655440002",
+    format: "uuid",
+  })
+  @IsOptional()
+  @IsUUID()
+  readonly serviceId?: string;
+}
+
 export class ListAppointmentsDto {
   @ApiPropertyOptional({
     description: "Page number for pagination",
@@ -201,6 +201,207 @@ export class AvailableSlotResponseDto {
   readonly isPreferred!: boolean;
 }
 
+export class BatchAvailableSlotResponseDto {
+  @ApiProperty({
+    description: "Calendar offering this slot",
+    example: "660e8400-e29b-41d4-a716-446655440001",
+  })
+  readonly calendarId!: string;
+
+  @ApiProperty({
+    description: "Slot start time (ISO 8601)",
+    example: "2025-01-15T09:00:00.000Z",
+  })
+  readonly startTime!: string;
+
+  @ApiProperty({
+    description: "Slot end time (ISO 8601)",
+    example: "2025-01-15T09:30:00.000Z",
+  })
+  readonly endTime!: string;
+}
+
+export class CalendarAvailabilityResponseDto {
+  @ApiProperty({
+    description: "Calendar UUID",
+    example: "660e8400-e29b-41d4-a716-446655440001",
+  })
+  readonly calendarId!: string;
+
+  @ApiProperty({
+    description: "First free slots of the week for this calendar",
+    type: [BatchAvailableSlotResponseDto],
+  })
+  readonly slots!: BatchAvailableSlotResponseDto[];
+}
+
+export class GetBatchAvailabilityResponseDto {
+  @ApiProperty({
+    description: "Start of the searched period (ISO 8601)",
+    example: "2025-01-13T00:00:00.000Z",
+  })
+  readonly periodStart!: string;
+
+  @ApiProperty({
+    description: "End of the searched period (ISO 8601)",
+    example: "2025-01-20T00:00:00.000Z",
+  })
+  readonly periodEnd!: string;
+
+  @ApiProperty({
+    description: "Service duration used for the slots, in minutes",
+    example: 30,
+  })
+  readonly durationMinutes!: number;
+
+  @ApiProperty({
+    description: "Free slots per calendar, in the requested order",
+    type: [CalendarAvailabilityResponseDto],
+  })
+  readonly calendars!: CalendarAvailabilityResponseDto[];
+
+  @ApiPropertyOptional({
+    description: "Earliest free slot across all calendars",
+    type: BatchAvailableSlotResponseDto,
+    nullable: true,
+  })
+  readonly firstAvailable!: BatchAvailableSlotResponseDto | null;
+}
+
+export class NextAvailableSlotResponseDto {
+  @ApiProperty({
+    description: "Service the slot was computed for",
+    example: "770e8400-e29b-41d4-a716-446655440002",
+  })
+  readonly serviceId!: string;
+
+  @ApiProperty({
+    description: "Calendar offering this slot",
+    example: "660e8400-e29b-41d4-a716-446655440001",
+  })
+  readonly calendarId!: string;
+
+  @ApiProperty({
+    description: "Slot start time (ISO 8601)",
+    example: "2025-01-15T09:00:00.000Z",
+  })
+  readonly startTime!: string;
+
+  @ApiProperty({
+    description: "Slot end time (ISO 8601)",
+    example: "2025-01-15T09:30:00.000Z",
+  })
+  readonly endTime!: string;
+}
+
+export class BusinessNextSlotResponseDto {
+  @ApiProperty({
+    description: "Business UUID",
+    example: "550e8400-e29b-41d4-a716-446655440000",
+  })
+  readonly businessId!: string;
+
+  @ApiPropertyOptional({
+    description: "Earliest indexed free slot, null if none is known",
+    type: NextAvailableSlotResponseDto,
+    nullable: true,
+  })
+  readonly nextSlot!: NextAvailableSlotResponseDto | null;
+}
+
+export class GetNextAvailableSlotsResponseDto {
+  @ApiProperty({
+    description: "Next free slot per business, in the requested order",
+    type: [BusinessNextSlotResponseDto],
+  })
+  readonly businesses!: BusinessNextSlotResponseDto[];
+}
+
+export class HoldSlotResponseDto {
+  @ApiProperty({
+    description: "Hold token, to send as holdToken when booking",
+    example: "3f2b8c1e-6a4d-4f7e-9b1a-2c5d8e7f9a0b",
+  })
+  readonly token!: string;
+
+  @ApiProperty({
+    description: "Calendar the slot is held on",
+    example: "660e8400-e29b-41d4-a716-446655440001",
+  })
+  readonly calendarId!: string;
+
+  @ApiProperty({
+    description: "Held slot start time (ISO 8601)",
+    example: "2025-01-15T14:30:00.000Z",
+  })
+  readonly startTime!: string;
+
+  @ApiProperty({
+    description: "Held slot end time (ISO 8601)",
+    example: "2025-01-15T15:30:00.000Z",
+  })
+  readonly endTime!: string;
+
+  @ApiProperty({
+    description: "Hold expiry (ISO 8601); the slot is released afterwards",
+    example: "2025-01-10T09:02:00.000Z",
+  })
+  readonly expiresAt!: string;
+}
+
+export class SeriesOccurrenceResponseDto {
+  @ApiProperty({
+    description: "Occurrence start time (ISO 8601)",
+    example: "2025-01-15T14:30:00.000Z",
+  })
+  readonly startTime!: string;
+
+  @ApiProperty({
+    description: "Occurrence end time (ISO 8601)",
+    example: "2025-01-15T15:30:00.000Z",
+  })
+  readonly endTime!: string;
+
+  @ApiProperty({
+    description: "Whether the occurrence was booked or skipped",
+    example: "BOOKED",
+    enum: ["BOOKED", "CONFLICT"],
+  })
+  readonly status!: "BOOKED" | "CONFLICT";
+
+  @ApiPropertyOptional({
+    description: "Appointment UUID when booked",
+    example: "990e8400-e29b-41d4-a716-446655440004",
+  })
+  readonly appointmentId?: string;
+}
+
+export class BookAppointmentSeriesResponseDto {
+  @ApiProperty({
+    description: "Calendar the series is booked on",
+    example: "660e8400-e29b-41d4-a716-446655440001",
+  })
+  readonly calendarId!: string;
+
+  @ApiProperty({
+    description: "Outcome of every occurrence, in chronological order",
+    type: [SeriesOccurrenceResponseDto],
+  })
+  readonly occurrences!: SeriesOccurrenceResponseDto[];
+
+  @ApiProperty({
+    description: "Booked occurrences",
+    example: 9,
+  })
+  readonly bookedCount!: number;
+
+  @ApiProperty({
+    description: "Occurrences skipped on conflict",
+    example: 1,
+  })
+  readonly conflictCount!: number;
+}
+
 export class GetAvailableSlotsResponseDto {
   @ApiProperty({
     description: "Success status",
@@ -11,6 +11,11 @@ import {
   IsBoolean,
   ValidateNested,
   IsIn,
+  IsInt,
+  IsArray,
+  ArrayMaxSize,
+  Min,
+  Max,
   Length,
 } from "class-validator";
 
@@ -231,4 +236,246 @@ export class BookAppointmentDto {
   @IsString()
   @Length(0, 500)
   readonly description?: string;
+
+  @ApiPropertyOptional({
+    description:
+      "Token from POST /appointments/holds for this slot; skips revalidation",
+    example: "3f2b8c1e-6a4d-4f7e-9b1a-2c5d8e7f9a0b",
+    format: "uuid",
+  })
+  @IsOptional()
+  @IsUUID()
+  readonly holdToken?: string;
+}
+
+export class HoldSlotDto {
+  @ApiProperty({
+    description: "UUID of the business",
+    example: "550e8400-e29b-41d4-a716-446655440000",
+    format: "uuid",
+  })
+  @IsUUID()
+  readonly businessId!: string;
+
+  @ApiProperty({
+    description: "UUID of the calendar to hold the slot on",
+    example: "660e8400-e29b-41d4-a716-446655440001",
+    format: "uuid",
+  })
+  @IsUUID()
+  readonly calendarId!: string;
+
+  @ApiProperty({
+    description: "UUID of the service to be booked",
+    example: "770e8400-e29b-41d4-a716-446655440002",
+    format: "uuid",
+  })
+  @IsUUID()
+  readonly serviceId!: string;
+
+  @ApiProperty({
+    description: "Start time of the slot (ISO 8601)",
+    example: "2025-01-15T14:30:00.000Z",
+    format: "date-time",
+  })
+  @IsDateString()
+  readonly startTime!: string;
+
+  @ApiProperty({
+    description: "End time of the slot (ISO 8601)",
+    example: "2025-01-15T15:30:00.000Z",
+    format: "date-time",
+  })
+  @IsDateString()
+  readonly endTime!: string;
+
+  @ApiPropertyOptional({
+    description: "UUID of the assigned staff member",
+    example: "880e8400-e29b-41d4-a716-446655440003",
+    format: "uuid",
+  })
+  @IsOptional()
+  @IsUUID()
+  readonly assignedStaffId?: string;
+}
+
+export class SeriesRecurrenceDto {
+  @ApiProperty({
+    description: "Recurrence frequency",
+    example: "WEEKLY",
+    enum: ["DAILY", "WEEKLY", "MONTHLY", "YEARLY"],
+  })
+  @IsIn(["DAILY", "WEEKLY", "MONTHLY", "YEARLY"])
+  readonly type!: "DAILY" | "WEEKLY" | "MONTHLY" | "YEARLY";
+
+  @ApiProperty({
+    description: "Repeat every N days/weeks/months/years",
+    example: 1,
+    minimum: 1,
+  })
+  @IsInt()
+  @Min(1)
+  readonly interval!: number;
+
+  @ApiPropertyOptional({
+    description: "Days of week for WEEKLY (0 = Sunday … 6 = Saturday)",
+    example: [1, 4],
+    type: [Number],
+  })
+  @IsOptional()
+  @IsArray()
+  @IsInt({ each: true })
+  @Min(0, { each: true })
+  @Max(6, { each: true })
+  readonly daysOfWeek?: number[];
+
+  @ApiPropertyOptional({
+    description: "Day of month for MONTHLY and YEARLY (1-31)",
+    example: 15,
+  })
+  @IsOptional()
+  @IsInt()
+  @Min(1)
+  @Max(31)
+  readonly dayOfMonth?: number;
+
+  @ApiPropertyOptional({
+    description: "Month for YEARLY (1-12)",
+    example: 3,
+  })
+  @IsOptional()
+  @IsInt()
+  @Min(1)
+  @Max(12)
+  readonly monthOfYear?: number;
+
+  @ApiPropertyOptional({
+    description: "Number of occurrences (exclusive with endDate)",
+    example: 10,
+    minimum: 1,
+    maximum: 100,
+  })
+  @IsOptional()
+  @IsInt()
+  @Min(1)
+  @Max(100)
+  readonly occurrences?: number;
+
+  @ApiPropertyOptional({
+    description: "Last possible occurrence date (ISO 8601)",
+    example: "2025-06-30T23:59:59.000Z",
+    format: "date-time",
+  })
+  @IsOptional()
+  @IsDateString()
+  readonly endDate?: string;
+
+  @ApiPropertyOptional({
+    description: "Dates to skip (ISO 8601)",
+    example: ["2025-02-12T14:30:00.000Z"],
+    type: [String],
+  })
+  @IsOptional()
+  @IsArray()
+  @ArrayMaxSize(100)
+  @IsDateString({}, { each: true })
+  readonly exceptions?: string[];
+}
+
+export class BookAppointmentSeriesDto {
+  @ApiProperty({
+    description: "UUID of the business where the series is booked",
+    example: "550e8400-e29b-41d4-a716-446655440000",
+    format: "uuid",
+  })
+  @IsUUID()
+  readonly businessId!: string;
+
+  @ApiProperty({
+    description: "UUID of the calendar for every occurrence",
+    example: "660e8400-e29b-41d4-a716-446655440001",
+    format: "uuid",
+  })
+  @IsUUID()
+  readonly calendarId!: string;
+
+  @ApiProperty({
+    description: "UUID of the service being booked",
+    example: "770e8400-e29b-41d4-a716-446655440002",
+    format: "uuid",
+  })
+  @IsUUID()
+  readonly serviceId!: string;
+
+  @ApiProperty({
+    description: "Start time of the first occurrence (ISO 8601)",
+    example: "2025-01-15T14:30:00.000Z",
+    format: "date-time",
+  })
+  @IsDateString()
+  readonly startTime!: string;
+
+  @ApiProperty({
+    description: "End time of the first occurrence (ISO 8601)",
+    example: "2025-01-15T15:30:00.000Z",
+    format: "date-time",
+  })
+  @IsDateString()
+  readonly endTime!: string;
+
+  @ApiProperty({
+    description: "Recurrence rule applied from the first occurrence",
+    type: SeriesRecurrenceDto,
+  })
+  @ValidateNested()
+  @Type(() => SeriesRecurrenceDto)
+  readonly recurrence!: SeriesRecurrenceDto;
+
+  @ApiProperty({
+    description: "Client information",
+    type: ClientInfoDto,
+  })
+  @ValidateNested()
+  @Type(() => ClientInfoDto)
+  readonly clientInfo!: ClientInfoDto;
+
+  @ApiPropertyOptional({
+    description: "UUID of the assigned staff member",
+    example: "880e8400-e29b-41d4-a716-446655440003",
+    format: "uuid",
+  })
+  @IsOptional()
+  @IsUUID()
+  readonly assignedStaffId?: string;
+
+  @ApiPropertyOptional({
+    description: "Custom title for every occurrence",
+    example: "Séance de kinésithérapie",
+    minLength: 5,
+    maxLength: 100,
+  })
+  @IsOptional()
+  @IsString()
+  @Length(5, 100)
+  readonly title?: string;
+
+  @ApiPropertyOptional({
+    description: "Additional description or notes",
+    example: "Rééducation du genou, 10 séances",
+    maxLength: 500,
+  })
+  @IsOptional()
+  @IsString()
+  @Length(0, 500)
+  readonly description?: string;
+
+  @ApiPropertyOptional({
+    description:
+      "Book nothing if any occurrence conflicts (default: book free ones)",
+    example: false,
+    default: false,
+  })
+  @IsOptional()
+  @IsBoolean()
+  readonly allOrNothing?: boolean;
 }
@@ -11,14 +11,20 @@ import {
   IsBoolean,
   IsEmail,
   IsEnum,
+  IsInt,
   IsNotEmpty,
   IsOptional,
   IsString,
   IsUUID,
   Length,
+  Min,
   ValidateNested,
 } from "class-validator";
 import { Type } from "class-transformer";
+import {
+  CertificationLevel,
+  ProficiencyLevel,
+} from "../../domain/value-objects/staff-skills.value-object";
 import { StaffRole } from "../../shared/enums/staff-role.enum";
 
 /**
@@ -402,6 +408,46 @@ export class StaffContactInfoUpdateDto {
   readonly phone?: string;
 }
 
+/**
+ * 🎯 STAFF SKILL ASSIGNMENT DTO
+ */
+export class StaffSkillAssignmentDto {
+  @ApiProperty({ description: "Skill ID" })
+  @IsString()
+  @IsNotEmpty()
+  readonly skillId!: string;
+
+  @ApiProperty({ description: "Skill name" })
+  @IsString()
+  @IsNotEmpty()
+  readonly skillName!: string;
+
+  @ApiProperty({ description: "Skill category" })
+  @IsString()
+  @IsNotEmpty()
+  readonly skillCategory!: string;
+
+  @ApiProperty({ enum: ProficiencyLevel })
+  @IsEnum(ProficiencyLevel)
+  readonly proficiencyLevel!: ProficiencyLevel;
+
+  @ApiProperty({ minimum: 0 })
+  @Type(() => Number)
+  @IsInt()
+  @Min(0)
+  readonly yearsOfExperience!: number;
+
+  @ApiPropertyOptional()
+  @IsOptional()
+  @IsBoolean()
+  readonly isCertified?: boolean;
+
+  @ApiPropertyOptional({ enum: CertificationLevel })
+  @IsOptional()
+  @IsEnum(CertificationLevel)
+  readonly certificationLevel?: CertificationLevel;
+}
+
 /**
  * ✏️ UPDATE STAFF DTO
  */
@@ -448,6 +494,16 @@ export class UpdateStaffDto {
   @IsOptional()
   readonly availability?: any;
 
+  @ApiPropertyOptional({
+    description: "Staff skills (replaces all skills, empty array clears them)",
+    type: [StaffSkillAssignmentDto],
+  })
+  @IsOptional()
+  @IsArray()
+  @ValidateNested({ each: true })
+  @Type(() => StaffSkillAssignmentDto)
+  readonly skills?: StaffSkillAssignmentDto[];
+
   @ApiPropertyOptional({
     description: "Calendar integration settings",
     type: "object",
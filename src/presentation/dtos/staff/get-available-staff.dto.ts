@@ -36,7 +36,7 @@ export class GetAvailableStaffDto {
   readonly endTime!: string;
 
   @ApiPropertyOptional({
-    description: "Required skills for the service",
+    description: "Required skill IDs (staff must have all of them)",
     type: [String],
     example: ["massage-therapy", "deep-tissue", "swedish-massage"],
   })
@@ -88,6 +88,9 @@ export class ApplicationExceptionFilter implements ExceptionFilter {
       // Conflicts
       RESOURCE_CONFLICT: HttpStatus.CONFLICT,
       BUSINESS_ALREADY_EXISTS: HttpStatus.CONFLICT,
+      APPOINTMENT_CONFLICT: HttpStatus.CONFLICT,
+      SLOT_HOLD_EXPIRED: HttpStatus.GONE,
+      SLOT_HOLD_LIMIT_EXCEEDED: HttpStatus.TOO_MANY_REQUESTS,
 
       // Use Case & Workflow Errors
       USE_CASE_EXECUTION_ERROR: HttpStatus.UNPROCESSABLE_ENTITY,
@@ -83,6 +83,9 @@ export class DomainExceptionFilter implements ExceptionFilter {
       BUSINESS_INVALID_EMAIL: HttpStatus.BAD_REQUEST,
       BUSINESS_INVALID_PHONE: HttpStatus.BAD_REQUEST,
 
+      // Appointment Domain Errors
+      APPOINTMENT_SLOT_TAKEN: HttpStatus.CONFLICT,
+
       // Auth Domain Errors
       AUTH_INVALID_CREDENTIALS: HttpStatus.UNAUTHORIZED,
       AUTH_INSUFFICIENT_PERMISSIONS: HttpStatus.FORBIDDEN,
@@ -1,3 +1,7 @@
+import {
+  BookAppointmentSeriesRequest,
+  BookAppointmentSeriesResponse,
+} from "../../application/use-cases/appointments/book-appointment-series.use-case";
 import {
   BookAppointmentRequest,
   BookAppointmentResponse,
@@ -6,7 +10,25 @@ import {
   CancelAppointmentRequest,
   CancelAppointmentResponse,
 } from "../../application/use-cases/appointments/cancel-appointment.use-case";
+import {
+  ExportAvailabilityRequest,
+  ExportAvailabilityResponse,
+  ExportedDay,
+} from "../../application/use-cases/appointments/export-availability.use-case";
 import { GetAvailableSlotsRequest } from "../../application/use-cases/appointments/get-available-slots-simple.use-case";
+import {
+  BatchSlot,
+  GetBatchAvailabilityRequest,
+  GetBatchAvailabilityResponse,
+} from "../../application/use-cases/appointments/get-batch-availability.use-case";
+import {
+  GetNextAvailableSlotsRequest,
+  GetNextAvailableSlotsResponse,
+} from "../../application/use-cases/appointments/get-next-available-slots.use-case";
+import {
+  HoldSlotRequest,
+  HoldSlotResponse,
+} from "../../application/use-cases/appointments/hold-slot.use-case";
 import {
   ListAppointmentsRequest,
   ListAppointmentsResponse,
@@ -16,15 +38,29 @@ import {
   Appointment,
   ClientInfo,
 } from "../../domain/entities/appointment.entity";
+import {
+  RecurrenceType,
+  WeekDay,
+} from "../../domain/value-objects/time-slot.value-object";
 import {
   AppointmentResponseDto,
   AvailableSlotResponseDto,
+  BatchAvailableSlotResponseDto,
   BookAppointmentDto,
   BookAppointmentResponseDto,
+  BookAppointmentSeriesDto,
+  BookAppointmentSeriesResponseDto,
   CancelAppointmentDto,
   CancelAppointmentResponseDto,
   ClientInfoWithBookedByResponseDto,
+  ExportAvailabilityDto,
   GetAvailableSlotsDto,
+  GetBatchAvailabilityDto,
+  GetBatchAvailabilityResponseDto,
+  GetNextAvailableSlotsDto,
+  GetNextAvailableSlotsResponseDto,
+  HoldSlotDto,
+  HoldSlotResponseDto,
   ListAppointmentsDto,
   ListAppointmentsResponseDto,
   UpdateAppointmentDto,
@@ -65,6 +101,100 @@ export class AppointmentMapper {
       description: dto.description,
       source: "ONLINE" as const,
       staffId: dto.assignedStaffId,
+      holdToken: dto.holdToken,
+    };
+  }
+
+  /**
+   * Converts HoldSlotDto to HoldSlotRequest
+   */
+  static toHoldSlotRequest(
+    dto: HoldSlotDto,
+    requestingUserId: string,
+  ): HoldSlotRequest {
+    return {
+      businessId: dto.businessId,
+      calendarId: dto.calendarId,
+      serviceId: dto.serviceId,
+      staffId: dto.assignedStaffId,
+      startTime: new Date(dto.startTime),
+      endTime: new Date(dto.endTime),
+      requestingUserId,
+    };
+  }
+
+  /**
+   * Converts HoldSlotResponse to HoldSlotResponseDto
+   */
+  static toHoldSlotResponseDto(
+    response: HoldSlotResponse,
+  ): HoldSlotResponseDto {
+    return {
+      token: response.token,
+      calendarId: response.calendarId,
+      startTime: response.startTime.toISOString(),
+      endTime: response.endTime.toISOString(),
+      expiresAt: response.expiresAt.toISOString(),
+    };
+  }
+
+  /**
+   * Converts BookAppointmentSeriesDto to BookAppointmentSeriesRequest
+   */
+  static toBookAppointmentSeriesRequest(
+    dto: BookAppointmentSeriesDto,
+    requestingUserId: string,
+  ): BookAppointmentSeriesRequest {
+    return {
+      businessId: dto.businessId,
+      calendarId: dto.calendarId,
+      serviceId: dto.serviceId,
+      staffId: dto.assignedStaffId,
+      startTime: new Date(dto.startTime),
+      endTime: new Date(dto.endTime),
+      recurrence: {
+        type: RecurrenceType[dto.recurrence.type],
+        interval: dto.recurrence.interval,
+        daysOfWeek: dto.recurrence.daysOfWeek as WeekDay[] | undefined,
+        dayOfMonth: dto.recurrence.dayOfMonth,
+        monthOfYear: dto.recurrence.monthOfYear,
+        occurrences: dto.recurrence.occurrences,
+        endDate: dto.recurrence.endDate
+          ? new Date(dto.recurrence.endDate)
+          : undefined,
+        exceptions: dto.recurrence.exceptions?.map((date) => new Date(date)),
+      },
+      clientInfo: {
+        firstName: dto.clientInfo.firstName,
+        lastName: dto.clientInfo.lastName,
+        email: dto.clientInfo.email,
+        phone: dto.clientInfo.phone,
+        isNewClient: dto.clientInfo.isNewClient ?? false,
+      },
+      title: dto.title,
+      description: dto.description,
+      allOrNothing: dto.allOrNothing,
+      source: "ONLINE" as const,
+      requestingUserId,
+    };
+  }
+
+  /**
+   * Converts BookAppointmentSeriesResponse to BookAppointmentSeriesResponseDto
+   */
+  static toBookAppointmentSeriesResponseDto(
+    response: BookAppointmentSeriesResponse,
+  ): BookAppointmentSeriesResponseDto {
+    return {
+      calendarId: response.calendarId,
+      occurrences: response.occurrences.map((occurrence) => ({
+        startTime: occurrence.startTime.toISOString(),
+        endTime: occurrence.endTime.toISOString(),
+        status: occurrence.status,
+        appointmentId: occurrence.appointmentId,
+      })),
+      bookedCount: response.bookedCount,
+      conflictCount: response.conflictCount,
     };
   }
 
@@ -132,6 +262,139 @@ export class AppointmentMapper {
     };
   }
 
+  /**
+   * Converts GetBatchAvailabilityDto to GetBatchAvailabilityRequest
+   */
+  static toGetBatchAvailabilityRequest(
+    dto: GetBatchAvailabilityDto,
+    requestingUserId: string,
+  ): GetBatchAvailabilityRequest {
+    return {
+      businessId: dto.businessId,
+      serviceId: dto.serviceId,
+      calendarIds: dto.calendarIds,
+      referenceDate: new Date(dto.date),
+      maxSlotsPerCalendar: dto.maxSlotsPerCalendar,
+      requestingUserId,
+    };
+  }
+
+  /**
+   * Converts GetBatchAvailabilityResponse to GetBatchAvailabilityResponseDto
+   */
+  static toGetBatchAvailabilityResponseDto(
+    response: GetBatchAvailabilityResponse,
+  ): GetBatchAvailabilityResponseDto {
+    const toSlotDto = (slot: BatchSlot): BatchAvailableSlotResponseDto => ({
+      calendarId: slot.calendarId,
+      startTime: slot.startTime.toISOString(),
+      endTime: slot.endTime.toISOString(),
+    });
+
+    return {
+      periodStart: response.periodStart.toISOString(),
+      periodEnd: response.periodEnd.toISOString(),
+      durationMinutes: response.durationMinutes,
+      calendars: response.calendars.map((calendar) => ({
+        calendarId: calendar.calendarId,
+        slots: calendar.slots.map(toSlotDto),
+      })),
+      firstAvailable: response.firstAvailable
+        ? toSlotDto(response.firstAvailable)
+        : null,
+    };
+  }
+
+  /**
+   * Converts ExportAvailabilityDto to ExportAvailabilityRequest
+   */
+  static toExportAvailabilityRequest(
+    dto: ExportAvailabilityDto,
+    requestingUserId: string,
+  ): ExportAvailabilityRequest {
+    return {
+      businessId: dto.businessId,
+      serviceId: dto.serviceId,
+      startDate: new Date(dto.startDate),
+      endDate: new Date(dto.endDate),
+      calendarIds: dto.calendarIds,
+      requestingUserId,
+    };
+  }
+
+  /**
+   * First NDJSON line of an availability export
+   */
+  static toExportAvailabilityHeaderLine(
+    response: ExportAvailabilityResponse,
+  ): string {
+    return (
+      JSON.stringify({
+        type: "meta",
+        businessId: response.businessId,
+        serviceId: response.serviceId,
+        durationMinutes: response.durationMinutes,
+        periodStart: response.periodStart.toISOString(),
+        periodEnd: response.periodEnd.toISOString(),
+        calendarIds: response.calendarIds,
+      }) + "\n"
+    );
+  }
+
+  /**
+   * One NDJSON line per exported day
+   */
+  static toExportAvailabilityDayLine(day: ExportedDay): string {
+    return (
+      JSON.stringify({
+        type: "day",
+        date: day.date,
+        calendars: day.calendars.map((calendar) => ({
+          calendarId: calendar.calendarId,
+          slots: calendar.slots.map((slot) => ({
+            startTime: slot.startTime.toISOString(),
+            endTime: slot.endTime.toISOString(),
+          })),
+        })),
+      }) + "\n"
+    );
+  }
+
+  /**
+   * Converts GetNextAvailableSlotsDto to GetNextAvailableSlotsRequest
+   */
+  static toGetNextAvailableSlotsRequest(
+    dto: GetNextAvailableSlotsDto,
+    requestingUserId: string,
+  ): GetNextAvailableSlotsRequest {
+    return {
+      businessIds: dto.businessIds,
+      serviceId: dto.serviceId,
+      requestingUserId,
+    };
+  }
+
+  /**
+   * Converts GetNextAvailableSlotsResponse to GetNextAvailableSlotsResponseDto
+   */
+  static toGetNextAvailableSlotsResponseDto(
+    response: GetNextAvailableSlotsResponse,
+  ): GetNextAvailableSlotsResponseDto {
+    return {
+      businesses: response.businesses.map(({ businessId, nextSlot }) => ({
+        businessId,
+        nextSlot: nextSlot
+          ? {
+              serviceId: nextSlot.serviceId,
+              calendarId: nextSlot.calendarId,
+              startTime: nextSlot.startTime.toISOString(),
+              endTime: nextSlot.endTime.toISOString(),
+            }
+          : null,
+      })),
+    };
+  }
+
   /**
    * Converts AvailableSlot domain object to AvailableSlotResponseDto
    */
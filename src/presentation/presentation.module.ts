@@ -102,10 +102,18 @@ import { SetStaffAvailabilityUseCase } from "@application/use-cases/staff/set-st
 // Appointment Use Cases
 import { BookAppointmentUseCase } from "@application/use-cases/appointments/book-appointment.use-case";
 import { CancelAppointmentUseCase } from "@application/use-cases/appointments/cancel-appointment.use-case";
+import { ExportAvailabilityUseCase } from "@application/use-cases/appointments/export-availability.use-case";
 import { GetAppointmentByIdUseCase } from "@application/use-cases/appointments/get-appointment-by-id.use-case";
 import { GetAvailableSlotsUseCase } from "@application/use-cases/appointments/get-available-slots-simple.use-case";
+import { GetBatchAvailabilityUseCase } from "@application/use-cases/appointments/get-batch-availability.use-case";
+import { GetNextAvailableSlotsUseCase } from "@application/use-cases/appointments/get-next-available-slots.use-case";
+import { HoldSlotUseCase } from "@application/use-cases/appointments/hold-slot.use-case";
+import { BookAppointmentSeriesUseCase } from "@application/use-cases/appointments/book-appointment-series.use-case";
 import { ListAppointmentsUseCase } from "@application/use-cases/appointments/list-appointments.use-case";
 import { UpdateAppointmentUseCase } from "@application/use-cases/appointments/update-appointment.use-case";
+import { FreeBusyService } from "@application/services/free-busy.service";
+import { NextAvailableSlotIndexService } from "@application/services/next-available-slot-index.service";
+import { OutboxDispatcherService } from "@application/services/outbox-dispatcher.service";
 
 // Notification Use Cases
 import { SendBulkNotificationUseCase } from "@application/use-cases/notification/send-bulk-notification.use-case";
@@ -179,6 +187,9 @@ import { SecurityValidationPipe } from "./security/validation.pipe";
 // 🔧 Services
 import { MockI18nService } from "@application/mocks/mock-i18n.service";
 import { AuditService } from "@infrastructure/services/audit.service";
+import { NextAvailableSlotRefreshService } from "@infrastructure/services/next-available-slot-refresh.service";
+import { StaffSkillIndexRefreshService } from "@infrastructure/services/staff-skill-index-refresh.service";
+import { OutboxDispatchService } from "@infrastructure/services/outbox-dispatch.service";
 import { PresentationCookieService } from "./services/cookie.service";
 
 @Module({
@@ -545,9 +556,30 @@ import { PresentationCookieService } from "./services/cookie.service";
     },
     {
       provide: TOKENS.MANAGE_BUSINESS_HOURS_USE_CASE,
-      useFactory: (businessRepo, logger, i18n) =>
-        new ManageBusinessHoursUseCase(businessRepo, logger, i18n),
-      inject: [TOKENS.BUSINESS_REPOSITORY, TOKENS.LOGGER, TOKENS.I18N_SERVICE],
+      useFactory: (
+        businessRepo,
+        logger,
+        i18n,
+        nextSlotIndex,
+        calendarRepo,
+        slotsCache,
+      ) =>
+        new ManageBusinessHoursUseCase(
+          businessRepo,
+          logger,
+          i18n,
+          nextSlotIndex,
+          calendarRepo,
+          slotsCache,
+        ),
+      inject: [
+        TOKENS.BUSINESS_REPOSITORY,
+        TOKENS.LOGGER,
+        TOKENS.I18N_SERVICE,
+        TOKENS.NEXT_AVAILABLE_SLOT_INDEX_SERVICE,
+        TOKENS.CALENDAR_REPOSITORY,
+        TOKENS.AVAILABLE_SLOTS_CACHE,
+      ],
     },
     {
       provide: TOKENS.UPDATE_BUSINESS_CONFIGURATION_USE_CASE,
@@ -875,12 +907,57 @@ import { PresentationCookieService } from "./services/cookie.service";
     },
     {
       provide: APPLICATION_TOKENS.GET_AVAILABLE_STAFF_USE_CASE,
-      useFactory: (staffRepository) =>
-        new GetAvailableStaffUseCase(staffRepository),
-      inject: [TOKENS.STAFF_REPOSITORY],
+      useFactory: (staffRepository, skillIndex) =>
+        new GetAvailableStaffUseCase(staffRepository, skillIndex),
+      inject: [TOKENS.STAFF_REPOSITORY, TOKENS.STAFF_SKILL_INDEX],
     },
+    StaffSkillIndexRefreshService,
 
     // 📅 Appointment Use Cases
+    {
+      provide: TOKENS.FREE_BUSY_SERVICE,
+      useFactory: (calendarRepo, freeBusyStore, logger) =>
+        new FreeBusyService(calendarRepo, freeBusyStore, logger),
+      inject: [
+        TOKENS.CALENDAR_REPOSITORY,
+        TOKENS.FREE_BUSY_STORE,
+        TOKENS.LOGGER,
+      ],
+    },
+    {
+      provide: TOKENS.NEXT_AVAILABLE_SLOT_INDEX_SERVICE,
+      useFactory: (nextSlotRepo, calendarRepo, serviceRepo, logger) =>
+        new NextAvailableSlotIndexService(
+          nextSlotRepo,
+          calendarRepo,
+          serviceRepo,
+          logger,
+        ),
+      inject: [
+        TOKENS.NEXT_AVAILABLE_SLOT_REPOSITORY,
+        TOKENS.CALENDAR_REPOSITORY,
+        TOKENS.SERVICE_REPOSITORY,
+        TOKENS.LOGGER,
+      ],
+    },
+    NextAvailableSlotRefreshService,
+    {
+      provide: TOKENS.OUTBOX_DISPATCHER_SERVICE,
+      useFactory: (outboxRepo, notificationService, auditService, logger) =>
+        new OutboxDispatcherService(
+          outboxRepo,
+          notificationService,
+          auditService,
+          logger,
+        ),
+      inject: [
+        TOKENS.OUTBOX_REPOSITORY,
+        TOKENS.NOTIFICATION_SERVICE,
+        TOKENS.AUDIT_SERVICE,
+        TOKENS.LOGGER,
+      ],
+    },
+    OutboxDispatchService,
     {
       provide: TOKENS.BOOK_APPOINTMENT_USE_CASE,
       useFactory: (
@@ -891,6 +968,10 @@ import { PresentationCookieService } from "./services/cookie.service";
         businessRepo: any,
         logger: any,
         i18n: any,
+        freeBusyService: any,
+        slotsCache: any,
+        nextSlotIndex: any,
+        slotHolds: any,
       ) =>
         new BookAppointmentUseCase(
           appointmentRepo,
@@ -900,6 +981,10 @@ import { PresentationCookieService } from "./services/cookie.service";
           businessRepo,
           logger,
           i18n,
+          freeBusyService,
+          slotsCache,
+          nextSlotIndex,
+          slotHolds,
         ),
       inject: [
         TOKENS.APPOINTMENT_REPOSITORY,
@@ -909,6 +994,79 @@ import { PresentationCookieService } from "./services/cookie.service";
         TOKENS.BUSINESS_REPOSITORY,
         TOKENS.LOGGER,
         TOKENS.I18N_SERVICE,
+        TOKENS.FREE_BUSY_SERVICE,
+        TOKENS.AVAILABLE_SLOTS_CACHE,
+        TOKENS.NEXT_AVAILABLE_SLOT_INDEX_SERVICE,
+        TOKENS.SLOT_HOLD_STORE,
+      ],
+    },
+    {
+      provide: TOKENS.BOOK_APPOINTMENT_SERIES_USE_CASE,
+      useFactory: (
+        appointmentRepo: any,
+        serviceRepo: any,
+        calendarRepo: any,
+        staffRepo: any,
+        businessRepo: any,
+        logger: any,
+        i18n: any,
+        freeBusyService: any,
+        slotsCache: any,
+        nextSlotIndex: any,
+      ) =>
+        new BookAppointmentSeriesUseCase(
+          appointmentRepo,
+          serviceRepo,
+          calendarRepo,
+          staffRepo,
+          businessRepo,
+          logger,
+          i18n,
+          freeBusyService,
+          slotsCache,
+          nextSlotIndex,
+        ),
+      inject: [
+        TOKENS.APPOINTMENT_REPOSITORY,
+        TOKENS.SERVICE_REPOSITORY,
+        TOKENS.CALENDAR_REPOSITORY,
+        TOKENS.STAFF_REPOSITORY,
+        TOKENS.BUSINESS_REPOSITORY,
+        TOKENS.LOGGER,
+        TOKENS.I18N_SERVICE,
+        TOKENS.FREE_BUSY_SERVICE,
+        TOKENS.AVAILABLE_SLOTS_CACHE,
+        TOKENS.NEXT_AVAILABLE_SLOT_INDEX_SERVICE,
+      ],
+    },
+    {
+      provide: TOKENS.HOLD_SLOT_USE_CASE,
+      useFactory: (
+        slotHolds,
+        appointmentRepo,
+        serviceRepo,
+        calendarRepo,
+        businessRepo,
+        logger,
+        i18n,
+      ) =>
+        new HoldSlotUseCase(
+          slotHolds,
+          appointmentRepo,
+          serviceRepo,
+          calendarRepo,
+          businessRepo,
+          logger,
+          i18n,
+        ),
+      inject: [
+        TOKENS.SLOT_HOLD_STORE,
+        TOKENS.APPOINTMENT_REPOSITORY,
+        TOKENS.SERVICE_REPOSITORY,
+        TOKENS.CALENDAR_REPOSITORY,
+        TOKENS.BUSINESS_REPOSITORY,
+        TOKENS.LOGGER,
+        TOKENS.I18N_SERVICE,
       ],
     },
     {
@@ -918,22 +1076,67 @@ import { PresentationCookieService } from "./services/cookie.service";
         serviceRepo,
         appointmentRepo,
         staffRepo,
+        businessRepo,
         logger,
         i18n,
+        slotsCache,
       ) =>
         new GetAvailableSlotsUseCase(
           calendarRepo,
           serviceRepo,
           appointmentRepo,
           staffRepo,
+          businessRepo,
           logger,
           i18n,
+          slotsCache,
         ),
       inject: [
         TOKENS.CALENDAR_REPOSITORY,
         TOKENS.SERVICE_REPOSITORY,
         TOKENS.APPOINTMENT_REPOSITORY,
         TOKENS.STAFF_REPOSITORY,
+        TOKENS.BUSINESS_REPOSITORY,
+        TOKENS.LOGGER,
+        TOKENS.I18N_SERVICE,
+        TOKENS.AVAILABLE_SLOTS_CACHE,
+      ],
+    },
+    {
+      provide: TOKENS.GET_BATCH_AVAILABILITY_USE_CASE,
+      useFactory: (calendarRepo, serviceRepo, logger, i18n, freeBusyService) =>
+        new GetBatchAvailabilityUseCase(
+          calendarRepo,
+          serviceRepo,
+          logger,
+          i18n,
+          freeBusyService,
+        ),
+      inject: [
+        TOKENS.CALENDAR_REPOSITORY,
+        TOKENS.SERVICE_REPOSITORY,
+        TOKENS.LOGGER,
+        TOKENS.I18N_SERVICE,
+        TOKENS.FREE_BUSY_SERVICE,
+      ],
+    },
+    {
+      provide: TOKENS.EXPORT_AVAILABILITY_USE_CASE,
+      useFactory: (calendarRepo, serviceRepo, logger, i18n) =>
+        new ExportAvailabilityUseCase(calendarRepo, serviceRepo, logger, i18n),
+      inject: [
+        TOKENS.CALENDAR_REPOSITORY,
+        TOKENS.SERVICE_REPOSITORY,
+        TOKENS.LOGGER,
+        TOKENS.I18N_SERVICE,
+      ],
+    },
+    {
+      provide: TOKENS.GET_NEXT_AVAILABLE_SLOTS_USE_CASE,
+      useFactory: (nextSlotIndex, logger, i18n) =>
+        new GetNextAvailableSlotsUseCase(nextSlotIndex, logger, i18n),
+      inject: [
+        TOKENS.NEXT_AVAILABLE_SLOT_INDEX_SERVICE,
         TOKENS.LOGGER,
         TOKENS.I18N_SERVICE,
       ],
@@ -948,11 +1151,40 @@ import { PresentationCookieService } from "./services/cookie.service";
     },
     {
       provide: TOKENS.UPDATE_APPOINTMENT_USE_CASE,
-      useClass: UpdateAppointmentUseCase,
+      useFactory: (appointmentRepo, slotsCache, nextSlotIndex, freeBusy) =>
+        new UpdateAppointmentUseCase(
+          appointmentRepo,
+          slotsCache,
+          nextSlotIndex,
+          freeBusy,
+        ),
+      inject: [
+        TOKENS.APPOINTMENT_REPOSITORY,
+        TOKENS.AVAILABLE_SLOTS_CACHE,
+        TOKENS.NEXT_AVAILABLE_SLOT_INDEX_SERVICE,
+        TOKENS.FREE_BUSY_SERVICE,
+      ],
     },
     {
       provide: TOKENS.CANCEL_APPOINTMENT_USE_CASE,
-      useClass: CancelAppointmentUseCase,
+      useFactory: (
+        appointmentRepo,
+        freeBusyService,
+        slotsCache,
+        nextSlotIndex,
+      ) =>
+        new CancelAppointmentUseCase(
+          appointmentRepo,
+          freeBusyService,
+          slotsCache,
+          nextSlotIndex,
+        ),
+      inject: [
+        TOKENS.APPOINTMENT_REPOSITORY,
+        TOKENS.FREE_BUSY_SERVICE,
+        TOKENS.AVAILABLE_SLOTS_CACHE,
+        TOKENS.NEXT_AVAILABLE_SLOT_INDEX_SERVICE,
+      ],
     },
 
     // 📢 Notification Use Cases
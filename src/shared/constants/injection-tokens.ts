@@ -115,6 +115,11 @@ export const APPLICATION_TOKENS = {
   UPDATE_APPOINTMENT_USE_CASE: "UpdateAppointmentUseCase",
   CANCEL_APPOINTMENT_USE_CASE: "CancelAppointmentUseCase",
   GET_AVAILABLE_SLOTS_USE_CASE: "GetAvailableSlotsUseCase",
+  GET_BATCH_AVAILABILITY_USE_CASE: "GetBatchAvailabilityUseCase",
+  GET_NEXT_AVAILABLE_SLOTS_USE_CASE: "GetNextAvailableSlotsUseCase",
+  EXPORT_AVAILABILITY_USE_CASE: "ExportAvailabilityUseCase",
+  HOLD_SLOT_USE_CASE: "HoldSlotUseCase",
+  BOOK_APPOINTMENT_SERIES_USE_CASE: "BookAppointmentSeriesUseCase",
 
   // Notification Use Cases
   SEND_NOTIFICATION_USE_CASE: "SendNotificationUseCase",
@@ -130,6 +135,10 @@ export const APPLICATION_TOKENS = {
   USER_ONBOARDING_SERVICE: "UserOnboardingApplicationService",
   USER_CACHE_SERVICE: "UserCacheService",
   STORE_USER_AFTER_LOGIN_SERVICE: "StoreUserAfterLoginService",
+  FREE_BUSY_SERVICE: "FreeBusyService",
+  AVAILABLE_SLOTS_CACHE: "AvailableSlotsCache",
+  NEXT_AVAILABLE_SLOT_INDEX_SERVICE: "NextAvailableSlotIndexService",
+  OUTBOX_DISPATCHER_SERVICE: "OutboxDispatcherService",
 
   // ✅ NEW: Skills Use Cases
   CREATE_SKILL_USE_CASE: "CreateSkillUseCase",
@@ -180,6 +189,8 @@ export const APPLICATION_TOKENS = {
   // Cache Services
   CACHE_SERVICE: "CacheService",
   USER_CACHE: "IUserCache",
+  SLOT_HOLD_STORE: "ISlotHoldStore",
+  FREE_BUSY_STORE: "IFreeBusyStore",
 
   // Session Services
   USER_SESSION_SERVICE: "UserSessionService",
@@ -199,6 +210,8 @@ export const DOMAIN_TOKENS = {
   PROFESSIONAL_ROLE_REPOSITORY: "ProfessionalRoleRepository",
   PERMISSION_REPOSITORY: "PermissionRepository",
   APPOINTMENT_REPOSITORY: "AppointmentRepository",
+  NEXT_AVAILABLE_SLOT_REPOSITORY: "NextAvailableSlotRepository",
+  OUTBOX_REPOSITORY: "OutboxRepository",
   NOTIFICATION_REPOSITORY: "NotificationRepository",
 
   // ✅ NEW: Entity Repositories
@@ -219,6 +232,7 @@ export const DOMAIN_TOKENS = {
   PASSWORD_DOMAIN_SERVICE: "PasswordDomainService",
   EMAIL_DOMAIN_SERVICE: "EmailDomainService",
   PERMISSION_SERVICE: "IPermissionService",
+  STAFF_SKILL_INDEX: "StaffSkillIndex",
 
   // 🔐 NEW: Simple Permission Service
   SIMPLE_PERMISSION_SERVICE: "SimplePermissionService",
@@ -0,0 +1,5 @@
+export enum ViewMode {
+  DAY = "day",
+  WEEK = "week",
+  NEXT_WEEK = "next_week",
+}
@@ -804,6 +804,158 @@ export class AppointmentAnalyticsUtils {
   }
 }
 
+/**
+ * 🧮 Slot occupancy on a uniform grid of epoch-ms slots
+ */
+export interface SlotOccupancy {
+  readonly gridStartMs: number;
+  readonly slotMs: number;
+  /** Number of appointments overlapping each slot */
+  readonly counts: Int32Array;
+  /** 1 when the slot lies entirely inside an opening window */
+  readonly open: Uint8Array;
+}
+
+/**
+ * 🧮 Batched occupancy kernel
+ *
+ * Each appointment (or opening window) adds +1 at its first slot and -1
+ * after its last one in a difference array; one prefix sum then yields
+ * the per-slot counts. Cost is O(appointments + windows + slots) whatever
+ * the range length, with no per-slot predicate and no Date allocation.
+ */
+export class AppointmentOccupancyKernel {
+  /**
+   * Occupancy counts for `slotCount` slots of `slotMs` starting at
+   * `gridStartMs`. Intervals are half-open [start, end) and need not be
+   * sorted. `openWindows` is flat [start0, end0, start1, end1, ...]; when
+   * omitted every slot is considered open.
+   */
+  static compute(
+    starts: Float64Array,
+    ends: Float64Array,
+    gridStartMs: number,
+    slotMs: number,
+    slotCount: number,
+    openWindows?: Float64Array,
+  ): SlotOccupancy {
+    const counts = new Int32Array(slotCount + 1);
+
+    for (let i = 0; i < starts.length; i++) {
+      if (!(ends[i] > starts[i])) continue;
+      // Overlaps slot k iff start < slotEnd(k) and end > slotStart(k)
+      const first = Math.max(0, Math.floor((starts[i] - gridStartMs) / slotMs));
+      const last = Math.min(
+        slotCount,
+        Math.ceil((ends[i] - gridStartMs) / slotMs),
+      );
+      if (first < last) {
+        counts[first]++;
+        counts[last]--;
+      }
+    }
+
+    let running = 0;
+    for (let k = 0; k < slotCount; k++) {
+      running += counts[k];
+      counts[k] = running;
+    }
+
+    return {
+      gridStartMs,
+      slotMs,
+      counts: counts.subarray(0, slotCount),
+      open: openWindows
+        ? AppointmentOccupancyKernel.openMask(
+            openWindows,
+            gridStartMs,
+            slotMs,
+            slotCount,
+          )
+        : new Uint8Array(slotCount).fill(1),
+    };
+  }
+
+  /**
+   * Utilization figures over the open slots of an occupancy grid.
+   * Peak times are local "HH:MM" slot starts ranked by booking count.
+   */
+  static summarize(
+    occupancy: SlotOccupancy,
+    peakCount = 5,
+  ): {
+    totalSlots: number;
+    bookedSlots: number;
+    availableSlots: number;
+    utilizationPercentage: number;
+    peakTimes: { time: string; bookingCount: number }[];
+  } {
+    const { counts, open, gridStartMs, slotMs } = occupancy;
+    const byTime = new Map<string, number>();
+    let totalSlots = 0;
+    let bookedSlots = 0;
+
+    for (let k = 0; k < counts.length; k++) {
+      if (open[k] === 0) continue;
+      totalSlots++;
+      if (counts[k] === 0) continue;
+      bookedSlots++;
+
+      const start = new Date(gridStartMs + k * slotMs);
+      const time = `${String(start.getHours()).padStart(2, "0")}:${String(
+        start.getMinutes(),
+      ).padStart(2, "0")}`;
+      byTime.set(time, (byTime.get(time) ?? 0) + counts[k]);
+    }
+
+    const peakTimes = [...byTime.entries()]
+      .sort(([timeA, a], [timeB, b]) => b - a || timeA.localeCompare(timeB))
+      .slice(0, peakCount)
+      .map(([time, bookingCount]) => ({ time, bookingCount }));
+
+    return {
+      totalSlots,
+      bookedSlots,
+      availableSlots: totalSlots - bookedSlots,
+      utilizationPercentage:
+        totalSlots > 0
+          ? Math.round((bookedSlots / totalSlots) * 10000) / 100
+          : 0,
+      peakTimes,
+    };
+  }
+
+  private static openMask(
+    windows: Float64Array,
+    gridStartMs: number,
+    slotMs: number,
+    slotCount: number,
+  ): Uint8Array {
+    const diff = new Int32Array(slotCount + 1);
+
+    for (let i = 0; i + 1 < windows.length; i += 2) {
+      // Slot k is open iff the window contains it entirely
+      const first = Math.max(0, Math.ceil((windows[i] - gridStartMs) / slotMs));
+      const last = Math.min(
+        slotCount,
+        Math.floor((windows[i + 1] - gridStartMs) / slotMs),
+      );
+      if (first < last) {
+        diff[first]++;
+        diff[last]--;
+      }
+    }
+
+    const open = new Uint8Array(slotCount);
+    let running = 0;
+    for (let k = 0; k < slotCount; k++) {
+      running += diff[k];
+      open[k] = running > 0 ? 1 : 0;
+    }
+    return open;
+  }
+}
+
 /**
  * 🎨 Frontend Integration Helpers
  */